@@ -1,5 +1,7 @@
 # Write the benchmarking functions here.
 # See "Writing benchmarks" in the asv docs for more information.
+import io
+import os
 import os.path as osp
 import numpy as np
 from tempfile import TemporaryDirectory
@@ -55,3 +57,280 @@ class WritingTimeSuite:
         data = np.zeros(self.shape[:2])
         for i in range(self.shape[2]):
             ds[..., i:i+1] = data[..., np.newaxis]
+
+
+class ChunkIterSuite:
+    """Overhead of working out chunk slices, before any I/O"""
+    def setup(self):
+        self._td = TemporaryDirectory()
+        path = osp.join(self._td.name, 'test.h5')
+        self.f = h5py.File(path, 'w')
+        # 100k chunks, none of them allocated
+        self.ds = self.f.create_dataset(
+            'a', shape=(1000, 1000), dtype=np.uint8, chunks=(10, 1)
+        )
+
+    def teardown(self):
+        self.f.close()
+        self._td.cleanup()
+
+    def time_iter_chunks(self):
+        for _ in self.ds.iter_chunks():
+            pass
+
+
+class DirectChunkSuite:
+    """Reading raw chunks one call at a time vs. in bulk"""
+    def setup(self):
+        self._td = TemporaryDirectory()
+        path = osp.join(self._td.name, 'test.h5')
+        with h5py.File(path, 'w') as f:
+            f.create_dataset(
+                'a', data=np.arange(200000, dtype=np.int32), chunks=(10,)
+            )
+        self.f = h5py.File(path, 'r')
+        self.ds = self.f['a']
+        self.offsets = np.arange(0, 200000, 10).reshape(-1, 1)
+        self.out = np.empty(200000 * 4, dtype=np.uint8)
+
+    def teardown(self):
+        self.f.close()
+        self._td.cleanup()
+
+    def time_read_direct_chunk(self):
+        for offset in self.offsets:
+            self.ds.id.read_direct_chunk(tuple(offset))
+
+    def time_read_direct_chunks(self):
+        self.ds.id.read_direct_chunks(self.offsets, self.out)
+
+
+class CompressionSuite:
+    """Bundled fast filters on integer detector-like frames"""
+    params = ['lzf', 'bslz4']
+    param_names = ['compression']
+
+    def setup(self, compression):
+        self._td = TemporaryDirectory()
+        path = osp.join(self._td.name, 'test.h5')
+        rng = np.random.RandomState(0)
+        self.data = rng.poisson(3, (50, 512, 512)).astype(np.uint16)
+        self.f = h5py.File(path, 'w')
+        self.ds = self.f.create_dataset(
+            'a', data=self.data, chunks=(1, 512, 512), compression=compression
+        )
+        self.f.flush()
+
+    def teardown(self, compression):
+        self.f.close()
+        self._td.cleanup()
+
+    def time_write(self, compression):
+        self.ds[...] = self.data
+        self.f.flush()
+
+    def time_read(self, compression):
+        self.ds[...]
+
+    def track_ratio(self, compression):
+        return self.data.nbytes / self.ds.id.get_storage_size()
+
+
+class ChunkShapeSuite:
+    """Reads in one access pattern with guessed vs. access-aware chunks"""
+    params = (['guess', 'auto'], ['rows', 'columns', 'planes'])
+    param_names = ['chunks', 'access']
+
+    def setup(self, chunks, access):
+        self._td = TemporaryDirectory()
+        path = osp.join(self._td.name, 'test.h5')
+        shape = (64, 256, 256)
+        kwds = {'chunks': True} if chunks == 'guess' else \
+               {'chunks': 'auto', 'access': access}
+        with h5py.File(path, 'w') as f:
+            f.create_dataset('a', data=np.zeros(shape, dtype=np.float32), **kwds)
+        self.f = h5py.File(path, 'r')
+        self.ds = self.f['a']
+        if access == 'rows':
+            self.sels = [(i, j, slice(None)) for i in range(0, 64, 8) for j in range(0, 256, 32)]
+        elif access == 'columns':
+            self.sels = [(slice(None), j, k) for j in range(0, 256, 32) for k in range(0, 256, 32)]
+        else:
+            self.sels = [i for i in range(64)]
+
+    def teardown(self, chunks, access):
+        self.f.close()
+        self._td.cleanup()
+
+    def time_read(self, chunks, access):
+        for sel in self.sels:
+            self.ds[sel]
+
+
+class _SeekOnly(io.RawIOBase):
+    """File object with neither a usable fileno() nor positional methods"""
+    def __init__(self, f):
+        self.f = f
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def seek(self, *args):
+        return self.f.seek(*args)
+
+    def tell(self):
+        return self.f.tell()
+
+    def readinto(self, b):
+        return self.f.readinto(b)
+
+
+class _ReadintoAt(_SeekOnly):
+    def readinto_at(self, offset, b):
+        return os.preadv(self.f.fileno(), [b], offset)
+
+
+class FileObjSuite:
+    """Small reads through the fileobj driver with each I/O protocol"""
+    params = ['seek', 'readinto_at', 'fileno']
+    param_names = ['protocol']
+
+    def setup(self, protocol):
+        if protocol == 'readinto_at' and not hasattr(os, 'preadv'):
+            raise NotImplementedError("os.preadv not available")
+        self._td = TemporaryDirectory()
+        path = osp.join(self._td.name, 'test.h5')
+        with h5py.File(path, 'w') as f:
+            f.create_dataset('a', data=np.arange(100000), chunks=(10,))
+        self.fileobj = open(path, 'rb')
+        wrapper = {'seek': _SeekOnly, 'readinto_at': _ReadintoAt}.get(protocol)
+        self.f = h5py.File(wrapper(self.fileobj) if wrapper else self.fileobj, 'r')
+        self.ds = self.f['a']
+
+    def teardown(self, protocol):
+        self.f.close()
+        self.fileobj.close()
+        self._td.cleanup()
+
+    def time_read_chunks(self, protocol):
+        for i in range(0, 100000, 10):
+            self.ds.id.read_direct_chunk((i,))
+
+
+class _CountingBytesIO(io.BytesIO):
+    reads = 0
+
+    def readinto(self, b):
+        self.reads += 1
+        return super().readinto(b)
+
+
+class PageBufferSuite:
+    """Reading many small objects with and without paged aggregation"""
+    params = ['default', 'paged']
+    param_names = ['layout']
+
+    def setup(self, layout):
+        if layout == 'paged' and h5py.version.hdf5_version_tuple < (1, 10, 1):
+            raise NotImplementedError("Paged aggregation requires HDF5 1.10.1")
+        self._td = TemporaryDirectory()
+        self.path = osp.join(self._td.name, 'test.h5')
+        if layout == 'paged':
+            create = {'fs_strategy': 'page', 'fs_page_size': 4096}
+            self.kwds = {'page_buf_size': 4 * 1024**2}
+        else:
+            create = self.kwds = {}
+        with h5py.File(self.path, 'w', **create) as f:
+            for i in range(1000):
+                g = f.create_group('g%d' % i)
+                g.attrs['index'] = i
+                g['data'] = np.arange(10)
+
+    def teardown(self, layout):
+        self._td.cleanup()
+
+    def _read_all(self, name):
+        with h5py.File(name, 'r', **self.kwds) as f:
+            for i in range(1000):
+                g = f['g%d' % i]
+                g.attrs['index']
+                g['data'][()]
+
+    def time_read_all(self, layout):
+        self._read_all(self.path)
+
+    def track_file_reads(self, layout):
+        with open(self.path, 'rb') as fh:
+            fileobj = _CountingBytesIO(fh.read())
+        self._read_all(fileobj)
+        return fileobj.reads
+
+
+class RangedSuite:
+    """Reading a chunked dataset from a store with 2 ms of latency per request"""
+    params = ['serial', 'concurrent']
+    param_names = ['fetching']
+
+    def setup(self, fetching):
+        self._td = TemporaryDirectory()
+        self.path = osp.join(self._td.name, 'test.h5')
+        with h5py.File(self.path, 'w') as f:
+            f.create_dataset('a', data=np.arange(2000000), chunks=(10000,))
+        if fetching == 'serial':
+            self.kwds = {'max_workers': 1, 'readahead': 0}
+        else:
+            self.kwds = {}
+
+    def teardown(self, fetching):
+        self._td.cleanup()
+
+    def _read(self):
+        backend = h5py.ranged.FileBackend(self.path, latency=0.002)
+        with h5py.File('blob', 'r', driver='ranged', fetch=backend, **self.kwds) as f:
+            f['a'][:]
+        backend.close()
+        return backend.requests
+
+    def time_read(self, fetching):
+        self._read()
+
+    def track_requests(self, fetching):
+        return self._read()
+
+
+class CompoundSuite:
+    """Many small reads and writes of a dataset and attribute with a
+    48-field compound type"""
+    def setup(self):
+        self._td = TemporaryDirectory()
+        path = osp.join(self._td.name, 'test.h5')
+        self.dtype = np.dtype([('f%d' % i, ['<i4', '<f8', 'S8'][i % 3])
+                               for i in range(48)])
+        self.f = h5py.File(path, 'w')
+        self.ds = self.f.create_dataset('a', shape=(10000,), dtype=self.dtype,
+                                        chunks=(100,))
+        self.ds.attrs.create('meta', np.zeros(4, dtype=self.dtype))
+        self.row = np.zeros(10, dtype=self.dtype)
+
+    def teardown(self):
+        self.f.close()
+        self._td.cleanup()
+
+    def time_small_reads(self):
+        for i in range(1000):
+            self.ds[i * 10:(i + 1) * 10]
+
+    def time_small_writes(self):
+        for i in range(1000):
+            self.ds[i * 10:(i + 1) * 10] = self.row
+
+    def time_field_reads(self):
+        for i in range(1000):
+            self.ds['f1', i * 10:(i + 1) * 10]
+
+    def time_attr_reads(self):
+        for _ in range(1000):
+            self.ds.attrs['meta']
@@ -0,0 +1,268 @@
+/***** Preamble block *********************************************************
+*
+* This file is part of h5py, a low-level Python interface to the HDF5 library.
+*
+* Copyright (C) 2020 Andrew Collette and contributors
+* http://h5py.org
+* License: BSD  (See LICENSE.txt for full license)
+*
+****** End preamble block ****************************************************/
+
+/*
+    Bit transposition ("bitshuffle") of blocks of elements.
+
+    The output layout is that of the bitshuffle library by Kiyoshi Masui
+    (https://github.com/kiyo-masui/bitshuffle), so that data compressed by
+    either can be read by the other.  A block of size elements is stored as
+    elem_size * 8 rows of size / 8 bytes, row 8*j+k holding bit k of byte j
+    of every element.
+
+    This is done in three steps: transposing bytes within elements, then
+    transposing bits within bytes, then reordering the rows of bits.  The
+    middle step dominates, and has SSE2 and AVX2 versions; the AVX2 one is
+    only used if the CPU supports it, so the module can be built for a
+    baseline x86-64 target.
+*/
+
+#include <string.h>
+#include <stdint.h>
+#include "bitshuffle.h"
+
+#if defined(__SSE2__) || defined(_M_X64) || (defined(_M_IX86_FP) && _M_IX86_FP >= 2)
+#define H5PY_BSHUF_SSE2 1
+#include <emmintrin.h>
+#endif
+
+/* GCC >= 4.9 and clang can compile AVX2 functions without -mavx2 */
+#if defined(H5PY_BSHUF_SSE2) && (defined(__x86_64__) || defined(__i386__)) && \
+    (defined(__clang__) || (defined(__GNUC__) && \
+     (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 9))))
+#define H5PY_BSHUF_AVX2 1
+#include <immintrin.h>
+#endif
+
+
+/* Transpose the 8x8 bit matrix held in x, one row per byte */
+#define TRANS_BIT_8X8(x, t) {                                   \
+        t = (x ^ (x >> 7)) & 0x00AA00AA00AA00AAULL;             \
+        x = x ^ t ^ (t << 7);                                   \
+        t = (x ^ (x >> 14)) & 0x0000CCCC0000CCCCULL;            \
+        x = x ^ t ^ (t << 14);                                  \
+        t = (x ^ (x >> 28)) & 0x00000000F0F0F0F0ULL;            \
+        x = x ^ t ^ (t << 28);                                  \
+    }
+
+static uint64_t load_le64(const uint8_t *p){
+    uint64_t x = 0;
+    int k;
+    for(k=0; k<8; k++){
+        x |= ((uint64_t)p[k]) << (8*k);
+    }
+    return x;
+}
+
+static void store_le64(uint8_t *p, uint64_t x){
+    int k;
+    for(k=0; k<8; k++){
+        p[k] = (uint8_t)(x >> (8*k));
+    }
+}
+
+
+/* Step 1: out[j*size + i] = in[i*elem_size + j] */
+#define BYTE_ELEM_LOOP(N)                                       \
+    for(i=0; i<size; i++){                                      \
+        for(j=0; j<(N); j++){                                   \
+            out[j*size + i] = in[i*(N) + j];                    \
+        }                                                       \
+    }
+
+static void trans_byte_elem(const uint8_t *in, uint8_t *out, size_t size,
+                            size_t elem_size){
+    size_t i, j;
+    switch(elem_size){
+        case 2: BYTE_ELEM_LOOP(2) break;
+        case 4: BYTE_ELEM_LOOP(4) break;
+        case 8: BYTE_ELEM_LOOP(8) break;
+        default: BYTE_ELEM_LOOP(elem_size) break;
+    }
+}
+
+#define UNTRANS_BYTE_ELEM_LOOP(N)                               \
+    for(i=0; i<size; i++){                                      \
+        for(j=0; j<(N); j++){                                   \
+            out[i*(N) + j] = in[j*size + i];                    \
+        }                                                       \
+    }
+
+static void untrans_byte_elem(const uint8_t *in, uint8_t *out, size_t size,
+                              size_t elem_size){
+    size_t i, j;
+    switch(elem_size){
+        case 2: UNTRANS_BYTE_ELEM_LOOP(2) break;
+        case 4: UNTRANS_BYTE_ELEM_LOOP(4) break;
+        case 8: UNTRANS_BYTE_ELEM_LOOP(8) break;
+        default: UNTRANS_BYTE_ELEM_LOOP(elem_size) break;
+    }
+}
+
+
+/* Step 2: for every group of 8 bytes, bit k of byte m goes to bit m of
+   byte m/8 in row k.  nbyte is a multiple of 8; start is where to begin,
+   so the SIMD versions can hand over the tail. */
+static void trans_bit_byte_scalar(const uint8_t *in, uint8_t *out,
+                                  size_t nbyte, size_t start){
+    size_t nrow = nbyte/8;
+    size_t i;
+    int k;
+    uint64_t x, t;
+
+    for(i=start/8; i<nrow; i++){
+        x = load_le64(in + 8*i);
+        TRANS_BIT_8X8(x, t);
+        for(k=0; k<8; k++){
+            out[k*nrow + i] = (uint8_t)x;
+            x >>= 8;
+        }
+    }
+}
+
+static void trans_bit_byte_default(const uint8_t *in, uint8_t *out, size_t nbyte){
+    trans_bit_byte_scalar(in, out, nbyte, 0);
+}
+
+#ifdef H5PY_BSHUF_SSE2
+/* The most significant bit of each of 16 bytes is collected by movemask;
+   shifting left brings up the next bit. */
+static void trans_bit_byte_sse2(const uint8_t *in, uint8_t *out, size_t nbyte){
+    size_t nrow = nbyte/8;
+    size_t i;
+    int k;
+    __m128i x;
+    uint16_t bits;
+
+    for(i=0; i+16<=nbyte; i+=16){
+        x = _mm_loadu_si128((const __m128i *)(in + i));
+        for(k=7; k>=0; k--){
+            bits = (uint16_t)_mm_movemask_epi8(x);
+            x = _mm_slli_epi16(x, 1);
+            memcpy(out + k*nrow + i/8, &bits, 2);
+        }
+    }
+    trans_bit_byte_scalar(in, out, nbyte, i);
+}
+#endif
+
+#ifdef H5PY_BSHUF_AVX2
+__attribute__((target("avx2")))
+static void trans_bit_byte_avx2(const uint8_t *in, uint8_t *out, size_t nbyte){
+    size_t nrow = nbyte/8;
+    size_t i;
+    int k;
+    __m256i x;
+    uint32_t bits;
+
+    for(i=0; i+32<=nbyte; i+=32){
+        x = _mm256_loadu_si256((const __m256i *)(in + i));
+        for(k=7; k>=0; k--){
+            bits = (uint32_t)_mm256_movemask_epi8(x);
+            x = _mm256_slli_epi16(x, 1);
+            memcpy(out + k*nrow + i/8, &bits, 4);
+        }
+    }
+    trans_bit_byte_scalar(in, out, nbyte, i);
+}
+#endif
+
+/* Inverse of step 2; the 8x8 bit transpose is its own inverse */
+static void untrans_bit_byte(const uint8_t *in, uint8_t *out, size_t nbyte){
+    size_t nrow = nbyte/8;
+    size_t i;
+    int k;
+    uint64_t x, t;
+
+    for(i=0; i<nrow; i++){
+        x = 0;
+        for(k=0; k<8; k++){
+            x |= ((uint64_t)in[k*nrow + i]) << (8*k);
+        }
+        TRANS_BIT_8X8(x, t);
+        store_le64(out + 8*i, x);
+    }
+}
+
+
+/* Step 3: rows come out of step 2 ordered by (bit, byte); reorder them
+   to (byte, bit). */
+static void trans_bitrow_eight(const uint8_t *in, uint8_t *out, size_t size,
+                               size_t elem_size){
+    size_t nbr = size/8;
+    size_t k, j;
+    for(k=0; k<8; k++){
+        for(j=0; j<elem_size; j++){
+            memcpy(out + (j*8 + k)*nbr, in + (k*elem_size + j)*nbr, nbr);
+        }
+    }
+}
+
+static void untrans_bitrow_eight(const uint8_t *in, uint8_t *out, size_t size,
+                                 size_t elem_size){
+    size_t nbr = size/8;
+    size_t k, j;
+    for(k=0; k<8; k++){
+        for(j=0; j<elem_size; j++){
+            memcpy(out + (k*elem_size + j)*nbr, in + (j*8 + k)*nbr, nbr);
+        }
+    }
+}
+
+
+typedef void (*bit_byte_func)(const uint8_t *, uint8_t *, size_t);
+
+static bit_byte_func trans_bit_byte = trans_bit_byte_default;
+static const char *impl_name = "scalar";
+
+void h5py_bshuf_init(void){
+#ifdef H5PY_BSHUF_AVX2
+    __builtin_cpu_init();
+    if(__builtin_cpu_supports("avx2")){
+        trans_bit_byte = trans_bit_byte_avx2;
+        impl_name = "avx2";
+        return;
+    }
+#endif
+#ifdef H5PY_BSHUF_SSE2
+    trans_bit_byte = trans_bit_byte_sse2;
+    impl_name = "sse2";
+#endif
+}
+
+const char *h5py_bshuf_impl(void){
+    return impl_name;
+}
+
+void h5py_bshuf_trans_bit_elem(const void *in, void *out, void *tmp,
+                               size_t size, size_t elem_size){
+    size_t nbyte = size*elem_size;
+
+    if(elem_size == 1){
+        trans_bit_byte((const uint8_t *)in, (uint8_t *)out, nbyte);
+        return;
+    }
+    trans_byte_elem((const uint8_t *)in, (uint8_t *)out, size, elem_size);
+    trans_bit_byte((const uint8_t *)out, (uint8_t *)tmp, nbyte);
+    trans_bitrow_eight((const uint8_t *)tmp, (uint8_t *)out, size, elem_size);
+}
+
+void h5py_bshuf_untrans_bit_elem(const void *in, void *out, void *tmp,
+                                 size_t size, size_t elem_size){
+    size_t nbyte = size*elem_size;
+
+    if(elem_size == 1){
+        untrans_bit_byte((const uint8_t *)in, (uint8_t *)out, nbyte);
+        return;
+    }
+    untrans_bitrow_eight((const uint8_t *)in, (uint8_t *)out, size, elem_size);
+    untrans_bit_byte((const uint8_t *)out, (uint8_t *)tmp, nbyte);
+    untrans_byte_elem((const uint8_t *)tmp, (uint8_t *)out, size, elem_size);
+}
@@ -0,0 +1,46 @@
+/***** Preamble block *********************************************************
+*
+* This file is part of h5py, a low-level Python interface to the HDF5 library.
+*
+* Copyright (C) 2020 Andrew Collette and contributors
+* http://h5py.org
+* License: BSD  (See LICENSE.txt for full license)
+*
+****** End preamble block ****************************************************/
+
+/*
+    Bit transposition of blocks of elements, in the layout defined by the
+    bitshuffle library (https://github.com/kiyo-masui/bitshuffle).
+*/
+
+#ifndef H5PY_BITSHUFFLE_H
+#define H5PY_BITSHUFFLE_H
+
+#include <stddef.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Pick the fastest implementation supported by the CPU.  Must be called
+   before the functions below; calling it again is harmless. */
+void h5py_bshuf_init(void);
+
+/* Name of the implementation in use: "avx2", "sse2" or "scalar" */
+const char *h5py_bshuf_impl(void);
+
+/* Bit transpose size elements of elem_size bytes from in to out, using tmp
+   as scratch space.  All buffers are size * elem_size bytes, and size must
+   be a multiple of 8. */
+void h5py_bshuf_trans_bit_elem(const void *in, void *out, void *tmp,
+                               size_t size, size_t elem_size);
+
+/* Inverse of h5py_bshuf_trans_bit_elem */
+void h5py_bshuf_untrans_bit_elem(const void *in, void *out, void *tmp,
+                                 size_t size, size_t elem_size);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
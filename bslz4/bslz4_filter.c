@@ -0,0 +1,397 @@
+/***** Preamble block *********************************************************
+*
+* This file is part of h5py, a low-level Python interface to the HDF5 library.
+*
+* Copyright (C) 2020 Andrew Collette and contributors
+* http://h5py.org
+* License: BSD  (See LICENSE.txt for full license)
+*
+****** End preamble block ****************************************************/
+
+/*
+    Implements the bitshuffle filter for HDF5, with optional LZ4 compression
+    using the BSD-licensed LZ4 library by Yann Collet (http://www.lz4.org).
+
+    The on-disk format is that of the bitshuffle library by Kiyoshi Masui
+    (https://github.com/kiyo-masui/bitshuffle), filter ID 32008, so files
+    can be exchanged with any program using that filter.  The client data
+    values are:
+
+        0, 1    Format version, set by the filter
+        2       Element size in bytes, set by the filter
+        3       Block size in elements; 0 picks a default of about 8 kB
+        4       0 for bitshuffle only, 2 for bitshuffle + LZ4
+
+    With LZ4, a chunk is stored as the uncompressed size (8 bytes) and
+    block size in bytes (4 bytes), followed by each block's compressed size
+    (4 bytes) and data.  All integers are big-endian.  Elements left over
+    after the last block whose size is a multiple of 8 are stored as-is.
+
+    No Python-specific code is used.  The only public functions are
+    register_bslz4(void), which passes on the result from H5Zregister, and
+    bslz4_simd(void).
+*/
+
+#include <stdlib.h>
+#include <stdint.h>
+#include <string.h>
+#include "hdf5.h"
+#include "lz4.h"
+#include "bitshuffle.h"
+#include "bslz4_filter.h"
+
+#define PUSH_ERR(func, minor, str)  H5Epush1(__FILE__, func, __LINE__, H5E_PLINE, minor, str)
+
+/* Format version recorded in cd_values[0:2], as written by bitshuffle */
+#define BSLZ4_VERSION_MAJOR 0
+#define BSLZ4_VERSION_MINOR 4
+
+/* Block sizes must be a multiple of this many elements */
+#define BSLZ4_BLOCKED_MULT 8
+#define BSLZ4_TARGET_BLOCK_BYTES 8192
+#define BSLZ4_MIN_BLOCK 128
+
+#define BSLZ4_HEADER 12
+
+size_t bslz4_filter(unsigned flags, size_t cd_nelmts,
+            const unsigned cd_values[], size_t nbytes,
+            size_t *buf_size, void **buf);
+
+herr_t bslz4_set_local(hid_t dcpl, hid_t type, hid_t space);
+
+static const H5Z_class2_t filter_class = {
+    H5Z_CLASS_T_VERS,
+    (H5Z_filter_t)(H5PY_FILTER_BSLZ4),
+    1, 1,
+    "bitshuffle",
+    NULL,
+    (H5Z_set_local_func_t)(bslz4_set_local),
+    (H5Z_func_t)(bslz4_filter)
+};
+
+/* Try to register the filter, passing on the HDF5 return value */
+int register_bslz4(void){
+
+    int retval;
+
+    h5py_bshuf_init();
+
+    retval = H5Zregister(&filter_class);
+    if(retval<0){
+        PUSH_ERR("register_bslz4", H5E_CANTREGISTER, "Can't register bitshuffle filter");
+    }
+    return retval;
+}
+
+const char *bslz4_simd(void){
+    return h5py_bshuf_impl();
+}
+
+/*  Filter setup.  Options given by the user (block size, compression) are
+    moved up to slots 3 and 4, and the version and element size are stored
+    in slots 0-2.  A DCPL copied from an existing dataset already has all
+    five slots, in which case only the element size is updated.
+*/
+herr_t bslz4_set_local(hid_t dcpl, hid_t type, hid_t space){
+
+    herr_t r;
+    size_t i;
+    size_t elem_size;
+
+    unsigned int flags;
+    size_t nelements = 8;
+    unsigned values[] = {0,0,0,0,0,0,0,0,0,0,0};
+    unsigned user_values[] = {0,0,0,0,0,0,0,0};
+
+    r = H5Pget_filter_by_id2(dcpl, H5PY_FILTER_BSLZ4, &flags, &nelements,
+                             user_values, 0, NULL, NULL);
+    if(r<0) return -1;
+    if(nelements > 8) nelements = 8;
+
+    if(nelements >= 5){
+        for(i=0; i<nelements; i++) values[i] = user_values[i];
+    }else{
+        for(i=0; i<nelements; i++) values[i+3] = user_values[i];
+        nelements += 3;
+    }
+
+    values[0] = BSLZ4_VERSION_MAJOR;
+    values[1] = BSLZ4_VERSION_MINOR;
+
+    elem_size = H5Tget_size(type);
+    if(elem_size == 0) return -1;
+    values[2] = (unsigned)elem_size;
+
+    if(nelements > 3 && values[3] % BSLZ4_BLOCKED_MULT){
+        PUSH_ERR("bslz4_set_local", H5E_CALLBACK, "Bitshuffle block size must be a multiple of 8");
+        return -1;
+    }
+    if(nelements > 4 && values[4] != H5PY_BSLZ4_NOCOMPRESS && values[4] != H5PY_BSLZ4_COMPRESS_LZ4){
+        PUSH_ERR("bslz4_set_local", H5E_CALLBACK, "Unsupported bitshuffle compression");
+        return -1;
+    }
+
+    r = H5Pmodify_filter(dcpl, H5PY_FILTER_BSLZ4, flags, nelements, values);
+    if(r<0) return -1;
+
+    return 1;
+}
+
+
+static size_t default_block_size(size_t elem_size){
+    size_t block_size = BSLZ4_TARGET_BLOCK_BYTES / elem_size;
+    block_size = (block_size / BSLZ4_BLOCKED_MULT) * BSLZ4_BLOCKED_MULT;
+    return block_size > BSLZ4_MIN_BLOCK ? block_size : BSLZ4_MIN_BLOCK;
+}
+
+static void write_uint32_BE(uint8_t *p, uint32_t x){
+    int k;
+    for(k=3; k>=0; k--){ p[k] = (uint8_t)x; x >>= 8; }
+}
+
+static void write_uint64_BE(uint8_t *p, uint64_t x){
+    int k;
+    for(k=7; k>=0; k--){ p[k] = (uint8_t)x; x >>= 8; }
+}
+
+static uint32_t read_uint32_BE(const uint8_t *p){
+    uint32_t x = 0;
+    int k;
+    for(k=0; k<4; k++) x = (x << 8) | p[k];
+    return x;
+}
+
+static uint64_t read_uint64_BE(const uint8_t *p){
+    uint64_t x = 0;
+    int k;
+    for(k=0; k<8; k++) x = (x << 8) | p[k];
+    return x;
+}
+
+/* Elements in block number i of a chunk of size elements, 0 after the end */
+static size_t block_elements(size_t size, size_t block_size, size_t i){
+    size_t nfull = size / block_size;
+    size_t last;
+    if(i < nfull) return block_size;
+    if(i > nfull) return 0;
+    last = size % block_size;
+    return last - last % BSLZ4_BLOCKED_MULT;
+}
+
+/* Bitshuffle + LZ4 compress nbytes of in; returns the output size or 0 */
+static size_t compress_lz4(const uint8_t *in, size_t nbytes, size_t elem_size,
+                           size_t block_size, void **out_buf, size_t *out_size){
+    size_t size = nbytes / elem_size;
+    size_t block_bytes = block_size * elem_size;
+    size_t last_bytes = block_elements(size, block_size, size / block_size) * elem_size;
+    size_t work_bytes = size < block_size ? last_bytes : block_bytes;
+    size_t leftover = (size % BSLZ4_BLOCKED_MULT) * elem_size;
+    size_t bound, pos, n, i;
+    int count;
+    uint8_t *out = NULL, *tmp = NULL, *scratch = NULL;
+
+    /* Each block may grow to the LZ4 bound, plus its 4-byte size */
+    bound = BSLZ4_HEADER + leftover;
+    if(size >= block_size)
+        bound += (size / block_size) * (4 + (size_t)LZ4_compressBound((int)block_bytes));
+    if(last_bytes)
+        bound += 4 + (size_t)LZ4_compressBound((int)last_bytes);
+
+    out = (uint8_t *)malloc(bound);
+    tmp = (uint8_t *)malloc(work_bytes > 0 ? work_bytes : 1);
+    scratch = (uint8_t *)malloc(work_bytes > 0 ? work_bytes : 1);
+    if(out == NULL || tmp == NULL || scratch == NULL){
+        PUSH_ERR("bslz4_filter", H5E_CALLBACK, "Can't allocate compression buffer");
+        goto failed;
+    }
+
+    write_uint64_BE(out, nbytes);
+    write_uint32_BE(out + 8, (uint32_t)block_bytes);
+    pos = BSLZ4_HEADER;
+
+    for(i=0; (n = block_elements(size, block_size, i)) > 0; i++){
+        h5py_bshuf_trans_bit_elem(in, tmp, scratch, n, elem_size);
+        count = LZ4_compress_default((const char *)tmp, (char *)out + pos + 4,
+                                     (int)(n * elem_size), (int)(bound - pos - 4));
+        if(count <= 0){
+            PUSH_ERR("bslz4_filter", H5E_CALLBACK, "LZ4 compression failed");
+            goto failed;
+        }
+        write_uint32_BE(out + pos, (uint32_t)count);
+        pos += 4 + count;
+        in += n * elem_size;
+    }
+    memcpy(out + pos, in, leftover);
+    pos += leftover;
+
+    free(tmp);
+    free(scratch);
+    *out_buf = out;
+    *out_size = bound;
+    return pos;
+
+    failed:
+
+    free(out);
+    free(tmp);
+    free(scratch);
+    return 0;
+}
+
+/* Decompress a bitshuffle + LZ4 chunk; returns the output size or 0 */
+static size_t decompress_lz4(const uint8_t *in, size_t nbytes, size_t elem_size,
+                             void **out_buf, size_t *out_size){
+    const uint8_t *end = in + nbytes;
+    size_t size, block_size, block_bytes, leftover, n, i, csize;
+    uint64_t nbytes_out;
+    uint8_t *out = NULL, *pos, *tmp = NULL, *scratch = NULL;
+
+    if(nbytes < BSLZ4_HEADER) goto corrupt;
+    nbytes_out = read_uint64_BE(in);
+    block_bytes = read_uint32_BE(in + 8);
+    in += BSLZ4_HEADER;
+    if(nbytes_out % elem_size || block_bytes % (elem_size * BSLZ4_BLOCKED_MULT) || block_bytes == 0)
+        goto corrupt;
+    if(nbytes_out > (uint64_t)(size_t)-1 || block_bytes > LZ4_MAX_INPUT_SIZE) goto corrupt;
+
+    size = (size_t)(nbytes_out / elem_size);
+    block_size = block_bytes / elem_size;
+    leftover = (size % BSLZ4_BLOCKED_MULT) * elem_size;
+    if(block_bytes > nbytes_out) block_bytes = (size_t)nbytes_out;
+
+    out = (uint8_t *)malloc(nbytes_out > 0 ? (size_t)nbytes_out : 1);
+    tmp = (uint8_t *)malloc(block_bytes > 0 ? block_bytes : 1);
+    scratch = (uint8_t *)malloc(block_bytes > 0 ? block_bytes : 1);
+    if(out == NULL || tmp == NULL || scratch == NULL){
+        PUSH_ERR("bslz4_filter", H5E_CALLBACK, "Can't allocate decompression buffer");
+        goto failed;
+    }
+
+    pos = out;
+    for(i=0; (n = block_elements(size, block_size, i)) > 0; i++){
+        if(end - in < 4) goto corrupt;
+        csize = read_uint32_BE(in);
+        in += 4;
+        if(csize > (size_t)(end - in)) goto corrupt;
+        if(LZ4_decompress_safe((const char *)in, (char *)tmp, (int)csize,
+                               (int)(n * elem_size)) != (int)(n * elem_size))
+            goto corrupt;
+        h5py_bshuf_untrans_bit_elem(tmp, pos, scratch, n, elem_size);
+        in += csize;
+        pos += n * elem_size;
+    }
+    if((size_t)(end - in) < leftover) goto corrupt;
+    memcpy(pos, in, leftover);
+
+    free(tmp);
+    free(scratch);
+    *out_buf = out;
+    *out_size = (size_t)nbytes_out;
+    return (size_t)nbytes_out;
+
+    corrupt:
+
+    PUSH_ERR("bslz4_filter", H5E_CALLBACK, "Invalid data for bitshuffle/LZ4 decompression");
+
+    failed:
+
+    free(out);
+    free(tmp);
+    free(scratch);
+    return 0;
+}
+
+/* Bitshuffle (or unshuffle) without compression; output is the same size */
+static size_t shuffle_only(const uint8_t *in, size_t nbytes, size_t elem_size,
+                           size_t block_size, int reverse,
+                           void **out_buf, size_t *out_size){
+    size_t size = nbytes / elem_size;
+    size_t block_bytes = (size < block_size ? size : block_size) * elem_size;
+    size_t n, i;
+    uint8_t *out, *pos, *scratch;
+
+    out = (uint8_t *)malloc(nbytes > 0 ? nbytes : 1);
+    scratch = (uint8_t *)malloc(block_bytes > 0 ? block_bytes : 1);
+    if(out == NULL || scratch == NULL){
+        PUSH_ERR("bslz4_filter", H5E_CALLBACK, "Can't allocate bitshuffle buffer");
+        free(out);
+        free(scratch);
+        return 0;
+    }
+
+    pos = out;
+    for(i=0; (n = block_elements(size, block_size, i)) > 0; i++){
+        if(reverse){
+            h5py_bshuf_untrans_bit_elem(in, pos, scratch, n, elem_size);
+        }else{
+            h5py_bshuf_trans_bit_elem(in, pos, scratch, n, elem_size);
+        }
+        in += n * elem_size;
+        pos += n * elem_size;
+    }
+    memcpy(pos, in, (size % BSLZ4_BLOCKED_MULT) * elem_size);
+
+    free(scratch);
+    *out_buf = out;
+    *out_size = nbytes;
+    return nbytes;
+}
+
+
+/* The filter function */
+size_t bslz4_filter(unsigned flags, size_t cd_nelmts,
+            const unsigned cd_values[], size_t nbytes,
+            size_t *buf_size, void **buf){
+
+    void *outbuf = NULL;
+    size_t outbuf_size = 0;
+    size_t status;
+    size_t elem_size, block_size = 0;
+    int lz4;
+
+    if(cd_nelmts < 3 || cd_values[2] == 0){
+        PUSH_ERR("bslz4_filter", H5E_CALLBACK, "Not enough parameters for bitshuffle filter");
+        return 0;
+    }
+    elem_size = cd_values[2];
+    if(cd_nelmts > 3) block_size = cd_values[3];
+    if(block_size == 0) block_size = default_block_size(elem_size);
+    if(block_size % BSLZ4_BLOCKED_MULT){
+        PUSH_ERR("bslz4_filter", H5E_CALLBACK, "Bitshuffle block size must be a multiple of 8");
+        return 0;
+    }
+    if(block_size > LZ4_MAX_INPUT_SIZE / elem_size){
+        PUSH_ERR("bslz4_filter", H5E_CALLBACK, "Bitshuffle block size too large");
+        return 0;
+    }
+    lz4 = cd_nelmts > 4 && cd_values[4] == H5PY_BSLZ4_COMPRESS_LZ4;
+    if(cd_nelmts > 4 && !lz4 && cd_values[4] != H5PY_BSLZ4_NOCOMPRESS){
+        PUSH_ERR("bslz4_filter", H5E_CALLBACK, "Unsupported bitshuffle compression");
+        return 0;
+    }
+
+    if(lz4 && (flags & H5Z_FLAG_REVERSE)){
+        status = decompress_lz4((const uint8_t *)*buf, nbytes, elem_size,
+                                &outbuf, &outbuf_size);
+    }else{
+        if(nbytes % elem_size){
+            PUSH_ERR("bslz4_filter", H5E_CALLBACK, "Chunk size is not a whole number of elements");
+            return 0;
+        }
+        if(lz4){
+            status = compress_lz4((const uint8_t *)*buf, nbytes, elem_size,
+                                  block_size, &outbuf, &outbuf_size);
+        }else{
+            status = shuffle_only((const uint8_t *)*buf, nbytes, elem_size,
+                                  block_size, flags & H5Z_FLAG_REVERSE,
+                                  &outbuf, &outbuf_size);
+        }
+    }
+
+    if(status == 0) return 0;
+
+    free(*buf);
+    *buf = outbuf;
+    *buf_size = outbuf_size;
+    return status;
+}
@@ -0,0 +1,46 @@
+/***** Preamble block *********************************************************
+*
+* This file is part of h5py, a low-level Python interface to the HDF5 library.
+*
+* Copyright (C) 2020 Andrew Collette and contributors
+* http://h5py.org
+* License: BSD  (See LICENSE.txt for full license)
+*
+****** End preamble block ****************************************************/
+
+
+#ifndef H5PY_BSLZ4_H
+#define H5PY_BSLZ4_H
+
+#include "hdf5.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/* Filter ID registered with the HDF Group for the bitshuffle filter */
+#define H5PY_FILTER_BSLZ4 32008
+
+/* Values of the compression slot (cd_values[4]) understood by the filter */
+#define H5PY_BSLZ4_NOCOMPRESS 0
+#define H5PY_BSLZ4_COMPRESS_LZ4 2
+
+/* Register the filter with the library. Returns a negative value on failure,
+   and a non-negative value on success.
+*/
+int register_bslz4(void);
+
+/* The filter callbacks, for code which wraps the filter (e.g. to time it) */
+size_t bslz4_filter(unsigned flags, size_t cd_nelmts,
+                    const unsigned cd_values[], size_t nbytes,
+                    size_t *buf_size, void **buf);
+herr_t bslz4_set_local(hid_t dcpl, hid_t type, hid_t space);
+
+/* Name of the bit transposition code in use ("avx2", "sse2" or "scalar") */
+const char *bslz4_simd(void);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
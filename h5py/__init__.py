@@ -47,15 +47,16 @@ from ._conv import register_converters as _register_converters, \
 _register_converters()
 atexit.register(_unregister_converters)
 
-from .h5z import _register_lzf
+from .h5z import _register_lzf, _register_bslz4
 _register_lzf()
+_register_bslz4()
 
 
 # --- Public API --------------------------------------------------------------
 
 from . import h5a, h5d, h5ds, h5f, h5fd, h5g, h5r, h5s, h5t, h5p, h5z, h5pl
 
-from ._hl import filters
+from ._hl import chunkcache, filters, ranged, trace, tune
 from ._hl.base import is_hdf5, HLObject, Empty
 from ._hl.files import (
     File,
@@ -65,6 +66,7 @@ from ._hl.files import (
 )
 from ._hl.group import Group, SoftLink, ExternalLink, HardLink
 from ._hl.dataset import Dataset
+from ._hl.chunkcopy import copy_chunks
 from ._hl.datatype import Datatype
 from ._hl.attrs import AttributeManager
 
@@ -0,0 +1,13540 @@
+/* Generated by Cython 0.29.37 */
+
+/* BEGIN: Cython Metadata
+{
+    "distutils": {
+        "define_macros": [
+            [
+                "H5_USE_18_API",
+                null
+            ],
+            [
+                "NPY_NO_DEPRECATED_API",
+                0
+            ],
+            [
+                "LZ4LIB_VISIBILITY",
+                "__attribute__((visibility(\"hidden\")))"
+            ]
+        ],
+        "depends": [
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/core/include/numpy/arrayobject.h",
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/core/include/numpy/arrayscalars.h",
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/core/include/numpy/ndarrayobject.h",
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/core/include/numpy/ndarraytypes.h",
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/core/include/numpy/ufuncobject.h",
+            "/root/package/bslz4/bslz4_filter.h",
+            "/root/package/lzf/lzf_filter.h",
+            "/usr/lib/x86_64-linux-gnu/hdf5/serial/include/H5Cpublic.h",
+            "/usr/lib/x86_64-linux-gnu/hdf5/serial/include/hdf5.h",
+            "/usr/lib/x86_64-linux-gnu/hdf5/serial/include/hdf5_hl.h",
+            "h5py/api_compat.h"
+        ],
+        "include_dirs": [
+            "./h5py",
+            "/usr/lib/x86_64-linux-gnu/hdf5/serial/include",
+            "/root/package/lzf",
+            "/root/package/bslz4",
+            "/root/package/lzf/lzf",
+            "/root/package/bslz4/lz4",
+            "/root/.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/core/include"
+        ],
+        "libraries": [
+            "hdf5",
+            "hdf5_hl"
+        ],
+        "library_dirs": [
+            "/usr/lib/x86_64-linux-gnu/hdf5/serial/lib"
+        ],
+        "name": "h5py._conv",
+        "runtime_library_dirs": [
+            "/usr/lib/x86_64-linux-gnu/hdf5/serial/lib"
+        ],
+        "sources": [
+            "/root/package/h5py/_conv.pyx"
+        ]
+    },
+    "module_name": "h5py._conv"
+}
+END: Cython Metadata */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
+    #error Cython requires Python 2.6+ or Python 3.3+.
+#else
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
+#define CYTHON_FUTURE_DIVISION 1
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef HAVE_LONG_LONG
+  #if PY_VERSION_HEX >= 0x02070000
+    #define HAVE_LONG_LONG
+  #endif
+#endif
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#ifdef PYPY_VERSION
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #if PY_VERSION_HEX < 0x03050000
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PYSTON_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_ASYNC_SLOTS
+  #define CYTHON_USE_ASYNC_SLOTS 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #elif !defined(CYTHON_USE_PYTYPE_LOOKUP)
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #if PY_MAJOR_VERSION < 3
+    #undef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 0
+  #elif !defined(CYTHON_USE_ASYNC_SLOTS)
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #if PY_VERSION_HEX < 0x02070000
+    #undef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
+  #endif
+  #ifndef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
+  #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+#endif
+#if !defined(CYTHON_FAST_PYCCALL)
+#define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_MAYBE_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_MAYBE_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#ifdef _MSC_VER
+    #ifndef _MSC_STDINT_H_
+        #if _MSC_VER < 1300
+           typedef unsigned char     uint8_t;
+           typedef unsigned int      uint32_t;
+        #else
+           typedef unsigned __int8   uint8_t;
+           typedef unsigned __int32  uint32_t;
+        #endif
+    #endif
+#else
+   #include <stdint.h>
+#endif
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus) && __cplusplus >= 201103L
+    #if __has_cpp_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH [[fallthrough]]
+    #elif __has_cpp_attribute(clang::fallthrough)
+      #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+    #elif __has_cpp_attribute(gnu::fallthrough)
+      #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__ ) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#if PY_MAJOR_VERSION < 3
+  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a+k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyClass_Type
+#else
+  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
+  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+  #define __Pyx_DefaultClassType PyType_Type
+#endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+#endif
+#if CYTHON_FAST_PYCCALL
+#define __Pyx_PyFastCFunction_Check(func)\
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
+#else
+#define __Pyx_PyFastCFunction_Check(func) 0
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
+#if CYTHON_COMPILING_IN_PYSTON
+  #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if !CYTHON_FAST_THREAD_STATE || PY_VERSION_HEX < 0x02070000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x03060000
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#elif PY_VERSION_HEX >= 0x03000000
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_Current
+#endif
+#if PY_VERSION_HEX < 0x030700A2 && !defined(PyThread_tss_create) && !defined(Py_tss_NEEDS_INIT)
+#include "pythread.h"
+#define Py_tss_NEEDS_INIT 0
+typedef int Py_tss_t;
+static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
+  *key = PyThread_create_key();
+  return 0;
+}
+static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
+  Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
+  *key = Py_tss_NEEDS_INIT;
+  return key;
+}
+static CYTHON_INLINE void PyThread_tss_free(Py_tss_t *key) {
+  PyObject_Free(key);
+}
+static CYTHON_INLINE int PyThread_tss_is_created(Py_tss_t *key) {
+  return *key != Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE void PyThread_tss_delete(Py_tss_t *key) {
+  PyThread_delete_key(*key);
+  *key = Py_tss_NEEDS_INIT;
+}
+static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
+  return PyThread_set_key_value(*key, value);
+}
+static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
+  return PyThread_get_key_value(*key);
+}
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#if PY_MAJOR_VERSION >= 3 || CYTHON_FUTURE_DIVISION
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#else
+  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
+  #define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceDivide(x,y)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStr(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+#else
+#define __Pyx_PyDict_GetItemStr(dict, name)  PyDict_GetItem(dict, name)
+#endif
+#if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
+  #define CYTHON_PEP393_ENABLED 1
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+#else
+  #define CYTHON_PEP393_ENABLED 0
+  #define PyUnicode_1BYTE_KIND  1
+  #define PyUnicode_2BYTE_KIND  2
+  #define PyUnicode_4BYTE_KIND  4
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_SIZE(u)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) ((Py_UCS4)(PyUnicode_AS_UNICODE(u)[i]))
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((sizeof(Py_UNICODE) == 2) ? 65535 : 1114111)
+  #define __Pyx_PyUnicode_KIND(u)         (sizeof(Py_UNICODE))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)PyUnicode_AS_UNICODE(u))
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)(k), (Py_UCS4)(((Py_UNICODE*)d)[i]))
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  (((void)(k)), ((Py_UNICODE*)d)[i] = ch)
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_SIZE(u))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_Contains)
+  #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyByteArray_Check)
+  #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
+  #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+#endif
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
+#else
+  #define __Pyx_PyString_Format(a, b)  PyString_Format(a, b)
+#endif
+#if PY_MAJOR_VERSION < 3 && !defined(PyObject_ASCII)
+  #define PyObject_ASCII(o)            PyObject_Repr(o)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBaseString_Type            PyUnicode_Type
+  #define PyStringObject               PyUnicodeObject
+  #define PyString_Type                PyUnicode_Type
+  #define PyString_Check               PyUnicode_Check
+  #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
+  #define PyObject_Unicode             PyObject_Str
+#endif
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
+  #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
+#else
+  #define __Pyx_PyBaseString_Check(obj) (PyString_Check(obj) || PyUnicode_Check(obj))
+  #define __Pyx_PyBaseString_CheckExact(obj) (PyString_CheckExact(obj) || PyUnicode_CheckExact(obj))
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
+#endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+#else
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyIntObject                  PyLongObject
+  #define PyInt_Type                   PyLong_Type
+  #define PyInt_Check(op)              PyLong_Check(op)
+  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
+  #define PyInt_FromString             PyLong_FromString
+  #define PyInt_FromUnicode            PyLong_FromUnicode
+  #define PyInt_FromLong               PyLong_FromLong
+  #define PyInt_FromSize_t             PyLong_FromSize_t
+  #define PyInt_FromSsize_t            PyLong_FromSsize_t
+  #define PyInt_AsLong                 PyLong_AsLong
+  #define PyInt_AS_LONG                PyLong_AS_LONG
+  #define PyInt_AsSsize_t              PyLong_AsSsize_t
+  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
+  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
+  #define PyNumber_Int                 PyNumber_Long
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define PyBoolObject                 PyLongObject
+#endif
+#if PY_MAJOR_VERSION >= 3 && CYTHON_COMPILING_IN_PYPY
+  #ifndef PyUnicode_InternFromString
+    #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+  #endif
+#endif
+#if PY_VERSION_HEX < 0x030200A4
+  typedef long Py_hash_t;
+  #define __Pyx_PyInt_FromHash_t PyInt_FromLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
+#else
+  #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#endif
+#if PY_MAJOR_VERSION >= 3
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
+#else
+  #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
+#endif
+#if CYTHON_USE_ASYNC_SLOTS
+  #if PY_VERSION_HEX >= 0x030500B1
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+    #define __Pyx_PyType_AsAsync(obj) (Py_TYPE(obj)->tp_as_async)
+  #else
+    #define __Pyx_PyType_AsAsync(obj) ((__Pyx_PyAsyncMethodsStruct*) (Py_TYPE(obj)->tp_reserved))
+  #endif
+#else
+  #define __Pyx_PyType_AsAsync(obj) NULL
+#endif
+#ifndef __Pyx_PyAsyncMethodsStruct
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+    } __Pyx_PyAsyncMethodsStruct;
+#endif
+
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#ifdef NAN
+#define __PYX_NAN() ((float) NAN)
+#else
+static CYTHON_INLINE float __PYX_NAN() {
+  float value;
+  memset(&value, 0xFF, sizeof(value));
+  return value;
+}
+#endif
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifndef __PYX_EXTERN_C
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#define __PYX_HAVE__h5py___conv
+#define __PYX_HAVE_API__h5py___conv
+/* Early includes */
+#include <string.h>
+#include <stdlib.h>
+#include <stddef.h>
+#include <time.h>
+#include <stdio.h>
+#include "numpy/arrayobject.h"
+#include "numpy/ndarrayobject.h"
+#include "numpy/ndarraytypes.h"
+#include "numpy/arrayscalars.h"
+#include "numpy/ufuncobject.h"
+
+    /* NumPy API declarations from "numpy/__init__.pxd" */
+    
+#include "unistd.h"
+#include "api_compat.h"
+#include "lzf_filter.h"
+#include "bslz4_filter.h"
+#include "H5Cpublic.h"
+#include "hdf5.h"
+#include "hdf5_hl.h"
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* encoding;
+                const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
+
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+#define __Pyx_PyByteArray_FromString(s) PyByteArray_FromStringAndSize((const char*)s, strlen((const char*)s))
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyStr_FromString        __Pyx_PyBytes_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#else
+    #define __Pyx_PyStr_FromString        __Pyx_PyUnicode_FromString
+    #define __Pyx_PyStr_FromStringAndSize __Pyx_PyUnicode_FromStringAndSize
+#endif
+#define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+#define __Pyx_PyObject_AsWritableString(s)    ((char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyStr_FromCString(s)     __Pyx_PyStr_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
+    const Py_UNICODE *u_end = u;
+    while (*u_end++) ;
+    return (size_t)(u_end - u - 1);
+}
+#define __Pyx_PyUnicode_FromUnicode(u)       PyUnicode_FromUnicode(u, __Pyx_Py_UNICODE_strlen(u))
+#define __Pyx_PyUnicode_FromUnicodeAndLength PyUnicode_FromUnicode
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+#define __Pyx_NewRef(obj) (Py_INCREF(obj), obj)
+#define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#else
+#define __pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#endif
+#define __pyx_PyFloat_AsFloat(x) ((float) __pyx_PyFloat_AsDouble(x))
+#if PY_MAJOR_VERSION >= 3
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#else
+#define __Pyx_PyNumber_Int(x) (PyInt_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Int(x))
+#endif
+#define __Pyx_PyNumber_Float(x) (PyFloat_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Float(x))
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+static int __Pyx_sys_getdefaultencoding_not_ascii;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    PyObject* ascii_chars_u = NULL;
+    PyObject* ascii_chars_b = NULL;
+    const char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    if (strcmp(default_encoding_c, "ascii") == 0) {
+        __Pyx_sys_getdefaultencoding_not_ascii = 0;
+    } else {
+        char ascii_chars[128];
+        int c;
+        for (c = 0; c < 128; c++) {
+            ascii_chars[c] = c;
+        }
+        __Pyx_sys_getdefaultencoding_not_ascii = 1;
+        ascii_chars_u = PyUnicode_DecodeASCII(ascii_chars, 128, NULL);
+        if (!ascii_chars_u) goto bad;
+        ascii_chars_b = PyUnicode_AsEncodedString(ascii_chars_u, default_encoding_c, NULL);
+        if (!ascii_chars_b || !PyBytes_Check(ascii_chars_b) || memcmp(ascii_chars, PyBytes_AS_STRING(ascii_chars_b), 128) != 0) {
+            PyErr_Format(
+                PyExc_ValueError,
+                "This module compiled with c_string_encoding=ascii, but default encoding '%.200s' is not a superset of ascii.",
+                default_encoding_c);
+            goto bad;
+        }
+        Py_DECREF(ascii_chars_u);
+        Py_DECREF(ascii_chars_b);
+    }
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    Py_XDECREF(ascii_chars_u);
+    Py_XDECREF(ascii_chars_b);
+    return -1;
+}
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT && PY_MAJOR_VERSION >= 3
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#else
+#define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#if __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+static char* __PYX_DEFAULT_STRING_ENCODING;
+static int __Pyx_init_sys_getdefaultencoding_params(void) {
+    PyObject* sys;
+    PyObject* default_encoding = NULL;
+    char* default_encoding_c;
+    sys = PyImport_ImportModule("sys");
+    if (!sys) goto bad;
+    default_encoding = PyObject_CallMethod(sys, (char*) (const char*) "getdefaultencoding", NULL);
+    Py_DECREF(sys);
+    if (!default_encoding) goto bad;
+    default_encoding_c = PyBytes_AsString(default_encoding);
+    if (!default_encoding_c) goto bad;
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
+    if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
+    strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
+    Py_DECREF(default_encoding);
+    return 0;
+bad:
+    Py_XDECREF(default_encoding);
+    return -1;
+}
+#endif
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+
+static PyObject *__pyx_m = NULL;
+static PyObject *__pyx_d;
+static PyObject *__pyx_b;
+static PyObject *__pyx_cython_runtime = NULL;
+static PyObject *__pyx_empty_tuple;
+static PyObject *__pyx_empty_bytes;
+static PyObject *__pyx_empty_unicode;
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * __pyx_cfilenm= __FILE__;
+static const char *__pyx_filename;
+
+/* Header.proto */
+#if !defined(CYTHON_CCOMPLEX)
+  #if defined(__cplusplus)
+    #define CYTHON_CCOMPLEX 1
+  #elif (defined(_Complex_I) && !defined(_MSC_VER))
+    #define CYTHON_CCOMPLEX 1
+  #else
+    #define CYTHON_CCOMPLEX 0
+  #endif
+#endif
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    #include <complex>
+  #else
+    #include <complex.h>
+  #endif
+#endif
+#if CYTHON_CCOMPLEX && !defined(__cplusplus) && defined(__sun__) && defined(__GNUC__)
+  #undef _Complex_I
+  #define _Complex_I 1.0fj
+#endif
+
+
+static const char *__pyx_f[] = {
+  "h5py/_conv.pyx",
+  "__init__.pxd",
+  "type.pxd",
+  "h5py/h5r.pxd",
+  "h5py/_objects.pxd",
+  "h5py/h5t.pxd",
+};
+/* ForceInitThreads.proto */
+#ifndef __PYX_FORCE_INIT_THREADS
+  #define __PYX_FORCE_INIT_THREADS 0
+#endif
+
+/* NoFastGil.proto */
+#define __Pyx_PyGILState_Ensure PyGILState_Ensure
+#define __Pyx_PyGILState_Release PyGILState_Release
+#define __Pyx_FastGIL_Remember()
+#define __Pyx_FastGIL_Forget()
+#define __Pyx_FastGilFuncInit()
+
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":688
+ * # in Cython to enable them only on the right systems.
+ * 
+ * ctypedef npy_int8       int8_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_int16      int16_t
+ * ctypedef npy_int32      int32_t
+ */
+typedef npy_int8 __pyx_t_5numpy_int8_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":689
+ * 
+ * ctypedef npy_int8       int8_t
+ * ctypedef npy_int16      int16_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_int32      int32_t
+ * ctypedef npy_int64      int64_t
+ */
+typedef npy_int16 __pyx_t_5numpy_int16_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":690
+ * ctypedef npy_int8       int8_t
+ * ctypedef npy_int16      int16_t
+ * ctypedef npy_int32      int32_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_int64      int64_t
+ * #ctypedef npy_int96      int96_t
+ */
+typedef npy_int32 __pyx_t_5numpy_int32_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":691
+ * ctypedef npy_int16      int16_t
+ * ctypedef npy_int32      int32_t
+ * ctypedef npy_int64      int64_t             # <<<<<<<<<<<<<<
+ * #ctypedef npy_int96      int96_t
+ * #ctypedef npy_int128     int128_t
+ */
+typedef npy_int64 __pyx_t_5numpy_int64_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":695
+ * #ctypedef npy_int128     int128_t
+ * 
+ * ctypedef npy_uint8      uint8_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uint16     uint16_t
+ * ctypedef npy_uint32     uint32_t
+ */
+typedef npy_uint8 __pyx_t_5numpy_uint8_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":696
+ * 
+ * ctypedef npy_uint8      uint8_t
+ * ctypedef npy_uint16     uint16_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uint32     uint32_t
+ * ctypedef npy_uint64     uint64_t
+ */
+typedef npy_uint16 __pyx_t_5numpy_uint16_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":697
+ * ctypedef npy_uint8      uint8_t
+ * ctypedef npy_uint16     uint16_t
+ * ctypedef npy_uint32     uint32_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uint64     uint64_t
+ * #ctypedef npy_uint96     uint96_t
+ */
+typedef npy_uint32 __pyx_t_5numpy_uint32_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":698
+ * ctypedef npy_uint16     uint16_t
+ * ctypedef npy_uint32     uint32_t
+ * ctypedef npy_uint64     uint64_t             # <<<<<<<<<<<<<<
+ * #ctypedef npy_uint96     uint96_t
+ * #ctypedef npy_uint128    uint128_t
+ */
+typedef npy_uint64 __pyx_t_5numpy_uint64_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":702
+ * #ctypedef npy_uint128    uint128_t
+ * 
+ * ctypedef npy_float32    float32_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_float64    float64_t
+ * #ctypedef npy_float80    float80_t
+ */
+typedef npy_float32 __pyx_t_5numpy_float32_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":703
+ * 
+ * ctypedef npy_float32    float32_t
+ * ctypedef npy_float64    float64_t             # <<<<<<<<<<<<<<
+ * #ctypedef npy_float80    float80_t
+ * #ctypedef npy_float128   float128_t
+ */
+typedef npy_float64 __pyx_t_5numpy_float64_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":712
+ * # The int types are mapped a bit surprising --
+ * # numpy.int corresponds to 'l' and numpy.long to 'q'
+ * ctypedef npy_long       int_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_longlong   longlong_t
+ * 
+ */
+typedef npy_long __pyx_t_5numpy_int_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":713
+ * # numpy.int corresponds to 'l' and numpy.long to 'q'
+ * ctypedef npy_long       int_t
+ * ctypedef npy_longlong   longlong_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_ulong      uint_t
+ */
+typedef npy_longlong __pyx_t_5numpy_longlong_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":715
+ * ctypedef npy_longlong   longlong_t
+ * 
+ * ctypedef npy_ulong      uint_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_ulonglong  ulonglong_t
+ * 
+ */
+typedef npy_ulong __pyx_t_5numpy_uint_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":716
+ * 
+ * ctypedef npy_ulong      uint_t
+ * ctypedef npy_ulonglong  ulonglong_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_intp       intp_t
+ */
+typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":718
+ * ctypedef npy_ulonglong  ulonglong_t
+ * 
+ * ctypedef npy_intp       intp_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_uintp      uintp_t
+ * 
+ */
+typedef npy_intp __pyx_t_5numpy_intp_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":719
+ * 
+ * ctypedef npy_intp       intp_t
+ * ctypedef npy_uintp      uintp_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_double     float_t
+ */
+typedef npy_uintp __pyx_t_5numpy_uintp_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":721
+ * ctypedef npy_uintp      uintp_t
+ * 
+ * ctypedef npy_double     float_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_double     double_t
+ * ctypedef npy_longdouble longdouble_t
+ */
+typedef npy_double __pyx_t_5numpy_float_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":722
+ * 
+ * ctypedef npy_double     float_t
+ * ctypedef npy_double     double_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_longdouble longdouble_t
+ * 
+ */
+typedef npy_double __pyx_t_5numpy_double_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":723
+ * ctypedef npy_double     float_t
+ * ctypedef npy_double     double_t
+ * ctypedef npy_longdouble longdouble_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_cfloat      cfloat_t
+ */
+typedef npy_longdouble __pyx_t_5numpy_longdouble_t;
+
+/* "api_types_ext.pxd":20
+ * from libc.string cimport strlen, strchr, strcpy, strncpy, strcmp,\
+ *                          strdup, strdup, memcpy, memset
+ * ctypedef long size_t             # <<<<<<<<<<<<<<
+ * from libc.time cimport time_t
+ * 
+ */
+typedef long __pyx_t_4h5py_13api_types_ext_size_t;
+/* Declarations.proto */
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    typedef ::std::complex< float > __pyx_t_float_complex;
+  #else
+    typedef float _Complex __pyx_t_float_complex;
+  #endif
+#else
+    typedef struct { float real, imag; } __pyx_t_float_complex;
+#endif
+static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float, float);
+
+/* Declarations.proto */
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    typedef ::std::complex< double > __pyx_t_double_complex;
+  #else
+    typedef double _Complex __pyx_t_double_complex;
+  #endif
+#else
+    typedef struct { double real, imag; } __pyx_t_double_complex;
+#endif
+static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double, double);
+
+
+/*--- Type declarations ---*/
+struct __pyx_obj_4h5py_3h5r_Reference;
+struct __pyx_obj_4h5py_3h5r_RegionReference;
+struct __pyx_obj_4h5py_8_objects_ObjectID;
+struct __pyx_obj_4h5py_3h5t_TypeID;
+struct __pyx_obj_4h5py_3h5t_TypeArrayID;
+struct __pyx_obj_4h5py_3h5t_TypeOpaqueID;
+struct __pyx_obj_4h5py_3h5t_TypeStringID;
+struct __pyx_obj_4h5py_3h5t_TypeVlenID;
+struct __pyx_obj_4h5py_3h5t_TypeTimeID;
+struct __pyx_obj_4h5py_3h5t_TypeBitfieldID;
+struct __pyx_obj_4h5py_3h5t_TypeReferenceID;
+struct __pyx_obj_4h5py_3h5t_TypeAtomicID;
+struct __pyx_obj_4h5py_3h5t_TypeIntegerID;
+struct __pyx_obj_4h5py_3h5t_TypeFloatID;
+struct __pyx_obj_4h5py_3h5t_TypeCompositeID;
+struct __pyx_obj_4h5py_3h5t_TypeEnumID;
+struct __pyx_obj_4h5py_3h5t_TypeCompoundID;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":725
+ * ctypedef npy_longdouble longdouble_t
+ * 
+ * ctypedef npy_cfloat      cfloat_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_cdouble     cdouble_t
+ * ctypedef npy_clongdouble clongdouble_t
+ */
+typedef npy_cfloat __pyx_t_5numpy_cfloat_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":726
+ * 
+ * ctypedef npy_cfloat      cfloat_t
+ * ctypedef npy_cdouble     cdouble_t             # <<<<<<<<<<<<<<
+ * ctypedef npy_clongdouble clongdouble_t
+ * 
+ */
+typedef npy_cdouble __pyx_t_5numpy_cdouble_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":727
+ * ctypedef npy_cfloat      cfloat_t
+ * ctypedef npy_cdouble     cdouble_t
+ * ctypedef npy_clongdouble clongdouble_t             # <<<<<<<<<<<<<<
+ * 
+ * ctypedef npy_cdouble     complex_t
+ */
+typedef npy_clongdouble __pyx_t_5numpy_clongdouble_t;
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":729
+ * ctypedef npy_clongdouble clongdouble_t
+ * 
+ * ctypedef npy_cdouble     complex_t             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):
+ */
+typedef npy_cdouble __pyx_t_5numpy_complex_t;
+union __pyx_t_4h5py_3h5r_ref_u;
+
+/* "h5r.pxd":21
+ *     uint8_t data[12] # sizeof(haddr_t) + 4 == sizeof(signed long long) + 4
+ * ELSE:
+ *   ctypedef unsigned char hdset_reg_ref_t[12]             # <<<<<<<<<<<<<<
+ * 
+ * cdef union ref_u:
+ */
+typedef unsigned char __pyx_t_4h5py_3h5r_hdset_reg_ref_t[12];
+
+/* "h5r.pxd":23
+ *   ctypedef unsigned char hdset_reg_ref_t[12]
+ * 
+ * cdef union ref_u:             # <<<<<<<<<<<<<<
+ *     hobj_ref_t         obj_ref
+ *     hdset_reg_ref_t    reg_ref
+ */
+union __pyx_t_4h5py_3h5r_ref_u {
+  hobj_ref_t obj_ref;
+  __pyx_t_4h5py_3h5r_hdset_reg_ref_t reg_ref;
+};
+struct __pyx_opt_args_4h5py_3h5t_py_create;
+
+/* "h5t.pxd":72
+ * cdef hid_t H5PY_OBJ
+ * cdef char* H5PY_PYTHON_OPAQUE_TAG
+ * cpdef TypeID py_create(object dtype, bint logical=*, bint aligned=*)             # <<<<<<<<<<<<<<
+ */
+struct __pyx_opt_args_4h5py_3h5t_py_create {
+  int __pyx_n;
+  int logical;
+  int aligned;
+};
+struct __pyx_opt_args_4h5py_5utils_check_numpy_read;
+struct __pyx_opt_args_4h5py_5utils_check_numpy_write;
+
+/* "utils.pxd":16
+ * cdef void efree(void* ptr)
+ * 
+ * cpdef int check_numpy_read(ndarray arr, hid_t space_id=*) except -1             # <<<<<<<<<<<<<<
+ * cpdef int check_numpy_write(ndarray arr, hid_t space_id=*) except -1
+ * 
+ */
+struct __pyx_opt_args_4h5py_5utils_check_numpy_read {
+  int __pyx_n;
+  hid_t space_id;
+};
+
+/* "utils.pxd":17
+ * 
+ * cpdef int check_numpy_read(ndarray arr, hid_t space_id=*) except -1
+ * cpdef int check_numpy_write(ndarray arr, hid_t space_id=*) except -1             # <<<<<<<<<<<<<<
+ * 
+ * cdef int convert_tuple(object tuple, hsize_t *dims, hsize_t rank) except -1
+ */
+struct __pyx_opt_args_4h5py_5utils_check_numpy_write {
+  int __pyx_n;
+  hid_t space_id;
+};
+struct __pyx_t_4h5py_5_conv_conv_size_t;
+typedef struct __pyx_t_4h5py_5_conv_conv_size_t __pyx_t_4h5py_5_conv_conv_size_t;
+struct __pyx_t_4h5py_5_conv_conv_enum_t;
+struct __pyx_t_4h5py_5_conv_vlen_t;
+
+/* "h5py/_conv.pyx":46
+ * 
+ * 
+ * ctypedef int (*conv_operator_t)(void* ipt, void* opt, void* bkg, void* priv) except -1             # <<<<<<<<<<<<<<
+ * ctypedef herr_t (*init_operator_t)(hid_t src, hid_t dst, void** priv) except -1
+ * 
+ */
+typedef int (*__pyx_t_4h5py_5_conv_conv_operator_t)(void *, void *, void *, void *);
+
+/* "h5py/_conv.pyx":47
+ * 
+ * ctypedef int (*conv_operator_t)(void* ipt, void* opt, void* bkg, void* priv) except -1
+ * ctypedef herr_t (*init_operator_t)(hid_t src, hid_t dst, void** priv) except -1             # <<<<<<<<<<<<<<
+ * 
+ * # Generic conversion callback
+ */
+typedef herr_t (*__pyx_t_4h5py_5_conv_init_operator_t)(hid_t, hid_t, void **);
+
+/* "h5py/_conv.pyx":127
+ * # Generic conversion
+ * 
+ * ctypedef struct conv_size_t:             # <<<<<<<<<<<<<<
+ *     size_t src_size
+ *     size_t dst_size
+ */
+struct __pyx_t_4h5py_5_conv_conv_size_t {
+  size_t src_size;
+  size_t dst_size;
+  int cset;
+};
+
+/* "h5py/_conv.pyx":485
+ * # Enum to integer converter
+ * 
+ * cdef struct conv_enum_t:             # <<<<<<<<<<<<<<
+ *     size_t src_size
+ *     size_t dst_size
+ */
+struct __pyx_t_4h5py_5_conv_conv_enum_t {
+  size_t src_size;
+  size_t dst_size;
+};
+
+/* "h5py/_conv.pyx":679
+ * 
+ * 
+ * cdef struct vlen_t:             # <<<<<<<<<<<<<<
+ *     size_t len
+ *     void* ptr
+ */
+struct __pyx_t_4h5py_5_conv_vlen_t {
+  size_t len;
+  void *ptr;
+};
+
+/* "h5r.pxd":27
+ *     hdset_reg_ref_t    reg_ref
+ * 
+ * cdef class Reference:             # <<<<<<<<<<<<<<
+ * 
+ *     cdef ref_u ref
+ */
+struct __pyx_obj_4h5py_3h5r_Reference {
+  PyObject_HEAD
+  union __pyx_t_4h5py_3h5r_ref_u ref;
+  int typecode;
+  size_t typesize;
+};
+
+
+/* "h5r.pxd":33
+ *     cdef readonly size_t typesize
+ * 
+ * cdef class RegionReference(Reference):             # <<<<<<<<<<<<<<
+ *     pass
+ */
+struct __pyx_obj_4h5py_3h5r_RegionReference {
+  struct __pyx_obj_4h5py_3h5r_Reference __pyx_base;
+};
+
+
+/* "_objects.pxd":12
+ * from .defs cimport *
+ * 
+ * cdef class ObjectID:             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object __weakref__
+ */
+struct __pyx_obj_4h5py_8_objects_ObjectID {
+  PyObject_HEAD
+  PyObject *__weakref__;
+  hid_t id;
+  int locked;
+  PyObject *_hash;
+  size_t _pyid;
+};
+
+
+/* "h5t.pxd":15
+ * from ._objects cimport class ObjectID
+ * 
+ * cdef class TypeID(ObjectID):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object py_dtype(self)
+ */
+struct __pyx_obj_4h5py_3h5t_TypeID {
+  struct __pyx_obj_4h5py_8_objects_ObjectID __pyx_base;
+  struct __pyx_vtabstruct_4h5py_3h5t_TypeID *__pyx_vtab;
+};
+
+
+/* "h5t.pxd":21
+ * # --- Top-level classes ---
+ * 
+ * cdef class TypeArrayID(TypeID):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+struct __pyx_obj_4h5py_3h5t_TypeArrayID {
+  struct __pyx_obj_4h5py_3h5t_TypeID __pyx_base;
+};
+
+
+/* "h5t.pxd":24
+ *     pass
+ * 
+ * cdef class TypeOpaqueID(TypeID):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+struct __pyx_obj_4h5py_3h5t_TypeOpaqueID {
+  struct __pyx_obj_4h5py_3h5t_TypeID __pyx_base;
+};
+
+
+/* "h5t.pxd":27
+ *     pass
+ * 
+ * cdef class TypeStringID(TypeID):             # <<<<<<<<<<<<<<
+ *     # Both vlen and fixed-len strings
+ *     pass
+ */
+struct __pyx_obj_4h5py_3h5t_TypeStringID {
+  struct __pyx_obj_4h5py_3h5t_TypeID __pyx_base;
+};
+
+
+/* "h5t.pxd":31
+ *     pass
+ * 
+ * cdef class TypeVlenID(TypeID):             # <<<<<<<<<<<<<<
+ *     # Non-string vlens
+ *     pass
+ */
+struct __pyx_obj_4h5py_3h5t_TypeVlenID {
+  struct __pyx_obj_4h5py_3h5t_TypeID __pyx_base;
+};
+
+
+/* "h5t.pxd":35
+ *     pass
+ * 
+ * cdef class TypeTimeID(TypeID):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+struct __pyx_obj_4h5py_3h5t_TypeTimeID {
+  struct __pyx_obj_4h5py_3h5t_TypeID __pyx_base;
+};
+
+
+/* "h5t.pxd":38
+ *     pass
+ * 
+ * cdef class TypeBitfieldID(TypeID):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+struct __pyx_obj_4h5py_3h5t_TypeBitfieldID {
+  struct __pyx_obj_4h5py_3h5t_TypeID __pyx_base;
+};
+
+
+/* "h5t.pxd":41
+ *     pass
+ * 
+ * cdef class TypeReferenceID(TypeID):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+struct __pyx_obj_4h5py_3h5t_TypeReferenceID {
+  struct __pyx_obj_4h5py_3h5t_TypeID __pyx_base;
+};
+
+
+/* "h5t.pxd":46
+ * # --- Numeric atomic types ---
+ * 
+ * cdef class TypeAtomicID(TypeID):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+struct __pyx_obj_4h5py_3h5t_TypeAtomicID {
+  struct __pyx_obj_4h5py_3h5t_TypeID __pyx_base;
+};
+
+
+/* "h5t.pxd":49
+ *     pass
+ * 
+ * cdef class TypeIntegerID(TypeAtomicID):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+struct __pyx_obj_4h5py_3h5t_TypeIntegerID {
+  struct __pyx_obj_4h5py_3h5t_TypeAtomicID __pyx_base;
+};
+
+
+/* "h5t.pxd":52
+ *     pass
+ * 
+ * cdef class TypeFloatID(TypeAtomicID):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+struct __pyx_obj_4h5py_3h5t_TypeFloatID {
+  struct __pyx_obj_4h5py_3h5t_TypeAtomicID __pyx_base;
+};
+
+
+/* "h5t.pxd":57
+ * # --- Enums & compound types ---
+ * 
+ * cdef class TypeCompositeID(TypeID):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+struct __pyx_obj_4h5py_3h5t_TypeCompositeID {
+  struct __pyx_obj_4h5py_3h5t_TypeID __pyx_base;
+};
+
+
+/* "h5t.pxd":60
+ *     pass
+ * 
+ * cdef class TypeEnumID(TypeCompositeID):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int enum_convert(self, long long *buf, int reverse) except -1
+ */
+struct __pyx_obj_4h5py_3h5t_TypeEnumID {
+  struct __pyx_obj_4h5py_3h5t_TypeCompositeID __pyx_base;
+};
+
+
+/* "h5t.pxd":64
+ *     cdef int enum_convert(self, long long *buf, int reverse) except -1
+ * 
+ * cdef class TypeCompoundID(TypeCompositeID):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+struct __pyx_obj_4h5py_3h5t_TypeCompoundID {
+  struct __pyx_obj_4h5py_3h5t_TypeCompositeID __pyx_base;
+};
+
+
+
+/* "h5t.pxd":15
+ * from ._objects cimport class ObjectID
+ * 
+ * cdef class TypeID(ObjectID):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef object py_dtype(self)
+ */
+
+struct __pyx_vtabstruct_4h5py_3h5t_TypeID {
+  PyObject *(*py_dtype)(struct __pyx_obj_4h5py_3h5t_TypeID *);
+};
+static struct __pyx_vtabstruct_4h5py_3h5t_TypeID *__pyx_vtabptr_4h5py_3h5t_TypeID;
+
+
+/* "h5t.pxd":21
+ * # --- Top-level classes ---
+ * 
+ * cdef class TypeArrayID(TypeID):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+
+struct __pyx_vtabstruct_4h5py_3h5t_TypeArrayID {
+  struct __pyx_vtabstruct_4h5py_3h5t_TypeID __pyx_base;
+};
+static struct __pyx_vtabstruct_4h5py_3h5t_TypeArrayID *__pyx_vtabptr_4h5py_3h5t_TypeArrayID;
+
+
+/* "h5t.pxd":24
+ *     pass
+ * 
+ * cdef class TypeOpaqueID(TypeID):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+
+struct __pyx_vtabstruct_4h5py_3h5t_TypeOpaqueID {
+  struct __pyx_vtabstruct_4h5py_3h5t_TypeID __pyx_base;
+};
+static struct __pyx_vtabstruct_4h5py_3h5t_TypeOpaqueID *__pyx_vtabptr_4h5py_3h5t_TypeOpaqueID;
+
+
+/* "h5t.pxd":27
+ *     pass
+ * 
+ * cdef class TypeStringID(TypeID):             # <<<<<<<<<<<<<<
+ *     # Both vlen and fixed-len strings
+ *     pass
+ */
+
+struct __pyx_vtabstruct_4h5py_3h5t_TypeStringID {
+  struct __pyx_vtabstruct_4h5py_3h5t_TypeID __pyx_base;
+};
+static struct __pyx_vtabstruct_4h5py_3h5t_TypeStringID *__pyx_vtabptr_4h5py_3h5t_TypeStringID;
+
+
+/* "h5t.pxd":31
+ *     pass
+ * 
+ * cdef class TypeVlenID(TypeID):             # <<<<<<<<<<<<<<
+ *     # Non-string vlens
+ *     pass
+ */
+
+struct __pyx_vtabstruct_4h5py_3h5t_TypeVlenID {
+  struct __pyx_vtabstruct_4h5py_3h5t_TypeID __pyx_base;
+};
+static struct __pyx_vtabstruct_4h5py_3h5t_TypeVlenID *__pyx_vtabptr_4h5py_3h5t_TypeVlenID;
+
+
+/* "h5t.pxd":35
+ *     pass
+ * 
+ * cdef class TypeTimeID(TypeID):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+
+struct __pyx_vtabstruct_4h5py_3h5t_TypeTimeID {
+  struct __pyx_vtabstruct_4h5py_3h5t_TypeID __pyx_base;
+};
+static struct __pyx_vtabstruct_4h5py_3h5t_TypeTimeID *__pyx_vtabptr_4h5py_3h5t_TypeTimeID;
+
+
+/* "h5t.pxd":38
+ *     pass
+ * 
+ * cdef class TypeBitfieldID(TypeID):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+
+struct __pyx_vtabstruct_4h5py_3h5t_TypeBitfieldID {
+  struct __pyx_vtabstruct_4h5py_3h5t_TypeID __pyx_base;
+};
+static struct __pyx_vtabstruct_4h5py_3h5t_TypeBitfieldID *__pyx_vtabptr_4h5py_3h5t_TypeBitfieldID;
+
+
+/* "h5t.pxd":41
+ *     pass
+ * 
+ * cdef class TypeReferenceID(TypeID):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+
+struct __pyx_vtabstruct_4h5py_3h5t_TypeReferenceID {
+  struct __pyx_vtabstruct_4h5py_3h5t_TypeID __pyx_base;
+};
+static struct __pyx_vtabstruct_4h5py_3h5t_TypeReferenceID *__pyx_vtabptr_4h5py_3h5t_TypeReferenceID;
+
+
+/* "h5t.pxd":46
+ * # --- Numeric atomic types ---
+ * 
+ * cdef class TypeAtomicID(TypeID):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+
+struct __pyx_vtabstruct_4h5py_3h5t_TypeAtomicID {
+  struct __pyx_vtabstruct_4h5py_3h5t_TypeID __pyx_base;
+};
+static struct __pyx_vtabstruct_4h5py_3h5t_TypeAtomicID *__pyx_vtabptr_4h5py_3h5t_TypeAtomicID;
+
+
+/* "h5t.pxd":49
+ *     pass
+ * 
+ * cdef class TypeIntegerID(TypeAtomicID):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+
+struct __pyx_vtabstruct_4h5py_3h5t_TypeIntegerID {
+  struct __pyx_vtabstruct_4h5py_3h5t_TypeAtomicID __pyx_base;
+};
+static struct __pyx_vtabstruct_4h5py_3h5t_TypeIntegerID *__pyx_vtabptr_4h5py_3h5t_TypeIntegerID;
+
+
+/* "h5t.pxd":52
+ *     pass
+ * 
+ * cdef class TypeFloatID(TypeAtomicID):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+
+struct __pyx_vtabstruct_4h5py_3h5t_TypeFloatID {
+  struct __pyx_vtabstruct_4h5py_3h5t_TypeAtomicID __pyx_base;
+};
+static struct __pyx_vtabstruct_4h5py_3h5t_TypeFloatID *__pyx_vtabptr_4h5py_3h5t_TypeFloatID;
+
+
+/* "h5t.pxd":57
+ * # --- Enums & compound types ---
+ * 
+ * cdef class TypeCompositeID(TypeID):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+
+struct __pyx_vtabstruct_4h5py_3h5t_TypeCompositeID {
+  struct __pyx_vtabstruct_4h5py_3h5t_TypeID __pyx_base;
+};
+static struct __pyx_vtabstruct_4h5py_3h5t_TypeCompositeID *__pyx_vtabptr_4h5py_3h5t_TypeCompositeID;
+
+
+/* "h5t.pxd":60
+ *     pass
+ * 
+ * cdef class TypeEnumID(TypeCompositeID):             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int enum_convert(self, long long *buf, int reverse) except -1
+ */
+
+struct __pyx_vtabstruct_4h5py_3h5t_TypeEnumID {
+  struct __pyx_vtabstruct_4h5py_3h5t_TypeCompositeID __pyx_base;
+  int (*enum_convert)(struct __pyx_obj_4h5py_3h5t_TypeEnumID *, PY_LONG_LONG *, int);
+};
+static struct __pyx_vtabstruct_4h5py_3h5t_TypeEnumID *__pyx_vtabptr_4h5py_3h5t_TypeEnumID;
+
+
+/* "h5t.pxd":64
+ *     cdef int enum_convert(self, long long *buf, int reverse) except -1
+ * 
+ * cdef class TypeCompoundID(TypeCompositeID):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+ */
+
+struct __pyx_vtabstruct_4h5py_3h5t_TypeCompoundID {
+  struct __pyx_vtabstruct_4h5py_3h5t_TypeCompositeID __pyx_base;
+};
+static struct __pyx_vtabstruct_4h5py_3h5t_TypeCompoundID *__pyx_vtabptr_4h5py_3h5t_TypeCompoundID;
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, int);
+    void (*DECREF)(void*, PyObject*, int);
+    void (*GOTREF)(void*, PyObject*, int);
+    void (*GIVEREF)(void*, PyObject*, int);
+    void* (*SetupContext)(const char*, int, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+#ifdef WITH_THREAD
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__);\
+          }
+#else
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), __LINE__, __FILE__)
+#endif
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), __LINE__)
+  #define __Pyx_XINCREF(r)  do { if((r) != NULL) {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) != NULL) {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) != NULL) {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) != NULL) {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* PyObjectGetAttrStr.proto */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* GetBuiltinName.proto */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* PyFunctionFastCall.proto */
+#if CYTHON_FAST_PYCALL
+#define __Pyx_PyFunction_FastCall(func, args, nargs)\
+    __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
+#else
+#define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
+#endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
+#endif
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* WriteUnraisableException.proto */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil);
+
+/* GetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* SwapException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSwap(type, value, tb)  __Pyx__ExceptionSwap(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* GetTopmostException.proto */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
+#endif
+
+/* SaveResetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+#else
+#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
+#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
+#endif
+
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* PyObjectCallNoArg.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+#else
+#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
+#endif
+
+/* IncludeStringH.proto */
+#include <string.h>
+
+/* ExtTypeTest.proto */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
+
+/* PyErrExceptionMatches.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* TypeImport.proto */
+#ifndef __PYX_HAVE_RT_ImportType_proto_0_29_37
+#define __PYX_HAVE_RT_ImportType_proto_0_29_37
+#if __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if __STDC_VERSION__ >= 201112L || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize_0_29_37 {
+   __Pyx_ImportType_CheckSize_Error_0_29_37 = 0,
+   __Pyx_ImportType_CheckSize_Warn_0_29_37 = 1,
+   __Pyx_ImportType_CheckSize_Ignore_0_29_37 = 2
+};
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size);
+#endif
+
+/* GetVTable.proto */
+static void* __Pyx_GetVtable(PyObject *dict);
+
+/* Import.proto */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
+
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+
+/* CLineInTraceback.proto */
+#ifdef CYTHON_CLINE_IN_TRACEBACK
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#else
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#endif
+
+/* CodeObjectCache.proto */
+typedef struct {
+    PyCodeObject* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+};
+static struct __Pyx_CodeObjectCache __pyx_code_cache = {0,0,NULL};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static PyCodeObject *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* RealImag.proto */
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    #define __Pyx_CREAL(z) ((z).real())
+    #define __Pyx_CIMAG(z) ((z).imag())
+  #else
+    #define __Pyx_CREAL(z) (__real__(z))
+    #define __Pyx_CIMAG(z) (__imag__(z))
+  #endif
+#else
+    #define __Pyx_CREAL(z) ((z).real)
+    #define __Pyx_CIMAG(z) ((z).imag)
+#endif
+#if defined(__cplusplus) && CYTHON_CCOMPLEX\
+        && (defined(_WIN32) || defined(__clang__) || (defined(__GNUC__) && (__GNUC__ >= 5 || __GNUC__ == 4 && __GNUC_MINOR__ >= 4 )) || __cplusplus >= 201103)
+    #define __Pyx_SET_CREAL(z,x) ((z).real(x))
+    #define __Pyx_SET_CIMAG(z,y) ((z).imag(y))
+#else
+    #define __Pyx_SET_CREAL(z,x) __Pyx_CREAL(z) = (x)
+    #define __Pyx_SET_CIMAG(z,y) __Pyx_CIMAG(z) = (y)
+#endif
+
+/* Arithmetic.proto */
+#if CYTHON_CCOMPLEX
+    #define __Pyx_c_eq_float(a, b)   ((a)==(b))
+    #define __Pyx_c_sum_float(a, b)  ((a)+(b))
+    #define __Pyx_c_diff_float(a, b) ((a)-(b))
+    #define __Pyx_c_prod_float(a, b) ((a)*(b))
+    #define __Pyx_c_quot_float(a, b) ((a)/(b))
+    #define __Pyx_c_neg_float(a)     (-(a))
+  #ifdef __cplusplus
+    #define __Pyx_c_is_zero_float(z) ((z)==(float)0)
+    #define __Pyx_c_conj_float(z)    (::std::conj(z))
+    #if 1
+        #define __Pyx_c_abs_float(z)     (::std::abs(z))
+        #define __Pyx_c_pow_float(a, b)  (::std::pow(a, b))
+    #endif
+  #else
+    #define __Pyx_c_is_zero_float(z) ((z)==0)
+    #define __Pyx_c_conj_float(z)    (conjf(z))
+    #if 1
+        #define __Pyx_c_abs_float(z)     (cabsf(z))
+        #define __Pyx_c_pow_float(a, b)  (cpowf(a, b))
+    #endif
+ #endif
+#else
+    static CYTHON_INLINE int __Pyx_c_eq_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_sum_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_diff_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_prod_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_quot_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_neg_float(__pyx_t_float_complex);
+    static CYTHON_INLINE int __Pyx_c_is_zero_float(__pyx_t_float_complex);
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_conj_float(__pyx_t_float_complex);
+    #if 1
+        static CYTHON_INLINE float __Pyx_c_abs_float(__pyx_t_float_complex);
+        static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_pow_float(__pyx_t_float_complex, __pyx_t_float_complex);
+    #endif
+#endif
+
+/* Arithmetic.proto */
+#if CYTHON_CCOMPLEX
+    #define __Pyx_c_eq_double(a, b)   ((a)==(b))
+    #define __Pyx_c_sum_double(a, b)  ((a)+(b))
+    #define __Pyx_c_diff_double(a, b) ((a)-(b))
+    #define __Pyx_c_prod_double(a, b) ((a)*(b))
+    #define __Pyx_c_quot_double(a, b) ((a)/(b))
+    #define __Pyx_c_neg_double(a)     (-(a))
+  #ifdef __cplusplus
+    #define __Pyx_c_is_zero_double(z) ((z)==(double)0)
+    #define __Pyx_c_conj_double(z)    (::std::conj(z))
+    #if 1
+        #define __Pyx_c_abs_double(z)     (::std::abs(z))
+        #define __Pyx_c_pow_double(a, b)  (::std::pow(a, b))
+    #endif
+  #else
+    #define __Pyx_c_is_zero_double(z) ((z)==0)
+    #define __Pyx_c_conj_double(z)    (conj(z))
+    #if 1
+        #define __Pyx_c_abs_double(z)     (cabs(z))
+        #define __Pyx_c_pow_double(a, b)  (cpow(a, b))
+    #endif
+ #endif
+#else
+    static CYTHON_INLINE int __Pyx_c_eq_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_sum_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_diff_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_prod_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_quot_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_neg_double(__pyx_t_double_complex);
+    static CYTHON_INLINE int __Pyx_c_is_zero_double(__pyx_t_double_complex);
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_conj_double(__pyx_t_double_complex);
+    #if 1
+        static CYTHON_INLINE double __Pyx_c_abs_double(__pyx_t_double_complex);
+        static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_pow_double(__pyx_t_double_complex, __pyx_t_double_complex);
+    #endif
+#endif
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_enum__H5T_class_t(enum H5T_class_t value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_htri_t(htri_t value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+#define __Pyx_PyErr_GivenExceptionMatches2(err, type1, type2) (PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2))
+#endif
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(void);
+
+/* VoidPtrImport.proto */
+static int __Pyx_ImportVoidPtr_0_29_37(PyObject *module, const char *name, void **p, const char *sig);
+
+/* FunctionImport.proto */
+static int __Pyx_ImportFunction_0_29_37(PyObject *module, const char *funcname, void (**f)(void), const char *sig);
+
+/* InitStrings.proto */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
+
+
+/* Module declarations from 'libc.string' */
+
+/* Module declarations from 'libc.stdlib' */
+
+/* Module declarations from 'libc.stddef' */
+
+/* Module declarations from 'libc.time' */
+
+/* Module declarations from 'cpython.buffer' */
+
+/* Module declarations from 'libc.stdio' */
+
+/* Module declarations from '__builtin__' */
+
+/* Module declarations from 'cpython.type' */
+static PyTypeObject *__pyx_ptype_7cpython_4type_type = 0;
+
+/* Module declarations from 'cpython' */
+
+/* Module declarations from 'cpython.object' */
+
+/* Module declarations from 'cpython.ref' */
+
+/* Module declarations from 'cpython.mem' */
+
+/* Module declarations from 'numpy' */
+
+/* Module declarations from 'numpy' */
+static PyTypeObject *__pyx_ptype_5numpy_dtype = 0;
+static PyTypeObject *__pyx_ptype_5numpy_flatiter = 0;
+static PyTypeObject *__pyx_ptype_5numpy_broadcast = 0;
+static PyTypeObject *__pyx_ptype_5numpy_ndarray = 0;
+static PyTypeObject *__pyx_ptype_5numpy_generic = 0;
+static PyTypeObject *__pyx_ptype_5numpy_number = 0;
+static PyTypeObject *__pyx_ptype_5numpy_integer = 0;
+static PyTypeObject *__pyx_ptype_5numpy_signedinteger = 0;
+static PyTypeObject *__pyx_ptype_5numpy_unsignedinteger = 0;
+static PyTypeObject *__pyx_ptype_5numpy_inexact = 0;
+static PyTypeObject *__pyx_ptype_5numpy_floating = 0;
+static PyTypeObject *__pyx_ptype_5numpy_complexfloating = 0;
+static PyTypeObject *__pyx_ptype_5numpy_flexible = 0;
+static PyTypeObject *__pyx_ptype_5numpy_character = 0;
+static PyTypeObject *__pyx_ptype_5numpy_ufunc = 0;
+
+/* Module declarations from 'h5py.api_types_ext' */
+
+/* Module declarations from 'h5py.api_types_hdf5' */
+
+/* Module declarations from 'h5py.defs' */
+static herr_t (*__pyx_f_4h5py_4defs_H5free_memory)(void *); /*proto*/
+static hid_t (*__pyx_f_4h5py_4defs_H5Tcopy)(hid_t); /*proto*/
+static htri_t (*__pyx_f_4h5py_4defs_H5Tequal)(hid_t, hid_t); /*proto*/
+static enum H5T_class_t (*__pyx_f_4h5py_4defs_H5Tget_class)(hid_t); /*proto*/
+static size_t (*__pyx_f_4h5py_4defs_H5Tget_size)(hid_t); /*proto*/
+static hid_t (*__pyx_f_4h5py_4defs_H5Tget_super)(hid_t); /*proto*/
+static herr_t (*__pyx_f_4h5py_4defs_H5Tclose)(hid_t); /*proto*/
+static herr_t (*__pyx_f_4h5py_4defs_H5Tconvert)(hid_t, hid_t, size_t, void *, void *, hid_t); /*proto*/
+static herr_t (*__pyx_f_4h5py_4defs_H5Tregister)(H5T_pers_t, char *, hid_t, hid_t, H5T_conv_t); /*proto*/
+static herr_t (*__pyx_f_4h5py_4defs_H5Tunregister)(H5T_pers_t, char *, hid_t, hid_t, H5T_conv_t); /*proto*/
+static herr_t (*__pyx_f_4h5py_4defs_H5Tset_size)(hid_t, size_t); /*proto*/
+static H5T_cset_t (*__pyx_f_4h5py_4defs_H5Tget_cset)(hid_t); /*proto*/
+static hid_t (*__pyx_f_4h5py_4defs_H5Tvlen_create)(hid_t); /*proto*/
+static htri_t (*__pyx_f_4h5py_4defs_H5Tis_variable_str)(hid_t); /*proto*/
+static hid_t (*__pyx_f_4h5py_4defs_H5Tenum_create)(hid_t); /*proto*/
+static herr_t (*__pyx_f_4h5py_4defs_H5Tenum_insert)(hid_t, char *, void *); /*proto*/
+static char *(*__pyx_f_4h5py_4defs_H5Tget_tag)(hid_t); /*proto*/
+
+/* Module declarations from 'h5py.h5r' */
+static PyTypeObject *__pyx_ptype_4h5py_3h5r_Reference = 0;
+static PyTypeObject *__pyx_ptype_4h5py_3h5r_RegionReference = 0;
+
+/* Module declarations from 'h5py._objects' */
+static PyTypeObject *__pyx_ptype_4h5py_8_objects_ObjectID = 0;
+
+/* Module declarations from 'h5py.h5t' */
+static PyTypeObject *__pyx_ptype_4h5py_3h5t_TypeID = 0;
+static PyTypeObject *__pyx_ptype_4h5py_3h5t_TypeArrayID = 0;
+static PyTypeObject *__pyx_ptype_4h5py_3h5t_TypeOpaqueID = 0;
+static PyTypeObject *__pyx_ptype_4h5py_3h5t_TypeStringID = 0;
+static PyTypeObject *__pyx_ptype_4h5py_3h5t_TypeVlenID = 0;
+static PyTypeObject *__pyx_ptype_4h5py_3h5t_TypeTimeID = 0;
+static PyTypeObject *__pyx_ptype_4h5py_3h5t_TypeBitfieldID = 0;
+static PyTypeObject *__pyx_ptype_4h5py_3h5t_TypeReferenceID = 0;
+static PyTypeObject *__pyx_ptype_4h5py_3h5t_TypeAtomicID = 0;
+static PyTypeObject *__pyx_ptype_4h5py_3h5t_TypeIntegerID = 0;
+static PyTypeObject *__pyx_ptype_4h5py_3h5t_TypeFloatID = 0;
+static PyTypeObject *__pyx_ptype_4h5py_3h5t_TypeCompositeID = 0;
+static PyTypeObject *__pyx_ptype_4h5py_3h5t_TypeEnumID = 0;
+static PyTypeObject *__pyx_ptype_4h5py_3h5t_TypeCompoundID = 0;
+static hid_t *__pyx_vp_4h5py_3h5t_H5PY_OBJ = 0;
+#define __pyx_v_4h5py_3h5t_H5PY_OBJ (*__pyx_vp_4h5py_3h5t_H5PY_OBJ)
+static char **__pyx_vp_4h5py_3h5t_H5PY_PYTHON_OPAQUE_TAG = 0;
+#define __pyx_v_4h5py_3h5t_H5PY_PYTHON_OPAQUE_TAG (*__pyx_vp_4h5py_3h5t_H5PY_PYTHON_OPAQUE_TAG)
+static struct __pyx_obj_4h5py_3h5t_TypeID *(*__pyx_f_4h5py_3h5t_typewrap)(hid_t, int __pyx_skip_dispatch); /*proto*/
+static struct __pyx_obj_4h5py_3h5t_TypeID *(*__pyx_f_4h5py_3h5t_py_create)(PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_4h5py_3h5t_py_create *__pyx_optional_args); /*proto*/
+
+/* Module declarations from 'h5py.utils' */
+static void *(*__pyx_f_4h5py_5utils_emalloc)(size_t); /*proto*/
+static void (*__pyx_f_4h5py_5utils_efree)(void *); /*proto*/
+
+/* Module declarations from 'h5py._conv' */
+static PyObject *__pyx_v_4h5py_5_conv_Py_None;
+static herr_t __pyx_f_4h5py_5_conv_generic_converter(hid_t, hid_t, H5T_cdata_t *, size_t, size_t, size_t, void *, void *, hid_t, __pyx_t_4h5py_5_conv_conv_operator_t, __pyx_t_4h5py_5_conv_init_operator_t, H5T_bkg_t); /*proto*/
+static void __pyx_f_4h5py_5_conv_log_convert_registered(hid_t, hid_t); /*proto*/
+static herr_t __pyx_f_4h5py_5_conv_init_generic(hid_t, hid_t, void **); /*proto*/
+static int __pyx_f_4h5py_5_conv__is_pyobject_opaque(hid_t); /*proto*/
+static herr_t __pyx_f_4h5py_5_conv_init_vlen2str(hid_t, hid_t, void **); /*proto*/
+static herr_t __pyx_f_4h5py_5_conv_init_str2vlen(hid_t, hid_t, void **); /*proto*/
+static int __pyx_f_4h5py_5_conv_conv_vlen2str(void *, void *, void *, void *); /*proto*/
+static int __pyx_f_4h5py_5_conv_conv_str2vlen(void *, void *, void *, void *); /*proto*/
+static herr_t __pyx_f_4h5py_5_conv_init_vlen2fixed(hid_t, hid_t, void **); /*proto*/
+static herr_t __pyx_f_4h5py_5_conv_init_fixed2vlen(hid_t, hid_t, void **); /*proto*/
+static int __pyx_f_4h5py_5_conv_conv_vlen2fixed(void *, void *, void *, void *); /*proto*/
+static int __pyx_f_4h5py_5_conv_conv_fixed2vlen(void *, void *, void *, void *); /*proto*/
+static CYTHON_INLINE int __pyx_f_4h5py_5_conv_conv_objref2pyref(void *, void *, void *, void *); /*proto*/
+static CYTHON_INLINE int __pyx_f_4h5py_5_conv_conv_pyref2objref(void *, void *, void *, void *); /*proto*/
+static CYTHON_INLINE int __pyx_f_4h5py_5_conv_conv_regref2pyref(void *, void *, void *, void *); /*proto*/
+static CYTHON_INLINE int __pyx_f_4h5py_5_conv_conv_pyref2regref(void *, void *, void *, void *); /*proto*/
+static CYTHON_INLINE herr_t __pyx_f_4h5py_5_conv_vlen2str(hid_t, hid_t, H5T_cdata_t *, size_t, size_t, size_t, void *, void *, hid_t); /*proto*/
+static CYTHON_INLINE herr_t __pyx_f_4h5py_5_conv_str2vlen(hid_t, hid_t, H5T_cdata_t *, size_t, size_t, size_t, void *, void *, hid_t); /*proto*/
+static CYTHON_INLINE herr_t __pyx_f_4h5py_5_conv_vlen2fixed(hid_t, hid_t, H5T_cdata_t *, size_t, size_t, size_t, void *, void *, hid_t); /*proto*/
+static CYTHON_INLINE herr_t __pyx_f_4h5py_5_conv_fixed2vlen(hid_t, hid_t, H5T_cdata_t *, size_t, size_t, size_t, void *, void *, hid_t); /*proto*/
+static CYTHON_INLINE herr_t __pyx_f_4h5py_5_conv_objref2pyref(hid_t, hid_t, H5T_cdata_t *, size_t, size_t, size_t, void *, void *, hid_t); /*proto*/
+static CYTHON_INLINE herr_t __pyx_f_4h5py_5_conv_pyref2objref(hid_t, hid_t, H5T_cdata_t *, size_t, size_t, size_t, void *, void *, hid_t); /*proto*/
+static CYTHON_INLINE herr_t __pyx_f_4h5py_5_conv_regref2pyref(hid_t, hid_t, H5T_cdata_t *, size_t, size_t, size_t, void *, void *, hid_t); /*proto*/
+static CYTHON_INLINE herr_t __pyx_f_4h5py_5_conv_pyref2regref(hid_t, hid_t, H5T_cdata_t *, size_t, size_t, size_t, void *, void *, hid_t); /*proto*/
+static int __pyx_f_4h5py_5_conv_enum_int_converter_init(hid_t, hid_t, H5T_cdata_t *, int); /*proto*/
+static void __pyx_f_4h5py_5_conv_enum_int_converter_free(H5T_cdata_t *); /*proto*/
+static int __pyx_f_4h5py_5_conv_enum_int_converter_conv(hid_t, hid_t, H5T_cdata_t *, size_t, size_t, size_t, void *, void *, hid_t, int); /*proto*/
+static herr_t __pyx_f_4h5py_5_conv_enum_int_converter(hid_t, hid_t, H5T_cdata_t *, size_t, size_t, size_t, void *, void *, hid_t, int); /*proto*/
+static herr_t __pyx_f_4h5py_5_conv_enum2int(hid_t, hid_t, H5T_cdata_t *, size_t, size_t, size_t, void *, void *, hid_t); /*proto*/
+static herr_t __pyx_f_4h5py_5_conv_int2enum(hid_t, hid_t, H5T_cdata_t *, size_t, size_t, size_t, void *, void *, hid_t); /*proto*/
+static herr_t __pyx_f_4h5py_5_conv_vlen2ndarray(hid_t, hid_t, H5T_cdata_t *, size_t, size_t, size_t, void *, void *, hid_t); /*proto*/
+static int __pyx_f_4h5py_5_conv_conv_vlen2ndarray(void *, void *, PyArray_Descr *, struct __pyx_obj_4h5py_3h5t_TypeID *, struct __pyx_obj_4h5py_3h5t_TypeID *); /*proto*/
+static herr_t __pyx_f_4h5py_5_conv_ndarray2vlen(hid_t, hid_t, H5T_cdata_t *, size_t, size_t, size_t, void *, void *, hid_t); /*proto*/
+static int __pyx_f_4h5py_5_conv_conv_ndarray2vlen(void *, void *, struct __pyx_obj_4h5py_3h5t_TypeID *, struct __pyx_obj_4h5py_3h5t_TypeID *); /*proto*/
+static herr_t __pyx_f_4h5py_5_conv_b82boolenum(hid_t, hid_t, H5T_cdata_t *, size_t, size_t, size_t, void *, void *, hid_t); /*proto*/
+static herr_t __pyx_f_4h5py_5_conv_boolenum2b8(hid_t, hid_t, H5T_cdata_t *, size_t, size_t, size_t, void *, void *, hid_t); /*proto*/
+static herr_t __pyx_f_4h5py_5_conv_b82uint8(hid_t, hid_t, H5T_cdata_t *, size_t, size_t, size_t, void *, void *, hid_t); /*proto*/
+static herr_t __pyx_f_4h5py_5_conv_uint82b8(hid_t, hid_t, H5T_cdata_t *, size_t, size_t, size_t, void *, void *, hid_t); /*proto*/
+static int __pyx_f_4h5py_5_conv_register_converters(int __pyx_skip_dispatch); /*proto*/
+static int __pyx_f_4h5py_5_conv_unregister_converters(int __pyx_skip_dispatch); /*proto*/
+#define __Pyx_MODULE_NAME "h5py._conv"
+extern int __pyx_module_is_main_h5py___conv;
+int __pyx_module_is_main_h5py___conv = 0;
+
+/* Implementation of 'h5py._conv' */
+static PyObject *__pyx_builtin_range;
+static PyObject *__pyx_builtin_TypeError;
+static PyObject *__pyx_builtin_ValueError;
+static PyObject *__pyx_builtin_MemoryError;
+static PyObject *__pyx_builtin_ImportError;
+static const char __pyx_k_[] = "";
+static const char __pyx_k_h5[] = "h5";
+static const char __pyx_k_cfg[] = "cfg";
+static const char __pyx_k_num[] = "num";
+static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_name[] = "__name__";
+static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_ascii[] = "ascii";
+static const char __pyx_k_debug[] = "debug";
+static const char __pyx_k_dtype[] = "dtype";
+static const char __pyx_k_range[] = "range";
+static const char __pyx_k_utf_8[] = "utf-8";
+static const char __pyx_k_encode[] = "encode";
+static const char __pyx_k_f_name[] = "_f_name";
+static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_logger[] = "logger";
+static const char __pyx_k_t_name[] = "_t_name";
+static const char __pyx_k_logging[] = "logging";
+static const char __pyx_k_get_size[] = "get_size";
+static const char __pyx_k_TypeError[] = "TypeError";
+static const char __pyx_k_getLogger[] = "getLogger";
+static const char __pyx_k_ValueError[] = "ValueError";
+static const char __pyx_k_get_config[] = "get_config";
+static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_ImportError[] = "ImportError";
+static const char __pyx_k_MemoryError[] = "MemoryError";
+static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_Creating_converter_from_s_to_s[] = "Creating converter from %s to %s";
+static const char __pyx_k_Low_level_type_conversion_routi[] = "\n    Low-level type-conversion routines.\n";
+static const char __pyx_k_numpy_core_multiarray_failed_to[] = "numpy.core.multiarray failed to import";
+static const char __pyx_k_Can_t_convert_incompatible_objec[] = "Can't convert incompatible object to HDF5 object reference";
+static const char __pyx_k_Can_t_implicitly_convert_non_str[] = "Can't implicitly convert non-string objects to strings";
+static const char __pyx_k_VLEN_strings_do_not_support_embe[] = "VLEN strings do not support embedded NULLs";
+static const char __pyx_k_numpy_core_umath_failed_to_impor[] = "numpy.core.umath failed to import";
+static const char __pyx_k_Can_t_convert_incompatible_objec_2[] = "Can't convert incompatible object to HDF5 region reference";
+static PyObject *__pyx_kp_b_;
+static PyObject *__pyx_kp_u_Can_t_convert_incompatible_objec;
+static PyObject *__pyx_kp_u_Can_t_convert_incompatible_objec_2;
+static PyObject *__pyx_kp_u_Can_t_implicitly_convert_non_str;
+static PyObject *__pyx_kp_u_Creating_converter_from_s_to_s;
+static PyObject *__pyx_n_s_ImportError;
+static PyObject *__pyx_n_s_MemoryError;
+static PyObject *__pyx_n_s_TypeError;
+static PyObject *__pyx_kp_u_VLEN_strings_do_not_support_embe;
+static PyObject *__pyx_n_s_ValueError;
+static PyObject *__pyx_n_u_ascii;
+static PyObject *__pyx_n_s_cfg;
+static PyObject *__pyx_n_s_cline_in_traceback;
+static PyObject *__pyx_n_s_debug;
+static PyObject *__pyx_n_s_dtype;
+static PyObject *__pyx_n_s_encode;
+static PyObject *__pyx_n_s_f_name;
+static PyObject *__pyx_n_s_getLogger;
+static PyObject *__pyx_n_s_get_config;
+static PyObject *__pyx_n_s_get_size;
+static PyObject *__pyx_n_s_h5;
+static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_logger;
+static PyObject *__pyx_n_s_logging;
+static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_name;
+static PyObject *__pyx_n_s_num;
+static PyObject *__pyx_kp_u_numpy_core_multiarray_failed_to;
+static PyObject *__pyx_kp_u_numpy_core_umath_failed_to_impor;
+static PyObject *__pyx_n_s_pyx_vtable;
+static PyObject *__pyx_n_s_range;
+static PyObject *__pyx_n_s_t_name;
+static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_kp_u_utf_8;
+static PyObject *__pyx_pf_4h5py_5_conv_register_converters(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
+static PyObject *__pyx_pf_4h5py_5_conv_2unregister_converters(CYTHON_UNUSED PyObject *__pyx_self); /* proto */
+static PyObject *__pyx_tuple__2;
+static PyObject *__pyx_tuple__3;
+static PyObject *__pyx_tuple__4;
+static PyObject *__pyx_tuple__5;
+static PyObject *__pyx_tuple__6;
+static PyObject *__pyx_tuple__7;
+/* Late includes */
+
+/* "h5py/_conv.pyx":58
+ * # likely small compared to the cost of the Python-side API calls required to
+ * # implement the conversions.
+ * cdef herr_t generic_converter(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl, conv_operator_t op,
+ */
+
+static herr_t __pyx_f_4h5py_5_conv_generic_converter(hid_t __pyx_v_src_id, hid_t __pyx_v_dst_id, H5T_cdata_t *__pyx_v_cdata, size_t __pyx_v_nl, size_t __pyx_v_buf_stride, size_t __pyx_v_bkg_stride, void *__pyx_v_buf_i, void *__pyx_v_bkg_i, CYTHON_UNUSED hid_t __pyx_v_dxpl, __pyx_t_4h5py_5_conv_conv_operator_t __pyx_v_op, __pyx_t_4h5py_5_conv_init_operator_t __pyx_v_initop, H5T_bkg_t __pyx_v_need_bkg) {
+  int __pyx_v_command;
+  __pyx_t_4h5py_5_conv_conv_size_t *__pyx_v_sizes;
+  int __pyx_v_i;
+  char *__pyx_v_buf;
+  char *__pyx_v_bkg;
+  herr_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  H5T_cmd_t __pyx_t_1;
+  herr_t __pyx_t_2;
+  htri_t __pyx_t_3;
+  int __pyx_t_4;
+  H5T_cset_t __pyx_t_5;
+  size_t __pyx_t_6;
+  size_t __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("generic_converter", 0);
+
+  /* "h5py/_conv.pyx":66
+ *         conv_size_t *sizes
+ *         int i
+ *         char* buf = <char*>buf_i             # <<<<<<<<<<<<<<
+ *         char* bkg = <char*>bkg_i
+ * 
+ */
+  __pyx_v_buf = ((char *)__pyx_v_buf_i);
+
+  /* "h5py/_conv.pyx":67
+ *         int i
+ *         char* buf = <char*>buf_i
+ *         char* bkg = <char*>bkg_i             # <<<<<<<<<<<<<<
+ * 
+ *     command = cdata[0].command
+ */
+  __pyx_v_bkg = ((char *)__pyx_v_bkg_i);
+
+  /* "h5py/_conv.pyx":69
+ *         char* bkg = <char*>bkg_i
+ * 
+ *     command = cdata[0].command             # <<<<<<<<<<<<<<
+ *     if command == H5T_CONV_INIT:
+ *         cdata[0].need_bkg = need_bkg
+ */
+  __pyx_t_1 = (__pyx_v_cdata[0]).command;
+  __pyx_v_command = __pyx_t_1;
+
+  /* "h5py/_conv.pyx":70
+ * 
+ *     command = cdata[0].command
+ *     if command == H5T_CONV_INIT:             # <<<<<<<<<<<<<<
+ *         cdata[0].need_bkg = need_bkg
+ *         return initop(src_id, dst_id, &(cdata[0].priv))
+ */
+  switch (__pyx_v_command) {
+    case H5T_CONV_INIT:
+
+    /* "h5py/_conv.pyx":71
+ *     command = cdata[0].command
+ *     if command == H5T_CONV_INIT:
+ *         cdata[0].need_bkg = need_bkg             # <<<<<<<<<<<<<<
+ *         return initop(src_id, dst_id, &(cdata[0].priv))
+ * 
+ */
+    (__pyx_v_cdata[0]).need_bkg = __pyx_v_need_bkg;
+
+    /* "h5py/_conv.pyx":72
+ *     if command == H5T_CONV_INIT:
+ *         cdata[0].need_bkg = need_bkg
+ *         return initop(src_id, dst_id, &(cdata[0].priv))             # <<<<<<<<<<<<<<
+ * 
+ *     elif command == H5T_CONV_FREE:
+ */
+    __pyx_t_2 = __pyx_v_initop(__pyx_v_src_id, __pyx_v_dst_id, (&(__pyx_v_cdata[0]).priv)); if (unlikely(__pyx_t_2 == ((herr_t)-1))) __PYX_ERR(0, 72, __pyx_L1_error)
+    __pyx_r = __pyx_t_2;
+    goto __pyx_L0;
+
+    /* "h5py/_conv.pyx":70
+ * 
+ *     command = cdata[0].command
+ *     if command == H5T_CONV_INIT:             # <<<<<<<<<<<<<<
+ *         cdata[0].need_bkg = need_bkg
+ *         return initop(src_id, dst_id, &(cdata[0].priv))
+ */
+    break;
+    case H5T_CONV_FREE:
+
+    /* "h5py/_conv.pyx":75
+ * 
+ *     elif command == H5T_CONV_FREE:
+ *         efree(cdata[0].priv)             # <<<<<<<<<<<<<<
+ *         cdata[0].priv = NULL
+ * 
+ */
+    __pyx_f_4h5py_5utils_efree((__pyx_v_cdata[0]).priv);
+
+    /* "h5py/_conv.pyx":76
+ *     elif command == H5T_CONV_FREE:
+ *         efree(cdata[0].priv)
+ *         cdata[0].priv = NULL             # <<<<<<<<<<<<<<
+ * 
+ *     elif command == H5T_CONV_CONV:
+ */
+    (__pyx_v_cdata[0]).priv = NULL;
+
+    /* "h5py/_conv.pyx":74
+ *         return initop(src_id, dst_id, &(cdata[0].priv))
+ * 
+ *     elif command == H5T_CONV_FREE:             # <<<<<<<<<<<<<<
+ *         efree(cdata[0].priv)
+ *         cdata[0].priv = NULL
+ */
+    break;
+    case H5T_CONV_CONV:
+
+    /* "h5py/_conv.pyx":79
+ * 
+ *     elif command == H5T_CONV_CONV:
+ *         sizes = <conv_size_t*>cdata[0].priv             # <<<<<<<<<<<<<<
+ *         if H5Tis_variable_str(src_id):
+ *             sizes.cset = H5Tget_cset(src_id)
+ */
+    __pyx_v_sizes = ((__pyx_t_4h5py_5_conv_conv_size_t *)(__pyx_v_cdata[0]).priv);
+
+    /* "h5py/_conv.pyx":80
+ *     elif command == H5T_CONV_CONV:
+ *         sizes = <conv_size_t*>cdata[0].priv
+ *         if H5Tis_variable_str(src_id):             # <<<<<<<<<<<<<<
+ *             sizes.cset = H5Tget_cset(src_id)
+ *         elif H5Tis_variable_str(dst_id):
+ */
+    __pyx_t_3 = __pyx_f_4h5py_4defs_H5Tis_variable_str(__pyx_v_src_id); if (unlikely(__pyx_t_3 == ((htri_t)((htri_t)-1L)))) __PYX_ERR(0, 80, __pyx_L1_error)
+    __pyx_t_4 = (__pyx_t_3 != 0);
+    if (__pyx_t_4) {
+
+      /* "h5py/_conv.pyx":81
+ *         sizes = <conv_size_t*>cdata[0].priv
+ *         if H5Tis_variable_str(src_id):
+ *             sizes.cset = H5Tget_cset(src_id)             # <<<<<<<<<<<<<<
+ *         elif H5Tis_variable_str(dst_id):
+ *             sizes.cset = H5Tget_cset(dst_id)
+ */
+      __pyx_t_5 = __pyx_f_4h5py_4defs_H5Tget_cset(__pyx_v_src_id); if (unlikely(__pyx_t_5 == ((H5T_cset_t)((H5T_cset_t)-1L)))) __PYX_ERR(0, 81, __pyx_L1_error)
+      __pyx_v_sizes->cset = __pyx_t_5;
+
+      /* "h5py/_conv.pyx":80
+ *     elif command == H5T_CONV_CONV:
+ *         sizes = <conv_size_t*>cdata[0].priv
+ *         if H5Tis_variable_str(src_id):             # <<<<<<<<<<<<<<
+ *             sizes.cset = H5Tget_cset(src_id)
+ *         elif H5Tis_variable_str(dst_id):
+ */
+      goto __pyx_L3;
+    }
+
+    /* "h5py/_conv.pyx":82
+ *         if H5Tis_variable_str(src_id):
+ *             sizes.cset = H5Tget_cset(src_id)
+ *         elif H5Tis_variable_str(dst_id):             # <<<<<<<<<<<<<<
+ *             sizes.cset = H5Tget_cset(dst_id)
+ *         if bkg_stride==0:
+ */
+    __pyx_t_3 = __pyx_f_4h5py_4defs_H5Tis_variable_str(__pyx_v_dst_id); if (unlikely(__pyx_t_3 == ((htri_t)((htri_t)-1L)))) __PYX_ERR(0, 82, __pyx_L1_error)
+    __pyx_t_4 = (__pyx_t_3 != 0);
+    if (__pyx_t_4) {
+
+      /* "h5py/_conv.pyx":83
+ *             sizes.cset = H5Tget_cset(src_id)
+ *         elif H5Tis_variable_str(dst_id):
+ *             sizes.cset = H5Tget_cset(dst_id)             # <<<<<<<<<<<<<<
+ *         if bkg_stride==0:
+ *             bkg_stride = sizes[0].dst_size
+ */
+      __pyx_t_5 = __pyx_f_4h5py_4defs_H5Tget_cset(__pyx_v_dst_id); if (unlikely(__pyx_t_5 == ((H5T_cset_t)((H5T_cset_t)-1L)))) __PYX_ERR(0, 83, __pyx_L1_error)
+      __pyx_v_sizes->cset = __pyx_t_5;
+
+      /* "h5py/_conv.pyx":82
+ *         if H5Tis_variable_str(src_id):
+ *             sizes.cset = H5Tget_cset(src_id)
+ *         elif H5Tis_variable_str(dst_id):             # <<<<<<<<<<<<<<
+ *             sizes.cset = H5Tget_cset(dst_id)
+ *         if bkg_stride==0:
+ */
+    }
+    __pyx_L3:;
+
+    /* "h5py/_conv.pyx":84
+ *         elif H5Tis_variable_str(dst_id):
+ *             sizes.cset = H5Tget_cset(dst_id)
+ *         if bkg_stride==0:             # <<<<<<<<<<<<<<
+ *             bkg_stride = sizes[0].dst_size
+ *         if buf_stride == 0:
+ */
+    __pyx_t_4 = ((__pyx_v_bkg_stride == 0) != 0);
+    if (__pyx_t_4) {
+
+      /* "h5py/_conv.pyx":85
+ *             sizes.cset = H5Tget_cset(dst_id)
+ *         if bkg_stride==0:
+ *             bkg_stride = sizes[0].dst_size             # <<<<<<<<<<<<<<
+ *         if buf_stride == 0:
+ *             # No explicit stride seems to mean that the elements are packed
+ */
+      __pyx_t_6 = (__pyx_v_sizes[0]).dst_size;
+      __pyx_v_bkg_stride = __pyx_t_6;
+
+      /* "h5py/_conv.pyx":84
+ *         elif H5Tis_variable_str(dst_id):
+ *             sizes.cset = H5Tget_cset(dst_id)
+ *         if bkg_stride==0:             # <<<<<<<<<<<<<<
+ *             bkg_stride = sizes[0].dst_size
+ *         if buf_stride == 0:
+ */
+    }
+
+    /* "h5py/_conv.pyx":86
+ *         if bkg_stride==0:
+ *             bkg_stride = sizes[0].dst_size
+ *         if buf_stride == 0:             # <<<<<<<<<<<<<<
+ *             # No explicit stride seems to mean that the elements are packed
+ *             # contiguously in the buffer.  In this case we must be careful
+ */
+    __pyx_t_4 = ((__pyx_v_buf_stride == 0) != 0);
+    if (__pyx_t_4) {
+
+      /* "h5py/_conv.pyx":92
+ *             # of a larger size.
+ * 
+ *             if sizes[0].src_size >= sizes[0].dst_size:             # <<<<<<<<<<<<<<
+ *                 for i in range(nl):
+ *                     op( buf + (i*sizes[0].src_size),    # input pointer
+ */
+      __pyx_t_4 = (((__pyx_v_sizes[0]).src_size >= (__pyx_v_sizes[0]).dst_size) != 0);
+      if (__pyx_t_4) {
+
+        /* "h5py/_conv.pyx":93
+ * 
+ *             if sizes[0].src_size >= sizes[0].dst_size:
+ *                 for i in range(nl):             # <<<<<<<<<<<<<<
+ *                     op( buf + (i*sizes[0].src_size),    # input pointer
+ *                         buf + (i*sizes[0].dst_size),    # output pointer
+ */
+        __pyx_t_6 = __pyx_v_nl;
+        __pyx_t_7 = __pyx_t_6;
+        for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+          __pyx_v_i = __pyx_t_8;
+
+          /* "h5py/_conv.pyx":94
+ *             if sizes[0].src_size >= sizes[0].dst_size:
+ *                 for i in range(nl):
+ *                     op( buf + (i*sizes[0].src_size),    # input pointer             # <<<<<<<<<<<<<<
+ *                         buf + (i*sizes[0].dst_size),    # output pointer
+ *                         bkg + (i*bkg_stride),           # backing buffer
+ */
+          __pyx_t_9 = __pyx_v_op((__pyx_v_buf + (__pyx_v_i * (__pyx_v_sizes[0]).src_size)), (__pyx_v_buf + (__pyx_v_i * (__pyx_v_sizes[0]).dst_size)), (__pyx_v_bkg + (__pyx_v_i * __pyx_v_bkg_stride)), (__pyx_v_cdata[0]).priv); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 94, __pyx_L1_error)
+        }
+
+        /* "h5py/_conv.pyx":92
+ *             # of a larger size.
+ * 
+ *             if sizes[0].src_size >= sizes[0].dst_size:             # <<<<<<<<<<<<<<
+ *                 for i in range(nl):
+ *                     op( buf + (i*sizes[0].src_size),    # input pointer
+ */
+        goto __pyx_L6;
+      }
+
+      /* "h5py/_conv.pyx":99
+ *                         cdata[0].priv)                  # conversion context
+ *             else:
+ *                 for i in range(nl-1, -1, -1):             # <<<<<<<<<<<<<<
+ *                     op( buf + (i*sizes[0].src_size),
+ *                         buf + (i*sizes[0].dst_size),
+ */
+      /*else*/ {
+        for (__pyx_t_8 = (__pyx_v_nl - 1); __pyx_t_8 > -1; __pyx_t_8-=1) {
+          __pyx_v_i = __pyx_t_8;
+
+          /* "h5py/_conv.pyx":100
+ *             else:
+ *                 for i in range(nl-1, -1, -1):
+ *                     op( buf + (i*sizes[0].src_size),             # <<<<<<<<<<<<<<
+ *                         buf + (i*sizes[0].dst_size),
+ *                         bkg + (i*bkg_stride),
+ */
+          __pyx_t_9 = __pyx_v_op((__pyx_v_buf + (__pyx_v_i * (__pyx_v_sizes[0]).src_size)), (__pyx_v_buf + (__pyx_v_i * (__pyx_v_sizes[0]).dst_size)), (__pyx_v_bkg + (__pyx_v_i * __pyx_v_bkg_stride)), (__pyx_v_cdata[0]).priv); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 100, __pyx_L1_error)
+        }
+      }
+      __pyx_L6:;
+
+      /* "h5py/_conv.pyx":86
+ *         if bkg_stride==0:
+ *             bkg_stride = sizes[0].dst_size
+ *         if buf_stride == 0:             # <<<<<<<<<<<<<<
+ *             # No explicit stride seems to mean that the elements are packed
+ *             # contiguously in the buffer.  In this case we must be careful
+ */
+      goto __pyx_L5;
+    }
+
+    /* "h5py/_conv.pyx":108
+ *             # alignment better than us.  Therefore we use the given stride
+ *             # offsets exclusively.
+ *             for i in range(nl):             # <<<<<<<<<<<<<<
+ *                 op( buf + (i*buf_stride),
+ *                     buf + (i*buf_stride),   # note this is the same!
+ */
+    /*else*/ {
+      __pyx_t_6 = __pyx_v_nl;
+      __pyx_t_7 = __pyx_t_6;
+      for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+        __pyx_v_i = __pyx_t_8;
+
+        /* "h5py/_conv.pyx":109
+ *             # offsets exclusively.
+ *             for i in range(nl):
+ *                 op( buf + (i*buf_stride),             # <<<<<<<<<<<<<<
+ *                     buf + (i*buf_stride),   # note this is the same!
+ *                     bkg + (i*bkg_stride),
+ */
+        __pyx_t_9 = __pyx_v_op((__pyx_v_buf + (__pyx_v_i * __pyx_v_buf_stride)), (__pyx_v_buf + (__pyx_v_i * __pyx_v_buf_stride)), (__pyx_v_bkg + (__pyx_v_i * __pyx_v_bkg_stride)), (__pyx_v_cdata[0]).priv); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 109, __pyx_L1_error)
+      }
+    }
+    __pyx_L5:;
+
+    /* "h5py/_conv.pyx":78
+ *         cdata[0].priv = NULL
+ * 
+ *     elif command == H5T_CONV_CONV:             # <<<<<<<<<<<<<<
+ *         sizes = <conv_size_t*>cdata[0].priv
+ *         if H5Tis_variable_str(src_id):
+ */
+    break;
+    default:
+
+    /* "h5py/_conv.pyx":114
+ *                     cdata[0].priv)
+ *     else:
+ *         return -2   # Unrecognized command.  Note this is NOT an exception.             # <<<<<<<<<<<<<<
+ *     return 0
+ * 
+ */
+    __pyx_r = -2;
+    goto __pyx_L0;
+    break;
+  }
+
+  /* "h5py/_conv.pyx":115
+ *     else:
+ *         return -2   # Unrecognized command.  Note this is NOT an exception.
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * # =============================================================================
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":58
+ * # likely small compared to the cost of the Python-side API calls required to
+ * # implement the conversions.
+ * cdef herr_t generic_converter(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl, conv_operator_t op,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("h5py._conv.generic_converter", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":120
+ * # Helper functions
+ * 
+ * cdef void log_convert_registered(hid_t src, hid_t dst):             # <<<<<<<<<<<<<<
+ *     logger.debug("Creating converter from %s to %s", H5Tget_class(src), H5Tget_class(dst))
+ * 
+ */
+
+static void __pyx_f_4h5py_5_conv_log_convert_registered(hid_t __pyx_v_src, hid_t __pyx_v_dst) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  enum H5T_class_t __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("log_convert_registered", 0);
+
+  /* "h5py/_conv.pyx":121
+ * 
+ * cdef void log_convert_registered(hid_t src, hid_t dst):
+ *     logger.debug("Creating converter from %s to %s", H5Tget_class(src), H5Tget_class(dst))             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_logger); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 121, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_debug); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 121, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_4 = __pyx_f_4h5py_4defs_H5Tget_class(__pyx_v_src); if (unlikely(__pyx_t_4 == ((enum H5T_class_t)((enum H5T_class_t)-1L)))) __PYX_ERR(0, 121, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_enum__H5T_class_t(__pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 121, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __pyx_f_4h5py_4defs_H5Tget_class(__pyx_v_dst); if (unlikely(__pyx_t_4 == ((enum H5T_class_t)((enum H5T_class_t)-1L)))) __PYX_ERR(0, 121, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyInt_From_enum__H5T_class_t(__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 121, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = NULL;
+  __pyx_t_7 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_7 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[4] = {__pyx_t_6, __pyx_kp_u_Creating_converter_from_s_to_s, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_7, 3+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 121, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+    PyObject *__pyx_temp[4] = {__pyx_t_6, __pyx_kp_u_Creating_converter_from_s_to_s, __pyx_t_2, __pyx_t_5};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_7, 3+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 121, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_8 = PyTuple_New(3+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 121, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    if (__pyx_t_6) {
+      __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6); __pyx_t_6 = NULL;
+    }
+    __Pyx_INCREF(__pyx_kp_u_Creating_converter_from_s_to_s);
+    __Pyx_GIVEREF(__pyx_kp_u_Creating_converter_from_s_to_s);
+    PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_7, __pyx_kp_u_Creating_converter_from_s_to_s);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_8, 2+__pyx_t_7, __pyx_t_5);
+    __pyx_t_2 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_8, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 121, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "h5py/_conv.pyx":120
+ * # Helper functions
+ * 
+ * cdef void log_convert_registered(hid_t src, hid_t dst):             # <<<<<<<<<<<<<<
+ *     logger.debug("Creating converter from %s to %s", H5Tget_class(src), H5Tget_class(dst))
+ * 
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_WriteUnraisable("h5py._conv.log_convert_registered", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "h5py/_conv.pyx":132
+ *     int cset
+ * 
+ * cdef herr_t init_generic(hid_t src, hid_t dst, void** priv) except -1:             # <<<<<<<<<<<<<<
+ * 
+ *     cdef conv_size_t *sizes
+ */
+
+static herr_t __pyx_f_4h5py_5_conv_init_generic(hid_t __pyx_v_src, hid_t __pyx_v_dst, void **__pyx_v_priv) {
+  __pyx_t_4h5py_5_conv_conv_size_t *__pyx_v_sizes;
+  herr_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  void *__pyx_t_1;
+  size_t __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("init_generic", 0);
+
+  /* "h5py/_conv.pyx":135
+ * 
+ *     cdef conv_size_t *sizes
+ *     sizes = <conv_size_t*>emalloc(sizeof(conv_size_t))             # <<<<<<<<<<<<<<
+ *     priv[0] = sizes
+ *     sizes[0].src_size = H5Tget_size(src)
+ */
+  __pyx_t_1 = __pyx_f_4h5py_5utils_emalloc((sizeof(__pyx_t_4h5py_5_conv_conv_size_t))); if (unlikely(__pyx_t_1 == ((void *)NULL) && PyErr_Occurred())) __PYX_ERR(0, 135, __pyx_L1_error)
+  __pyx_v_sizes = ((__pyx_t_4h5py_5_conv_conv_size_t *)__pyx_t_1);
+
+  /* "h5py/_conv.pyx":136
+ *     cdef conv_size_t *sizes
+ *     sizes = <conv_size_t*>emalloc(sizeof(conv_size_t))
+ *     priv[0] = sizes             # <<<<<<<<<<<<<<
+ *     sizes[0].src_size = H5Tget_size(src)
+ *     sizes[0].dst_size = H5Tget_size(dst)
+ */
+  (__pyx_v_priv[0]) = __pyx_v_sizes;
+
+  /* "h5py/_conv.pyx":137
+ *     sizes = <conv_size_t*>emalloc(sizeof(conv_size_t))
+ *     priv[0] = sizes
+ *     sizes[0].src_size = H5Tget_size(src)             # <<<<<<<<<<<<<<
+ *     sizes[0].dst_size = H5Tget_size(dst)
+ *     log_convert_registered(src, dst)
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tget_size(__pyx_v_src); if (unlikely(__pyx_t_2 == ((size_t)((size_t)0)))) __PYX_ERR(0, 137, __pyx_L1_error)
+  (__pyx_v_sizes[0]).src_size = __pyx_t_2;
+
+  /* "h5py/_conv.pyx":138
+ *     priv[0] = sizes
+ *     sizes[0].src_size = H5Tget_size(src)
+ *     sizes[0].dst_size = H5Tget_size(dst)             # <<<<<<<<<<<<<<
+ *     log_convert_registered(src, dst)
+ * 
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tget_size(__pyx_v_dst); if (unlikely(__pyx_t_2 == ((size_t)((size_t)0)))) __PYX_ERR(0, 138, __pyx_L1_error)
+  (__pyx_v_sizes[0]).dst_size = __pyx_t_2;
+
+  /* "h5py/_conv.pyx":139
+ *     sizes[0].src_size = H5Tget_size(src)
+ *     sizes[0].dst_size = H5Tget_size(dst)
+ *     log_convert_registered(src, dst)             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+  __pyx_f_4h5py_5_conv_log_convert_registered(__pyx_v_src, __pyx_v_dst);
+
+  /* "h5py/_conv.pyx":141
+ *     log_convert_registered(src, dst)
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * # =============================================================================
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":132
+ *     int cset
+ * 
+ * cdef herr_t init_generic(hid_t src, hid_t dst, void** priv) except -1:             # <<<<<<<<<<<<<<
+ * 
+ *     cdef conv_size_t *sizes
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("h5py._conv.init_generic", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":146
+ * # Vlen string conversion
+ * 
+ * cdef bint _is_pyobject_opaque(hid_t obj):             # <<<<<<<<<<<<<<
+ *     # This complexity is needed to sure:
+ *     #   1) That ctag is freed
+ */
+
+static int __pyx_f_4h5py_5_conv__is_pyobject_opaque(hid_t __pyx_v_obj) {
+  char *__pyx_v_ctag;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  enum H5T_class_t __pyx_t_1;
+  int __pyx_t_2;
+  char *__pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  char const *__pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  herr_t __pyx_t_13;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_is_pyobject_opaque", 0);
+
+  /* "h5py/_conv.pyx":151
+ *     #   2) We don't segfault (for some reason a try-finally statement is needed,
+ *     #   even if we do (what I think are) the right steps in copying and freeing.
+ *     cdef char* ctag = NULL             # <<<<<<<<<<<<<<
+ *     try:
+ *         if H5Tget_class(obj) == H5T_OPAQUE:
+ */
+  __pyx_v_ctag = NULL;
+
+  /* "h5py/_conv.pyx":152
+ *     #   even if we do (what I think are) the right steps in copying and freeing.
+ *     cdef char* ctag = NULL
+ *     try:             # <<<<<<<<<<<<<<
+ *         if H5Tget_class(obj) == H5T_OPAQUE:
+ *             ctag = H5Tget_tag(obj)
+ */
+  /*try:*/ {
+
+    /* "h5py/_conv.pyx":153
+ *     cdef char* ctag = NULL
+ *     try:
+ *         if H5Tget_class(obj) == H5T_OPAQUE:             # <<<<<<<<<<<<<<
+ *             ctag = H5Tget_tag(obj)
+ *             if ctag != NULL:
+ */
+    __pyx_t_1 = __pyx_f_4h5py_4defs_H5Tget_class(__pyx_v_obj); if (unlikely(__pyx_t_1 == ((enum H5T_class_t)((enum H5T_class_t)-1L)))) __PYX_ERR(0, 153, __pyx_L4_error)
+    __pyx_t_2 = ((__pyx_t_1 == H5T_OPAQUE) != 0);
+    if (__pyx_t_2) {
+
+      /* "h5py/_conv.pyx":154
+ *     try:
+ *         if H5Tget_class(obj) == H5T_OPAQUE:
+ *             ctag = H5Tget_tag(obj)             # <<<<<<<<<<<<<<
+ *             if ctag != NULL:
+ *                 if strcmp(ctag, H5PY_PYTHON_OPAQUE_TAG) == 0:
+ */
+      __pyx_t_3 = __pyx_f_4h5py_4defs_H5Tget_tag(__pyx_v_obj); if (unlikely(__pyx_t_3 == ((char *)((char *)NULL)))) __PYX_ERR(0, 154, __pyx_L4_error)
+      __pyx_v_ctag = __pyx_t_3;
+
+      /* "h5py/_conv.pyx":155
+ *         if H5Tget_class(obj) == H5T_OPAQUE:
+ *             ctag = H5Tget_tag(obj)
+ *             if ctag != NULL:             # <<<<<<<<<<<<<<
+ *                 if strcmp(ctag, H5PY_PYTHON_OPAQUE_TAG) == 0:
+ *                     return True
+ */
+      __pyx_t_2 = ((__pyx_v_ctag != NULL) != 0);
+      if (__pyx_t_2) {
+
+        /* "h5py/_conv.pyx":156
+ *             ctag = H5Tget_tag(obj)
+ *             if ctag != NULL:
+ *                 if strcmp(ctag, H5PY_PYTHON_OPAQUE_TAG) == 0:             # <<<<<<<<<<<<<<
+ *                     return True
+ *         return False
+ */
+        __pyx_t_2 = ((strcmp(__pyx_v_ctag, __pyx_v_4h5py_3h5t_H5PY_PYTHON_OPAQUE_TAG) == 0) != 0);
+        if (__pyx_t_2) {
+
+          /* "h5py/_conv.pyx":157
+ *             if ctag != NULL:
+ *                 if strcmp(ctag, H5PY_PYTHON_OPAQUE_TAG) == 0:
+ *                     return True             # <<<<<<<<<<<<<<
+ *         return False
+ *     finally:
+ */
+          __pyx_r = 1;
+          goto __pyx_L3_return;
+
+          /* "h5py/_conv.pyx":156
+ *             ctag = H5Tget_tag(obj)
+ *             if ctag != NULL:
+ *                 if strcmp(ctag, H5PY_PYTHON_OPAQUE_TAG) == 0:             # <<<<<<<<<<<<<<
+ *                     return True
+ *         return False
+ */
+        }
+
+        /* "h5py/_conv.pyx":155
+ *         if H5Tget_class(obj) == H5T_OPAQUE:
+ *             ctag = H5Tget_tag(obj)
+ *             if ctag != NULL:             # <<<<<<<<<<<<<<
+ *                 if strcmp(ctag, H5PY_PYTHON_OPAQUE_TAG) == 0:
+ *                     return True
+ */
+      }
+
+      /* "h5py/_conv.pyx":153
+ *     cdef char* ctag = NULL
+ *     try:
+ *         if H5Tget_class(obj) == H5T_OPAQUE:             # <<<<<<<<<<<<<<
+ *             ctag = H5Tget_tag(obj)
+ *             if ctag != NULL:
+ */
+    }
+
+    /* "h5py/_conv.pyx":158
+ *                 if strcmp(ctag, H5PY_PYTHON_OPAQUE_TAG) == 0:
+ *                     return True
+ *         return False             # <<<<<<<<<<<<<<
+ *     finally:
+ *         IF HDF5_VERSION >= (1, 8, 13):
+ */
+    __pyx_r = 0;
+    goto __pyx_L3_return;
+  }
+
+  /* "h5py/_conv.pyx":161
+ *     finally:
+ *         IF HDF5_VERSION >= (1, 8, 13):
+ *             H5free_memory(ctag)             # <<<<<<<<<<<<<<
+ *         ELSE:
+ *             free(ctag)
+ */
+  /*finally:*/ {
+    __pyx_L4_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_7 = 0; __pyx_t_8 = 0; __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0;
+      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_10, &__pyx_t_11, &__pyx_t_12);
+      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_7, &__pyx_t_8, &__pyx_t_9) < 0)) __Pyx_ErrFetch(&__pyx_t_7, &__pyx_t_8, &__pyx_t_9);
+      __Pyx_XGOTREF(__pyx_t_7);
+      __Pyx_XGOTREF(__pyx_t_8);
+      __Pyx_XGOTREF(__pyx_t_9);
+      __Pyx_XGOTREF(__pyx_t_10);
+      __Pyx_XGOTREF(__pyx_t_11);
+      __Pyx_XGOTREF(__pyx_t_12);
+      __pyx_t_4 = __pyx_lineno; __pyx_t_5 = __pyx_clineno; __pyx_t_6 = __pyx_filename;
+      {
+        __pyx_t_13 = __pyx_f_4h5py_4defs_H5free_memory(__pyx_v_ctag); if (unlikely(__pyx_t_13 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 161, __pyx_L10_error)
+      }
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_10);
+        __Pyx_XGIVEREF(__pyx_t_11);
+        __Pyx_XGIVEREF(__pyx_t_12);
+        __Pyx_ExceptionReset(__pyx_t_10, __pyx_t_11, __pyx_t_12);
+      }
+      __Pyx_XGIVEREF(__pyx_t_7);
+      __Pyx_XGIVEREF(__pyx_t_8);
+      __Pyx_XGIVEREF(__pyx_t_9);
+      __Pyx_ErrRestore(__pyx_t_7, __pyx_t_8, __pyx_t_9);
+      __pyx_t_7 = 0; __pyx_t_8 = 0; __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0;
+      __pyx_lineno = __pyx_t_4; __pyx_clineno = __pyx_t_5; __pyx_filename = __pyx_t_6;
+      goto __pyx_L1_error;
+      __pyx_L10_error:;
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_10);
+        __Pyx_XGIVEREF(__pyx_t_11);
+        __Pyx_XGIVEREF(__pyx_t_12);
+        __Pyx_ExceptionReset(__pyx_t_10, __pyx_t_11, __pyx_t_12);
+      }
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0;
+      goto __pyx_L1_error;
+    }
+    __pyx_L3_return: {
+      __pyx_t_2 = __pyx_r;
+      __pyx_t_13 = __pyx_f_4h5py_4defs_H5free_memory(__pyx_v_ctag); if (unlikely(__pyx_t_13 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 161, __pyx_L1_error)
+      __pyx_r = __pyx_t_2;
+      goto __pyx_L0;
+    }
+  }
+
+  /* "h5py/_conv.pyx":146
+ * # Vlen string conversion
+ * 
+ * cdef bint _is_pyobject_opaque(hid_t obj):             # <<<<<<<<<<<<<<
+ *     # This complexity is needed to sure:
+ *     #   1) That ctag is freed
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("h5py._conv._is_pyobject_opaque", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":165
+ *             free(ctag)
+ * 
+ * cdef herr_t init_vlen2str(hid_t src_vlen, hid_t dst_str, void** priv) except -1:             # <<<<<<<<<<<<<<
+ *     # /!\ Untested
+ *     cdef conv_size_t *sizes
+ */
+
+static herr_t __pyx_f_4h5py_5_conv_init_vlen2str(hid_t __pyx_v_src_vlen, hid_t __pyx_v_dst_str, void **__pyx_v_priv) {
+  __pyx_t_4h5py_5_conv_conv_size_t *__pyx_v_sizes;
+  herr_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  htri_t __pyx_t_1;
+  int __pyx_t_2;
+  void *__pyx_t_3;
+  size_t __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("init_vlen2str", 0);
+
+  /* "h5py/_conv.pyx":169
+ *     cdef conv_size_t *sizes
+ * 
+ *     if not H5Tis_variable_str(src_vlen):             # <<<<<<<<<<<<<<
+ *         return -2
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4h5py_4defs_H5Tis_variable_str(__pyx_v_src_vlen); if (unlikely(__pyx_t_1 == ((htri_t)((htri_t)-1L)))) __PYX_ERR(0, 169, __pyx_L1_error)
+  __pyx_t_2 = ((!(__pyx_t_1 != 0)) != 0);
+  if (__pyx_t_2) {
+
+    /* "h5py/_conv.pyx":170
+ * 
+ *     if not H5Tis_variable_str(src_vlen):
+ *         return -2             # <<<<<<<<<<<<<<
+ * 
+ *     if not _is_pyobject_opaque(dst_str):
+ */
+    __pyx_r = -2;
+    goto __pyx_L0;
+
+    /* "h5py/_conv.pyx":169
+ *     cdef conv_size_t *sizes
+ * 
+ *     if not H5Tis_variable_str(src_vlen):             # <<<<<<<<<<<<<<
+ *         return -2
+ * 
+ */
+  }
+
+  /* "h5py/_conv.pyx":172
+ *         return -2
+ * 
+ *     if not _is_pyobject_opaque(dst_str):             # <<<<<<<<<<<<<<
+ *         return -2
+ * 
+ */
+  __pyx_t_2 = ((!(__pyx_f_4h5py_5_conv__is_pyobject_opaque(__pyx_v_dst_str) != 0)) != 0);
+  if (__pyx_t_2) {
+
+    /* "h5py/_conv.pyx":173
+ * 
+ *     if not _is_pyobject_opaque(dst_str):
+ *         return -2             # <<<<<<<<<<<<<<
+ * 
+ *     log_convert_registered(src_vlen, dst_str)
+ */
+    __pyx_r = -2;
+    goto __pyx_L0;
+
+    /* "h5py/_conv.pyx":172
+ *         return -2
+ * 
+ *     if not _is_pyobject_opaque(dst_str):             # <<<<<<<<<<<<<<
+ *         return -2
+ * 
+ */
+  }
+
+  /* "h5py/_conv.pyx":175
+ *         return -2
+ * 
+ *     log_convert_registered(src_vlen, dst_str)             # <<<<<<<<<<<<<<
+ * 
+ *     sizes = <conv_size_t*>emalloc(sizeof(conv_size_t))
+ */
+  __pyx_f_4h5py_5_conv_log_convert_registered(__pyx_v_src_vlen, __pyx_v_dst_str);
+
+  /* "h5py/_conv.pyx":177
+ *     log_convert_registered(src_vlen, dst_str)
+ * 
+ *     sizes = <conv_size_t*>emalloc(sizeof(conv_size_t))             # <<<<<<<<<<<<<<
+ *     priv[0] = sizes
+ * 
+ */
+  __pyx_t_3 = __pyx_f_4h5py_5utils_emalloc((sizeof(__pyx_t_4h5py_5_conv_conv_size_t))); if (unlikely(__pyx_t_3 == ((void *)NULL) && PyErr_Occurred())) __PYX_ERR(0, 177, __pyx_L1_error)
+  __pyx_v_sizes = ((__pyx_t_4h5py_5_conv_conv_size_t *)__pyx_t_3);
+
+  /* "h5py/_conv.pyx":178
+ * 
+ *     sizes = <conv_size_t*>emalloc(sizeof(conv_size_t))
+ *     priv[0] = sizes             # <<<<<<<<<<<<<<
+ * 
+ *     sizes[0].src_size = H5Tget_size(src_vlen)
+ */
+  (__pyx_v_priv[0]) = __pyx_v_sizes;
+
+  /* "h5py/_conv.pyx":180
+ *     priv[0] = sizes
+ * 
+ *     sizes[0].src_size = H5Tget_size(src_vlen)             # <<<<<<<<<<<<<<
+ *     sizes[0].dst_size = H5Tget_size(dst_str)
+ *     return 0
+ */
+  __pyx_t_4 = __pyx_f_4h5py_4defs_H5Tget_size(__pyx_v_src_vlen); if (unlikely(__pyx_t_4 == ((size_t)((size_t)0)))) __PYX_ERR(0, 180, __pyx_L1_error)
+  (__pyx_v_sizes[0]).src_size = __pyx_t_4;
+
+  /* "h5py/_conv.pyx":181
+ * 
+ *     sizes[0].src_size = H5Tget_size(src_vlen)
+ *     sizes[0].dst_size = H5Tget_size(dst_str)             # <<<<<<<<<<<<<<
+ *     return 0
+ * 
+ */
+  __pyx_t_4 = __pyx_f_4h5py_4defs_H5Tget_size(__pyx_v_dst_str); if (unlikely(__pyx_t_4 == ((size_t)((size_t)0)))) __PYX_ERR(0, 181, __pyx_L1_error)
+  (__pyx_v_sizes[0]).dst_size = __pyx_t_4;
+
+  /* "h5py/_conv.pyx":182
+ *     sizes[0].src_size = H5Tget_size(src_vlen)
+ *     sizes[0].dst_size = H5Tget_size(dst_str)
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * cdef herr_t init_str2vlen(hid_t src_str, hid_t dst_vlen, void** priv) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":165
+ *             free(ctag)
+ * 
+ * cdef herr_t init_vlen2str(hid_t src_vlen, hid_t dst_str, void** priv) except -1:             # <<<<<<<<<<<<<<
+ *     # /!\ Untested
+ *     cdef conv_size_t *sizes
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("h5py._conv.init_vlen2str", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":184
+ *     return 0
+ * 
+ * cdef herr_t init_str2vlen(hid_t src_str, hid_t dst_vlen, void** priv) except -1:             # <<<<<<<<<<<<<<
+ *     # /!\ untested !
+ *     cdef conv_size_t *sizes
+ */
+
+static herr_t __pyx_f_4h5py_5_conv_init_str2vlen(hid_t __pyx_v_src_str, hid_t __pyx_v_dst_vlen, void **__pyx_v_priv) {
+  __pyx_t_4h5py_5_conv_conv_size_t *__pyx_v_sizes;
+  herr_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  htri_t __pyx_t_1;
+  int __pyx_t_2;
+  void *__pyx_t_3;
+  size_t __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("init_str2vlen", 0);
+
+  /* "h5py/_conv.pyx":188
+ *     cdef conv_size_t *sizes
+ * 
+ *     if not H5Tis_variable_str(dst_vlen):             # <<<<<<<<<<<<<<
+ *         return -2
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4h5py_4defs_H5Tis_variable_str(__pyx_v_dst_vlen); if (unlikely(__pyx_t_1 == ((htri_t)((htri_t)-1L)))) __PYX_ERR(0, 188, __pyx_L1_error)
+  __pyx_t_2 = ((!(__pyx_t_1 != 0)) != 0);
+  if (__pyx_t_2) {
+
+    /* "h5py/_conv.pyx":189
+ * 
+ *     if not H5Tis_variable_str(dst_vlen):
+ *         return -2             # <<<<<<<<<<<<<<
+ * 
+ *     if not _is_pyobject_opaque(src_str):
+ */
+    __pyx_r = -2;
+    goto __pyx_L0;
+
+    /* "h5py/_conv.pyx":188
+ *     cdef conv_size_t *sizes
+ * 
+ *     if not H5Tis_variable_str(dst_vlen):             # <<<<<<<<<<<<<<
+ *         return -2
+ * 
+ */
+  }
+
+  /* "h5py/_conv.pyx":191
+ *         return -2
+ * 
+ *     if not _is_pyobject_opaque(src_str):             # <<<<<<<<<<<<<<
+ *         return -2
+ * 
+ */
+  __pyx_t_2 = ((!(__pyx_f_4h5py_5_conv__is_pyobject_opaque(__pyx_v_src_str) != 0)) != 0);
+  if (__pyx_t_2) {
+
+    /* "h5py/_conv.pyx":192
+ * 
+ *     if not _is_pyobject_opaque(src_str):
+ *         return -2             # <<<<<<<<<<<<<<
+ * 
+ *     log_convert_registered(src_str, dst_vlen)
+ */
+    __pyx_r = -2;
+    goto __pyx_L0;
+
+    /* "h5py/_conv.pyx":191
+ *         return -2
+ * 
+ *     if not _is_pyobject_opaque(src_str):             # <<<<<<<<<<<<<<
+ *         return -2
+ * 
+ */
+  }
+
+  /* "h5py/_conv.pyx":194
+ *         return -2
+ * 
+ *     log_convert_registered(src_str, dst_vlen)             # <<<<<<<<<<<<<<
+ * 
+ *     sizes = <conv_size_t*>emalloc(sizeof(conv_size_t))
+ */
+  __pyx_f_4h5py_5_conv_log_convert_registered(__pyx_v_src_str, __pyx_v_dst_vlen);
+
+  /* "h5py/_conv.pyx":196
+ *     log_convert_registered(src_str, dst_vlen)
+ * 
+ *     sizes = <conv_size_t*>emalloc(sizeof(conv_size_t))             # <<<<<<<<<<<<<<
+ *     priv[0] = sizes
+ *     sizes[0].src_size = H5Tget_size(src_str)
+ */
+  __pyx_t_3 = __pyx_f_4h5py_5utils_emalloc((sizeof(__pyx_t_4h5py_5_conv_conv_size_t))); if (unlikely(__pyx_t_3 == ((void *)NULL) && PyErr_Occurred())) __PYX_ERR(0, 196, __pyx_L1_error)
+  __pyx_v_sizes = ((__pyx_t_4h5py_5_conv_conv_size_t *)__pyx_t_3);
+
+  /* "h5py/_conv.pyx":197
+ * 
+ *     sizes = <conv_size_t*>emalloc(sizeof(conv_size_t))
+ *     priv[0] = sizes             # <<<<<<<<<<<<<<
+ *     sizes[0].src_size = H5Tget_size(src_str)
+ *     sizes[0].dst_size = H5Tget_size(dst_vlen)
+ */
+  (__pyx_v_priv[0]) = __pyx_v_sizes;
+
+  /* "h5py/_conv.pyx":198
+ *     sizes = <conv_size_t*>emalloc(sizeof(conv_size_t))
+ *     priv[0] = sizes
+ *     sizes[0].src_size = H5Tget_size(src_str)             # <<<<<<<<<<<<<<
+ *     sizes[0].dst_size = H5Tget_size(dst_vlen)
+ * 
+ */
+  __pyx_t_4 = __pyx_f_4h5py_4defs_H5Tget_size(__pyx_v_src_str); if (unlikely(__pyx_t_4 == ((size_t)((size_t)0)))) __PYX_ERR(0, 198, __pyx_L1_error)
+  (__pyx_v_sizes[0]).src_size = __pyx_t_4;
+
+  /* "h5py/_conv.pyx":199
+ *     priv[0] = sizes
+ *     sizes[0].src_size = H5Tget_size(src_str)
+ *     sizes[0].dst_size = H5Tget_size(dst_vlen)             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+  __pyx_t_4 = __pyx_f_4h5py_4defs_H5Tget_size(__pyx_v_dst_vlen); if (unlikely(__pyx_t_4 == ((size_t)((size_t)0)))) __PYX_ERR(0, 199, __pyx_L1_error)
+  (__pyx_v_sizes[0]).dst_size = __pyx_t_4;
+
+  /* "h5py/_conv.pyx":201
+ *     sizes[0].dst_size = H5Tget_size(dst_vlen)
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * cdef int conv_vlen2str(void* ipt, void* opt, void* bkg, void* priv) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":184
+ *     return 0
+ * 
+ * cdef herr_t init_str2vlen(hid_t src_str, hid_t dst_vlen, void** priv) except -1:             # <<<<<<<<<<<<<<
+ *     # /!\ untested !
+ *     cdef conv_size_t *sizes
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("h5py._conv.init_str2vlen", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":203
+ *     return 0
+ * 
+ * cdef int conv_vlen2str(void* ipt, void* opt, void* bkg, void* priv) except -1:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>opt
+ */
+
+static int __pyx_f_4h5py_5_conv_conv_vlen2str(void *__pyx_v_ipt, void *__pyx_v_opt, CYTHON_UNUSED void *__pyx_v_bkg, void *__pyx_v_priv) {
+  PyObject **__pyx_v_buf_obj;
+  char **__pyx_v_buf_cstring;
+  PyObject *__pyx_v_tmp_object;
+  PyObject *__pyx_v_tmp_bytes = 0;
+  CYTHON_UNUSED __pyx_t_4h5py_5_conv_conv_size_t *__pyx_v_sizes;
+  char *__pyx_v_buf_cstring0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("conv_vlen2str", 0);
+
+  /* "h5py/_conv.pyx":205
+ * cdef int conv_vlen2str(void* ipt, void* opt, void* bkg, void* priv) except -1:
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>opt             # <<<<<<<<<<<<<<
+ *         char** buf_cstring = <char**>ipt
+ *         PyObject* tmp_object
+ */
+  __pyx_v_buf_obj = ((PyObject **)__pyx_v_opt);
+
+  /* "h5py/_conv.pyx":206
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>opt
+ *         char** buf_cstring = <char**>ipt             # <<<<<<<<<<<<<<
+ *         PyObject* tmp_object
+ *         bytes tmp_bytes
+ */
+  __pyx_v_buf_cstring = ((char **)__pyx_v_ipt);
+
+  /* "h5py/_conv.pyx":209
+ *         PyObject* tmp_object
+ *         bytes tmp_bytes
+ *         conv_size_t *sizes = <conv_size_t*>priv             # <<<<<<<<<<<<<<
+ *         char* buf_cstring0
+ * 
+ */
+  __pyx_v_sizes = ((__pyx_t_4h5py_5_conv_conv_size_t *)__pyx_v_priv);
+
+  /* "h5py/_conv.pyx":212
+ *         char* buf_cstring0
+ * 
+ *     buf_cstring0 = buf_cstring[0]             # <<<<<<<<<<<<<<
+ * 
+ *     if buf_cstring0 == NULL:
+ */
+  __pyx_v_buf_cstring0 = (__pyx_v_buf_cstring[0]);
+
+  /* "h5py/_conv.pyx":214
+ *     buf_cstring0 = buf_cstring[0]
+ * 
+ *     if buf_cstring0 == NULL:             # <<<<<<<<<<<<<<
+ *         tmp_bytes =  b""
+ *     else:
+ */
+  __pyx_t_1 = ((__pyx_v_buf_cstring0 == NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "h5py/_conv.pyx":215
+ * 
+ *     if buf_cstring0 == NULL:
+ *         tmp_bytes =  b""             # <<<<<<<<<<<<<<
+ *     else:
+ *         tmp_bytes = buf_cstring0 # Let cython converts char* -> bytes for us
+ */
+    __Pyx_INCREF(__pyx_kp_b_);
+    __pyx_v_tmp_bytes = __pyx_kp_b_;
+
+    /* "h5py/_conv.pyx":214
+ *     buf_cstring0 = buf_cstring[0]
+ * 
+ *     if buf_cstring0 == NULL:             # <<<<<<<<<<<<<<
+ *         tmp_bytes =  b""
+ *     else:
+ */
+    goto __pyx_L3;
+  }
+
+  /* "h5py/_conv.pyx":217
+ *         tmp_bytes =  b""
+ *     else:
+ *         tmp_bytes = buf_cstring0 # Let cython converts char* -> bytes for us             # <<<<<<<<<<<<<<
+ *     tmp_object = <PyObject *>tmp_bytes
+ * 
+ */
+  /*else*/ {
+    __pyx_t_2 = __Pyx_PyBytes_FromString(__pyx_v_buf_cstring0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 217, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_v_tmp_bytes = ((PyObject*)__pyx_t_2);
+    __pyx_t_2 = 0;
+  }
+  __pyx_L3:;
+
+  /* "h5py/_conv.pyx":218
+ *     else:
+ *         tmp_bytes = buf_cstring0 # Let cython converts char* -> bytes for us
+ *     tmp_object = <PyObject *>tmp_bytes             # <<<<<<<<<<<<<<
+ * 
+ *     # Since all data conversions are by definition in-place, it
+ */
+  __pyx_v_tmp_object = ((PyObject *)__pyx_v_tmp_bytes);
+
+  /* "h5py/_conv.pyx":222
+ *     # Since all data conversions are by definition in-place, it
+ *     # is our responsibility to free the memory used by the vlens.
+ *     efree(buf_cstring0)             # <<<<<<<<<<<<<<
+ * 
+ *     # Write the new unicode object to the buffer in-place and ensure it is not destroyed
+ */
+  __pyx_f_4h5py_5utils_efree(__pyx_v_buf_cstring0);
+
+  /* "h5py/_conv.pyx":225
+ * 
+ *     # Write the new unicode object to the buffer in-place and ensure it is not destroyed
+ *     buf_obj[0] = tmp_object             # <<<<<<<<<<<<<<
+ *     Py_XINCREF(tmp_object)
+ *     return 0
+ */
+  (__pyx_v_buf_obj[0]) = __pyx_v_tmp_object;
+
+  /* "h5py/_conv.pyx":226
+ *     # Write the new unicode object to the buffer in-place and ensure it is not destroyed
+ *     buf_obj[0] = tmp_object
+ *     Py_XINCREF(tmp_object)             # <<<<<<<<<<<<<<
+ *     return 0
+ * 
+ */
+  Py_XINCREF(__pyx_v_tmp_object);
+
+  /* "h5py/_conv.pyx":227
+ *     buf_obj[0] = tmp_object
+ *     Py_XINCREF(tmp_object)
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * cdef int conv_str2vlen(void* ipt, void* opt, void* bkg, void* priv) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":203
+ *     return 0
+ * 
+ * cdef int conv_vlen2str(void* ipt, void* opt, void* bkg, void* priv) except -1:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>opt
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("h5py._conv.conv_vlen2str", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_tmp_bytes);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":229
+ *     return 0
+ * 
+ * cdef int conv_str2vlen(void* ipt, void* opt, void* bkg, void* priv) except -1:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>ipt
+ */
+
+static int __pyx_f_4h5py_5_conv_conv_str2vlen(void *__pyx_v_ipt, void *__pyx_v_opt, CYTHON_UNUSED void *__pyx_v_bkg, void *__pyx_v_priv) {
+  PyObject **__pyx_v_buf_obj;
+  char **__pyx_v_buf_cstring;
+  __pyx_t_4h5py_5_conv_conv_size_t *__pyx_v_sizes;
+  char *__pyx_v_temp_string;
+  size_t __pyx_v_temp_string_len;
+  PyObject *__pyx_v_buf_obj0;
+  char *__pyx_v_buf_cstring0;
+  PyObject *__pyx_v_temp_object = 0;
+  PyObject *__pyx_v_enc = NULL;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  char *__pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  void *__pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("conv_str2vlen", 0);
+
+  /* "h5py/_conv.pyx":231
+ * cdef int conv_str2vlen(void* ipt, void* opt, void* bkg, void* priv) except -1:
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>ipt             # <<<<<<<<<<<<<<
+ *         char** buf_cstring = <char**>opt
+ *         conv_size_t* sizes = <conv_size_t*>priv
+ */
+  __pyx_v_buf_obj = ((PyObject **)__pyx_v_ipt);
+
+  /* "h5py/_conv.pyx":232
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>ipt
+ *         char** buf_cstring = <char**>opt             # <<<<<<<<<<<<<<
+ *         conv_size_t* sizes = <conv_size_t*>priv
+ *         char* temp_string = NULL
+ */
+  __pyx_v_buf_cstring = ((char **)__pyx_v_opt);
+
+  /* "h5py/_conv.pyx":233
+ *         PyObject** buf_obj = <PyObject**>ipt
+ *         char** buf_cstring = <char**>opt
+ *         conv_size_t* sizes = <conv_size_t*>priv             # <<<<<<<<<<<<<<
+ *         char* temp_string = NULL
+ *         size_t temp_string_len = 0  # Not including null term
+ */
+  __pyx_v_sizes = ((__pyx_t_4h5py_5_conv_conv_size_t *)__pyx_v_priv);
+
+  /* "h5py/_conv.pyx":234
+ *         char** buf_cstring = <char**>opt
+ *         conv_size_t* sizes = <conv_size_t*>priv
+ *         char* temp_string = NULL             # <<<<<<<<<<<<<<
+ *         size_t temp_string_len = 0  # Not including null term
+ *         PyObject* buf_obj0
+ */
+  __pyx_v_temp_string = NULL;
+
+  /* "h5py/_conv.pyx":235
+ *         conv_size_t* sizes = <conv_size_t*>priv
+ *         char* temp_string = NULL
+ *         size_t temp_string_len = 0  # Not including null term             # <<<<<<<<<<<<<<
+ *         PyObject* buf_obj0
+ *         char* buf_cstring0
+ */
+  __pyx_v_temp_string_len = 0;
+
+  /* "h5py/_conv.pyx":240
+ *         object temp_object
+ * 
+ *     buf_obj0 = buf_obj[0]             # <<<<<<<<<<<<<<
+ *     temp_object = <object> buf_obj0
+ * 
+ */
+  __pyx_v_buf_obj0 = (__pyx_v_buf_obj[0]);
+
+  /* "h5py/_conv.pyx":241
+ * 
+ *     buf_obj0 = buf_obj[0]
+ *     temp_object = <object> buf_obj0             # <<<<<<<<<<<<<<
+ * 
+ *     if isinstance(temp_object, unicode):
+ */
+  __pyx_t_1 = ((PyObject *)__pyx_v_buf_obj0);
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_temp_object = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "h5py/_conv.pyx":243
+ *     temp_object = <object> buf_obj0
+ * 
+ *     if isinstance(temp_object, unicode):             # <<<<<<<<<<<<<<
+ *         enc = 'utf-8' if (sizes[0].cset == H5T_CSET_UTF8) else 'ascii'
+ *         temp_object = temp_object.encode(enc)
+ */
+  __pyx_t_2 = PyUnicode_Check(__pyx_v_temp_object); 
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+
+    /* "h5py/_conv.pyx":244
+ * 
+ *     if isinstance(temp_object, unicode):
+ *         enc = 'utf-8' if (sizes[0].cset == H5T_CSET_UTF8) else 'ascii'             # <<<<<<<<<<<<<<
+ *         temp_object = temp_object.encode(enc)
+ * 
+ */
+    if ((((__pyx_v_sizes[0]).cset == H5T_CSET_UTF8) != 0)) {
+      __Pyx_INCREF(__pyx_kp_u_utf_8);
+      __pyx_t_1 = __pyx_kp_u_utf_8;
+    } else {
+      __Pyx_INCREF(__pyx_n_u_ascii);
+      __pyx_t_1 = __pyx_n_u_ascii;
+    }
+    __pyx_v_enc = ((PyObject*)__pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "h5py/_conv.pyx":245
+ *     if isinstance(temp_object, unicode):
+ *         enc = 'utf-8' if (sizes[0].cset == H5T_CSET_UTF8) else 'ascii'
+ *         temp_object = temp_object.encode(enc)             # <<<<<<<<<<<<<<
+ * 
+ *     elif not isinstance(temp_object, bytes):
+ */
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_temp_object, __pyx_n_s_encode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 245, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_v_enc) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_v_enc);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 245, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF_SET(__pyx_v_temp_object, __pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "h5py/_conv.pyx":243
+ *     temp_object = <object> buf_obj0
+ * 
+ *     if isinstance(temp_object, unicode):             # <<<<<<<<<<<<<<
+ *         enc = 'utf-8' if (sizes[0].cset == H5T_CSET_UTF8) else 'ascii'
+ *         temp_object = temp_object.encode(enc)
+ */
+    goto __pyx_L3;
+  }
+
+  /* "h5py/_conv.pyx":247
+ *         temp_object = temp_object.encode(enc)
+ * 
+ *     elif not isinstance(temp_object, bytes):             # <<<<<<<<<<<<<<
+ *         raise TypeError("Can't implicitly convert non-string objects to strings")
+ * 
+ */
+  __pyx_t_3 = PyBytes_Check(__pyx_v_temp_object); 
+  __pyx_t_2 = ((!(__pyx_t_3 != 0)) != 0);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "h5py/_conv.pyx":248
+ * 
+ *     elif not isinstance(temp_object, bytes):
+ *         raise TypeError("Can't implicitly convert non-string objects to strings")             # <<<<<<<<<<<<<<
+ * 
+ *     # temp_object is bytes
+ */
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 248, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 248, __pyx_L1_error)
+
+    /* "h5py/_conv.pyx":247
+ *         temp_object = temp_object.encode(enc)
+ * 
+ *     elif not isinstance(temp_object, bytes):             # <<<<<<<<<<<<<<
+ *         raise TypeError("Can't implicitly convert non-string objects to strings")
+ * 
+ */
+  }
+  __pyx_L3:;
+
+  /* "h5py/_conv.pyx":251
+ * 
+ *     # temp_object is bytes
+ *     temp_string = temp_object  # cython cast it as char *             # <<<<<<<<<<<<<<
+ *     temp_string_len = len(temp_object)
+ * 
+ */
+  __pyx_t_6 = __Pyx_PyObject_AsWritableString(__pyx_v_temp_object); if (unlikely((!__pyx_t_6) && PyErr_Occurred())) __PYX_ERR(0, 251, __pyx_L1_error)
+  __pyx_v_temp_string = __pyx_t_6;
+
+  /* "h5py/_conv.pyx":252
+ *     # temp_object is bytes
+ *     temp_string = temp_object  # cython cast it as char *
+ *     temp_string_len = len(temp_object)             # <<<<<<<<<<<<<<
+ * 
+ *     if strlen(temp_string) != temp_string_len:
+ */
+  __pyx_t_7 = PyObject_Length(__pyx_v_temp_object); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(0, 252, __pyx_L1_error)
+  __pyx_v_temp_string_len = __pyx_t_7;
+
+  /* "h5py/_conv.pyx":254
+ *     temp_string_len = len(temp_object)
+ * 
+ *     if strlen(temp_string) != temp_string_len:             # <<<<<<<<<<<<<<
+ *         raise ValueError("VLEN strings do not support embedded NULLs")
+ *     buf_cstring0 = <char*>emalloc(temp_string_len+1)
+ */
+  __pyx_t_2 = ((strlen(__pyx_v_temp_string) != __pyx_v_temp_string_len) != 0);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "h5py/_conv.pyx":255
+ * 
+ *     if strlen(temp_string) != temp_string_len:
+ *         raise ValueError("VLEN strings do not support embedded NULLs")             # <<<<<<<<<<<<<<
+ *     buf_cstring0 = <char*>emalloc(temp_string_len+1)
+ *     memcpy(buf_cstring0, temp_string, temp_string_len+1)
+ */
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 255, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 255, __pyx_L1_error)
+
+    /* "h5py/_conv.pyx":254
+ *     temp_string_len = len(temp_object)
+ * 
+ *     if strlen(temp_string) != temp_string_len:             # <<<<<<<<<<<<<<
+ *         raise ValueError("VLEN strings do not support embedded NULLs")
+ *     buf_cstring0 = <char*>emalloc(temp_string_len+1)
+ */
+  }
+
+  /* "h5py/_conv.pyx":256
+ *     if strlen(temp_string) != temp_string_len:
+ *         raise ValueError("VLEN strings do not support embedded NULLs")
+ *     buf_cstring0 = <char*>emalloc(temp_string_len+1)             # <<<<<<<<<<<<<<
+ *     memcpy(buf_cstring0, temp_string, temp_string_len+1)
+ *     buf_cstring[0] = buf_cstring0
+ */
+  __pyx_t_8 = __pyx_f_4h5py_5utils_emalloc((__pyx_v_temp_string_len + 1)); if (unlikely(__pyx_t_8 == ((void *)NULL) && PyErr_Occurred())) __PYX_ERR(0, 256, __pyx_L1_error)
+  __pyx_v_buf_cstring0 = ((char *)__pyx_t_8);
+
+  /* "h5py/_conv.pyx":257
+ *         raise ValueError("VLEN strings do not support embedded NULLs")
+ *     buf_cstring0 = <char*>emalloc(temp_string_len+1)
+ *     memcpy(buf_cstring0, temp_string, temp_string_len+1)             # <<<<<<<<<<<<<<
+ *     buf_cstring[0] = buf_cstring0
+ * 
+ */
+  (void)(memcpy(__pyx_v_buf_cstring0, __pyx_v_temp_string, (__pyx_v_temp_string_len + 1)));
+
+  /* "h5py/_conv.pyx":258
+ *     buf_cstring0 = <char*>emalloc(temp_string_len+1)
+ *     memcpy(buf_cstring0, temp_string, temp_string_len+1)
+ *     buf_cstring[0] = buf_cstring0             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+  (__pyx_v_buf_cstring[0]) = __pyx_v_buf_cstring0;
+
+  /* "h5py/_conv.pyx":260
+ *     buf_cstring[0] = buf_cstring0
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * # =============================================================================
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":229
+ *     return 0
+ * 
+ * cdef int conv_str2vlen(void* ipt, void* opt, void* bkg, void* priv) except -1:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>ipt
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("h5py._conv.conv_str2vlen", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_temp_object);
+  __Pyx_XDECREF(__pyx_v_enc);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":265
+ * # VLEN to fixed-width strings
+ * 
+ * cdef herr_t init_vlen2fixed(hid_t src, hid_t dst, void** priv) except -1:             # <<<<<<<<<<<<<<
+ *     cdef conv_size_t *sizes
+ * 
+ */
+
+static herr_t __pyx_f_4h5py_5_conv_init_vlen2fixed(hid_t __pyx_v_src, hid_t __pyx_v_dst, void **__pyx_v_priv) {
+  __pyx_t_4h5py_5_conv_conv_size_t *__pyx_v_sizes;
+  herr_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  htri_t __pyx_t_2;
+  int __pyx_t_3;
+  void *__pyx_t_4;
+  size_t __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("init_vlen2fixed", 0);
+
+  /* "h5py/_conv.pyx":270
+ *     # /!\ Untested
+ * 
+ *     if not (H5Tis_variable_str(src) and (not H5Tis_variable_str(dst))):             # <<<<<<<<<<<<<<
+ *         return -2
+ *     log_convert_registered(src, dst)
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tis_variable_str(__pyx_v_src); if (unlikely(__pyx_t_2 == ((htri_t)((htri_t)-1L)))) __PYX_ERR(0, 270, __pyx_L1_error)
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tis_variable_str(__pyx_v_dst); if (unlikely(__pyx_t_2 == ((htri_t)((htri_t)-1L)))) __PYX_ERR(0, 270, __pyx_L1_error)
+  __pyx_t_3 = ((!(__pyx_t_2 != 0)) != 0);
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  __pyx_t_3 = ((!__pyx_t_1) != 0);
+  if (__pyx_t_3) {
+
+    /* "h5py/_conv.pyx":271
+ * 
+ *     if not (H5Tis_variable_str(src) and (not H5Tis_variable_str(dst))):
+ *         return -2             # <<<<<<<<<<<<<<
+ *     log_convert_registered(src, dst)
+ * 
+ */
+    __pyx_r = -2;
+    goto __pyx_L0;
+
+    /* "h5py/_conv.pyx":270
+ *     # /!\ Untested
+ * 
+ *     if not (H5Tis_variable_str(src) and (not H5Tis_variable_str(dst))):             # <<<<<<<<<<<<<<
+ *         return -2
+ *     log_convert_registered(src, dst)
+ */
+  }
+
+  /* "h5py/_conv.pyx":272
+ *     if not (H5Tis_variable_str(src) and (not H5Tis_variable_str(dst))):
+ *         return -2
+ *     log_convert_registered(src, dst)             # <<<<<<<<<<<<<<
+ * 
+ *     sizes = <conv_size_t*>emalloc(sizeof(conv_size_t))
+ */
+  __pyx_f_4h5py_5_conv_log_convert_registered(__pyx_v_src, __pyx_v_dst);
+
+  /* "h5py/_conv.pyx":274
+ *     log_convert_registered(src, dst)
+ * 
+ *     sizes = <conv_size_t*>emalloc(sizeof(conv_size_t))             # <<<<<<<<<<<<<<
+ *     priv[0] = sizes
+ * 
+ */
+  __pyx_t_4 = __pyx_f_4h5py_5utils_emalloc((sizeof(__pyx_t_4h5py_5_conv_conv_size_t))); if (unlikely(__pyx_t_4 == ((void *)NULL) && PyErr_Occurred())) __PYX_ERR(0, 274, __pyx_L1_error)
+  __pyx_v_sizes = ((__pyx_t_4h5py_5_conv_conv_size_t *)__pyx_t_4);
+
+  /* "h5py/_conv.pyx":275
+ * 
+ *     sizes = <conv_size_t*>emalloc(sizeof(conv_size_t))
+ *     priv[0] = sizes             # <<<<<<<<<<<<<<
+ * 
+ *     sizes[0].src_size = H5Tget_size(src)
+ */
+  (__pyx_v_priv[0]) = __pyx_v_sizes;
+
+  /* "h5py/_conv.pyx":277
+ *     priv[0] = sizes
+ * 
+ *     sizes[0].src_size = H5Tget_size(src)             # <<<<<<<<<<<<<<
+ *     sizes[0].dst_size = H5Tget_size(dst)
+ *     return 0
+ */
+  __pyx_t_5 = __pyx_f_4h5py_4defs_H5Tget_size(__pyx_v_src); if (unlikely(__pyx_t_5 == ((size_t)((size_t)0)))) __PYX_ERR(0, 277, __pyx_L1_error)
+  (__pyx_v_sizes[0]).src_size = __pyx_t_5;
+
+  /* "h5py/_conv.pyx":278
+ * 
+ *     sizes[0].src_size = H5Tget_size(src)
+ *     sizes[0].dst_size = H5Tget_size(dst)             # <<<<<<<<<<<<<<
+ *     return 0
+ * 
+ */
+  __pyx_t_5 = __pyx_f_4h5py_4defs_H5Tget_size(__pyx_v_dst); if (unlikely(__pyx_t_5 == ((size_t)((size_t)0)))) __PYX_ERR(0, 278, __pyx_L1_error)
+  (__pyx_v_sizes[0]).dst_size = __pyx_t_5;
+
+  /* "h5py/_conv.pyx":279
+ *     sizes[0].src_size = H5Tget_size(src)
+ *     sizes[0].dst_size = H5Tget_size(dst)
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * cdef herr_t init_fixed2vlen(hid_t src, hid_t dst, void** priv) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":265
+ * # VLEN to fixed-width strings
+ * 
+ * cdef herr_t init_vlen2fixed(hid_t src, hid_t dst, void** priv) except -1:             # <<<<<<<<<<<<<<
+ *     cdef conv_size_t *sizes
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("h5py._conv.init_vlen2fixed", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":281
+ *     return 0
+ * 
+ * cdef herr_t init_fixed2vlen(hid_t src, hid_t dst, void** priv) except -1:             # <<<<<<<<<<<<<<
+ * 
+ *     cdef conv_size_t *sizes
+ */
+
+static herr_t __pyx_f_4h5py_5_conv_init_fixed2vlen(hid_t __pyx_v_src, hid_t __pyx_v_dst, void **__pyx_v_priv) {
+  __pyx_t_4h5py_5_conv_conv_size_t *__pyx_v_sizes;
+  herr_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  htri_t __pyx_t_2;
+  int __pyx_t_3;
+  void *__pyx_t_4;
+  size_t __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("init_fixed2vlen", 0);
+
+  /* "h5py/_conv.pyx":284
+ * 
+ *     cdef conv_size_t *sizes
+ *     if not (H5Tis_variable_str(dst) and (not H5Tis_variable_str(src))):             # <<<<<<<<<<<<<<
+ *         return -2
+ *     log_convert_registered(src, dst)
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tis_variable_str(__pyx_v_dst); if (unlikely(__pyx_t_2 == ((htri_t)((htri_t)-1L)))) __PYX_ERR(0, 284, __pyx_L1_error)
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tis_variable_str(__pyx_v_src); if (unlikely(__pyx_t_2 == ((htri_t)((htri_t)-1L)))) __PYX_ERR(0, 284, __pyx_L1_error)
+  __pyx_t_3 = ((!(__pyx_t_2 != 0)) != 0);
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  __pyx_t_3 = ((!__pyx_t_1) != 0);
+  if (__pyx_t_3) {
+
+    /* "h5py/_conv.pyx":285
+ *     cdef conv_size_t *sizes
+ *     if not (H5Tis_variable_str(dst) and (not H5Tis_variable_str(src))):
+ *         return -2             # <<<<<<<<<<<<<<
+ *     log_convert_registered(src, dst)
+ * 
+ */
+    __pyx_r = -2;
+    goto __pyx_L0;
+
+    /* "h5py/_conv.pyx":284
+ * 
+ *     cdef conv_size_t *sizes
+ *     if not (H5Tis_variable_str(dst) and (not H5Tis_variable_str(src))):             # <<<<<<<<<<<<<<
+ *         return -2
+ *     log_convert_registered(src, dst)
+ */
+  }
+
+  /* "h5py/_conv.pyx":286
+ *     if not (H5Tis_variable_str(dst) and (not H5Tis_variable_str(src))):
+ *         return -2
+ *     log_convert_registered(src, dst)             # <<<<<<<<<<<<<<
+ * 
+ *     # /!\ untested !
+ */
+  __pyx_f_4h5py_5_conv_log_convert_registered(__pyx_v_src, __pyx_v_dst);
+
+  /* "h5py/_conv.pyx":290
+ *     # /!\ untested !
+ * 
+ *     sizes = <conv_size_t*>emalloc(sizeof(conv_size_t))             # <<<<<<<<<<<<<<
+ *     priv[0] = sizes
+ *     sizes[0].src_size = H5Tget_size(src)
+ */
+  __pyx_t_4 = __pyx_f_4h5py_5utils_emalloc((sizeof(__pyx_t_4h5py_5_conv_conv_size_t))); if (unlikely(__pyx_t_4 == ((void *)NULL) && PyErr_Occurred())) __PYX_ERR(0, 290, __pyx_L1_error)
+  __pyx_v_sizes = ((__pyx_t_4h5py_5_conv_conv_size_t *)__pyx_t_4);
+
+  /* "h5py/_conv.pyx":291
+ * 
+ *     sizes = <conv_size_t*>emalloc(sizeof(conv_size_t))
+ *     priv[0] = sizes             # <<<<<<<<<<<<<<
+ *     sizes[0].src_size = H5Tget_size(src)
+ *     sizes[0].dst_size = H5Tget_size(dst)
+ */
+  (__pyx_v_priv[0]) = __pyx_v_sizes;
+
+  /* "h5py/_conv.pyx":292
+ *     sizes = <conv_size_t*>emalloc(sizeof(conv_size_t))
+ *     priv[0] = sizes
+ *     sizes[0].src_size = H5Tget_size(src)             # <<<<<<<<<<<<<<
+ *     sizes[0].dst_size = H5Tget_size(dst)
+ * 
+ */
+  __pyx_t_5 = __pyx_f_4h5py_4defs_H5Tget_size(__pyx_v_src); if (unlikely(__pyx_t_5 == ((size_t)((size_t)0)))) __PYX_ERR(0, 292, __pyx_L1_error)
+  (__pyx_v_sizes[0]).src_size = __pyx_t_5;
+
+  /* "h5py/_conv.pyx":293
+ *     priv[0] = sizes
+ *     sizes[0].src_size = H5Tget_size(src)
+ *     sizes[0].dst_size = H5Tget_size(dst)             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+  __pyx_t_5 = __pyx_f_4h5py_4defs_H5Tget_size(__pyx_v_dst); if (unlikely(__pyx_t_5 == ((size_t)((size_t)0)))) __PYX_ERR(0, 293, __pyx_L1_error)
+  (__pyx_v_sizes[0]).dst_size = __pyx_t_5;
+
+  /* "h5py/_conv.pyx":295
+ *     sizes[0].dst_size = H5Tget_size(dst)
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * cdef int conv_vlen2fixed(void* ipt, void* opt, void* bkg, void* priv) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":281
+ *     return 0
+ * 
+ * cdef herr_t init_fixed2vlen(hid_t src, hid_t dst, void** priv) except -1:             # <<<<<<<<<<<<<<
+ * 
+ *     cdef conv_size_t *sizes
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("h5py._conv.init_fixed2vlen", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":297
+ *     return 0
+ * 
+ * cdef int conv_vlen2fixed(void* ipt, void* opt, void* bkg, void* priv) except -1:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         char** buf_vlen = <char**>ipt
+ */
+
+static int __pyx_f_4h5py_5_conv_conv_vlen2fixed(void *__pyx_v_ipt, void *__pyx_v_opt, CYTHON_UNUSED void *__pyx_v_bkg, void *__pyx_v_priv) {
+  char **__pyx_v_buf_vlen;
+  char *__pyx_v_buf_fixed;
+  char *__pyx_v_temp_string;
+  size_t __pyx_v_temp_string_len;
+  __pyx_t_4h5py_5_conv_conv_size_t *__pyx_v_sizes;
+  char *__pyx_v_buf_vlen0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("conv_vlen2fixed", 0);
+
+  /* "h5py/_conv.pyx":299
+ * cdef int conv_vlen2fixed(void* ipt, void* opt, void* bkg, void* priv) except -1:
+ *     cdef:
+ *         char** buf_vlen = <char**>ipt             # <<<<<<<<<<<<<<
+ *         char* buf_fixed = <char*>opt
+ *         char* temp_string = NULL
+ */
+  __pyx_v_buf_vlen = ((char **)__pyx_v_ipt);
+
+  /* "h5py/_conv.pyx":300
+ *     cdef:
+ *         char** buf_vlen = <char**>ipt
+ *         char* buf_fixed = <char*>opt             # <<<<<<<<<<<<<<
+ *         char* temp_string = NULL
+ *         size_t temp_string_len = 0  # Without null term
+ */
+  __pyx_v_buf_fixed = ((char *)__pyx_v_opt);
+
+  /* "h5py/_conv.pyx":301
+ *         char** buf_vlen = <char**>ipt
+ *         char* buf_fixed = <char*>opt
+ *         char* temp_string = NULL             # <<<<<<<<<<<<<<
+ *         size_t temp_string_len = 0  # Without null term
+ *         conv_size_t *sizes = <conv_size_t*>priv
+ */
+  __pyx_v_temp_string = NULL;
+
+  /* "h5py/_conv.pyx":302
+ *         char* buf_fixed = <char*>opt
+ *         char* temp_string = NULL
+ *         size_t temp_string_len = 0  # Without null term             # <<<<<<<<<<<<<<
+ *         conv_size_t *sizes = <conv_size_t*>priv
+ *         char* buf_vlen0
+ */
+  __pyx_v_temp_string_len = 0;
+
+  /* "h5py/_conv.pyx":303
+ *         char* temp_string = NULL
+ *         size_t temp_string_len = 0  # Without null term
+ *         conv_size_t *sizes = <conv_size_t*>priv             # <<<<<<<<<<<<<<
+ *         char* buf_vlen0
+ * 
+ */
+  __pyx_v_sizes = ((__pyx_t_4h5py_5_conv_conv_size_t *)__pyx_v_priv);
+
+  /* "h5py/_conv.pyx":308
+ *     # /!\ untested !
+ * 
+ *     buf_vlen0 = buf_vlen[0]             # <<<<<<<<<<<<<<
+ * 
+ *     if buf_vlen0 != NULL:
+ */
+  __pyx_v_buf_vlen0 = (__pyx_v_buf_vlen[0]);
+
+  /* "h5py/_conv.pyx":310
+ *     buf_vlen0 = buf_vlen[0]
+ * 
+ *     if buf_vlen0 != NULL:             # <<<<<<<<<<<<<<
+ *         temp_string = buf_vlen0
+ *         temp_string_len = strlen(temp_string)
+ */
+  __pyx_t_1 = ((__pyx_v_buf_vlen0 != NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "h5py/_conv.pyx":311
+ * 
+ *     if buf_vlen0 != NULL:
+ *         temp_string = buf_vlen0             # <<<<<<<<<<<<<<
+ *         temp_string_len = strlen(temp_string)
+ * 
+ */
+    __pyx_v_temp_string = __pyx_v_buf_vlen0;
+
+    /* "h5py/_conv.pyx":312
+ *     if buf_vlen0 != NULL:
+ *         temp_string = buf_vlen0
+ *         temp_string_len = strlen(temp_string)             # <<<<<<<<<<<<<<
+ * 
+ *         if temp_string_len <= sizes[0].dst_size:
+ */
+    __pyx_v_temp_string_len = strlen(__pyx_v_temp_string);
+
+    /* "h5py/_conv.pyx":314
+ *         temp_string_len = strlen(temp_string)
+ * 
+ *         if temp_string_len <= sizes[0].dst_size:             # <<<<<<<<<<<<<<
+ *             # Pad with zeros
+ *             memcpy(buf_fixed, temp_string, temp_string_len)
+ */
+    __pyx_t_1 = ((__pyx_v_temp_string_len <= (__pyx_v_sizes[0]).dst_size) != 0);
+    if (__pyx_t_1) {
+
+      /* "h5py/_conv.pyx":316
+ *         if temp_string_len <= sizes[0].dst_size:
+ *             # Pad with zeros
+ *             memcpy(buf_fixed, temp_string, temp_string_len)             # <<<<<<<<<<<<<<
+ *             memset(buf_fixed + temp_string_len, c'\0', sizes[0].dst_size - temp_string_len)
+ *         else:
+ */
+      (void)(memcpy(__pyx_v_buf_fixed, __pyx_v_temp_string, __pyx_v_temp_string_len));
+
+      /* "h5py/_conv.pyx":317
+ *             # Pad with zeros
+ *             memcpy(buf_fixed, temp_string, temp_string_len)
+ *             memset(buf_fixed + temp_string_len, c'\0', sizes[0].dst_size - temp_string_len)             # <<<<<<<<<<<<<<
+ *         else:
+ *             # Simply truncate the string
+ */
+      (void)(memset((__pyx_v_buf_fixed + __pyx_v_temp_string_len), '\x00', ((__pyx_v_sizes[0]).dst_size - __pyx_v_temp_string_len)));
+
+      /* "h5py/_conv.pyx":314
+ *         temp_string_len = strlen(temp_string)
+ * 
+ *         if temp_string_len <= sizes[0].dst_size:             # <<<<<<<<<<<<<<
+ *             # Pad with zeros
+ *             memcpy(buf_fixed, temp_string, temp_string_len)
+ */
+      goto __pyx_L4;
+    }
+
+    /* "h5py/_conv.pyx":320
+ *         else:
+ *             # Simply truncate the string
+ *             memcpy(buf_fixed, temp_string, sizes[0].dst_size)             # <<<<<<<<<<<<<<
+ *     else:
+ *         memset(buf_fixed, c'\0', sizes[0].dst_size)
+ */
+    /*else*/ {
+      (void)(memcpy(__pyx_v_buf_fixed, __pyx_v_temp_string, (__pyx_v_sizes[0]).dst_size));
+    }
+    __pyx_L4:;
+
+    /* "h5py/_conv.pyx":310
+ *     buf_vlen0 = buf_vlen[0]
+ * 
+ *     if buf_vlen0 != NULL:             # <<<<<<<<<<<<<<
+ *         temp_string = buf_vlen0
+ *         temp_string_len = strlen(temp_string)
+ */
+    goto __pyx_L3;
+  }
+
+  /* "h5py/_conv.pyx":322
+ *             memcpy(buf_fixed, temp_string, sizes[0].dst_size)
+ *     else:
+ *         memset(buf_fixed, c'\0', sizes[0].dst_size)             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+  /*else*/ {
+    (void)(memset(__pyx_v_buf_fixed, '\x00', (__pyx_v_sizes[0]).dst_size));
+  }
+  __pyx_L3:;
+
+  /* "h5py/_conv.pyx":324
+ *         memset(buf_fixed, c'\0', sizes[0].dst_size)
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * cdef int conv_fixed2vlen(void* ipt, void* opt, void* bkg, void* priv) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":297
+ *     return 0
+ * 
+ * cdef int conv_vlen2fixed(void* ipt, void* opt, void* bkg, void* priv) except -1:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         char** buf_vlen = <char**>ipt
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":326
+ *     return 0
+ * 
+ * cdef int conv_fixed2vlen(void* ipt, void* opt, void* bkg, void* priv) except -1:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         char** buf_vlen = <char**>opt
+ */
+
+static int __pyx_f_4h5py_5_conv_conv_fixed2vlen(void *__pyx_v_ipt, void *__pyx_v_opt, CYTHON_UNUSED void *__pyx_v_bkg, void *__pyx_v_priv) {
+  char **__pyx_v_buf_vlen;
+  char *__pyx_v_buf_fixed;
+  char *__pyx_v_temp_string;
+  __pyx_t_4h5py_5_conv_conv_size_t *__pyx_v_sizes;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  void *__pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("conv_fixed2vlen", 0);
+
+  /* "h5py/_conv.pyx":328
+ * cdef int conv_fixed2vlen(void* ipt, void* opt, void* bkg, void* priv) except -1:
+ *     cdef:
+ *         char** buf_vlen = <char**>opt             # <<<<<<<<<<<<<<
+ *         char* buf_fixed = <char*>ipt
+ *         char* temp_string = NULL
+ */
+  __pyx_v_buf_vlen = ((char **)__pyx_v_opt);
+
+  /* "h5py/_conv.pyx":329
+ *     cdef:
+ *         char** buf_vlen = <char**>opt
+ *         char* buf_fixed = <char*>ipt             # <<<<<<<<<<<<<<
+ *         char* temp_string = NULL
+ *         conv_size_t *sizes = <conv_size_t*>priv
+ */
+  __pyx_v_buf_fixed = ((char *)__pyx_v_ipt);
+
+  /* "h5py/_conv.pyx":330
+ *         char** buf_vlen = <char**>opt
+ *         char* buf_fixed = <char*>ipt
+ *         char* temp_string = NULL             # <<<<<<<<<<<<<<
+ *         conv_size_t *sizes = <conv_size_t*>priv
+ * 
+ */
+  __pyx_v_temp_string = NULL;
+
+  /* "h5py/_conv.pyx":331
+ *         char* buf_fixed = <char*>ipt
+ *         char* temp_string = NULL
+ *         conv_size_t *sizes = <conv_size_t*>priv             # <<<<<<<<<<<<<<
+ * 
+ *     # /!\ untested !
+ */
+  __pyx_v_sizes = ((__pyx_t_4h5py_5_conv_conv_size_t *)__pyx_v_priv);
+
+  /* "h5py/_conv.pyx":335
+ *     # /!\ untested !
+ * 
+ *     temp_string = <char*>emalloc(sizes[0].src_size+1)             # <<<<<<<<<<<<<<
+ *     memcpy(temp_string, buf_fixed, sizes[0].src_size)
+ *     temp_string[sizes[0].src_size] = c'\0'
+ */
+  __pyx_t_1 = __pyx_f_4h5py_5utils_emalloc(((__pyx_v_sizes[0]).src_size + 1)); if (unlikely(__pyx_t_1 == ((void *)NULL) && PyErr_Occurred())) __PYX_ERR(0, 335, __pyx_L1_error)
+  __pyx_v_temp_string = ((char *)__pyx_t_1);
+
+  /* "h5py/_conv.pyx":336
+ * 
+ *     temp_string = <char*>emalloc(sizes[0].src_size+1)
+ *     memcpy(temp_string, buf_fixed, sizes[0].src_size)             # <<<<<<<<<<<<<<
+ *     temp_string[sizes[0].src_size] = c'\0'
+ * 
+ */
+  (void)(memcpy(__pyx_v_temp_string, __pyx_v_buf_fixed, (__pyx_v_sizes[0]).src_size));
+
+  /* "h5py/_conv.pyx":337
+ *     temp_string = <char*>emalloc(sizes[0].src_size+1)
+ *     memcpy(temp_string, buf_fixed, sizes[0].src_size)
+ *     temp_string[sizes[0].src_size] = c'\0'             # <<<<<<<<<<<<<<
+ * 
+ *     memcpy(buf_vlen, &temp_string, sizeof(temp_string))
+ */
+  (__pyx_v_temp_string[(__pyx_v_sizes[0]).src_size]) = '\x00';
+
+  /* "h5py/_conv.pyx":339
+ *     temp_string[sizes[0].src_size] = c'\0'
+ * 
+ *     memcpy(buf_vlen, &temp_string, sizeof(temp_string))             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+  (void)(memcpy(__pyx_v_buf_vlen, (&__pyx_v_temp_string), (sizeof(__pyx_v_temp_string))));
+
+  /* "h5py/_conv.pyx":341
+ *     memcpy(buf_vlen, &temp_string, sizeof(temp_string))
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * # =============================================================================
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":326
+ *     return 0
+ * 
+ * cdef int conv_fixed2vlen(void* ipt, void* opt, void* bkg, void* priv) except -1:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         char** buf_vlen = <char**>opt
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("h5py._conv.conv_fixed2vlen", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":346
+ * # HDF5 references to Python instances of h5r.Reference
+ * 
+ * cdef inline int conv_objref2pyref(void* ipt, void* opt, void* bkg, void* priv) except -1:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>opt
+ */
+
+static CYTHON_INLINE int __pyx_f_4h5py_5_conv_conv_objref2pyref(void *__pyx_v_ipt, void *__pyx_v_opt, CYTHON_UNUSED void *__pyx_v_bkg, CYTHON_UNUSED void *__pyx_v_priv) {
+  PyObject **__pyx_v_buf_obj;
+  hobj_ref_t *__pyx_v_buf_ref;
+  struct __pyx_obj_4h5py_3h5r_Reference *__pyx_v_ref = 0;
+  PyObject *__pyx_v_ref_ptr;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("conv_objref2pyref", 0);
+
+  /* "h5py/_conv.pyx":348
+ * cdef inline int conv_objref2pyref(void* ipt, void* opt, void* bkg, void* priv) except -1:
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>opt             # <<<<<<<<<<<<<<
+ *         hobj_ref_t* buf_ref = <hobj_ref_t*>ipt
+ *         Reference ref
+ */
+  __pyx_v_buf_obj = ((PyObject **)__pyx_v_opt);
+
+  /* "h5py/_conv.pyx":349
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>opt
+ *         hobj_ref_t* buf_ref = <hobj_ref_t*>ipt             # <<<<<<<<<<<<<<
+ *         Reference ref
+ *         PyObject* ref_ptr = NULL
+ */
+  __pyx_v_buf_ref = ((hobj_ref_t *)__pyx_v_ipt);
+
+  /* "h5py/_conv.pyx":351
+ *         hobj_ref_t* buf_ref = <hobj_ref_t*>ipt
+ *         Reference ref
+ *         PyObject* ref_ptr = NULL             # <<<<<<<<<<<<<<
+ * 
+ *     ref = Reference()
+ */
+  __pyx_v_ref_ptr = NULL;
+
+  /* "h5py/_conv.pyx":353
+ *         PyObject* ref_ptr = NULL
+ * 
+ *     ref = Reference()             # <<<<<<<<<<<<<<
+ *     ref.ref.obj_ref = buf_ref[0]
+ *     ref.typecode = H5R_OBJECT
+ */
+  __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_4h5py_3h5r_Reference)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 353, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_ref = ((struct __pyx_obj_4h5py_3h5r_Reference *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "h5py/_conv.pyx":354
+ * 
+ *     ref = Reference()
+ *     ref.ref.obj_ref = buf_ref[0]             # <<<<<<<<<<<<<<
+ *     ref.typecode = H5R_OBJECT
+ * 
+ */
+  __pyx_v_ref->ref.obj_ref = (__pyx_v_buf_ref[0]);
+
+  /* "h5py/_conv.pyx":355
+ *     ref = Reference()
+ *     ref.ref.obj_ref = buf_ref[0]
+ *     ref.typecode = H5R_OBJECT             # <<<<<<<<<<<<<<
+ * 
+ *     ref_ptr = <PyObject*>ref
+ */
+  __pyx_v_ref->typecode = H5R_OBJECT;
+
+  /* "h5py/_conv.pyx":357
+ *     ref.typecode = H5R_OBJECT
+ * 
+ *     ref_ptr = <PyObject*>ref             # <<<<<<<<<<<<<<
+ *     Py_INCREF(ref)  # prevent ref from garbage collection
+ *     buf_obj[0] = ref_ptr
+ */
+  __pyx_v_ref_ptr = ((PyObject *)__pyx_v_ref);
+
+  /* "h5py/_conv.pyx":358
+ * 
+ *     ref_ptr = <PyObject*>ref
+ *     Py_INCREF(ref)  # prevent ref from garbage collection             # <<<<<<<<<<<<<<
+ *     buf_obj[0] = ref_ptr
+ * 
+ */
+  Py_INCREF(((PyObject *)__pyx_v_ref));
+
+  /* "h5py/_conv.pyx":359
+ *     ref_ptr = <PyObject*>ref
+ *     Py_INCREF(ref)  # prevent ref from garbage collection
+ *     buf_obj[0] = ref_ptr             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+  (__pyx_v_buf_obj[0]) = __pyx_v_ref_ptr;
+
+  /* "h5py/_conv.pyx":361
+ *     buf_obj[0] = ref_ptr
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int conv_pyref2objref(void* ipt, void* opt, void* bkg, void* priv)  except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":346
+ * # HDF5 references to Python instances of h5r.Reference
+ * 
+ * cdef inline int conv_objref2pyref(void* ipt, void* opt, void* bkg, void* priv) except -1:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>opt
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("h5py._conv.conv_objref2pyref", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_ref);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":363
+ *     return 0
+ * 
+ * cdef inline int conv_pyref2objref(void* ipt, void* opt, void* bkg, void* priv)  except -1:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>ipt
+ */
+
+static CYTHON_INLINE int __pyx_f_4h5py_5_conv_conv_pyref2objref(void *__pyx_v_ipt, void *__pyx_v_opt, CYTHON_UNUSED void *__pyx_v_bkg, CYTHON_UNUSED void *__pyx_v_priv) {
+  PyObject **__pyx_v_buf_obj;
+  hobj_ref_t *__pyx_v_buf_ref;
+  PyObject *__pyx_v_obj = 0;
+  struct __pyx_obj_4h5py_3h5r_Reference *__pyx_v_ref = 0;
+  PyObject *__pyx_v_buf_obj0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  hobj_ref_t __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("conv_pyref2objref", 0);
+
+  /* "h5py/_conv.pyx":365
+ * cdef inline int conv_pyref2objref(void* ipt, void* opt, void* bkg, void* priv)  except -1:
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>ipt             # <<<<<<<<<<<<<<
+ *         hobj_ref_t* buf_ref = <hobj_ref_t*>opt
+ *         object obj
+ */
+  __pyx_v_buf_obj = ((PyObject **)__pyx_v_ipt);
+
+  /* "h5py/_conv.pyx":366
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>ipt
+ *         hobj_ref_t* buf_ref = <hobj_ref_t*>opt             # <<<<<<<<<<<<<<
+ *         object obj
+ *         Reference ref
+ */
+  __pyx_v_buf_ref = ((hobj_ref_t *)__pyx_v_opt);
+
+  /* "h5py/_conv.pyx":371
+ *         PyObject* buf_obj0
+ * 
+ *     buf_obj0 = buf_obj[0]             # <<<<<<<<<<<<<<
+ * 
+ *     if buf_obj0 != NULL and buf_obj0 != Py_None:
+ */
+  __pyx_v_buf_obj0 = (__pyx_v_buf_obj[0]);
+
+  /* "h5py/_conv.pyx":373
+ *     buf_obj0 = buf_obj[0]
+ * 
+ *     if buf_obj0 != NULL and buf_obj0 != Py_None:             # <<<<<<<<<<<<<<
+ *         obj = <object>(buf_obj0)
+ *         if not isinstance(obj, Reference):
+ */
+  __pyx_t_2 = ((__pyx_v_buf_obj0 != NULL) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_buf_obj0 != __pyx_v_4h5py_5_conv_Py_None) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "h5py/_conv.pyx":374
+ * 
+ *     if buf_obj0 != NULL and buf_obj0 != Py_None:
+ *         obj = <object>(buf_obj0)             # <<<<<<<<<<<<<<
+ *         if not isinstance(obj, Reference):
+ *             raise TypeError("Can't convert incompatible object to HDF5 object reference")
+ */
+    __pyx_t_3 = ((PyObject *)__pyx_v_buf_obj0);
+    __Pyx_INCREF(__pyx_t_3);
+    __pyx_v_obj = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "h5py/_conv.pyx":375
+ *     if buf_obj0 != NULL and buf_obj0 != Py_None:
+ *         obj = <object>(buf_obj0)
+ *         if not isinstance(obj, Reference):             # <<<<<<<<<<<<<<
+ *             raise TypeError("Can't convert incompatible object to HDF5 object reference")
+ *         ref = <Reference>(buf_obj0)
+ */
+    __pyx_t_1 = __Pyx_TypeCheck(__pyx_v_obj, __pyx_ptype_4h5py_3h5r_Reference); 
+    __pyx_t_2 = ((!(__pyx_t_1 != 0)) != 0);
+    if (unlikely(__pyx_t_2)) {
+
+      /* "h5py/_conv.pyx":376
+ *         obj = <object>(buf_obj0)
+ *         if not isinstance(obj, Reference):
+ *             raise TypeError("Can't convert incompatible object to HDF5 object reference")             # <<<<<<<<<<<<<<
+ *         ref = <Reference>(buf_obj0)
+ *         buf_ref[0] = ref.ref.obj_ref
+ */
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 376, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __PYX_ERR(0, 376, __pyx_L1_error)
+
+      /* "h5py/_conv.pyx":375
+ *     if buf_obj0 != NULL and buf_obj0 != Py_None:
+ *         obj = <object>(buf_obj0)
+ *         if not isinstance(obj, Reference):             # <<<<<<<<<<<<<<
+ *             raise TypeError("Can't convert incompatible object to HDF5 object reference")
+ *         ref = <Reference>(buf_obj0)
+ */
+    }
+
+    /* "h5py/_conv.pyx":377
+ *         if not isinstance(obj, Reference):
+ *             raise TypeError("Can't convert incompatible object to HDF5 object reference")
+ *         ref = <Reference>(buf_obj0)             # <<<<<<<<<<<<<<
+ *         buf_ref[0] = ref.ref.obj_ref
+ *     else:
+ */
+    __pyx_t_3 = ((PyObject *)__pyx_v_buf_obj0);
+    __Pyx_INCREF(__pyx_t_3);
+    __pyx_v_ref = ((struct __pyx_obj_4h5py_3h5r_Reference *)__pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "h5py/_conv.pyx":378
+ *             raise TypeError("Can't convert incompatible object to HDF5 object reference")
+ *         ref = <Reference>(buf_obj0)
+ *         buf_ref[0] = ref.ref.obj_ref             # <<<<<<<<<<<<<<
+ *     else:
+ *         memset(buf_ref, c'\0', sizeof(hobj_ref_t))
+ */
+    __pyx_t_4 = __pyx_v_ref->ref.obj_ref;
+    (__pyx_v_buf_ref[0]) = __pyx_t_4;
+
+    /* "h5py/_conv.pyx":373
+ *     buf_obj0 = buf_obj[0]
+ * 
+ *     if buf_obj0 != NULL and buf_obj0 != Py_None:             # <<<<<<<<<<<<<<
+ *         obj = <object>(buf_obj0)
+ *         if not isinstance(obj, Reference):
+ */
+    goto __pyx_L3;
+  }
+
+  /* "h5py/_conv.pyx":380
+ *         buf_ref[0] = ref.ref.obj_ref
+ *     else:
+ *         memset(buf_ref, c'\0', sizeof(hobj_ref_t))             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+  /*else*/ {
+    (void)(memset(__pyx_v_buf_ref, '\x00', (sizeof(hobj_ref_t))));
+  }
+  __pyx_L3:;
+
+  /* "h5py/_conv.pyx":382
+ *         memset(buf_ref, c'\0', sizeof(hobj_ref_t))
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int conv_regref2pyref(void* ipt, void* opt, void* bkg, void* priv) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":363
+ *     return 0
+ * 
+ * cdef inline int conv_pyref2objref(void* ipt, void* opt, void* bkg, void* priv)  except -1:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>ipt
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("h5py._conv.conv_pyref2objref", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_obj);
+  __Pyx_XDECREF((PyObject *)__pyx_v_ref);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":384
+ *     return 0
+ * 
+ * cdef inline int conv_regref2pyref(void* ipt, void* opt, void* bkg, void* priv) except -1:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>opt
+ */
+
+static CYTHON_INLINE int __pyx_f_4h5py_5_conv_conv_regref2pyref(void *__pyx_v_ipt, void *__pyx_v_opt, void *__pyx_v_bkg, CYTHON_UNUSED void *__pyx_v_priv) {
+  PyObject **__pyx_v_buf_obj;
+  PyObject **__pyx_v_bkg_obj;
+  __pyx_t_4h5py_3h5r_hdset_reg_ref_t *__pyx_v_buf_ref;
+  struct __pyx_obj_4h5py_3h5r_RegionReference *__pyx_v_ref = 0;
+  PyObject *__pyx_v_ref_ptr;
+  PyObject *__pyx_v_bkg_obj0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("conv_regref2pyref", 0);
+
+  /* "h5py/_conv.pyx":386
+ * cdef inline int conv_regref2pyref(void* ipt, void* opt, void* bkg, void* priv) except -1:
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>opt             # <<<<<<<<<<<<<<
+ *         PyObject** bkg_obj = <PyObject**>bkg
+ *         hdset_reg_ref_t* buf_ref = <hdset_reg_ref_t*>ipt
+ */
+  __pyx_v_buf_obj = ((PyObject **)__pyx_v_opt);
+
+  /* "h5py/_conv.pyx":387
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>opt
+ *         PyObject** bkg_obj = <PyObject**>bkg             # <<<<<<<<<<<<<<
+ *         hdset_reg_ref_t* buf_ref = <hdset_reg_ref_t*>ipt
+ *         RegionReference ref
+ */
+  __pyx_v_bkg_obj = ((PyObject **)__pyx_v_bkg);
+
+  /* "h5py/_conv.pyx":388
+ *         PyObject** buf_obj = <PyObject**>opt
+ *         PyObject** bkg_obj = <PyObject**>bkg
+ *         hdset_reg_ref_t* buf_ref = <hdset_reg_ref_t*>ipt             # <<<<<<<<<<<<<<
+ *         RegionReference ref
+ *         PyObject* ref_ptr = NULL
+ */
+  __pyx_v_buf_ref = ((__pyx_t_4h5py_3h5r_hdset_reg_ref_t *)__pyx_v_ipt);
+
+  /* "h5py/_conv.pyx":390
+ *         hdset_reg_ref_t* buf_ref = <hdset_reg_ref_t*>ipt
+ *         RegionReference ref
+ *         PyObject* ref_ptr = NULL             # <<<<<<<<<<<<<<
+ *         PyObject* bkg_obj0
+ * 
+ */
+  __pyx_v_ref_ptr = NULL;
+
+  /* "h5py/_conv.pyx":393
+ *         PyObject* bkg_obj0
+ * 
+ *     bkg_obj0 = bkg_obj[0]             # <<<<<<<<<<<<<<
+ *     ref = RegionReference()
+ *     ref.ref.reg_ref = buf_ref[0]
+ */
+  __pyx_v_bkg_obj0 = (__pyx_v_bkg_obj[0]);
+
+  /* "h5py/_conv.pyx":394
+ * 
+ *     bkg_obj0 = bkg_obj[0]
+ *     ref = RegionReference()             # <<<<<<<<<<<<<<
+ *     ref.ref.reg_ref = buf_ref[0]
+ *     ref.typecode = H5R_DATASET_REGION
+ */
+  __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_4h5py_3h5r_RegionReference)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 394, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_ref = ((struct __pyx_obj_4h5py_3h5r_RegionReference *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "h5py/_conv.pyx":395
+ *     bkg_obj0 = bkg_obj[0]
+ *     ref = RegionReference()
+ *     ref.ref.reg_ref = buf_ref[0]             # <<<<<<<<<<<<<<
+ *     ref.typecode = H5R_DATASET_REGION
+ *     ref_ptr = <PyObject*>ref
+ */
+  memcpy(&(__pyx_v_ref->__pyx_base.ref.reg_ref[0]), (__pyx_v_buf_ref[0]), sizeof(__pyx_v_ref->__pyx_base.ref.reg_ref[0]) * (12));
+
+  /* "h5py/_conv.pyx":396
+ *     ref = RegionReference()
+ *     ref.ref.reg_ref = buf_ref[0]
+ *     ref.typecode = H5R_DATASET_REGION             # <<<<<<<<<<<<<<
+ *     ref_ptr = <PyObject*>ref
+ *     Py_INCREF(ref)  # because Cython discards its reference when the
+ */
+  __pyx_v_ref->__pyx_base.typecode = H5R_DATASET_REGION;
+
+  /* "h5py/_conv.pyx":397
+ *     ref.ref.reg_ref = buf_ref[0]
+ *     ref.typecode = H5R_DATASET_REGION
+ *     ref_ptr = <PyObject*>ref             # <<<<<<<<<<<<<<
+ *     Py_INCREF(ref)  # because Cython discards its reference when the
+ *                         # function exits
+ */
+  __pyx_v_ref_ptr = ((PyObject *)__pyx_v_ref);
+
+  /* "h5py/_conv.pyx":398
+ *     ref.typecode = H5R_DATASET_REGION
+ *     ref_ptr = <PyObject*>ref
+ *     Py_INCREF(ref)  # because Cython discards its reference when the             # <<<<<<<<<<<<<<
+ *                         # function exits
+ * 
+ */
+  Py_INCREF(((PyObject *)__pyx_v_ref));
+
+  /* "h5py/_conv.pyx":401
+ *                         # function exits
+ * 
+ *     Py_XDECREF(bkg_obj0)             # <<<<<<<<<<<<<<
+ *     buf_obj[0] = ref_ptr
+ * 
+ */
+  Py_XDECREF(__pyx_v_bkg_obj0);
+
+  /* "h5py/_conv.pyx":402
+ * 
+ *     Py_XDECREF(bkg_obj0)
+ *     buf_obj[0] = ref_ptr             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+  (__pyx_v_buf_obj[0]) = __pyx_v_ref_ptr;
+
+  /* "h5py/_conv.pyx":404
+ *     buf_obj[0] = ref_ptr
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int conv_pyref2regref(void* ipt, void* opt, void* bkg, void* priv) except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":384
+ *     return 0
+ * 
+ * cdef inline int conv_regref2pyref(void* ipt, void* opt, void* bkg, void* priv) except -1:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>opt
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("h5py._conv.conv_regref2pyref", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_ref);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":406
+ *     return 0
+ * 
+ * cdef inline int conv_pyref2regref(void* ipt, void* opt, void* bkg, void* priv) except -1:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>ipt
+ */
+
+static CYTHON_INLINE int __pyx_f_4h5py_5_conv_conv_pyref2regref(void *__pyx_v_ipt, void *__pyx_v_opt, CYTHON_UNUSED void *__pyx_v_bkg, CYTHON_UNUSED void *__pyx_v_priv) {
+  PyObject **__pyx_v_buf_obj;
+  __pyx_t_4h5py_3h5r_hdset_reg_ref_t *__pyx_v_buf_ref;
+  PyObject *__pyx_v_obj = 0;
+  struct __pyx_obj_4h5py_3h5r_RegionReference *__pyx_v_ref = 0;
+  PyObject *__pyx_v_buf_obj0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("conv_pyref2regref", 0);
+
+  /* "h5py/_conv.pyx":408
+ * cdef inline int conv_pyref2regref(void* ipt, void* opt, void* bkg, void* priv) except -1:
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>ipt             # <<<<<<<<<<<<<<
+ *         hdset_reg_ref_t* buf_ref = <hdset_reg_ref_t*>opt
+ *         object obj
+ */
+  __pyx_v_buf_obj = ((PyObject **)__pyx_v_ipt);
+
+  /* "h5py/_conv.pyx":409
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>ipt
+ *         hdset_reg_ref_t* buf_ref = <hdset_reg_ref_t*>opt             # <<<<<<<<<<<<<<
+ *         object obj
+ *         RegionReference ref
+ */
+  __pyx_v_buf_ref = ((__pyx_t_4h5py_3h5r_hdset_reg_ref_t *)__pyx_v_opt);
+
+  /* "h5py/_conv.pyx":414
+ *         PyObject* buf_obj0
+ * 
+ *     buf_obj0 = buf_obj[0]             # <<<<<<<<<<<<<<
+ * 
+ *     if buf_obj0 != NULL and buf_obj0 != Py_None:
+ */
+  __pyx_v_buf_obj0 = (__pyx_v_buf_obj[0]);
+
+  /* "h5py/_conv.pyx":416
+ *     buf_obj0 = buf_obj[0]
+ * 
+ *     if buf_obj0 != NULL and buf_obj0 != Py_None:             # <<<<<<<<<<<<<<
+ *         obj = <object>(buf_obj0)
+ *         if not isinstance(obj, RegionReference):
+ */
+  __pyx_t_2 = ((__pyx_v_buf_obj0 != NULL) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_buf_obj0 != __pyx_v_4h5py_5_conv_Py_None) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "h5py/_conv.pyx":417
+ * 
+ *     if buf_obj0 != NULL and buf_obj0 != Py_None:
+ *         obj = <object>(buf_obj0)             # <<<<<<<<<<<<<<
+ *         if not isinstance(obj, RegionReference):
+ *             raise TypeError("Can't convert incompatible object to HDF5 region reference")
+ */
+    __pyx_t_3 = ((PyObject *)__pyx_v_buf_obj0);
+    __Pyx_INCREF(__pyx_t_3);
+    __pyx_v_obj = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "h5py/_conv.pyx":418
+ *     if buf_obj0 != NULL and buf_obj0 != Py_None:
+ *         obj = <object>(buf_obj0)
+ *         if not isinstance(obj, RegionReference):             # <<<<<<<<<<<<<<
+ *             raise TypeError("Can't convert incompatible object to HDF5 region reference")
+ *         ref = <RegionReference>(buf_obj0)
+ */
+    __pyx_t_1 = __Pyx_TypeCheck(__pyx_v_obj, __pyx_ptype_4h5py_3h5r_RegionReference); 
+    __pyx_t_2 = ((!(__pyx_t_1 != 0)) != 0);
+    if (unlikely(__pyx_t_2)) {
+
+      /* "h5py/_conv.pyx":419
+ *         obj = <object>(buf_obj0)
+ *         if not isinstance(obj, RegionReference):
+ *             raise TypeError("Can't convert incompatible object to HDF5 region reference")             # <<<<<<<<<<<<<<
+ *         ref = <RegionReference>(buf_obj0)
+ *         IF HDF5_VERSION >= (1, 12, 0):
+ */
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 419, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __PYX_ERR(0, 419, __pyx_L1_error)
+
+      /* "h5py/_conv.pyx":418
+ *     if buf_obj0 != NULL and buf_obj0 != Py_None:
+ *         obj = <object>(buf_obj0)
+ *         if not isinstance(obj, RegionReference):             # <<<<<<<<<<<<<<
+ *             raise TypeError("Can't convert incompatible object to HDF5 region reference")
+ *         ref = <RegionReference>(buf_obj0)
+ */
+    }
+
+    /* "h5py/_conv.pyx":420
+ *         if not isinstance(obj, RegionReference):
+ *             raise TypeError("Can't convert incompatible object to HDF5 region reference")
+ *         ref = <RegionReference>(buf_obj0)             # <<<<<<<<<<<<<<
+ *         IF HDF5_VERSION >= (1, 12, 0):
+ *             memcpy(buf_ref, ref.ref.reg_ref.data, sizeof(hdset_reg_ref_t))
+ */
+    __pyx_t_3 = ((PyObject *)__pyx_v_buf_obj0);
+    __Pyx_INCREF(__pyx_t_3);
+    __pyx_v_ref = ((struct __pyx_obj_4h5py_3h5r_RegionReference *)__pyx_t_3);
+    __pyx_t_3 = 0;
+
+    /* "h5py/_conv.pyx":424
+ *             memcpy(buf_ref, ref.ref.reg_ref.data, sizeof(hdset_reg_ref_t))
+ *         ELSE:
+ *             memcpy(buf_ref, ref.ref.reg_ref, sizeof(hdset_reg_ref_t))             # <<<<<<<<<<<<<<
+ *     else:
+ *         memset(buf_ref, c'\0', sizeof(hdset_reg_ref_t))
+ */
+    (void)(memcpy(__pyx_v_buf_ref, __pyx_v_ref->__pyx_base.ref.reg_ref, (sizeof(__pyx_t_4h5py_3h5r_hdset_reg_ref_t))));
+
+    /* "h5py/_conv.pyx":416
+ *     buf_obj0 = buf_obj[0]
+ * 
+ *     if buf_obj0 != NULL and buf_obj0 != Py_None:             # <<<<<<<<<<<<<<
+ *         obj = <object>(buf_obj0)
+ *         if not isinstance(obj, RegionReference):
+ */
+    goto __pyx_L3;
+  }
+
+  /* "h5py/_conv.pyx":426
+ *             memcpy(buf_ref, ref.ref.reg_ref, sizeof(hdset_reg_ref_t))
+ *     else:
+ *         memset(buf_ref, c'\0', sizeof(hdset_reg_ref_t))             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+  /*else*/ {
+    (void)(memset(__pyx_v_buf_ref, '\x00', (sizeof(__pyx_t_4h5py_3h5r_hdset_reg_ref_t))));
+  }
+  __pyx_L3:;
+
+  /* "h5py/_conv.pyx":428
+ *         memset(buf_ref, c'\0', sizeof(hdset_reg_ref_t))
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * # =============================================================================
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":406
+ *     return 0
+ * 
+ * cdef inline int conv_pyref2regref(void* ipt, void* opt, void* bkg, void* priv) except -1:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>ipt
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("h5py._conv.conv_pyref2regref", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_obj);
+  __Pyx_XDECREF((PyObject *)__pyx_v_ref);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":434
+ * 
+ * 
+ * cdef inline herr_t vlen2str(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ */
+
+static CYTHON_INLINE herr_t __pyx_f_4h5py_5_conv_vlen2str(hid_t __pyx_v_src_id, hid_t __pyx_v_dst_id, H5T_cdata_t *__pyx_v_cdata, size_t __pyx_v_nl, size_t __pyx_v_buf_stride, size_t __pyx_v_bkg_stride, void *__pyx_v_buf_i, void *__pyx_v_bkg_i, hid_t __pyx_v_dxpl) {
+  herr_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  herr_t __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  #ifdef WITH_THREAD
+  PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  #endif
+  __Pyx_RefNannySetupContext("vlen2str", 0);
+
+  /* "h5py/_conv.pyx":437
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ *     return generic_converter(src_id, dst_id, cdata, nl, buf_stride, bkg_stride,             # <<<<<<<<<<<<<<
+ *              buf_i, bkg_i, dxpl,  conv_vlen2str, init_vlen2str, H5T_BKG_YES)
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4h5py_5_conv_generic_converter(__pyx_v_src_id, __pyx_v_dst_id, __pyx_v_cdata, __pyx_v_nl, __pyx_v_buf_stride, __pyx_v_bkg_stride, __pyx_v_buf_i, __pyx_v_bkg_i, __pyx_v_dxpl, __pyx_f_4h5py_5_conv_conv_vlen2str, __pyx_f_4h5py_5_conv_init_vlen2str, H5T_BKG_YES); if (unlikely(__pyx_t_1 == ((herr_t)-1))) __PYX_ERR(0, 437, __pyx_L1_error)
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":434
+ * 
+ * 
+ * cdef inline herr_t vlen2str(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("h5py._conv.vlen2str", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #ifdef WITH_THREAD
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  #endif
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":440
+ *              buf_i, bkg_i, dxpl,  conv_vlen2str, init_vlen2str, H5T_BKG_YES)
+ * 
+ * cdef inline herr_t str2vlen(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl)except -1 with gil:
+ */
+
+static CYTHON_INLINE herr_t __pyx_f_4h5py_5_conv_str2vlen(hid_t __pyx_v_src_id, hid_t __pyx_v_dst_id, H5T_cdata_t *__pyx_v_cdata, size_t __pyx_v_nl, size_t __pyx_v_buf_stride, size_t __pyx_v_bkg_stride, void *__pyx_v_buf_i, void *__pyx_v_bkg_i, hid_t __pyx_v_dxpl) {
+  herr_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  herr_t __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  #ifdef WITH_THREAD
+  PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  #endif
+  __Pyx_RefNannySetupContext("str2vlen", 0);
+
+  /* "h5py/_conv.pyx":443
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl)except -1 with gil:
+ *     return generic_converter(src_id, dst_id, cdata, nl, buf_stride, bkg_stride,             # <<<<<<<<<<<<<<
+ *              buf_i, bkg_i, dxpl, conv_str2vlen, init_str2vlen, H5T_BKG_NO)
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4h5py_5_conv_generic_converter(__pyx_v_src_id, __pyx_v_dst_id, __pyx_v_cdata, __pyx_v_nl, __pyx_v_buf_stride, __pyx_v_bkg_stride, __pyx_v_buf_i, __pyx_v_bkg_i, __pyx_v_dxpl, __pyx_f_4h5py_5_conv_conv_str2vlen, __pyx_f_4h5py_5_conv_init_str2vlen, H5T_BKG_NO); if (unlikely(__pyx_t_1 == ((herr_t)-1))) __PYX_ERR(0, 443, __pyx_L1_error)
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":440
+ *              buf_i, bkg_i, dxpl,  conv_vlen2str, init_vlen2str, H5T_BKG_YES)
+ * 
+ * cdef inline herr_t str2vlen(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl)except -1 with gil:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("h5py._conv.str2vlen", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #ifdef WITH_THREAD
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  #endif
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":446
+ *              buf_i, bkg_i, dxpl, conv_str2vlen, init_str2vlen, H5T_BKG_NO)
+ * 
+ * cdef inline herr_t vlen2fixed(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ */
+
+static CYTHON_INLINE herr_t __pyx_f_4h5py_5_conv_vlen2fixed(hid_t __pyx_v_src_id, hid_t __pyx_v_dst_id, H5T_cdata_t *__pyx_v_cdata, size_t __pyx_v_nl, size_t __pyx_v_buf_stride, size_t __pyx_v_bkg_stride, void *__pyx_v_buf_i, void *__pyx_v_bkg_i, hid_t __pyx_v_dxpl) {
+  herr_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  herr_t __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  #ifdef WITH_THREAD
+  PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  #endif
+  __Pyx_RefNannySetupContext("vlen2fixed", 0);
+
+  /* "h5py/_conv.pyx":449
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ *     return generic_converter(src_id, dst_id, cdata, nl, buf_stride, bkg_stride,             # <<<<<<<<<<<<<<
+ *              buf_i, bkg_i, dxpl, conv_vlen2fixed, init_vlen2fixed, H5T_BKG_NO)
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4h5py_5_conv_generic_converter(__pyx_v_src_id, __pyx_v_dst_id, __pyx_v_cdata, __pyx_v_nl, __pyx_v_buf_stride, __pyx_v_bkg_stride, __pyx_v_buf_i, __pyx_v_bkg_i, __pyx_v_dxpl, __pyx_f_4h5py_5_conv_conv_vlen2fixed, __pyx_f_4h5py_5_conv_init_vlen2fixed, H5T_BKG_NO); if (unlikely(__pyx_t_1 == ((herr_t)-1))) __PYX_ERR(0, 449, __pyx_L1_error)
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":446
+ *              buf_i, bkg_i, dxpl, conv_str2vlen, init_str2vlen, H5T_BKG_NO)
+ * 
+ * cdef inline herr_t vlen2fixed(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("h5py._conv.vlen2fixed", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #ifdef WITH_THREAD
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  #endif
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":452
+ *              buf_i, bkg_i, dxpl, conv_vlen2fixed, init_vlen2fixed, H5T_BKG_NO)
+ * 
+ * cdef inline herr_t fixed2vlen(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ */
+
+static CYTHON_INLINE herr_t __pyx_f_4h5py_5_conv_fixed2vlen(hid_t __pyx_v_src_id, hid_t __pyx_v_dst_id, H5T_cdata_t *__pyx_v_cdata, size_t __pyx_v_nl, size_t __pyx_v_buf_stride, size_t __pyx_v_bkg_stride, void *__pyx_v_buf_i, void *__pyx_v_bkg_i, hid_t __pyx_v_dxpl) {
+  herr_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  herr_t __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  #ifdef WITH_THREAD
+  PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  #endif
+  __Pyx_RefNannySetupContext("fixed2vlen", 0);
+
+  /* "h5py/_conv.pyx":455
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ *     return generic_converter(src_id, dst_id, cdata, nl, buf_stride, bkg_stride,             # <<<<<<<<<<<<<<
+ *              buf_i, bkg_i, dxpl, conv_fixed2vlen, init_fixed2vlen, H5T_BKG_NO)
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4h5py_5_conv_generic_converter(__pyx_v_src_id, __pyx_v_dst_id, __pyx_v_cdata, __pyx_v_nl, __pyx_v_buf_stride, __pyx_v_bkg_stride, __pyx_v_buf_i, __pyx_v_bkg_i, __pyx_v_dxpl, __pyx_f_4h5py_5_conv_conv_fixed2vlen, __pyx_f_4h5py_5_conv_init_fixed2vlen, H5T_BKG_NO); if (unlikely(__pyx_t_1 == ((herr_t)-1))) __PYX_ERR(0, 455, __pyx_L1_error)
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":452
+ *              buf_i, bkg_i, dxpl, conv_vlen2fixed, init_vlen2fixed, H5T_BKG_NO)
+ * 
+ * cdef inline herr_t fixed2vlen(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("h5py._conv.fixed2vlen", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #ifdef WITH_THREAD
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  #endif
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":458
+ *              buf_i, bkg_i, dxpl, conv_fixed2vlen, init_fixed2vlen, H5T_BKG_NO)
+ * 
+ * cdef inline herr_t objref2pyref(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ */
+
+static CYTHON_INLINE herr_t __pyx_f_4h5py_5_conv_objref2pyref(hid_t __pyx_v_src_id, hid_t __pyx_v_dst_id, H5T_cdata_t *__pyx_v_cdata, size_t __pyx_v_nl, size_t __pyx_v_buf_stride, size_t __pyx_v_bkg_stride, void *__pyx_v_buf_i, void *__pyx_v_bkg_i, hid_t __pyx_v_dxpl) {
+  herr_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  herr_t __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  #ifdef WITH_THREAD
+  PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  #endif
+  __Pyx_RefNannySetupContext("objref2pyref", 0);
+
+  /* "h5py/_conv.pyx":461
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ *     return generic_converter(src_id, dst_id, cdata, nl, buf_stride, bkg_stride,             # <<<<<<<<<<<<<<
+ *              buf_i, bkg_i, dxpl, conv_objref2pyref, init_generic, H5T_BKG_NO)
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4h5py_5_conv_generic_converter(__pyx_v_src_id, __pyx_v_dst_id, __pyx_v_cdata, __pyx_v_nl, __pyx_v_buf_stride, __pyx_v_bkg_stride, __pyx_v_buf_i, __pyx_v_bkg_i, __pyx_v_dxpl, __pyx_f_4h5py_5_conv_conv_objref2pyref, __pyx_f_4h5py_5_conv_init_generic, H5T_BKG_NO); if (unlikely(__pyx_t_1 == ((herr_t)-1))) __PYX_ERR(0, 461, __pyx_L1_error)
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":458
+ *              buf_i, bkg_i, dxpl, conv_fixed2vlen, init_fixed2vlen, H5T_BKG_NO)
+ * 
+ * cdef inline herr_t objref2pyref(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("h5py._conv.objref2pyref", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #ifdef WITH_THREAD
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  #endif
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":464
+ *              buf_i, bkg_i, dxpl, conv_objref2pyref, init_generic, H5T_BKG_NO)
+ * 
+ * cdef inline herr_t pyref2objref(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ */
+
+static CYTHON_INLINE herr_t __pyx_f_4h5py_5_conv_pyref2objref(hid_t __pyx_v_src_id, hid_t __pyx_v_dst_id, H5T_cdata_t *__pyx_v_cdata, size_t __pyx_v_nl, size_t __pyx_v_buf_stride, size_t __pyx_v_bkg_stride, void *__pyx_v_buf_i, void *__pyx_v_bkg_i, hid_t __pyx_v_dxpl) {
+  herr_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  herr_t __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  #ifdef WITH_THREAD
+  PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  #endif
+  __Pyx_RefNannySetupContext("pyref2objref", 0);
+
+  /* "h5py/_conv.pyx":467
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ *     return generic_converter(src_id, dst_id, cdata, nl, buf_stride, bkg_stride,             # <<<<<<<<<<<<<<
+ *              buf_i, bkg_i, dxpl, conv_pyref2objref, init_generic, H5T_BKG_NO)
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4h5py_5_conv_generic_converter(__pyx_v_src_id, __pyx_v_dst_id, __pyx_v_cdata, __pyx_v_nl, __pyx_v_buf_stride, __pyx_v_bkg_stride, __pyx_v_buf_i, __pyx_v_bkg_i, __pyx_v_dxpl, __pyx_f_4h5py_5_conv_conv_pyref2objref, __pyx_f_4h5py_5_conv_init_generic, H5T_BKG_NO); if (unlikely(__pyx_t_1 == ((herr_t)-1))) __PYX_ERR(0, 467, __pyx_L1_error)
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":464
+ *              buf_i, bkg_i, dxpl, conv_objref2pyref, init_generic, H5T_BKG_NO)
+ * 
+ * cdef inline herr_t pyref2objref(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("h5py._conv.pyref2objref", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #ifdef WITH_THREAD
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  #endif
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":470
+ *              buf_i, bkg_i, dxpl, conv_pyref2objref, init_generic, H5T_BKG_NO)
+ * 
+ * cdef inline herr_t regref2pyref(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ */
+
+static CYTHON_INLINE herr_t __pyx_f_4h5py_5_conv_regref2pyref(hid_t __pyx_v_src_id, hid_t __pyx_v_dst_id, H5T_cdata_t *__pyx_v_cdata, size_t __pyx_v_nl, size_t __pyx_v_buf_stride, size_t __pyx_v_bkg_stride, void *__pyx_v_buf_i, void *__pyx_v_bkg_i, hid_t __pyx_v_dxpl) {
+  herr_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  herr_t __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  #ifdef WITH_THREAD
+  PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  #endif
+  __Pyx_RefNannySetupContext("regref2pyref", 0);
+
+  /* "h5py/_conv.pyx":473
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ *     return generic_converter(src_id, dst_id, cdata, nl, buf_stride, bkg_stride,             # <<<<<<<<<<<<<<
+ *              buf_i, bkg_i, dxpl, conv_regref2pyref, init_generic, H5T_BKG_YES)
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4h5py_5_conv_generic_converter(__pyx_v_src_id, __pyx_v_dst_id, __pyx_v_cdata, __pyx_v_nl, __pyx_v_buf_stride, __pyx_v_bkg_stride, __pyx_v_buf_i, __pyx_v_bkg_i, __pyx_v_dxpl, __pyx_f_4h5py_5_conv_conv_regref2pyref, __pyx_f_4h5py_5_conv_init_generic, H5T_BKG_YES); if (unlikely(__pyx_t_1 == ((herr_t)-1))) __PYX_ERR(0, 473, __pyx_L1_error)
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":470
+ *              buf_i, bkg_i, dxpl, conv_pyref2objref, init_generic, H5T_BKG_NO)
+ * 
+ * cdef inline herr_t regref2pyref(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("h5py._conv.regref2pyref", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #ifdef WITH_THREAD
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  #endif
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":476
+ *              buf_i, bkg_i, dxpl, conv_regref2pyref, init_generic, H5T_BKG_YES)
+ * 
+ * cdef inline herr_t pyref2regref(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ */
+
+static CYTHON_INLINE herr_t __pyx_f_4h5py_5_conv_pyref2regref(hid_t __pyx_v_src_id, hid_t __pyx_v_dst_id, H5T_cdata_t *__pyx_v_cdata, size_t __pyx_v_nl, size_t __pyx_v_buf_stride, size_t __pyx_v_bkg_stride, void *__pyx_v_buf_i, void *__pyx_v_bkg_i, hid_t __pyx_v_dxpl) {
+  herr_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  herr_t __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  #ifdef WITH_THREAD
+  PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  #endif
+  __Pyx_RefNannySetupContext("pyref2regref", 0);
+
+  /* "h5py/_conv.pyx":479
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ *     return generic_converter(src_id, dst_id, cdata, nl, buf_stride, bkg_stride,             # <<<<<<<<<<<<<<
+ *              buf_i, bkg_i, dxpl, conv_pyref2regref, init_generic, H5T_BKG_NO)
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4h5py_5_conv_generic_converter(__pyx_v_src_id, __pyx_v_dst_id, __pyx_v_cdata, __pyx_v_nl, __pyx_v_buf_stride, __pyx_v_bkg_stride, __pyx_v_buf_i, __pyx_v_bkg_i, __pyx_v_dxpl, __pyx_f_4h5py_5_conv_conv_pyref2regref, __pyx_f_4h5py_5_conv_init_generic, H5T_BKG_NO); if (unlikely(__pyx_t_1 == ((herr_t)-1))) __PYX_ERR(0, 479, __pyx_L1_error)
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":476
+ *              buf_i, bkg_i, dxpl, conv_regref2pyref, init_generic, H5T_BKG_YES)
+ * 
+ * cdef inline herr_t pyref2regref(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("h5py._conv.pyref2regref", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #ifdef WITH_THREAD
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  #endif
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":489
+ *     size_t dst_size
+ * 
+ * cdef int enum_int_converter_init(hid_t src, hid_t dst,             # <<<<<<<<<<<<<<
+ *                                  H5T_cdata_t *cdata, int forward) except -1:
+ *     cdef conv_enum_t *info
+ */
+
+static int __pyx_f_4h5py_5_conv_enum_int_converter_init(hid_t __pyx_v_src, hid_t __pyx_v_dst, H5T_cdata_t *__pyx_v_cdata, CYTHON_UNUSED int __pyx_v_forward) {
+  struct __pyx_t_4h5py_5_conv_conv_enum_t *__pyx_v_info;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  void *__pyx_t_1;
+  struct __pyx_t_4h5py_5_conv_conv_enum_t *__pyx_t_2;
+  size_t __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("enum_int_converter_init", 0);
+
+  /* "h5py/_conv.pyx":493
+ *     cdef conv_enum_t *info
+ * 
+ *     cdata[0].need_bkg = H5T_BKG_NO             # <<<<<<<<<<<<<<
+ *     cdata[0].priv = info = <conv_enum_t*>emalloc(sizeof(conv_enum_t))
+ *     info[0].src_size = H5Tget_size(src)
+ */
+  (__pyx_v_cdata[0]).need_bkg = H5T_BKG_NO;
+
+  /* "h5py/_conv.pyx":494
+ * 
+ *     cdata[0].need_bkg = H5T_BKG_NO
+ *     cdata[0].priv = info = <conv_enum_t*>emalloc(sizeof(conv_enum_t))             # <<<<<<<<<<<<<<
+ *     info[0].src_size = H5Tget_size(src)
+ *     info[0].dst_size = H5Tget_size(dst)
+ */
+  __pyx_t_1 = __pyx_f_4h5py_5utils_emalloc((sizeof(struct __pyx_t_4h5py_5_conv_conv_enum_t))); if (unlikely(__pyx_t_1 == ((void *)NULL) && PyErr_Occurred())) __PYX_ERR(0, 494, __pyx_L1_error)
+  __pyx_t_2 = ((struct __pyx_t_4h5py_5_conv_conv_enum_t *)__pyx_t_1);
+  (__pyx_v_cdata[0]).priv = __pyx_t_2;
+  __pyx_v_info = __pyx_t_2;
+
+  /* "h5py/_conv.pyx":495
+ *     cdata[0].need_bkg = H5T_BKG_NO
+ *     cdata[0].priv = info = <conv_enum_t*>emalloc(sizeof(conv_enum_t))
+ *     info[0].src_size = H5Tget_size(src)             # <<<<<<<<<<<<<<
+ *     info[0].dst_size = H5Tget_size(dst)
+ * 
+ */
+  __pyx_t_3 = __pyx_f_4h5py_4defs_H5Tget_size(__pyx_v_src); if (unlikely(__pyx_t_3 == ((size_t)((size_t)0)))) __PYX_ERR(0, 495, __pyx_L1_error)
+  (__pyx_v_info[0]).src_size = __pyx_t_3;
+
+  /* "h5py/_conv.pyx":496
+ *     cdata[0].priv = info = <conv_enum_t*>emalloc(sizeof(conv_enum_t))
+ *     info[0].src_size = H5Tget_size(src)
+ *     info[0].dst_size = H5Tget_size(dst)             # <<<<<<<<<<<<<<
+ * 
+ * cdef void enum_int_converter_free(H5T_cdata_t *cdata):
+ */
+  __pyx_t_3 = __pyx_f_4h5py_4defs_H5Tget_size(__pyx_v_dst); if (unlikely(__pyx_t_3 == ((size_t)((size_t)0)))) __PYX_ERR(0, 496, __pyx_L1_error)
+  (__pyx_v_info[0]).dst_size = __pyx_t_3;
+
+  /* "h5py/_conv.pyx":489
+ *     size_t dst_size
+ * 
+ * cdef int enum_int_converter_init(hid_t src, hid_t dst,             # <<<<<<<<<<<<<<
+ *                                  H5T_cdata_t *cdata, int forward) except -1:
+ *     cdef conv_enum_t *info
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("h5py._conv.enum_int_converter_init", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":498
+ *     info[0].dst_size = H5Tget_size(dst)
+ * 
+ * cdef void enum_int_converter_free(H5T_cdata_t *cdata):             # <<<<<<<<<<<<<<
+ *     cdef conv_enum_t *info
+ * 
+ */
+
+static void __pyx_f_4h5py_5_conv_enum_int_converter_free(H5T_cdata_t *__pyx_v_cdata) {
+  struct __pyx_t_4h5py_5_conv_conv_enum_t *__pyx_v_info;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("enum_int_converter_free", 0);
+
+  /* "h5py/_conv.pyx":501
+ *     cdef conv_enum_t *info
+ * 
+ *     info = <conv_enum_t*>cdata[0].priv             # <<<<<<<<<<<<<<
+ *     efree(info)
+ *     cdata[0].priv = NULL
+ */
+  __pyx_v_info = ((struct __pyx_t_4h5py_5_conv_conv_enum_t *)(__pyx_v_cdata[0]).priv);
+
+  /* "h5py/_conv.pyx":502
+ * 
+ *     info = <conv_enum_t*>cdata[0].priv
+ *     efree(info)             # <<<<<<<<<<<<<<
+ *     cdata[0].priv = NULL
+ * 
+ */
+  __pyx_f_4h5py_5utils_efree(__pyx_v_info);
+
+  /* "h5py/_conv.pyx":503
+ *     info = <conv_enum_t*>cdata[0].priv
+ *     efree(info)
+ *     cdata[0].priv = NULL             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  (__pyx_v_cdata[0]).priv = NULL;
+
+  /* "h5py/_conv.pyx":498
+ *     info[0].dst_size = H5Tget_size(dst)
+ * 
+ * cdef void enum_int_converter_free(H5T_cdata_t *cdata):             # <<<<<<<<<<<<<<
+ *     cdef conv_enum_t *info
+ * 
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "h5py/_conv.pyx":506
+ * 
+ * 
+ * cdef int enum_int_converter_conv(hid_t src, hid_t dst, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                                   size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                                  void *bkg_i, hid_t dxpl, int forward) except -1:
+ */
+
+static int __pyx_f_4h5py_5_conv_enum_int_converter_conv(hid_t __pyx_v_src, hid_t __pyx_v_dst, H5T_cdata_t *__pyx_v_cdata, size_t __pyx_v_nl, size_t __pyx_v_buf_stride, CYTHON_UNUSED size_t __pyx_v_bkg_stride, void *__pyx_v_buf_i, CYTHON_UNUSED void *__pyx_v_bkg_i, hid_t __pyx_v_dxpl, int __pyx_v_forward) {
+  struct __pyx_t_4h5py_5_conv_conv_enum_t *__pyx_v_info;
+  size_t __pyx_v_nalloc;
+  int __pyx_v_i;
+  char *__pyx_v_cbuf;
+  char *__pyx_v_buf;
+  int __pyx_v_identical;
+  hid_t __pyx_v_supertype;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  hid_t __pyx_t_2;
+  htri_t __pyx_t_3;
+  herr_t __pyx_t_4;
+  void *__pyx_t_5;
+  size_t __pyx_t_6;
+  size_t __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  char const *__pyx_t_10;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  PyObject *__pyx_t_15 = NULL;
+  PyObject *__pyx_t_16 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("enum_int_converter_conv", 0);
+
+  /* "h5py/_conv.pyx":513
+ *         size_t nalloc
+ *         int i
+ *         char* cbuf = NULL             # <<<<<<<<<<<<<<
+ *         char* buf = <char*>buf_i
+ *         int identical
+ */
+  __pyx_v_cbuf = NULL;
+
+  /* "h5py/_conv.pyx":514
+ *         int i
+ *         char* cbuf = NULL
+ *         char* buf = <char*>buf_i             # <<<<<<<<<<<<<<
+ *         int identical
+ *         hid_t supertype = -1
+ */
+  __pyx_v_buf = ((char *)__pyx_v_buf_i);
+
+  /* "h5py/_conv.pyx":516
+ *         char* buf = <char*>buf_i
+ *         int identical
+ *         hid_t supertype = -1             # <<<<<<<<<<<<<<
+ * 
+ *     info = <conv_enum_t*>cdata[0].priv
+ */
+  __pyx_v_supertype = -1L;
+
+  /* "h5py/_conv.pyx":518
+ *         hid_t supertype = -1
+ * 
+ *     info = <conv_enum_t*>cdata[0].priv             # <<<<<<<<<<<<<<
+ * 
+ *     try:
+ */
+  __pyx_v_info = ((struct __pyx_t_4h5py_5_conv_conv_enum_t *)(__pyx_v_cdata[0]).priv);
+
+  /* "h5py/_conv.pyx":520
+ *     info = <conv_enum_t*>cdata[0].priv
+ * 
+ *     try:             # <<<<<<<<<<<<<<
+ *         if forward:
+ *             supertype = H5Tget_super(src)
+ */
+  /*try:*/ {
+
+    /* "h5py/_conv.pyx":521
+ * 
+ *     try:
+ *         if forward:             # <<<<<<<<<<<<<<
+ *             supertype = H5Tget_super(src)
+ *             identical = H5Tequal(supertype, dst)
+ */
+    __pyx_t_1 = (__pyx_v_forward != 0);
+    if (__pyx_t_1) {
+
+      /* "h5py/_conv.pyx":522
+ *     try:
+ *         if forward:
+ *             supertype = H5Tget_super(src)             # <<<<<<<<<<<<<<
+ *             identical = H5Tequal(supertype, dst)
+ *         else:
+ */
+      __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tget_super(__pyx_v_src); if (unlikely(__pyx_t_2 == ((hid_t)((hid_t)-1L)))) __PYX_ERR(0, 522, __pyx_L4_error)
+      __pyx_v_supertype = __pyx_t_2;
+
+      /* "h5py/_conv.pyx":523
+ *         if forward:
+ *             supertype = H5Tget_super(src)
+ *             identical = H5Tequal(supertype, dst)             # <<<<<<<<<<<<<<
+ *         else:
+ *             supertype = H5Tget_super(dst)
+ */
+      __pyx_t_3 = __pyx_f_4h5py_4defs_H5Tequal(__pyx_v_supertype, __pyx_v_dst); if (unlikely(__pyx_t_3 == ((htri_t)((htri_t)-1L)))) __PYX_ERR(0, 523, __pyx_L4_error)
+      __pyx_v_identical = __pyx_t_3;
+
+      /* "h5py/_conv.pyx":521
+ * 
+ *     try:
+ *         if forward:             # <<<<<<<<<<<<<<
+ *             supertype = H5Tget_super(src)
+ *             identical = H5Tequal(supertype, dst)
+ */
+      goto __pyx_L6;
+    }
+
+    /* "h5py/_conv.pyx":525
+ *             identical = H5Tequal(supertype, dst)
+ *         else:
+ *             supertype = H5Tget_super(dst)             # <<<<<<<<<<<<<<
+ *             identical = H5Tequal(supertype, src)
+ * 
+ */
+    /*else*/ {
+      __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tget_super(__pyx_v_dst); if (unlikely(__pyx_t_2 == ((hid_t)((hid_t)-1L)))) __PYX_ERR(0, 525, __pyx_L4_error)
+      __pyx_v_supertype = __pyx_t_2;
+
+      /* "h5py/_conv.pyx":526
+ *         else:
+ *             supertype = H5Tget_super(dst)
+ *             identical = H5Tequal(supertype, src)             # <<<<<<<<<<<<<<
+ * 
+ *         # Short-circuit success
+ */
+      __pyx_t_3 = __pyx_f_4h5py_4defs_H5Tequal(__pyx_v_supertype, __pyx_v_src); if (unlikely(__pyx_t_3 == ((htri_t)((htri_t)-1L)))) __PYX_ERR(0, 526, __pyx_L4_error)
+      __pyx_v_identical = __pyx_t_3;
+    }
+    __pyx_L6:;
+
+    /* "h5py/_conv.pyx":529
+ * 
+ *         # Short-circuit success
+ *         if identical:             # <<<<<<<<<<<<<<
+ *             return 0
+ * 
+ */
+    __pyx_t_1 = (__pyx_v_identical != 0);
+    if (__pyx_t_1) {
+
+      /* "h5py/_conv.pyx":530
+ *         # Short-circuit success
+ *         if identical:
+ *             return 0             # <<<<<<<<<<<<<<
+ * 
+ *         if buf_stride == 0:
+ */
+      __pyx_r = 0;
+      goto __pyx_L3_return;
+
+      /* "h5py/_conv.pyx":529
+ * 
+ *         # Short-circuit success
+ *         if identical:             # <<<<<<<<<<<<<<
+ *             return 0
+ * 
+ */
+    }
+
+    /* "h5py/_conv.pyx":532
+ *             return 0
+ * 
+ *         if buf_stride == 0:             # <<<<<<<<<<<<<<
+ *             # Contiguous case: call H5Tconvert directly
+ *             if forward:
+ */
+    __pyx_t_1 = ((__pyx_v_buf_stride == 0) != 0);
+    if (__pyx_t_1) {
+
+      /* "h5py/_conv.pyx":534
+ *         if buf_stride == 0:
+ *             # Contiguous case: call H5Tconvert directly
+ *             if forward:             # <<<<<<<<<<<<<<
+ *                 H5Tconvert(supertype, dst, nl, buf, NULL, dxpl)
+ *             else:
+ */
+      __pyx_t_1 = (__pyx_v_forward != 0);
+      if (__pyx_t_1) {
+
+        /* "h5py/_conv.pyx":535
+ *             # Contiguous case: call H5Tconvert directly
+ *             if forward:
+ *                 H5Tconvert(supertype, dst, nl, buf, NULL, dxpl)             # <<<<<<<<<<<<<<
+ *             else:
+ *                 H5Tconvert(src, supertype, nl, buf, NULL, dxpl)
+ */
+        __pyx_t_4 = __pyx_f_4h5py_4defs_H5Tconvert(__pyx_v_supertype, __pyx_v_dst, __pyx_v_nl, __pyx_v_buf, NULL, __pyx_v_dxpl); if (unlikely(__pyx_t_4 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 535, __pyx_L4_error)
+
+        /* "h5py/_conv.pyx":534
+ *         if buf_stride == 0:
+ *             # Contiguous case: call H5Tconvert directly
+ *             if forward:             # <<<<<<<<<<<<<<
+ *                 H5Tconvert(supertype, dst, nl, buf, NULL, dxpl)
+ *             else:
+ */
+        goto __pyx_L9;
+      }
+
+      /* "h5py/_conv.pyx":537
+ *                 H5Tconvert(supertype, dst, nl, buf, NULL, dxpl)
+ *             else:
+ *                 H5Tconvert(src, supertype, nl, buf, NULL, dxpl)             # <<<<<<<<<<<<<<
+ *         else:
+ *             # Non-contiguous: gather, convert and then scatter
+ */
+      /*else*/ {
+        __pyx_t_4 = __pyx_f_4h5py_4defs_H5Tconvert(__pyx_v_src, __pyx_v_supertype, __pyx_v_nl, __pyx_v_buf, NULL, __pyx_v_dxpl); if (unlikely(__pyx_t_4 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 537, __pyx_L4_error)
+      }
+      __pyx_L9:;
+
+      /* "h5py/_conv.pyx":532
+ *             return 0
+ * 
+ *         if buf_stride == 0:             # <<<<<<<<<<<<<<
+ *             # Contiguous case: call H5Tconvert directly
+ *             if forward:
+ */
+      goto __pyx_L8;
+    }
+
+    /* "h5py/_conv.pyx":540
+ *         else:
+ *             # Non-contiguous: gather, convert and then scatter
+ *             if info[0].src_size > info[0].dst_size:             # <<<<<<<<<<<<<<
+ *                 nalloc = info[0].src_size*nl
+ *             else:
+ */
+    /*else*/ {
+      __pyx_t_1 = (((__pyx_v_info[0]).src_size > (__pyx_v_info[0]).dst_size) != 0);
+      if (__pyx_t_1) {
+
+        /* "h5py/_conv.pyx":541
+ *             # Non-contiguous: gather, convert and then scatter
+ *             if info[0].src_size > info[0].dst_size:
+ *                 nalloc = info[0].src_size*nl             # <<<<<<<<<<<<<<
+ *             else:
+ *                 nalloc = info[0].dst_size*nl
+ */
+        __pyx_v_nalloc = ((__pyx_v_info[0]).src_size * __pyx_v_nl);
+
+        /* "h5py/_conv.pyx":540
+ *         else:
+ *             # Non-contiguous: gather, convert and then scatter
+ *             if info[0].src_size > info[0].dst_size:             # <<<<<<<<<<<<<<
+ *                 nalloc = info[0].src_size*nl
+ *             else:
+ */
+        goto __pyx_L10;
+      }
+
+      /* "h5py/_conv.pyx":543
+ *                 nalloc = info[0].src_size*nl
+ *             else:
+ *                 nalloc = info[0].dst_size*nl             # <<<<<<<<<<<<<<
+ * 
+ *             cbuf = <char*>emalloc(nalloc)
+ */
+      /*else*/ {
+        __pyx_v_nalloc = ((__pyx_v_info[0]).dst_size * __pyx_v_nl);
+      }
+      __pyx_L10:;
+
+      /* "h5py/_conv.pyx":545
+ *                 nalloc = info[0].dst_size*nl
+ * 
+ *             cbuf = <char*>emalloc(nalloc)             # <<<<<<<<<<<<<<
+ *             if cbuf == NULL:
+ *                 raise MemoryError()
+ */
+      __pyx_t_5 = __pyx_f_4h5py_5utils_emalloc(__pyx_v_nalloc); if (unlikely(__pyx_t_5 == ((void *)NULL) && PyErr_Occurred())) __PYX_ERR(0, 545, __pyx_L4_error)
+      __pyx_v_cbuf = ((char *)__pyx_t_5);
+
+      /* "h5py/_conv.pyx":546
+ * 
+ *             cbuf = <char*>emalloc(nalloc)
+ *             if cbuf == NULL:             # <<<<<<<<<<<<<<
+ *                 raise MemoryError()
+ * 
+ */
+      __pyx_t_1 = ((__pyx_v_cbuf == NULL) != 0);
+      if (unlikely(__pyx_t_1)) {
+
+        /* "h5py/_conv.pyx":547
+ *             cbuf = <char*>emalloc(nalloc)
+ *             if cbuf == NULL:
+ *                 raise MemoryError()             # <<<<<<<<<<<<<<
+ * 
+ *             for i in range(nl):
+ */
+        PyErr_NoMemory(); __PYX_ERR(0, 547, __pyx_L4_error)
+
+        /* "h5py/_conv.pyx":546
+ * 
+ *             cbuf = <char*>emalloc(nalloc)
+ *             if cbuf == NULL:             # <<<<<<<<<<<<<<
+ *                 raise MemoryError()
+ * 
+ */
+      }
+
+      /* "h5py/_conv.pyx":549
+ *                 raise MemoryError()
+ * 
+ *             for i in range(nl):             # <<<<<<<<<<<<<<
+ *                 memcpy(cbuf + (i*info[0].src_size), buf + (i*buf_stride),
+ *                         info[0].src_size)
+ */
+      __pyx_t_6 = __pyx_v_nl;
+      __pyx_t_7 = __pyx_t_6;
+      for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+        __pyx_v_i = __pyx_t_8;
+
+        /* "h5py/_conv.pyx":550
+ * 
+ *             for i in range(nl):
+ *                 memcpy(cbuf + (i*info[0].src_size), buf + (i*buf_stride),             # <<<<<<<<<<<<<<
+ *                         info[0].src_size)
+ * 
+ */
+        (void)(memcpy((__pyx_v_cbuf + (__pyx_v_i * (__pyx_v_info[0]).src_size)), (__pyx_v_buf + (__pyx_v_i * __pyx_v_buf_stride)), (__pyx_v_info[0]).src_size));
+      }
+
+      /* "h5py/_conv.pyx":553
+ *                         info[0].src_size)
+ * 
+ *             if forward:             # <<<<<<<<<<<<<<
+ *                 H5Tconvert(supertype, dst, nl, cbuf, NULL, dxpl)
+ *             else:
+ */
+      __pyx_t_1 = (__pyx_v_forward != 0);
+      if (__pyx_t_1) {
+
+        /* "h5py/_conv.pyx":554
+ * 
+ *             if forward:
+ *                 H5Tconvert(supertype, dst, nl, cbuf, NULL, dxpl)             # <<<<<<<<<<<<<<
+ *             else:
+ *                 H5Tconvert(src, supertype, nl, cbuf, NULL, dxpl)
+ */
+        __pyx_t_4 = __pyx_f_4h5py_4defs_H5Tconvert(__pyx_v_supertype, __pyx_v_dst, __pyx_v_nl, __pyx_v_cbuf, NULL, __pyx_v_dxpl); if (unlikely(__pyx_t_4 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 554, __pyx_L4_error)
+
+        /* "h5py/_conv.pyx":553
+ *                         info[0].src_size)
+ * 
+ *             if forward:             # <<<<<<<<<<<<<<
+ *                 H5Tconvert(supertype, dst, nl, cbuf, NULL, dxpl)
+ *             else:
+ */
+        goto __pyx_L14;
+      }
+
+      /* "h5py/_conv.pyx":556
+ *                 H5Tconvert(supertype, dst, nl, cbuf, NULL, dxpl)
+ *             else:
+ *                 H5Tconvert(src, supertype, nl, cbuf, NULL, dxpl)             # <<<<<<<<<<<<<<
+ * 
+ *             for i in range(nl):
+ */
+      /*else*/ {
+        __pyx_t_4 = __pyx_f_4h5py_4defs_H5Tconvert(__pyx_v_src, __pyx_v_supertype, __pyx_v_nl, __pyx_v_cbuf, NULL, __pyx_v_dxpl); if (unlikely(__pyx_t_4 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 556, __pyx_L4_error)
+      }
+      __pyx_L14:;
+
+      /* "h5py/_conv.pyx":558
+ *                 H5Tconvert(src, supertype, nl, cbuf, NULL, dxpl)
+ * 
+ *             for i in range(nl):             # <<<<<<<<<<<<<<
+ *                 memcpy(buf + (i*buf_stride), cbuf + (i*info[0].dst_size),
+ *                         info[0].dst_size)
+ */
+      __pyx_t_6 = __pyx_v_nl;
+      __pyx_t_7 = __pyx_t_6;
+      for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+        __pyx_v_i = __pyx_t_8;
+
+        /* "h5py/_conv.pyx":559
+ * 
+ *             for i in range(nl):
+ *                 memcpy(buf + (i*buf_stride), cbuf + (i*info[0].dst_size),             # <<<<<<<<<<<<<<
+ *                         info[0].dst_size)
+ * 
+ */
+        (void)(memcpy((__pyx_v_buf + (__pyx_v_i * __pyx_v_buf_stride)), (__pyx_v_cbuf + (__pyx_v_i * (__pyx_v_info[0]).dst_size)), (__pyx_v_info[0]).dst_size));
+      }
+    }
+    __pyx_L8:;
+  }
+
+  /* "h5py/_conv.pyx":563
+ * 
+ *     finally:
+ *         efree(cbuf)             # <<<<<<<<<<<<<<
+ *         cbuf = NULL
+ *         if supertype > 0:
+ */
+  /*finally:*/ {
+    /*normal exit:*/{
+      __pyx_f_4h5py_5utils_efree(__pyx_v_cbuf);
+
+      /* "h5py/_conv.pyx":564
+ *     finally:
+ *         efree(cbuf)
+ *         cbuf = NULL             # <<<<<<<<<<<<<<
+ *         if supertype > 0:
+ *             H5Tclose(supertype)
+ */
+      __pyx_v_cbuf = NULL;
+
+      /* "h5py/_conv.pyx":565
+ *         efree(cbuf)
+ *         cbuf = NULL
+ *         if supertype > 0:             # <<<<<<<<<<<<<<
+ *             H5Tclose(supertype)
+ * 
+ */
+      __pyx_t_1 = ((__pyx_v_supertype > 0) != 0);
+      if (__pyx_t_1) {
+
+        /* "h5py/_conv.pyx":566
+ *         cbuf = NULL
+ *         if supertype > 0:
+ *             H5Tclose(supertype)             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+        __pyx_t_4 = __pyx_f_4h5py_4defs_H5Tclose(__pyx_v_supertype); if (unlikely(__pyx_t_4 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 566, __pyx_L1_error)
+
+        /* "h5py/_conv.pyx":565
+ *         efree(cbuf)
+ *         cbuf = NULL
+ *         if supertype > 0:             # <<<<<<<<<<<<<<
+ *             H5Tclose(supertype)
+ * 
+ */
+      }
+      goto __pyx_L5;
+    }
+    __pyx_L4_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0; __pyx_t_14 = 0; __pyx_t_15 = 0; __pyx_t_16 = 0;
+      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_14, &__pyx_t_15, &__pyx_t_16);
+      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_11, &__pyx_t_12, &__pyx_t_13) < 0)) __Pyx_ErrFetch(&__pyx_t_11, &__pyx_t_12, &__pyx_t_13);
+      __Pyx_XGOTREF(__pyx_t_11);
+      __Pyx_XGOTREF(__pyx_t_12);
+      __Pyx_XGOTREF(__pyx_t_13);
+      __Pyx_XGOTREF(__pyx_t_14);
+      __Pyx_XGOTREF(__pyx_t_15);
+      __Pyx_XGOTREF(__pyx_t_16);
+      __pyx_t_8 = __pyx_lineno; __pyx_t_9 = __pyx_clineno; __pyx_t_10 = __pyx_filename;
+      {
+
+        /* "h5py/_conv.pyx":563
+ * 
+ *     finally:
+ *         efree(cbuf)             # <<<<<<<<<<<<<<
+ *         cbuf = NULL
+ *         if supertype > 0:
+ */
+        __pyx_f_4h5py_5utils_efree(__pyx_v_cbuf);
+
+        /* "h5py/_conv.pyx":564
+ *     finally:
+ *         efree(cbuf)
+ *         cbuf = NULL             # <<<<<<<<<<<<<<
+ *         if supertype > 0:
+ *             H5Tclose(supertype)
+ */
+        __pyx_v_cbuf = NULL;
+
+        /* "h5py/_conv.pyx":565
+ *         efree(cbuf)
+ *         cbuf = NULL
+ *         if supertype > 0:             # <<<<<<<<<<<<<<
+ *             H5Tclose(supertype)
+ * 
+ */
+        __pyx_t_1 = ((__pyx_v_supertype > 0) != 0);
+        if (__pyx_t_1) {
+
+          /* "h5py/_conv.pyx":566
+ *         cbuf = NULL
+ *         if supertype > 0:
+ *             H5Tclose(supertype)             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+          __pyx_t_4 = __pyx_f_4h5py_4defs_H5Tclose(__pyx_v_supertype); if (unlikely(__pyx_t_4 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 566, __pyx_L19_error)
+
+          /* "h5py/_conv.pyx":565
+ *         efree(cbuf)
+ *         cbuf = NULL
+ *         if supertype > 0:             # <<<<<<<<<<<<<<
+ *             H5Tclose(supertype)
+ * 
+ */
+        }
+      }
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_14);
+        __Pyx_XGIVEREF(__pyx_t_15);
+        __Pyx_XGIVEREF(__pyx_t_16);
+        __Pyx_ExceptionReset(__pyx_t_14, __pyx_t_15, __pyx_t_16);
+      }
+      __Pyx_XGIVEREF(__pyx_t_11);
+      __Pyx_XGIVEREF(__pyx_t_12);
+      __Pyx_XGIVEREF(__pyx_t_13);
+      __Pyx_ErrRestore(__pyx_t_11, __pyx_t_12, __pyx_t_13);
+      __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0; __pyx_t_14 = 0; __pyx_t_15 = 0; __pyx_t_16 = 0;
+      __pyx_lineno = __pyx_t_8; __pyx_clineno = __pyx_t_9; __pyx_filename = __pyx_t_10;
+      goto __pyx_L1_error;
+      __pyx_L19_error:;
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_14);
+        __Pyx_XGIVEREF(__pyx_t_15);
+        __Pyx_XGIVEREF(__pyx_t_16);
+        __Pyx_ExceptionReset(__pyx_t_14, __pyx_t_15, __pyx_t_16);
+      }
+      __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __Pyx_XDECREF(__pyx_t_12); __pyx_t_12 = 0;
+      __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
+      __pyx_t_14 = 0; __pyx_t_15 = 0; __pyx_t_16 = 0;
+      goto __pyx_L1_error;
+    }
+    __pyx_L3_return: {
+      __pyx_t_9 = __pyx_r;
+
+      /* "h5py/_conv.pyx":563
+ * 
+ *     finally:
+ *         efree(cbuf)             # <<<<<<<<<<<<<<
+ *         cbuf = NULL
+ *         if supertype > 0:
+ */
+      __pyx_f_4h5py_5utils_efree(__pyx_v_cbuf);
+
+      /* "h5py/_conv.pyx":564
+ *     finally:
+ *         efree(cbuf)
+ *         cbuf = NULL             # <<<<<<<<<<<<<<
+ *         if supertype > 0:
+ *             H5Tclose(supertype)
+ */
+      __pyx_v_cbuf = NULL;
+
+      /* "h5py/_conv.pyx":565
+ *         efree(cbuf)
+ *         cbuf = NULL
+ *         if supertype > 0:             # <<<<<<<<<<<<<<
+ *             H5Tclose(supertype)
+ * 
+ */
+      __pyx_t_1 = ((__pyx_v_supertype > 0) != 0);
+      if (__pyx_t_1) {
+
+        /* "h5py/_conv.pyx":566
+ *         cbuf = NULL
+ *         if supertype > 0:
+ *             H5Tclose(supertype)             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+        __pyx_t_4 = __pyx_f_4h5py_4defs_H5Tclose(__pyx_v_supertype); if (unlikely(__pyx_t_4 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 566, __pyx_L1_error)
+
+        /* "h5py/_conv.pyx":565
+ *         efree(cbuf)
+ *         cbuf = NULL
+ *         if supertype > 0:             # <<<<<<<<<<<<<<
+ *             H5Tclose(supertype)
+ * 
+ */
+      }
+      __pyx_r = __pyx_t_9;
+      goto __pyx_L0;
+    }
+    __pyx_L5:;
+  }
+
+  /* "h5py/_conv.pyx":568
+ *             H5Tclose(supertype)
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":506
+ * 
+ * 
+ * cdef int enum_int_converter_conv(hid_t src, hid_t dst, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                                   size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                                  void *bkg_i, hid_t dxpl, int forward) except -1:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("h5py._conv.enum_int_converter_conv", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":572
+ * 
+ * # Direction ("forward"): 1 = enum to int, 0 = int to enum
+ * cdef herr_t enum_int_converter(hid_t src, hid_t dst, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                                void *bkg_i, hid_t dxpl, int forward) except -1:
+ */
+
+static herr_t __pyx_f_4h5py_5_conv_enum_int_converter(hid_t __pyx_v_src, hid_t __pyx_v_dst, H5T_cdata_t *__pyx_v_cdata, size_t __pyx_v_nl, size_t __pyx_v_buf_stride, size_t __pyx_v_bkg_stride, void *__pyx_v_buf_i, void *__pyx_v_bkg_i, hid_t __pyx_v_dxpl, int __pyx_v_forward) {
+  int __pyx_v_command;
+  herr_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  H5T_cmd_t __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("enum_int_converter", 0);
+
+  /* "h5py/_conv.pyx":576
+ *                                void *bkg_i, hid_t dxpl, int forward) except -1:
+ * 
+ *     cdef int command = cdata[0].command             # <<<<<<<<<<<<<<
+ * 
+ *     if command == H5T_CONV_INIT:
+ */
+  __pyx_t_1 = (__pyx_v_cdata[0]).command;
+  __pyx_v_command = __pyx_t_1;
+
+  /* "h5py/_conv.pyx":578
+ *     cdef int command = cdata[0].command
+ * 
+ *     if command == H5T_CONV_INIT:             # <<<<<<<<<<<<<<
+ *         enum_int_converter_init(src, dst, cdata, forward)
+ *     elif command == H5T_CONV_FREE:
+ */
+  switch (__pyx_v_command) {
+    case H5T_CONV_INIT:
+
+    /* "h5py/_conv.pyx":579
+ * 
+ *     if command == H5T_CONV_INIT:
+ *         enum_int_converter_init(src, dst, cdata, forward)             # <<<<<<<<<<<<<<
+ *     elif command == H5T_CONV_FREE:
+ *         enum_int_converter_free(cdata)
+ */
+    __pyx_t_2 = __pyx_f_4h5py_5_conv_enum_int_converter_init(__pyx_v_src, __pyx_v_dst, __pyx_v_cdata, __pyx_v_forward); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 579, __pyx_L1_error)
+
+    /* "h5py/_conv.pyx":578
+ *     cdef int command = cdata[0].command
+ * 
+ *     if command == H5T_CONV_INIT:             # <<<<<<<<<<<<<<
+ *         enum_int_converter_init(src, dst, cdata, forward)
+ *     elif command == H5T_CONV_FREE:
+ */
+    break;
+    case H5T_CONV_FREE:
+
+    /* "h5py/_conv.pyx":581
+ *         enum_int_converter_init(src, dst, cdata, forward)
+ *     elif command == H5T_CONV_FREE:
+ *         enum_int_converter_free(cdata)             # <<<<<<<<<<<<<<
+ *     elif command == H5T_CONV_CONV:
+ *         return enum_int_converter_conv(src, dst, cdata, nl, buf_stride,
+ */
+    __pyx_f_4h5py_5_conv_enum_int_converter_free(__pyx_v_cdata);
+
+    /* "h5py/_conv.pyx":580
+ *     if command == H5T_CONV_INIT:
+ *         enum_int_converter_init(src, dst, cdata, forward)
+ *     elif command == H5T_CONV_FREE:             # <<<<<<<<<<<<<<
+ *         enum_int_converter_free(cdata)
+ *     elif command == H5T_CONV_CONV:
+ */
+    break;
+    case H5T_CONV_CONV:
+
+    /* "h5py/_conv.pyx":583
+ *         enum_int_converter_free(cdata)
+ *     elif command == H5T_CONV_CONV:
+ *         return enum_int_converter_conv(src, dst, cdata, nl, buf_stride,             # <<<<<<<<<<<<<<
+ *                                        bkg_stride, buf_i, bkg_i, dxpl, forward)
+ *     else:
+ */
+    __pyx_t_2 = __pyx_f_4h5py_5_conv_enum_int_converter_conv(__pyx_v_src, __pyx_v_dst, __pyx_v_cdata, __pyx_v_nl, __pyx_v_buf_stride, __pyx_v_bkg_stride, __pyx_v_buf_i, __pyx_v_bkg_i, __pyx_v_dxpl, __pyx_v_forward); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 583, __pyx_L1_error)
+    __pyx_r = __pyx_t_2;
+    goto __pyx_L0;
+
+    /* "h5py/_conv.pyx":582
+ *     elif command == H5T_CONV_FREE:
+ *         enum_int_converter_free(cdata)
+ *     elif command == H5T_CONV_CONV:             # <<<<<<<<<<<<<<
+ *         return enum_int_converter_conv(src, dst, cdata, nl, buf_stride,
+ *                                        bkg_stride, buf_i, bkg_i, dxpl, forward)
+ */
+    break;
+    default:
+
+    /* "h5py/_conv.pyx":586
+ *                                        bkg_stride, buf_i, bkg_i, dxpl, forward)
+ *     else:
+ *         return -2             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+    __pyx_r = -2;
+    goto __pyx_L0;
+    break;
+  }
+
+  /* "h5py/_conv.pyx":588
+ *         return -2
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":572
+ * 
+ * # Direction ("forward"): 1 = enum to int, 0 = int to enum
+ * cdef herr_t enum_int_converter(hid_t src, hid_t dst, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                                void *bkg_i, hid_t dxpl, int forward) except -1:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("h5py._conv.enum_int_converter", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":591
+ * 
+ * 
+ * cdef herr_t enum2int(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ */
+
+static herr_t __pyx_f_4h5py_5_conv_enum2int(hid_t __pyx_v_src_id, hid_t __pyx_v_dst_id, H5T_cdata_t *__pyx_v_cdata, size_t __pyx_v_nl, size_t __pyx_v_buf_stride, size_t __pyx_v_bkg_stride, void *__pyx_v_buf_i, void *__pyx_v_bkg_i, hid_t __pyx_v_dxpl) {
+  herr_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  herr_t __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  #ifdef WITH_THREAD
+  PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  #endif
+  __Pyx_RefNannySetupContext("enum2int", 0);
+
+  /* "h5py/_conv.pyx":594
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ *     return enum_int_converter(src_id, dst_id, cdata, nl, buf_stride, bkg_stride,             # <<<<<<<<<<<<<<
+ *              buf_i, bkg_i, dxpl, 1)
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4h5py_5_conv_enum_int_converter(__pyx_v_src_id, __pyx_v_dst_id, __pyx_v_cdata, __pyx_v_nl, __pyx_v_buf_stride, __pyx_v_bkg_stride, __pyx_v_buf_i, __pyx_v_bkg_i, __pyx_v_dxpl, 1); if (unlikely(__pyx_t_1 == ((herr_t)-1))) __PYX_ERR(0, 594, __pyx_L1_error)
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":591
+ * 
+ * 
+ * cdef herr_t enum2int(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("h5py._conv.enum2int", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #ifdef WITH_THREAD
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  #endif
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":597
+ *              buf_i, bkg_i, dxpl, 1)
+ * 
+ * cdef herr_t int2enum(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ */
+
+static herr_t __pyx_f_4h5py_5_conv_int2enum(hid_t __pyx_v_src_id, hid_t __pyx_v_dst_id, H5T_cdata_t *__pyx_v_cdata, size_t __pyx_v_nl, size_t __pyx_v_buf_stride, size_t __pyx_v_bkg_stride, void *__pyx_v_buf_i, void *__pyx_v_bkg_i, hid_t __pyx_v_dxpl) {
+  herr_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  herr_t __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  #ifdef WITH_THREAD
+  PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  #endif
+  __Pyx_RefNannySetupContext("int2enum", 0);
+
+  /* "h5py/_conv.pyx":600
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ *     return enum_int_converter(src_id, dst_id, cdata, nl, buf_stride, bkg_stride,             # <<<<<<<<<<<<<<
+ *              buf_i, bkg_i, dxpl, 0)
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4h5py_5_conv_enum_int_converter(__pyx_v_src_id, __pyx_v_dst_id, __pyx_v_cdata, __pyx_v_nl, __pyx_v_buf_stride, __pyx_v_bkg_stride, __pyx_v_buf_i, __pyx_v_bkg_i, __pyx_v_dxpl, 0); if (unlikely(__pyx_t_1 == ((herr_t)-1))) __PYX_ERR(0, 600, __pyx_L1_error)
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":597
+ *              buf_i, bkg_i, dxpl, 1)
+ * 
+ * cdef herr_t int2enum(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                     size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                     void *bkg_i, hid_t dxpl) except -1 with gil:
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("h5py._conv.int2enum", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #ifdef WITH_THREAD
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  #endif
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":606
+ * # ndarray to VLEN routines
+ * 
+ * cdef herr_t vlen2ndarray(hid_t src_id,             # <<<<<<<<<<<<<<
+ *                          hid_t dst_id,
+ *                          H5T_cdata_t *cdata,
+ */
+
+static herr_t __pyx_f_4h5py_5_conv_vlen2ndarray(hid_t __pyx_v_src_id, hid_t __pyx_v_dst_id, H5T_cdata_t *__pyx_v_cdata, size_t __pyx_v_nl, size_t __pyx_v_buf_stride, CYTHON_UNUSED size_t __pyx_v_bkg_stride, void *__pyx_v_buf_i, CYTHON_UNUSED void *__pyx_v_bkg_i, CYTHON_UNUSED hid_t __pyx_v_dxpl) {
+  int __pyx_v_command;
+  size_t __pyx_v_src_size;
+  size_t __pyx_v_dst_size;
+  struct __pyx_obj_4h5py_3h5t_TypeID *__pyx_v_supertype = 0;
+  struct __pyx_obj_4h5py_3h5t_TypeID *__pyx_v_outtype = 0;
+  PyArray_Descr *__pyx_v_dt = 0;
+  int __pyx_v_i;
+  char *__pyx_v_buf;
+  herr_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  H5T_cmd_t __pyx_t_1;
+  int __pyx_t_2;
+  enum H5T_class_t __pyx_t_3;
+  int __pyx_t_4;
+  hid_t __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  size_t __pyx_t_7;
+  size_t __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  #ifdef WITH_THREAD
+  PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  #endif
+  __Pyx_RefNannySetupContext("vlen2ndarray", 0);
+
+  /* "h5py/_conv.pyx":626
+ *     """
+ *     cdef:
+ *         int command = cdata[0].command             # <<<<<<<<<<<<<<
+ *         size_t src_size, dst_size
+ *         TypeID supertype
+ */
+  __pyx_t_1 = (__pyx_v_cdata[0]).command;
+  __pyx_v_command = __pyx_t_1;
+
+  /* "h5py/_conv.pyx":632
+ *         cnp.dtype dt
+ *         int i
+ *         char* buf = <char*>buf_i             # <<<<<<<<<<<<<<
+ * 
+ *     if command == H5T_CONV_INIT:
+ */
+  __pyx_v_buf = ((char *)__pyx_v_buf_i);
+
+  /* "h5py/_conv.pyx":634
+ *         char* buf = <char*>buf_i
+ * 
+ *     if command == H5T_CONV_INIT:             # <<<<<<<<<<<<<<
+ *         cdata[0].need_bkg = H5T_BKG_NO
+ *         if H5Tget_class(src_id) != H5T_VLEN or H5Tget_class(dst_id) != H5T_OPAQUE:
+ */
+  switch (__pyx_v_command) {
+    case H5T_CONV_INIT:
+
+    /* "h5py/_conv.pyx":635
+ * 
+ *     if command == H5T_CONV_INIT:
+ *         cdata[0].need_bkg = H5T_BKG_NO             # <<<<<<<<<<<<<<
+ *         if H5Tget_class(src_id) != H5T_VLEN or H5Tget_class(dst_id) != H5T_OPAQUE:
+ *             return -2
+ */
+    (__pyx_v_cdata[0]).need_bkg = H5T_BKG_NO;
+
+    /* "h5py/_conv.pyx":636
+ *     if command == H5T_CONV_INIT:
+ *         cdata[0].need_bkg = H5T_BKG_NO
+ *         if H5Tget_class(src_id) != H5T_VLEN or H5Tget_class(dst_id) != H5T_OPAQUE:             # <<<<<<<<<<<<<<
+ *             return -2
+ * 
+ */
+    __pyx_t_3 = __pyx_f_4h5py_4defs_H5Tget_class(__pyx_v_src_id); if (unlikely(__pyx_t_3 == ((enum H5T_class_t)((enum H5T_class_t)-1L)))) __PYX_ERR(0, 636, __pyx_L1_error)
+    __pyx_t_4 = ((__pyx_t_3 != H5T_VLEN) != 0);
+    if (!__pyx_t_4) {
+    } else {
+      __pyx_t_2 = __pyx_t_4;
+      goto __pyx_L4_bool_binop_done;
+    }
+    __pyx_t_3 = __pyx_f_4h5py_4defs_H5Tget_class(__pyx_v_dst_id); if (unlikely(__pyx_t_3 == ((enum H5T_class_t)((enum H5T_class_t)-1L)))) __PYX_ERR(0, 636, __pyx_L1_error)
+    __pyx_t_4 = ((__pyx_t_3 != H5T_OPAQUE) != 0);
+    __pyx_t_2 = __pyx_t_4;
+    __pyx_L4_bool_binop_done:;
+    if (__pyx_t_2) {
+
+      /* "h5py/_conv.pyx":637
+ *         cdata[0].need_bkg = H5T_BKG_NO
+ *         if H5Tget_class(src_id) != H5T_VLEN or H5Tget_class(dst_id) != H5T_OPAQUE:
+ *             return -2             # <<<<<<<<<<<<<<
+ * 
+ *     elif command == H5T_CONV_FREE:
+ */
+      __pyx_r = -2;
+      goto __pyx_L0;
+
+      /* "h5py/_conv.pyx":636
+ *     if command == H5T_CONV_INIT:
+ *         cdata[0].need_bkg = H5T_BKG_NO
+ *         if H5Tget_class(src_id) != H5T_VLEN or H5Tget_class(dst_id) != H5T_OPAQUE:             # <<<<<<<<<<<<<<
+ *             return -2
+ * 
+ */
+    }
+
+    /* "h5py/_conv.pyx":634
+ *         char* buf = <char*>buf_i
+ * 
+ *     if command == H5T_CONV_INIT:             # <<<<<<<<<<<<<<
+ *         cdata[0].need_bkg = H5T_BKG_NO
+ *         if H5Tget_class(src_id) != H5T_VLEN or H5Tget_class(dst_id) != H5T_OPAQUE:
+ */
+    break;
+    case H5T_CONV_FREE:
+
+    /* "h5py/_conv.pyx":639
+ *             return -2
+ * 
+ *     elif command == H5T_CONV_FREE:             # <<<<<<<<<<<<<<
+ *         pass
+ * 
+ */
+    break;
+    case H5T_CONV_CONV:
+
+    /* "h5py/_conv.pyx":644
+ *     elif command == H5T_CONV_CONV:
+ *         # need to pass element dtype to converter
+ *         supertype = typewrap(H5Tget_super(src_id))             # <<<<<<<<<<<<<<
+ *         dt = supertype.dtype
+ *         outtype = py_create(dt)
+ */
+    __pyx_t_5 = __pyx_f_4h5py_4defs_H5Tget_super(__pyx_v_src_id); if (unlikely(__pyx_t_5 == ((hid_t)((hid_t)-1L)))) __PYX_ERR(0, 644, __pyx_L1_error)
+    __pyx_t_6 = ((PyObject *)__pyx_f_4h5py_3h5t_typewrap(__pyx_t_5, 0)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 644, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_v_supertype = ((struct __pyx_obj_4h5py_3h5t_TypeID *)__pyx_t_6);
+    __pyx_t_6 = 0;
+
+    /* "h5py/_conv.pyx":645
+ *         # need to pass element dtype to converter
+ *         supertype = typewrap(H5Tget_super(src_id))
+ *         dt = supertype.dtype             # <<<<<<<<<<<<<<
+ *         outtype = py_create(dt)
+ * 
+ */
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_supertype), __pyx_n_s_dtype); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 645, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    if (!(likely(((__pyx_t_6) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_6, __pyx_ptype_5numpy_dtype))))) __PYX_ERR(0, 645, __pyx_L1_error)
+    __pyx_v_dt = ((PyArray_Descr *)__pyx_t_6);
+    __pyx_t_6 = 0;
+
+    /* "h5py/_conv.pyx":646
+ *         supertype = typewrap(H5Tget_super(src_id))
+ *         dt = supertype.dtype
+ *         outtype = py_create(dt)             # <<<<<<<<<<<<<<
+ * 
+ *         if buf_stride == 0:
+ */
+    __pyx_t_6 = ((PyObject *)__pyx_f_4h5py_3h5t_py_create(((PyObject *)__pyx_v_dt), 0, NULL)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 646, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_v_outtype = ((struct __pyx_obj_4h5py_3h5t_TypeID *)__pyx_t_6);
+    __pyx_t_6 = 0;
+
+    /* "h5py/_conv.pyx":648
+ *         outtype = py_create(dt)
+ * 
+ *         if buf_stride == 0:             # <<<<<<<<<<<<<<
+ *             # No explicit stride seems to mean that the elements are packed
+ *             # contiguously in the buffer.  In this case we must be careful
+ */
+    __pyx_t_2 = ((__pyx_v_buf_stride == 0) != 0);
+    if (__pyx_t_2) {
+
+      /* "h5py/_conv.pyx":654
+ *             # of a larger size.
+ * 
+ *             src_size = H5Tget_size(src_id)             # <<<<<<<<<<<<<<
+ *             dst_size = H5Tget_size(dst_id)
+ * 
+ */
+      __pyx_t_7 = __pyx_f_4h5py_4defs_H5Tget_size(__pyx_v_src_id); if (unlikely(__pyx_t_7 == ((size_t)((size_t)0)))) __PYX_ERR(0, 654, __pyx_L1_error)
+      __pyx_v_src_size = __pyx_t_7;
+
+      /* "h5py/_conv.pyx":655
+ * 
+ *             src_size = H5Tget_size(src_id)
+ *             dst_size = H5Tget_size(dst_id)             # <<<<<<<<<<<<<<
+ * 
+ *             if src_size >= dst_size:
+ */
+      __pyx_t_7 = __pyx_f_4h5py_4defs_H5Tget_size(__pyx_v_dst_id); if (unlikely(__pyx_t_7 == ((size_t)((size_t)0)))) __PYX_ERR(0, 655, __pyx_L1_error)
+      __pyx_v_dst_size = __pyx_t_7;
+
+      /* "h5py/_conv.pyx":657
+ *             dst_size = H5Tget_size(dst_id)
+ * 
+ *             if src_size >= dst_size:             # <<<<<<<<<<<<<<
+ *                 for i in range(nl):
+ *                     conv_vlen2ndarray(buf + (i*src_size), buf + (i*dst_size),
+ */
+      __pyx_t_2 = ((__pyx_v_src_size >= __pyx_v_dst_size) != 0);
+      if (__pyx_t_2) {
+
+        /* "h5py/_conv.pyx":658
+ * 
+ *             if src_size >= dst_size:
+ *                 for i in range(nl):             # <<<<<<<<<<<<<<
+ *                     conv_vlen2ndarray(buf + (i*src_size), buf + (i*dst_size),
+ *                                       dt, supertype, outtype)
+ */
+        __pyx_t_7 = __pyx_v_nl;
+        __pyx_t_8 = __pyx_t_7;
+        for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+          __pyx_v_i = __pyx_t_9;
+
+          /* "h5py/_conv.pyx":659
+ *             if src_size >= dst_size:
+ *                 for i in range(nl):
+ *                     conv_vlen2ndarray(buf + (i*src_size), buf + (i*dst_size),             # <<<<<<<<<<<<<<
+ *                                       dt, supertype, outtype)
+ *             else:
+ */
+          __pyx_t_10 = __pyx_f_4h5py_5_conv_conv_vlen2ndarray((__pyx_v_buf + (__pyx_v_i * __pyx_v_src_size)), (__pyx_v_buf + (__pyx_v_i * __pyx_v_dst_size)), __pyx_v_dt, __pyx_v_supertype, __pyx_v_outtype); if (unlikely(__pyx_t_10 == ((int)-1))) __PYX_ERR(0, 659, __pyx_L1_error)
+        }
+
+        /* "h5py/_conv.pyx":657
+ *             dst_size = H5Tget_size(dst_id)
+ * 
+ *             if src_size >= dst_size:             # <<<<<<<<<<<<<<
+ *                 for i in range(nl):
+ *                     conv_vlen2ndarray(buf + (i*src_size), buf + (i*dst_size),
+ */
+        goto __pyx_L7;
+      }
+
+      /* "h5py/_conv.pyx":662
+ *                                       dt, supertype, outtype)
+ *             else:
+ *                 for i in range(nl-1, -1, -1):             # <<<<<<<<<<<<<<
+ *                     conv_vlen2ndarray(buf + (i*src_size), buf + (i*dst_size),
+ *                                       dt, supertype, outtype)
+ */
+      /*else*/ {
+        for (__pyx_t_9 = (__pyx_v_nl - 1); __pyx_t_9 > -1; __pyx_t_9-=1) {
+          __pyx_v_i = __pyx_t_9;
+
+          /* "h5py/_conv.pyx":663
+ *             else:
+ *                 for i in range(nl-1, -1, -1):
+ *                     conv_vlen2ndarray(buf + (i*src_size), buf + (i*dst_size),             # <<<<<<<<<<<<<<
+ *                                       dt, supertype, outtype)
+ *         else:
+ */
+          __pyx_t_10 = __pyx_f_4h5py_5_conv_conv_vlen2ndarray((__pyx_v_buf + (__pyx_v_i * __pyx_v_src_size)), (__pyx_v_buf + (__pyx_v_i * __pyx_v_dst_size)), __pyx_v_dt, __pyx_v_supertype, __pyx_v_outtype); if (unlikely(__pyx_t_10 == ((int)-1))) __PYX_ERR(0, 663, __pyx_L1_error)
+        }
+      }
+      __pyx_L7:;
+
+      /* "h5py/_conv.pyx":648
+ *         outtype = py_create(dt)
+ * 
+ *         if buf_stride == 0:             # <<<<<<<<<<<<<<
+ *             # No explicit stride seems to mean that the elements are packed
+ *             # contiguously in the buffer.  In this case we must be careful
+ */
+      goto __pyx_L6;
+    }
+
+    /* "h5py/_conv.pyx":669
+ *             # alignment better than us.  Therefore we use the given stride
+ *             # offsets exclusively.
+ *             for i in range(nl):             # <<<<<<<<<<<<<<
+ *                 conv_vlen2ndarray(buf + (i*buf_stride), buf + (i*buf_stride),
+ *                                   dt, supertype, outtype)
+ */
+    /*else*/ {
+      __pyx_t_7 = __pyx_v_nl;
+      __pyx_t_8 = __pyx_t_7;
+      for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
+        __pyx_v_i = __pyx_t_9;
+
+        /* "h5py/_conv.pyx":670
+ *             # offsets exclusively.
+ *             for i in range(nl):
+ *                 conv_vlen2ndarray(buf + (i*buf_stride), buf + (i*buf_stride),             # <<<<<<<<<<<<<<
+ *                                   dt, supertype, outtype)
+ * 
+ */
+        __pyx_t_10 = __pyx_f_4h5py_5_conv_conv_vlen2ndarray((__pyx_v_buf + (__pyx_v_i * __pyx_v_buf_stride)), (__pyx_v_buf + (__pyx_v_i * __pyx_v_buf_stride)), __pyx_v_dt, __pyx_v_supertype, __pyx_v_outtype); if (unlikely(__pyx_t_10 == ((int)-1))) __PYX_ERR(0, 670, __pyx_L1_error)
+      }
+    }
+    __pyx_L6:;
+
+    /* "h5py/_conv.pyx":642
+ *         pass
+ * 
+ *     elif command == H5T_CONV_CONV:             # <<<<<<<<<<<<<<
+ *         # need to pass element dtype to converter
+ *         supertype = typewrap(H5Tget_super(src_id))
+ */
+    break;
+    default:
+
+    /* "h5py/_conv.pyx":674
+ * 
+ *     else:
+ *         return -2   # Unrecognized command.  Note this is NOT an exception.             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+    __pyx_r = -2;
+    goto __pyx_L0;
+    break;
+  }
+
+  /* "h5py/_conv.pyx":676
+ *         return -2   # Unrecognized command.  Note this is NOT an exception.
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":606
+ * # ndarray to VLEN routines
+ * 
+ * cdef herr_t vlen2ndarray(hid_t src_id,             # <<<<<<<<<<<<<<
+ *                          hid_t dst_id,
+ *                          H5T_cdata_t *cdata,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("h5py._conv.vlen2ndarray", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_supertype);
+  __Pyx_XDECREF((PyObject *)__pyx_v_outtype);
+  __Pyx_XDECREF((PyObject *)__pyx_v_dt);
+  __Pyx_RefNannyFinishContext();
+  #ifdef WITH_THREAD
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  #endif
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":683
+ *     void* ptr
+ * 
+ * cdef int conv_vlen2ndarray(void* ipt,             # <<<<<<<<<<<<<<
+ *                            void* opt,
+ *                            cnp.dtype elem_dtype,
+ */
+
+static int __pyx_f_4h5py_5_conv_conv_vlen2ndarray(void *__pyx_v_ipt, void *__pyx_v_opt, PyArray_Descr *__pyx_v_elem_dtype, struct __pyx_obj_4h5py_3h5t_TypeID *__pyx_v_intype, struct __pyx_obj_4h5py_3h5t_TypeID *__pyx_v_outtype) {
+  PyObject **__pyx_v_buf_obj;
+  struct __pyx_t_4h5py_5_conv_vlen_t *__pyx_v_in_vlen;
+  int __pyx_v_flags;
+  npy_intp __pyx_v_dims[1];
+  void *__pyx_v_data;
+  PyArrayObject *__pyx_v_ndarray = 0;
+  PyObject *__pyx_v_ndarray_obj;
+  struct __pyx_t_4h5py_5_conv_vlen_t __pyx_v_in_vlen0;
+  size_t __pyx_v_size;
+  size_t __pyx_v_itemsize;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  size_t __pyx_t_1;
+  void *__pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  herr_t __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("conv_vlen2ndarray", 0);
+
+  /* "h5py/_conv.pyx":697
+ *     """
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>opt             # <<<<<<<<<<<<<<
+ *         vlen_t* in_vlen = <vlen_t*>ipt
+ *         int flags = NPY_WRITEABLE | NPY_C_CONTIGUOUS | NPY_OWNDATA
+ */
+  __pyx_v_buf_obj = ((PyObject **)__pyx_v_opt);
+
+  /* "h5py/_conv.pyx":698
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>opt
+ *         vlen_t* in_vlen = <vlen_t*>ipt             # <<<<<<<<<<<<<<
+ *         int flags = NPY_WRITEABLE | NPY_C_CONTIGUOUS | NPY_OWNDATA
+ *         npy_intp dims[1]
+ */
+  __pyx_v_in_vlen = ((struct __pyx_t_4h5py_5_conv_vlen_t *)__pyx_v_ipt);
+
+  /* "h5py/_conv.pyx":699
+ *         PyObject** buf_obj = <PyObject**>opt
+ *         vlen_t* in_vlen = <vlen_t*>ipt
+ *         int flags = NPY_WRITEABLE | NPY_C_CONTIGUOUS | NPY_OWNDATA             # <<<<<<<<<<<<<<
+ *         npy_intp dims[1]
+ *         void* data
+ */
+  __pyx_v_flags = ((NPY_WRITEABLE | NPY_C_CONTIGUOUS) | NPY_OWNDATA);
+
+  /* "h5py/_conv.pyx":708
+ * 
+ *     #Replaces the memcpy
+ *     size = in_vlen0.len = in_vlen[0].len             # <<<<<<<<<<<<<<
+ *     data = in_vlen0.ptr = in_vlen[0].ptr
+ * 
+ */
+  __pyx_t_1 = (__pyx_v_in_vlen[0]).len;
+  __pyx_v_size = __pyx_t_1;
+  __pyx_v_in_vlen0.len = __pyx_t_1;
+
+  /* "h5py/_conv.pyx":709
+ *     #Replaces the memcpy
+ *     size = in_vlen0.len = in_vlen[0].len
+ *     data = in_vlen0.ptr = in_vlen[0].ptr             # <<<<<<<<<<<<<<
+ * 
+ *     dims[0] = size
+ */
+  __pyx_t_2 = (__pyx_v_in_vlen[0]).ptr;
+  __pyx_v_data = __pyx_t_2;
+  __pyx_v_in_vlen0.ptr = __pyx_t_2;
+
+  /* "h5py/_conv.pyx":711
+ *     data = in_vlen0.ptr = in_vlen[0].ptr
+ * 
+ *     dims[0] = size             # <<<<<<<<<<<<<<
+ *     itemsize = outtype.get_size()
+ *     if itemsize > intype.get_size():
+ */
+  (__pyx_v_dims[0]) = __pyx_v_size;
+
+  /* "h5py/_conv.pyx":712
+ * 
+ *     dims[0] = size
+ *     itemsize = outtype.get_size()             # <<<<<<<<<<<<<<
+ *     if itemsize > intype.get_size():
+ *         data = realloc(data, itemsize * size)
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_outtype), __pyx_n_s_get_size); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 712, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 712, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_1 = __Pyx_PyInt_As_size_t(__pyx_t_3); if (unlikely((__pyx_t_1 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 712, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_itemsize = __pyx_t_1;
+
+  /* "h5py/_conv.pyx":713
+ *     dims[0] = size
+ *     itemsize = outtype.get_size()
+ *     if itemsize > intype.get_size():             # <<<<<<<<<<<<<<
+ *         data = realloc(data, itemsize * size)
+ *     H5Tconvert(intype.id, outtype.id, size, data, NULL, H5P_DEFAULT)
+ */
+  __pyx_t_3 = __Pyx_PyInt_FromSize_t(__pyx_v_itemsize); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_intype), __pyx_n_s_get_size); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_5, function);
+    }
+  }
+  __pyx_t_4 = (__pyx_t_6) ? __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_6) : __Pyx_PyObject_CallNoArg(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = PyObject_RichCompare(__pyx_t_3, __pyx_t_4, Py_GT); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(0, 713, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (__pyx_t_7) {
+
+    /* "h5py/_conv.pyx":714
+ *     itemsize = outtype.get_size()
+ *     if itemsize > intype.get_size():
+ *         data = realloc(data, itemsize * size)             # <<<<<<<<<<<<<<
+ *     H5Tconvert(intype.id, outtype.id, size, data, NULL, H5P_DEFAULT)
+ * 
+ */
+    __pyx_v_data = realloc(__pyx_v_data, (__pyx_v_itemsize * __pyx_v_size));
+
+    /* "h5py/_conv.pyx":713
+ *     dims[0] = size
+ *     itemsize = outtype.get_size()
+ *     if itemsize > intype.get_size():             # <<<<<<<<<<<<<<
+ *         data = realloc(data, itemsize * size)
+ *     H5Tconvert(intype.id, outtype.id, size, data, NULL, H5P_DEFAULT)
+ */
+  }
+
+  /* "h5py/_conv.pyx":715
+ *     if itemsize > intype.get_size():
+ *         data = realloc(data, itemsize * size)
+ *     H5Tconvert(intype.id, outtype.id, size, data, NULL, H5P_DEFAULT)             # <<<<<<<<<<<<<<
+ * 
+ *     ndarray = cnp.PyArray_SimpleNewFromData(1, dims, elem_dtype.num, data)
+ */
+  __pyx_t_8 = __pyx_f_4h5py_4defs_H5Tconvert(__pyx_v_intype->__pyx_base.id, __pyx_v_outtype->__pyx_base.id, __pyx_v_size, __pyx_v_data, NULL, H5P_DEFAULT); if (unlikely(__pyx_t_8 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 715, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":717
+ *     H5Tconvert(intype.id, outtype.id, size, data, NULL, H5P_DEFAULT)
+ * 
+ *     ndarray = cnp.PyArray_SimpleNewFromData(1, dims, elem_dtype.num, data)             # <<<<<<<<<<<<<<
+ *     PyArray_ENABLEFLAGS(ndarray, flags)
+ *     ndarray_obj = <PyObject*>ndarray
+ */
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_elem_dtype), __pyx_n_s_num); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 717, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_9 = __Pyx_PyInt_As_int(__pyx_t_5); if (unlikely((__pyx_t_9 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 717, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = PyArray_SimpleNewFromData(1, __pyx_v_dims, __pyx_t_9, __pyx_v_data); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 717, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 717, __pyx_L1_error)
+  __pyx_v_ndarray = ((PyArrayObject *)__pyx_t_5);
+  __pyx_t_5 = 0;
+
+  /* "h5py/_conv.pyx":718
+ * 
+ *     ndarray = cnp.PyArray_SimpleNewFromData(1, dims, elem_dtype.num, data)
+ *     PyArray_ENABLEFLAGS(ndarray, flags)             # <<<<<<<<<<<<<<
+ *     ndarray_obj = <PyObject*>ndarray
+ * 
+ */
+  PyArray_ENABLEFLAGS(__pyx_v_ndarray, __pyx_v_flags);
+
+  /* "h5py/_conv.pyx":719
+ *     ndarray = cnp.PyArray_SimpleNewFromData(1, dims, elem_dtype.num, data)
+ *     PyArray_ENABLEFLAGS(ndarray, flags)
+ *     ndarray_obj = <PyObject*>ndarray             # <<<<<<<<<<<<<<
+ * 
+ *     in_vlen0.ptr = NULL
+ */
+  __pyx_v_ndarray_obj = ((PyObject *)__pyx_v_ndarray);
+
+  /* "h5py/_conv.pyx":721
+ *     ndarray_obj = <PyObject*>ndarray
+ * 
+ *     in_vlen0.ptr = NULL             # <<<<<<<<<<<<<<
+ * 
+ *     # Write the new ndarray object to the buffer in-place and ensure it is not destroyed
+ */
+  __pyx_v_in_vlen0.ptr = NULL;
+
+  /* "h5py/_conv.pyx":724
+ * 
+ *     # Write the new ndarray object to the buffer in-place and ensure it is not destroyed
+ *     buf_obj[0] = ndarray_obj             # <<<<<<<<<<<<<<
+ *     Py_INCREF(ndarray)
+ *     Py_INCREF(elem_dtype)
+ */
+  (__pyx_v_buf_obj[0]) = __pyx_v_ndarray_obj;
+
+  /* "h5py/_conv.pyx":725
+ *     # Write the new ndarray object to the buffer in-place and ensure it is not destroyed
+ *     buf_obj[0] = ndarray_obj
+ *     Py_INCREF(ndarray)             # <<<<<<<<<<<<<<
+ *     Py_INCREF(elem_dtype)
+ *     return 0
+ */
+  Py_INCREF(((PyObject *)__pyx_v_ndarray));
+
+  /* "h5py/_conv.pyx":726
+ *     buf_obj[0] = ndarray_obj
+ *     Py_INCREF(ndarray)
+ *     Py_INCREF(elem_dtype)             # <<<<<<<<<<<<<<
+ *     return 0
+ * 
+ */
+  Py_INCREF(((PyObject *)__pyx_v_elem_dtype));
+
+  /* "h5py/_conv.pyx":727
+ *     Py_INCREF(ndarray)
+ *     Py_INCREF(elem_dtype)
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * cdef herr_t ndarray2vlen(hid_t src_id,
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":683
+ *     void* ptr
+ * 
+ * cdef int conv_vlen2ndarray(void* ipt,             # <<<<<<<<<<<<<<
+ *                            void* opt,
+ *                            cnp.dtype elem_dtype,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("h5py._conv.conv_vlen2ndarray", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_ndarray);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":729
+ *     return 0
+ * 
+ * cdef herr_t ndarray2vlen(hid_t src_id,             # <<<<<<<<<<<<<<
+ *                          hid_t dst_id,
+ *                          H5T_cdata_t *cdata,
+ */
+
+static herr_t __pyx_f_4h5py_5_conv_ndarray2vlen(hid_t __pyx_v_src_id, hid_t __pyx_v_dst_id, H5T_cdata_t *__pyx_v_cdata, size_t __pyx_v_nl, size_t __pyx_v_buf_stride, CYTHON_UNUSED size_t __pyx_v_bkg_stride, void *__pyx_v_buf_i, CYTHON_UNUSED void *__pyx_v_bkg_i, CYTHON_UNUSED hid_t __pyx_v_dxpl) {
+  int __pyx_v_command;
+  size_t __pyx_v_src_size;
+  size_t __pyx_v_dst_size;
+  struct __pyx_obj_4h5py_3h5t_TypeID *__pyx_v_supertype = 0;
+  struct __pyx_obj_4h5py_3h5t_TypeID *__pyx_v_outtype = 0;
+  int __pyx_v_i;
+  PyObject **__pyx_v_pdata;
+  PyObject *__pyx_v_pdata_elem;
+  char *__pyx_v_buf;
+  herr_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  H5T_cmd_t __pyx_t_1;
+  int __pyx_t_2;
+  htri_t __pyx_t_3;
+  int __pyx_t_4;
+  enum H5T_class_t __pyx_t_5;
+  hid_t __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  size_t __pyx_t_8;
+  size_t __pyx_t_9;
+  int __pyx_t_10;
+  PyObject *__pyx_t_11 = NULL;
+  struct __pyx_opt_args_4h5py_3h5t_py_create __pyx_t_12;
+  int __pyx_t_13;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  #ifdef WITH_THREAD
+  PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  #endif
+  __Pyx_RefNannySetupContext("ndarray2vlen", 0);
+
+  /* "h5py/_conv.pyx":739
+ *                          hid_t dxpl) except -1 with gil:
+ *     cdef:
+ *         int command = cdata[0].command             # <<<<<<<<<<<<<<
+ *         size_t src_size, dst_size
+ *         TypeID supertype
+ */
+  __pyx_t_1 = (__pyx_v_cdata[0]).command;
+  __pyx_v_command = __pyx_t_1;
+
+  /* "h5py/_conv.pyx":744
+ *         TypeID outtype
+ *         int i
+ *         PyObject **pdata = <PyObject **> buf_i             # <<<<<<<<<<<<<<
+ *         PyObject *pdata_elem
+ *         char* buf = <char*>buf_i
+ */
+  __pyx_v_pdata = ((PyObject **)__pyx_v_buf_i);
+
+  /* "h5py/_conv.pyx":746
+ *         PyObject **pdata = <PyObject **> buf_i
+ *         PyObject *pdata_elem
+ *         char* buf = <char*>buf_i             # <<<<<<<<<<<<<<
+ * 
+ *     if command == H5T_CONV_INIT:
+ */
+  __pyx_v_buf = ((char *)__pyx_v_buf_i);
+
+  /* "h5py/_conv.pyx":748
+ *         char* buf = <char*>buf_i
+ * 
+ *     if command == H5T_CONV_INIT:             # <<<<<<<<<<<<<<
+ *         cdata[0].need_bkg = H5T_BKG_NO
+ *         if not H5Tequal(src_id, H5PY_OBJ) or H5Tget_class(dst_id) != H5T_VLEN:
+ */
+  switch (__pyx_v_command) {
+    case H5T_CONV_INIT:
+
+    /* "h5py/_conv.pyx":749
+ * 
+ *     if command == H5T_CONV_INIT:
+ *         cdata[0].need_bkg = H5T_BKG_NO             # <<<<<<<<<<<<<<
+ *         if not H5Tequal(src_id, H5PY_OBJ) or H5Tget_class(dst_id) != H5T_VLEN:
+ *             return -2
+ */
+    (__pyx_v_cdata[0]).need_bkg = H5T_BKG_NO;
+
+    /* "h5py/_conv.pyx":750
+ *     if command == H5T_CONV_INIT:
+ *         cdata[0].need_bkg = H5T_BKG_NO
+ *         if not H5Tequal(src_id, H5PY_OBJ) or H5Tget_class(dst_id) != H5T_VLEN:             # <<<<<<<<<<<<<<
+ *             return -2
+ *         supertype = typewrap(H5Tget_super(dst_id))
+ */
+    __pyx_t_3 = __pyx_f_4h5py_4defs_H5Tequal(__pyx_v_src_id, __pyx_v_4h5py_3h5t_H5PY_OBJ); if (unlikely(__pyx_t_3 == ((htri_t)((htri_t)-1L)))) __PYX_ERR(0, 750, __pyx_L1_error)
+    __pyx_t_4 = ((!(__pyx_t_3 != 0)) != 0);
+    if (!__pyx_t_4) {
+    } else {
+      __pyx_t_2 = __pyx_t_4;
+      goto __pyx_L4_bool_binop_done;
+    }
+    __pyx_t_5 = __pyx_f_4h5py_4defs_H5Tget_class(__pyx_v_dst_id); if (unlikely(__pyx_t_5 == ((enum H5T_class_t)((enum H5T_class_t)-1L)))) __PYX_ERR(0, 750, __pyx_L1_error)
+    __pyx_t_4 = ((__pyx_t_5 != H5T_VLEN) != 0);
+    __pyx_t_2 = __pyx_t_4;
+    __pyx_L4_bool_binop_done:;
+    if (__pyx_t_2) {
+
+      /* "h5py/_conv.pyx":751
+ *         cdata[0].need_bkg = H5T_BKG_NO
+ *         if not H5Tequal(src_id, H5PY_OBJ) or H5Tget_class(dst_id) != H5T_VLEN:
+ *             return -2             # <<<<<<<<<<<<<<
+ *         supertype = typewrap(H5Tget_super(dst_id))
+ *         for i in range(nl):
+ */
+      __pyx_r = -2;
+      goto __pyx_L0;
+
+      /* "h5py/_conv.pyx":750
+ *     if command == H5T_CONV_INIT:
+ *         cdata[0].need_bkg = H5T_BKG_NO
+ *         if not H5Tequal(src_id, H5PY_OBJ) or H5Tget_class(dst_id) != H5T_VLEN:             # <<<<<<<<<<<<<<
+ *             return -2
+ *         supertype = typewrap(H5Tget_super(dst_id))
+ */
+    }
+
+    /* "h5py/_conv.pyx":752
+ *         if not H5Tequal(src_id, H5PY_OBJ) or H5Tget_class(dst_id) != H5T_VLEN:
+ *             return -2
+ *         supertype = typewrap(H5Tget_super(dst_id))             # <<<<<<<<<<<<<<
+ *         for i in range(nl):
+ *             # smells a lot
+ */
+    __pyx_t_6 = __pyx_f_4h5py_4defs_H5Tget_super(__pyx_v_dst_id); if (unlikely(__pyx_t_6 == ((hid_t)((hid_t)-1L)))) __PYX_ERR(0, 752, __pyx_L1_error)
+    __pyx_t_7 = ((PyObject *)__pyx_f_4h5py_3h5t_typewrap(__pyx_t_6, 0)); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 752, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_v_supertype = ((struct __pyx_obj_4h5py_3h5t_TypeID *)__pyx_t_7);
+    __pyx_t_7 = 0;
+
+    /* "h5py/_conv.pyx":753
+ *             return -2
+ *         supertype = typewrap(H5Tget_super(dst_id))
+ *         for i in range(nl):             # <<<<<<<<<<<<<<
+ *             # smells a lot
+ *             memcpy(&pdata_elem, pdata+i, sizeof(pdata_elem))
+ */
+    __pyx_t_8 = __pyx_v_nl;
+    __pyx_t_9 = __pyx_t_8;
+    for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+      __pyx_v_i = __pyx_t_10;
+
+      /* "h5py/_conv.pyx":755
+ *         for i in range(nl):
+ *             # smells a lot
+ *             memcpy(&pdata_elem, pdata+i, sizeof(pdata_elem))             # <<<<<<<<<<<<<<
+ *             if supertype != py_create((<cnp.ndarray> pdata_elem).dtype, 1):
+ *                 return -2
+ */
+      (void)(memcpy((&__pyx_v_pdata_elem), (__pyx_v_pdata + __pyx_v_i), (sizeof(__pyx_v_pdata_elem))));
+
+      /* "h5py/_conv.pyx":756
+ *             # smells a lot
+ *             memcpy(&pdata_elem, pdata+i, sizeof(pdata_elem))
+ *             if supertype != py_create((<cnp.ndarray> pdata_elem).dtype, 1):             # <<<<<<<<<<<<<<
+ *                 return -2
+ *             if (<cnp.ndarray> pdata_elem).ndim != 1:
+ */
+      __pyx_t_7 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_pdata_elem), __pyx_n_s_dtype); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 756, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __pyx_t_12.__pyx_n = 1;
+      __pyx_t_12.logical = 1;
+      __pyx_t_11 = ((PyObject *)__pyx_f_4h5py_3h5t_py_create(__pyx_t_7, 0, &__pyx_t_12)); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 756, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_11);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __pyx_t_7 = PyObject_RichCompare(((PyObject *)__pyx_v_supertype), __pyx_t_11, Py_NE); __Pyx_XGOTREF(__pyx_t_7); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 756, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 756, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+      if (__pyx_t_2) {
+
+        /* "h5py/_conv.pyx":757
+ *             memcpy(&pdata_elem, pdata+i, sizeof(pdata_elem))
+ *             if supertype != py_create((<cnp.ndarray> pdata_elem).dtype, 1):
+ *                 return -2             # <<<<<<<<<<<<<<
+ *             if (<cnp.ndarray> pdata_elem).ndim != 1:
+ *                 return -2
+ */
+        __pyx_r = -2;
+        goto __pyx_L0;
+
+        /* "h5py/_conv.pyx":756
+ *             # smells a lot
+ *             memcpy(&pdata_elem, pdata+i, sizeof(pdata_elem))
+ *             if supertype != py_create((<cnp.ndarray> pdata_elem).dtype, 1):             # <<<<<<<<<<<<<<
+ *                 return -2
+ *             if (<cnp.ndarray> pdata_elem).ndim != 1:
+ */
+      }
+
+      /* "h5py/_conv.pyx":758
+ *             if supertype != py_create((<cnp.ndarray> pdata_elem).dtype, 1):
+ *                 return -2
+ *             if (<cnp.ndarray> pdata_elem).ndim != 1:             # <<<<<<<<<<<<<<
+ *                 return -2
+ *         log_convert_registered(src_id, dst_id)
+ */
+      __pyx_t_2 = ((((PyArrayObject *)__pyx_v_pdata_elem)->nd != 1) != 0);
+      if (__pyx_t_2) {
+
+        /* "h5py/_conv.pyx":759
+ *                 return -2
+ *             if (<cnp.ndarray> pdata_elem).ndim != 1:
+ *                 return -2             # <<<<<<<<<<<<<<
+ *         log_convert_registered(src_id, dst_id)
+ * 
+ */
+        __pyx_r = -2;
+        goto __pyx_L0;
+
+        /* "h5py/_conv.pyx":758
+ *             if supertype != py_create((<cnp.ndarray> pdata_elem).dtype, 1):
+ *                 return -2
+ *             if (<cnp.ndarray> pdata_elem).ndim != 1:             # <<<<<<<<<<<<<<
+ *                 return -2
+ *         log_convert_registered(src_id, dst_id)
+ */
+      }
+    }
+
+    /* "h5py/_conv.pyx":760
+ *             if (<cnp.ndarray> pdata_elem).ndim != 1:
+ *                 return -2
+ *         log_convert_registered(src_id, dst_id)             # <<<<<<<<<<<<<<
+ * 
+ *     elif command == H5T_CONV_FREE:
+ */
+    __pyx_f_4h5py_5_conv_log_convert_registered(__pyx_v_src_id, __pyx_v_dst_id);
+
+    /* "h5py/_conv.pyx":748
+ *         char* buf = <char*>buf_i
+ * 
+ *     if command == H5T_CONV_INIT:             # <<<<<<<<<<<<<<
+ *         cdata[0].need_bkg = H5T_BKG_NO
+ *         if not H5Tequal(src_id, H5PY_OBJ) or H5Tget_class(dst_id) != H5T_VLEN:
+ */
+    break;
+    case H5T_CONV_FREE:
+
+    /* "h5py/_conv.pyx":762
+ *         log_convert_registered(src_id, dst_id)
+ * 
+ *     elif command == H5T_CONV_FREE:             # <<<<<<<<<<<<<<
+ *         pass
+ * 
+ */
+    break;
+    case H5T_CONV_CONV:
+
+    /* "h5py/_conv.pyx":768
+ *         # If there are no elements to convert, pdata will not point to
+ *         # a valid PyObject*, so bail here to prevent accessing the dtype below
+ *         if nl == 0:             # <<<<<<<<<<<<<<
+ *             return 0
+ * 
+ */
+    __pyx_t_2 = ((__pyx_v_nl == 0) != 0);
+    if (__pyx_t_2) {
+
+      /* "h5py/_conv.pyx":769
+ *         # a valid PyObject*, so bail here to prevent accessing the dtype below
+ *         if nl == 0:
+ *             return 0             # <<<<<<<<<<<<<<
+ * 
+ *         # need to pass element dtype to converter
+ */
+      __pyx_r = 0;
+      goto __pyx_L0;
+
+      /* "h5py/_conv.pyx":768
+ *         # If there are no elements to convert, pdata will not point to
+ *         # a valid PyObject*, so bail here to prevent accessing the dtype below
+ *         if nl == 0:             # <<<<<<<<<<<<<<
+ *             return 0
+ * 
+ */
+    }
+
+    /* "h5py/_conv.pyx":772
+ * 
+ *         # need to pass element dtype to converter
+ *         pdata_elem = pdata[0]             # <<<<<<<<<<<<<<
+ *         supertype = py_create((<cnp.ndarray> pdata_elem).dtype)
+ *         outtype = typewrap(H5Tget_super(dst_id))
+ */
+    __pyx_v_pdata_elem = (__pyx_v_pdata[0]);
+
+    /* "h5py/_conv.pyx":773
+ *         # need to pass element dtype to converter
+ *         pdata_elem = pdata[0]
+ *         supertype = py_create((<cnp.ndarray> pdata_elem).dtype)             # <<<<<<<<<<<<<<
+ *         outtype = typewrap(H5Tget_super(dst_id))
+ * 
+ */
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_pdata_elem), __pyx_n_s_dtype); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 773, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_11 = ((PyObject *)__pyx_f_4h5py_3h5t_py_create(__pyx_t_7, 0, NULL)); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 773, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_11);
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_v_supertype = ((struct __pyx_obj_4h5py_3h5t_TypeID *)__pyx_t_11);
+    __pyx_t_11 = 0;
+
+    /* "h5py/_conv.pyx":774
+ *         pdata_elem = pdata[0]
+ *         supertype = py_create((<cnp.ndarray> pdata_elem).dtype)
+ *         outtype = typewrap(H5Tget_super(dst_id))             # <<<<<<<<<<<<<<
+ * 
+ *         if buf_stride == 0:
+ */
+    __pyx_t_6 = __pyx_f_4h5py_4defs_H5Tget_super(__pyx_v_dst_id); if (unlikely(__pyx_t_6 == ((hid_t)((hid_t)-1L)))) __PYX_ERR(0, 774, __pyx_L1_error)
+    __pyx_t_11 = ((PyObject *)__pyx_f_4h5py_3h5t_typewrap(__pyx_t_6, 0)); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 774, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_11);
+    __pyx_v_outtype = ((struct __pyx_obj_4h5py_3h5t_TypeID *)__pyx_t_11);
+    __pyx_t_11 = 0;
+
+    /* "h5py/_conv.pyx":776
+ *         outtype = typewrap(H5Tget_super(dst_id))
+ * 
+ *         if buf_stride == 0:             # <<<<<<<<<<<<<<
+ *             # No explicit stride seems to mean that the elements are packed
+ *             # contiguously in the buffer.  In this case we must be careful
+ */
+    __pyx_t_2 = ((__pyx_v_buf_stride == 0) != 0);
+    if (__pyx_t_2) {
+
+      /* "h5py/_conv.pyx":782
+ *             # of a larger size.
+ * 
+ *             src_size = H5Tget_size(src_id)             # <<<<<<<<<<<<<<
+ *             dst_size = H5Tget_size(dst_id)
+ * 
+ */
+      __pyx_t_8 = __pyx_f_4h5py_4defs_H5Tget_size(__pyx_v_src_id); if (unlikely(__pyx_t_8 == ((size_t)((size_t)0)))) __PYX_ERR(0, 782, __pyx_L1_error)
+      __pyx_v_src_size = __pyx_t_8;
+
+      /* "h5py/_conv.pyx":783
+ * 
+ *             src_size = H5Tget_size(src_id)
+ *             dst_size = H5Tget_size(dst_id)             # <<<<<<<<<<<<<<
+ * 
+ *             if src_size >= dst_size:
+ */
+      __pyx_t_8 = __pyx_f_4h5py_4defs_H5Tget_size(__pyx_v_dst_id); if (unlikely(__pyx_t_8 == ((size_t)((size_t)0)))) __PYX_ERR(0, 783, __pyx_L1_error)
+      __pyx_v_dst_size = __pyx_t_8;
+
+      /* "h5py/_conv.pyx":785
+ *             dst_size = H5Tget_size(dst_id)
+ * 
+ *             if src_size >= dst_size:             # <<<<<<<<<<<<<<
+ *                 for i in range(nl):
+ *                     conv_ndarray2vlen(buf + (i*src_size), buf + (i*dst_size),
+ */
+      __pyx_t_2 = ((__pyx_v_src_size >= __pyx_v_dst_size) != 0);
+      if (__pyx_t_2) {
+
+        /* "h5py/_conv.pyx":786
+ * 
+ *             if src_size >= dst_size:
+ *                 for i in range(nl):             # <<<<<<<<<<<<<<
+ *                     conv_ndarray2vlen(buf + (i*src_size), buf + (i*dst_size),
+ *                                       supertype, outtype)
+ */
+        __pyx_t_8 = __pyx_v_nl;
+        __pyx_t_9 = __pyx_t_8;
+        for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+          __pyx_v_i = __pyx_t_10;
+
+          /* "h5py/_conv.pyx":787
+ *             if src_size >= dst_size:
+ *                 for i in range(nl):
+ *                     conv_ndarray2vlen(buf + (i*src_size), buf + (i*dst_size),             # <<<<<<<<<<<<<<
+ *                                       supertype, outtype)
+ *             else:
+ */
+          __pyx_t_13 = __pyx_f_4h5py_5_conv_conv_ndarray2vlen((__pyx_v_buf + (__pyx_v_i * __pyx_v_src_size)), (__pyx_v_buf + (__pyx_v_i * __pyx_v_dst_size)), __pyx_v_supertype, __pyx_v_outtype); if (unlikely(__pyx_t_13 == ((int)-1))) __PYX_ERR(0, 787, __pyx_L1_error)
+        }
+
+        /* "h5py/_conv.pyx":785
+ *             dst_size = H5Tget_size(dst_id)
+ * 
+ *             if src_size >= dst_size:             # <<<<<<<<<<<<<<
+ *                 for i in range(nl):
+ *                     conv_ndarray2vlen(buf + (i*src_size), buf + (i*dst_size),
+ */
+        goto __pyx_L12;
+      }
+
+      /* "h5py/_conv.pyx":790
+ *                                       supertype, outtype)
+ *             else:
+ *                 for i in range(nl-1, -1, -1):             # <<<<<<<<<<<<<<
+ *                     conv_ndarray2vlen(buf + (i*src_size), buf + (i*dst_size),
+ *                                       supertype, outtype)
+ */
+      /*else*/ {
+        for (__pyx_t_10 = (__pyx_v_nl - 1); __pyx_t_10 > -1; __pyx_t_10-=1) {
+          __pyx_v_i = __pyx_t_10;
+
+          /* "h5py/_conv.pyx":791
+ *             else:
+ *                 for i in range(nl-1, -1, -1):
+ *                     conv_ndarray2vlen(buf + (i*src_size), buf + (i*dst_size),             # <<<<<<<<<<<<<<
+ *                                       supertype, outtype)
+ *         else:
+ */
+          __pyx_t_13 = __pyx_f_4h5py_5_conv_conv_ndarray2vlen((__pyx_v_buf + (__pyx_v_i * __pyx_v_src_size)), (__pyx_v_buf + (__pyx_v_i * __pyx_v_dst_size)), __pyx_v_supertype, __pyx_v_outtype); if (unlikely(__pyx_t_13 == ((int)-1))) __PYX_ERR(0, 791, __pyx_L1_error)
+        }
+      }
+      __pyx_L12:;
+
+      /* "h5py/_conv.pyx":776
+ *         outtype = typewrap(H5Tget_super(dst_id))
+ * 
+ *         if buf_stride == 0:             # <<<<<<<<<<<<<<
+ *             # No explicit stride seems to mean that the elements are packed
+ *             # contiguously in the buffer.  In this case we must be careful
+ */
+      goto __pyx_L11;
+    }
+
+    /* "h5py/_conv.pyx":797
+ *             # alignment better than us.  Therefore we use the given stride
+ *             # offsets exclusively.
+ *             for i in range(nl):             # <<<<<<<<<<<<<<
+ *                 conv_ndarray2vlen(buf + (i*buf_stride), buf + (i*buf_stride),
+ *                                   supertype, outtype)
+ */
+    /*else*/ {
+      __pyx_t_8 = __pyx_v_nl;
+      __pyx_t_9 = __pyx_t_8;
+      for (__pyx_t_10 = 0; __pyx_t_10 < __pyx_t_9; __pyx_t_10+=1) {
+        __pyx_v_i = __pyx_t_10;
+
+        /* "h5py/_conv.pyx":798
+ *             # offsets exclusively.
+ *             for i in range(nl):
+ *                 conv_ndarray2vlen(buf + (i*buf_stride), buf + (i*buf_stride),             # <<<<<<<<<<<<<<
+ *                                   supertype, outtype)
+ * 
+ */
+        __pyx_t_13 = __pyx_f_4h5py_5_conv_conv_ndarray2vlen((__pyx_v_buf + (__pyx_v_i * __pyx_v_buf_stride)), (__pyx_v_buf + (__pyx_v_i * __pyx_v_buf_stride)), __pyx_v_supertype, __pyx_v_outtype); if (unlikely(__pyx_t_13 == ((int)-1))) __PYX_ERR(0, 798, __pyx_L1_error)
+      }
+    }
+    __pyx_L11:;
+
+    /* "h5py/_conv.pyx":765
+ *         pass
+ * 
+ *     elif command == H5T_CONV_CONV:             # <<<<<<<<<<<<<<
+ *         # If there are no elements to convert, pdata will not point to
+ *         # a valid PyObject*, so bail here to prevent accessing the dtype below
+ */
+    break;
+    default:
+
+    /* "h5py/_conv.pyx":802
+ * 
+ *     else:
+ *         return -2   # Unrecognized command.  Note this is NOT an exception.             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+    __pyx_r = -2;
+    goto __pyx_L0;
+    break;
+  }
+
+  /* "h5py/_conv.pyx":804
+ *         return -2   # Unrecognized command.  Note this is NOT an exception.
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":729
+ *     return 0
+ * 
+ * cdef herr_t ndarray2vlen(hid_t src_id,             # <<<<<<<<<<<<<<
+ *                          hid_t dst_id,
+ *                          H5T_cdata_t *cdata,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_AddTraceback("h5py._conv.ndarray2vlen", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_supertype);
+  __Pyx_XDECREF((PyObject *)__pyx_v_outtype);
+  __Pyx_RefNannyFinishContext();
+  #ifdef WITH_THREAD
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  #endif
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":807
+ * 
+ * 
+ * cdef int conv_ndarray2vlen(void* ipt,             # <<<<<<<<<<<<<<
+ *                            void* opt,
+ *                            TypeID intype,
+ */
+
+static int __pyx_f_4h5py_5_conv_conv_ndarray2vlen(void *__pyx_v_ipt, void *__pyx_v_opt, struct __pyx_obj_4h5py_3h5t_TypeID *__pyx_v_intype, struct __pyx_obj_4h5py_3h5t_TypeID *__pyx_v_outtype) {
+  PyObject **__pyx_v_buf_obj;
+  struct __pyx_t_4h5py_5_conv_vlen_t *__pyx_v_in_vlen;
+  void *__pyx_v_data;
+  PyArrayObject *__pyx_v_ndarray = 0;
+  size_t __pyx_v_len;
+  size_t __pyx_v_nbytes;
+  PyObject *__pyx_v_buf_obj0;
+  Py_buffer __pyx_v_view;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  size_t __pyx_t_7;
+  void *__pyx_t_8;
+  int __pyx_t_9;
+  herr_t __pyx_t_10;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("conv_ndarray2vlen", 0);
+
+  /* "h5py/_conv.pyx":812
+ *                            TypeID outtype) except -1:
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>ipt             # <<<<<<<<<<<<<<
+ *         vlen_t* in_vlen = <vlen_t*>opt
+ *         void* data
+ */
+  __pyx_v_buf_obj = ((PyObject **)__pyx_v_ipt);
+
+  /* "h5py/_conv.pyx":813
+ *     cdef:
+ *         PyObject** buf_obj = <PyObject**>ipt
+ *         vlen_t* in_vlen = <vlen_t*>opt             # <<<<<<<<<<<<<<
+ *         void* data
+ *         cnp.ndarray ndarray
+ */
+  __pyx_v_in_vlen = ((struct __pyx_t_4h5py_5_conv_vlen_t *)__pyx_v_opt);
+
+  /* "h5py/_conv.pyx":820
+ *         Py_buffer view
+ * 
+ *     buf_obj0 = buf_obj[0]             # <<<<<<<<<<<<<<
+ *     ndarray = <cnp.ndarray> buf_obj0
+ *     len = ndarray.shape[0]
+ */
+  __pyx_v_buf_obj0 = (__pyx_v_buf_obj[0]);
+
+  /* "h5py/_conv.pyx":821
+ * 
+ *     buf_obj0 = buf_obj[0]
+ *     ndarray = <cnp.ndarray> buf_obj0             # <<<<<<<<<<<<<<
+ *     len = ndarray.shape[0]
+ *     nbytes = len * max(outtype.get_size(), intype.get_size())
+ */
+  __pyx_t_1 = ((PyObject *)__pyx_v_buf_obj0);
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_ndarray = ((PyArrayObject *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "h5py/_conv.pyx":822
+ *     buf_obj0 = buf_obj[0]
+ *     ndarray = <cnp.ndarray> buf_obj0
+ *     len = ndarray.shape[0]             # <<<<<<<<<<<<<<
+ *     nbytes = len * max(outtype.get_size(), intype.get_size())
+ * 
+ */
+  __pyx_v_len = (__pyx_v_ndarray->dimensions[0]);
+
+  /* "h5py/_conv.pyx":823
+ *     ndarray = <cnp.ndarray> buf_obj0
+ *     len = ndarray.shape[0]
+ *     nbytes = len * max(outtype.get_size(), intype.get_size())             # <<<<<<<<<<<<<<
+ * 
+ *     data = emalloc(nbytes)
+ */
+  __pyx_t_1 = __Pyx_PyInt_FromSize_t(__pyx_v_len); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 823, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_intype), __pyx_n_s_get_size); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 823, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 823, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_outtype), __pyx_n_s_get_size); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 823, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 823, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_5 = PyObject_RichCompare(__pyx_t_2, __pyx_t_3, Py_GT); __Pyx_XGOTREF(__pyx_t_5); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 823, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_5); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(0, 823, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (__pyx_t_6) {
+    __Pyx_INCREF(__pyx_t_2);
+    __pyx_t_4 = __pyx_t_2;
+  } else {
+    __Pyx_INCREF(__pyx_t_3);
+    __pyx_t_4 = __pyx_t_3;
+  }
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyNumber_Multiply(__pyx_t_1, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 823, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_7 = __Pyx_PyInt_As_size_t(__pyx_t_2); if (unlikely((__pyx_t_7 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 823, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_nbytes = __pyx_t_7;
+
+  /* "h5py/_conv.pyx":825
+ *     nbytes = len * max(outtype.get_size(), intype.get_size())
+ * 
+ *     data = emalloc(nbytes)             # <<<<<<<<<<<<<<
+ * 
+ *     PyObject_GetBuffer(ndarray, &view, PyBUF_INDIRECT)
+ */
+  __pyx_t_8 = __pyx_f_4h5py_5utils_emalloc(__pyx_v_nbytes); if (unlikely(__pyx_t_8 == ((void *)NULL) && PyErr_Occurred())) __PYX_ERR(0, 825, __pyx_L1_error)
+  __pyx_v_data = __pyx_t_8;
+
+  /* "h5py/_conv.pyx":827
+ *     data = emalloc(nbytes)
+ * 
+ *     PyObject_GetBuffer(ndarray, &view, PyBUF_INDIRECT)             # <<<<<<<<<<<<<<
+ *     PyBuffer_ToContiguous(data, &view, view.len, b'C')
+ *     PyBuffer_Release(&view)
+ */
+  __pyx_t_9 = PyObject_GetBuffer(((PyObject *)__pyx_v_ndarray), (&__pyx_v_view), PyBUF_INDIRECT); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 827, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":828
+ * 
+ *     PyObject_GetBuffer(ndarray, &view, PyBUF_INDIRECT)
+ *     PyBuffer_ToContiguous(data, &view, view.len, b'C')             # <<<<<<<<<<<<<<
+ *     PyBuffer_Release(&view)
+ * 
+ */
+  (void)(PyBuffer_ToContiguous(__pyx_v_data, (&__pyx_v_view), __pyx_v_view.len, 'C'));
+
+  /* "h5py/_conv.pyx":829
+ *     PyObject_GetBuffer(ndarray, &view, PyBUF_INDIRECT)
+ *     PyBuffer_ToContiguous(data, &view, view.len, b'C')
+ *     PyBuffer_Release(&view)             # <<<<<<<<<<<<<<
+ * 
+ *     H5Tconvert(intype.id, outtype.id, len, data, NULL, H5P_DEFAULT)
+ */
+  PyBuffer_Release((&__pyx_v_view));
+
+  /* "h5py/_conv.pyx":831
+ *     PyBuffer_Release(&view)
+ * 
+ *     H5Tconvert(intype.id, outtype.id, len, data, NULL, H5P_DEFAULT)             # <<<<<<<<<<<<<<
+ * 
+ *     in_vlen[0].len = len
+ */
+  __pyx_t_10 = __pyx_f_4h5py_4defs_H5Tconvert(__pyx_v_intype->__pyx_base.id, __pyx_v_outtype->__pyx_base.id, __pyx_v_len, __pyx_v_data, NULL, H5P_DEFAULT); if (unlikely(__pyx_t_10 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 831, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":833
+ *     H5Tconvert(intype.id, outtype.id, len, data, NULL, H5P_DEFAULT)
+ * 
+ *     in_vlen[0].len = len             # <<<<<<<<<<<<<<
+ *     in_vlen[0].ptr = data
+ * 
+ */
+  (__pyx_v_in_vlen[0]).len = __pyx_v_len;
+
+  /* "h5py/_conv.pyx":834
+ * 
+ *     in_vlen[0].len = len
+ *     in_vlen[0].ptr = data             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+  (__pyx_v_in_vlen[0]).ptr = __pyx_v_data;
+
+  /* "h5py/_conv.pyx":836
+ *     in_vlen[0].ptr = data
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * # =============================================================================
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":807
+ * 
+ * 
+ * cdef int conv_ndarray2vlen(void* ipt,             # <<<<<<<<<<<<<<
+ *                            void* opt,
+ *                            TypeID intype,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("h5py._conv.conv_ndarray2vlen", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_ndarray);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":841
+ * # B8 to enum bool routines
+ * 
+ * cdef herr_t b82boolenum(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                         size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                         void *bkg_i, hid_t dxpl) except -1:
+ */
+
+static herr_t __pyx_f_4h5py_5_conv_b82boolenum(CYTHON_UNUSED hid_t __pyx_v_src_id, CYTHON_UNUSED hid_t __pyx_v_dst_id, CYTHON_UNUSED H5T_cdata_t *__pyx_v_cdata, CYTHON_UNUSED size_t __pyx_v_nl, CYTHON_UNUSED size_t __pyx_v_buf_stride, CYTHON_UNUSED size_t __pyx_v_bkg_stride, CYTHON_UNUSED void *__pyx_v_buf_i, CYTHON_UNUSED void *__pyx_v_bkg_i, CYTHON_UNUSED hid_t __pyx_v_dxpl) {
+  herr_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("b82boolenum", 0);
+
+  /* "h5py/_conv.pyx":844
+ *                         size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                         void *bkg_i, hid_t dxpl) except -1:
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * cdef herr_t boolenum2b8(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":841
+ * # B8 to enum bool routines
+ * 
+ * cdef herr_t b82boolenum(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                         size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                         void *bkg_i, hid_t dxpl) except -1:
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":846
+ *     return 0
+ * 
+ * cdef herr_t boolenum2b8(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                         size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                         void *bkg_i, hid_t dxpl) except -1:
+ */
+
+static herr_t __pyx_f_4h5py_5_conv_boolenum2b8(CYTHON_UNUSED hid_t __pyx_v_src_id, CYTHON_UNUSED hid_t __pyx_v_dst_id, CYTHON_UNUSED H5T_cdata_t *__pyx_v_cdata, CYTHON_UNUSED size_t __pyx_v_nl, CYTHON_UNUSED size_t __pyx_v_buf_stride, CYTHON_UNUSED size_t __pyx_v_bkg_stride, CYTHON_UNUSED void *__pyx_v_buf_i, CYTHON_UNUSED void *__pyx_v_bkg_i, CYTHON_UNUSED hid_t __pyx_v_dxpl) {
+  herr_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("boolenum2b8", 0);
+
+  /* "h5py/_conv.pyx":849
+ *                         size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                         void *bkg_i, hid_t dxpl) except -1:
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * # =============================================================================
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":846
+ *     return 0
+ * 
+ * cdef herr_t boolenum2b8(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                         size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                         void *bkg_i, hid_t dxpl) except -1:
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":854
+ * # B8 to UINT8 routines
+ * 
+ * cdef herr_t b82uint8(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                      size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                      void *bkg_i, hid_t dxpl) except -1:
+ */
+
+static herr_t __pyx_f_4h5py_5_conv_b82uint8(CYTHON_UNUSED hid_t __pyx_v_src_id, CYTHON_UNUSED hid_t __pyx_v_dst_id, CYTHON_UNUSED H5T_cdata_t *__pyx_v_cdata, CYTHON_UNUSED size_t __pyx_v_nl, CYTHON_UNUSED size_t __pyx_v_buf_stride, CYTHON_UNUSED size_t __pyx_v_bkg_stride, CYTHON_UNUSED void *__pyx_v_buf_i, CYTHON_UNUSED void *__pyx_v_bkg_i, CYTHON_UNUSED hid_t __pyx_v_dxpl) {
+  herr_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("b82uint8", 0);
+
+  /* "h5py/_conv.pyx":857
+ *                      size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                      void *bkg_i, hid_t dxpl) except -1:
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * cdef herr_t uint82b8(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":854
+ * # B8 to UINT8 routines
+ * 
+ * cdef herr_t b82uint8(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                      size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                      void *bkg_i, hid_t dxpl) except -1:
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":859
+ *     return 0
+ * 
+ * cdef herr_t uint82b8(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                      size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                      void *bkg_i, hid_t dxpl) except -1:
+ */
+
+static herr_t __pyx_f_4h5py_5_conv_uint82b8(CYTHON_UNUSED hid_t __pyx_v_src_id, CYTHON_UNUSED hid_t __pyx_v_dst_id, CYTHON_UNUSED H5T_cdata_t *__pyx_v_cdata, CYTHON_UNUSED size_t __pyx_v_nl, CYTHON_UNUSED size_t __pyx_v_buf_stride, CYTHON_UNUSED size_t __pyx_v_bkg_stride, CYTHON_UNUSED void *__pyx_v_buf_i, CYTHON_UNUSED void *__pyx_v_bkg_i, CYTHON_UNUSED hid_t __pyx_v_dxpl) {
+  herr_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("uint82b8", 0);
+
+  /* "h5py/_conv.pyx":862
+ *                      size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                      void *bkg_i, hid_t dxpl) except -1:
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * # =============================================================================
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":859
+ *     return 0
+ * 
+ * cdef herr_t uint82b8(hid_t src_id, hid_t dst_id, H5T_cdata_t *cdata,             # <<<<<<<<<<<<<<
+ *                      size_t nl, size_t buf_stride, size_t bkg_stride, void *buf_i,
+ *                      void *bkg_i, hid_t dxpl) except -1:
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":866
+ * # =============================================================================
+ * 
+ * cpdef int register_converters() except -1:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         hid_t vlstring
+ */
+
+static PyObject *__pyx_pw_4h5py_5_conv_1register_converters(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static int __pyx_f_4h5py_5_conv_register_converters(CYTHON_UNUSED int __pyx_skip_dispatch) {
+  hid_t __pyx_v_vlstring;
+  hid_t __pyx_v_vlentype;
+  hid_t __pyx_v_pyobj;
+  hid_t __pyx_v_enum;
+  hid_t __pyx_v_boolenum;
+  __pyx_t_5numpy_int8_t __pyx_v_f_value;
+  __pyx_t_5numpy_int8_t __pyx_v_t_value;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  hid_t __pyx_t_1;
+  herr_t __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  char *__pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("register_converters", 0);
+
+  /* "h5py/_conv.pyx":872
+ *         hid_t pyobj
+ *         hid_t enum
+ *         hid_t boolenum = -1             # <<<<<<<<<<<<<<
+ *         int8_t f_value = 0
+ *         int8_t t_value = 1
+ */
+  __pyx_v_boolenum = -1L;
+
+  /* "h5py/_conv.pyx":873
+ *         hid_t enum
+ *         hid_t boolenum = -1
+ *         int8_t f_value = 0             # <<<<<<<<<<<<<<
+ *         int8_t t_value = 1
+ * 
+ */
+  __pyx_v_f_value = 0;
+
+  /* "h5py/_conv.pyx":874
+ *         hid_t boolenum = -1
+ *         int8_t f_value = 0
+ *         int8_t t_value = 1             # <<<<<<<<<<<<<<
+ * 
+ *     vlstring = H5Tcopy(H5T_C_S1)
+ */
+  __pyx_v_t_value = 1;
+
+  /* "h5py/_conv.pyx":876
+ *         int8_t t_value = 1
+ * 
+ *     vlstring = H5Tcopy(H5T_C_S1)             # <<<<<<<<<<<<<<
+ *     H5Tset_size(vlstring, H5T_VARIABLE)
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4h5py_4defs_H5Tcopy(H5T_C_S1); if (unlikely(__pyx_t_1 == ((hid_t)((hid_t)-1L)))) __PYX_ERR(0, 876, __pyx_L1_error)
+  __pyx_v_vlstring = __pyx_t_1;
+
+  /* "h5py/_conv.pyx":877
+ * 
+ *     vlstring = H5Tcopy(H5T_C_S1)
+ *     H5Tset_size(vlstring, H5T_VARIABLE)             # <<<<<<<<<<<<<<
+ * 
+ *     enum = H5Tenum_create(H5T_STD_I32LE)
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tset_size(__pyx_v_vlstring, H5T_VARIABLE); if (unlikely(__pyx_t_2 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 877, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":879
+ *     H5Tset_size(vlstring, H5T_VARIABLE)
+ * 
+ *     enum = H5Tenum_create(H5T_STD_I32LE)             # <<<<<<<<<<<<<<
+ * 
+ *     vlentype = H5Tvlen_create(H5T_STD_I32LE)
+ */
+  __pyx_t_1 = __pyx_f_4h5py_4defs_H5Tenum_create(H5T_STD_I32LE); if (unlikely(__pyx_t_1 == ((hid_t)((hid_t)-1L)))) __PYX_ERR(0, 879, __pyx_L1_error)
+  __pyx_v_enum = __pyx_t_1;
+
+  /* "h5py/_conv.pyx":881
+ *     enum = H5Tenum_create(H5T_STD_I32LE)
+ * 
+ *     vlentype = H5Tvlen_create(H5T_STD_I32LE)             # <<<<<<<<<<<<<<
+ * 
+ *     pyobj = H5PY_OBJ
+ */
+  __pyx_t_1 = __pyx_f_4h5py_4defs_H5Tvlen_create(H5T_STD_I32LE); if (unlikely(__pyx_t_1 == ((hid_t)((hid_t)-1L)))) __PYX_ERR(0, 881, __pyx_L1_error)
+  __pyx_v_vlentype = __pyx_t_1;
+
+  /* "h5py/_conv.pyx":883
+ *     vlentype = H5Tvlen_create(H5T_STD_I32LE)
+ * 
+ *     pyobj = H5PY_OBJ             # <<<<<<<<<<<<<<
+ * 
+ *     boolenum = H5Tenum_create(H5T_NATIVE_INT8)
+ */
+  __pyx_v_pyobj = __pyx_v_4h5py_3h5t_H5PY_OBJ;
+
+  /* "h5py/_conv.pyx":885
+ *     pyobj = H5PY_OBJ
+ * 
+ *     boolenum = H5Tenum_create(H5T_NATIVE_INT8)             # <<<<<<<<<<<<<<
+ *     H5Tenum_insert(boolenum, cfg._f_name, &f_value)
+ *     H5Tenum_insert(boolenum, cfg._t_name, &t_value)
+ */
+  __pyx_t_1 = __pyx_f_4h5py_4defs_H5Tenum_create(H5T_NATIVE_INT8); if (unlikely(__pyx_t_1 == ((hid_t)((hid_t)-1L)))) __PYX_ERR(0, 885, __pyx_L1_error)
+  __pyx_v_boolenum = __pyx_t_1;
+
+  /* "h5py/_conv.pyx":886
+ * 
+ *     boolenum = H5Tenum_create(H5T_NATIVE_INT8)
+ *     H5Tenum_insert(boolenum, cfg._f_name, &f_value)             # <<<<<<<<<<<<<<
+ *     H5Tenum_insert(boolenum, cfg._t_name, &t_value)
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_cfg); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 886, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_f_name); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 886, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_5 = __Pyx_PyObject_AsWritableString(__pyx_t_4); if (unlikely((!__pyx_t_5) && PyErr_Occurred())) __PYX_ERR(0, 886, __pyx_L1_error)
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tenum_insert(__pyx_v_boolenum, __pyx_t_5, (&__pyx_v_f_value)); if (unlikely(__pyx_t_2 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 886, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "h5py/_conv.pyx":887
+ *     boolenum = H5Tenum_create(H5T_NATIVE_INT8)
+ *     H5Tenum_insert(boolenum, cfg._f_name, &f_value)
+ *     H5Tenum_insert(boolenum, cfg._t_name, &t_value)             # <<<<<<<<<<<<<<
+ * 
+ *     H5Tregister(H5T_PERS_SOFT, "vlen2fixed", vlstring, H5T_C_S1, vlen2fixed)
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_cfg); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 887, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_t_name); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 887, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_5 = __Pyx_PyObject_AsWritableString(__pyx_t_3); if (unlikely((!__pyx_t_5) && PyErr_Occurred())) __PYX_ERR(0, 887, __pyx_L1_error)
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tenum_insert(__pyx_v_boolenum, __pyx_t_5, (&__pyx_v_t_value)); if (unlikely(__pyx_t_2 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 887, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "h5py/_conv.pyx":889
+ *     H5Tenum_insert(boolenum, cfg._t_name, &t_value)
+ * 
+ *     H5Tregister(H5T_PERS_SOFT, "vlen2fixed", vlstring, H5T_C_S1, vlen2fixed)             # <<<<<<<<<<<<<<
+ *     H5Tregister(H5T_PERS_SOFT, "fixed2vlen", H5T_C_S1, vlstring, fixed2vlen)
+ * 
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tregister(H5T_PERS_SOFT, ((char *)"vlen2fixed"), __pyx_v_vlstring, H5T_C_S1, __pyx_f_4h5py_5_conv_vlen2fixed); if (unlikely(__pyx_t_2 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 889, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":890
+ * 
+ *     H5Tregister(H5T_PERS_SOFT, "vlen2fixed", vlstring, H5T_C_S1, vlen2fixed)
+ *     H5Tregister(H5T_PERS_SOFT, "fixed2vlen", H5T_C_S1, vlstring, fixed2vlen)             # <<<<<<<<<<<<<<
+ * 
+ *     H5Tregister(H5T_PERS_HARD, "objref2pyref", H5T_STD_REF_OBJ, pyobj, objref2pyref)
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tregister(H5T_PERS_SOFT, ((char *)"fixed2vlen"), H5T_C_S1, __pyx_v_vlstring, __pyx_f_4h5py_5_conv_fixed2vlen); if (unlikely(__pyx_t_2 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 890, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":892
+ *     H5Tregister(H5T_PERS_SOFT, "fixed2vlen", H5T_C_S1, vlstring, fixed2vlen)
+ * 
+ *     H5Tregister(H5T_PERS_HARD, "objref2pyref", H5T_STD_REF_OBJ, pyobj, objref2pyref)             # <<<<<<<<<<<<<<
+ *     H5Tregister(H5T_PERS_HARD, "pyref2objref", pyobj, H5T_STD_REF_OBJ, pyref2objref)
+ * 
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tregister(H5T_PERS_HARD, ((char *)"objref2pyref"), H5T_STD_REF_OBJ, __pyx_v_pyobj, __pyx_f_4h5py_5_conv_objref2pyref); if (unlikely(__pyx_t_2 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 892, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":893
+ * 
+ *     H5Tregister(H5T_PERS_HARD, "objref2pyref", H5T_STD_REF_OBJ, pyobj, objref2pyref)
+ *     H5Tregister(H5T_PERS_HARD, "pyref2objref", pyobj, H5T_STD_REF_OBJ, pyref2objref)             # <<<<<<<<<<<<<<
+ * 
+ *     H5Tregister(H5T_PERS_HARD, "regref2pyref", H5T_STD_REF_DSETREG, pyobj, regref2pyref)
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tregister(H5T_PERS_HARD, ((char *)"pyref2objref"), __pyx_v_pyobj, H5T_STD_REF_OBJ, __pyx_f_4h5py_5_conv_pyref2objref); if (unlikely(__pyx_t_2 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 893, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":895
+ *     H5Tregister(H5T_PERS_HARD, "pyref2objref", pyobj, H5T_STD_REF_OBJ, pyref2objref)
+ * 
+ *     H5Tregister(H5T_PERS_HARD, "regref2pyref", H5T_STD_REF_DSETREG, pyobj, regref2pyref)             # <<<<<<<<<<<<<<
+ *     H5Tregister(H5T_PERS_HARD, "pyref2regref", pyobj, H5T_STD_REF_DSETREG, pyref2regref)
+ * 
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tregister(H5T_PERS_HARD, ((char *)"regref2pyref"), H5T_STD_REF_DSETREG, __pyx_v_pyobj, __pyx_f_4h5py_5_conv_regref2pyref); if (unlikely(__pyx_t_2 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 895, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":896
+ * 
+ *     H5Tregister(H5T_PERS_HARD, "regref2pyref", H5T_STD_REF_DSETREG, pyobj, regref2pyref)
+ *     H5Tregister(H5T_PERS_HARD, "pyref2regref", pyobj, H5T_STD_REF_DSETREG, pyref2regref)             # <<<<<<<<<<<<<<
+ * 
+ *     H5Tregister(H5T_PERS_SOFT, "enum2int", enum, H5T_STD_I32LE, enum2int)
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tregister(H5T_PERS_HARD, ((char *)"pyref2regref"), __pyx_v_pyobj, H5T_STD_REF_DSETREG, __pyx_f_4h5py_5_conv_pyref2regref); if (unlikely(__pyx_t_2 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 896, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":898
+ *     H5Tregister(H5T_PERS_HARD, "pyref2regref", pyobj, H5T_STD_REF_DSETREG, pyref2regref)
+ * 
+ *     H5Tregister(H5T_PERS_SOFT, "enum2int", enum, H5T_STD_I32LE, enum2int)             # <<<<<<<<<<<<<<
+ *     H5Tregister(H5T_PERS_SOFT, "int2enum", H5T_STD_I32LE, enum, int2enum)
+ * 
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tregister(H5T_PERS_SOFT, ((char *)"enum2int"), __pyx_v_enum, H5T_STD_I32LE, __pyx_f_4h5py_5_conv_enum2int); if (unlikely(__pyx_t_2 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 898, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":899
+ * 
+ *     H5Tregister(H5T_PERS_SOFT, "enum2int", enum, H5T_STD_I32LE, enum2int)
+ *     H5Tregister(H5T_PERS_SOFT, "int2enum", H5T_STD_I32LE, enum, int2enum)             # <<<<<<<<<<<<<<
+ * 
+ *     H5Tregister(H5T_PERS_SOFT, "vlen2ndarray", vlentype, pyobj, vlen2ndarray)
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tregister(H5T_PERS_SOFT, ((char *)"int2enum"), H5T_STD_I32LE, __pyx_v_enum, __pyx_f_4h5py_5_conv_int2enum); if (unlikely(__pyx_t_2 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 899, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":901
+ *     H5Tregister(H5T_PERS_SOFT, "int2enum", H5T_STD_I32LE, enum, int2enum)
+ * 
+ *     H5Tregister(H5T_PERS_SOFT, "vlen2ndarray", vlentype, pyobj, vlen2ndarray)             # <<<<<<<<<<<<<<
+ *     H5Tregister(H5T_PERS_SOFT, "ndarray2vlen", pyobj, vlentype, ndarray2vlen)
+ * 
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tregister(H5T_PERS_SOFT, ((char *)"vlen2ndarray"), __pyx_v_vlentype, __pyx_v_pyobj, __pyx_f_4h5py_5_conv_vlen2ndarray); if (unlikely(__pyx_t_2 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 901, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":902
+ * 
+ *     H5Tregister(H5T_PERS_SOFT, "vlen2ndarray", vlentype, pyobj, vlen2ndarray)
+ *     H5Tregister(H5T_PERS_SOFT, "ndarray2vlen", pyobj, vlentype, ndarray2vlen)             # <<<<<<<<<<<<<<
+ * 
+ *     H5Tregister(H5T_PERS_HARD, "boolenum2b8", boolenum, H5T_NATIVE_B8, boolenum2b8)
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tregister(H5T_PERS_SOFT, ((char *)"ndarray2vlen"), __pyx_v_pyobj, __pyx_v_vlentype, __pyx_f_4h5py_5_conv_ndarray2vlen); if (unlikely(__pyx_t_2 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 902, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":904
+ *     H5Tregister(H5T_PERS_SOFT, "ndarray2vlen", pyobj, vlentype, ndarray2vlen)
+ * 
+ *     H5Tregister(H5T_PERS_HARD, "boolenum2b8", boolenum, H5T_NATIVE_B8, boolenum2b8)             # <<<<<<<<<<<<<<
+ *     H5Tregister(H5T_PERS_HARD, "b82boolenum", H5T_NATIVE_B8, boolenum, b82boolenum)
+ * 
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tregister(H5T_PERS_HARD, ((char *)"boolenum2b8"), __pyx_v_boolenum, H5T_NATIVE_B8, __pyx_f_4h5py_5_conv_boolenum2b8); if (unlikely(__pyx_t_2 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 904, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":905
+ * 
+ *     H5Tregister(H5T_PERS_HARD, "boolenum2b8", boolenum, H5T_NATIVE_B8, boolenum2b8)
+ *     H5Tregister(H5T_PERS_HARD, "b82boolenum", H5T_NATIVE_B8, boolenum, b82boolenum)             # <<<<<<<<<<<<<<
+ * 
+ *     H5Tregister(H5T_PERS_HARD, "uint82b8", H5T_NATIVE_UINT8, H5T_NATIVE_B8, uint82b8)
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tregister(H5T_PERS_HARD, ((char *)"b82boolenum"), H5T_NATIVE_B8, __pyx_v_boolenum, __pyx_f_4h5py_5_conv_b82boolenum); if (unlikely(__pyx_t_2 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 905, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":907
+ *     H5Tregister(H5T_PERS_HARD, "b82boolenum", H5T_NATIVE_B8, boolenum, b82boolenum)
+ * 
+ *     H5Tregister(H5T_PERS_HARD, "uint82b8", H5T_NATIVE_UINT8, H5T_NATIVE_B8, uint82b8)             # <<<<<<<<<<<<<<
+ *     H5Tregister(H5T_PERS_HARD, "b82uint8", H5T_NATIVE_B8, H5T_NATIVE_UINT8, b82uint8)
+ * 
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tregister(H5T_PERS_HARD, ((char *)"uint82b8"), H5T_NATIVE_UINT8, H5T_NATIVE_B8, __pyx_f_4h5py_5_conv_uint82b8); if (unlikely(__pyx_t_2 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 907, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":908
+ * 
+ *     H5Tregister(H5T_PERS_HARD, "uint82b8", H5T_NATIVE_UINT8, H5T_NATIVE_B8, uint82b8)
+ *     H5Tregister(H5T_PERS_HARD, "b82uint8", H5T_NATIVE_B8, H5T_NATIVE_UINT8, b82uint8)             # <<<<<<<<<<<<<<
+ * 
+ *     H5Tregister(H5T_PERS_SOFT, "vlen2str", vlstring, pyobj, vlen2str)
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tregister(H5T_PERS_HARD, ((char *)"b82uint8"), H5T_NATIVE_B8, H5T_NATIVE_UINT8, __pyx_f_4h5py_5_conv_b82uint8); if (unlikely(__pyx_t_2 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 908, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":910
+ *     H5Tregister(H5T_PERS_HARD, "b82uint8", H5T_NATIVE_B8, H5T_NATIVE_UINT8, b82uint8)
+ * 
+ *     H5Tregister(H5T_PERS_SOFT, "vlen2str", vlstring, pyobj, vlen2str)             # <<<<<<<<<<<<<<
+ *     H5Tregister(H5T_PERS_SOFT, "str2vlen", pyobj, vlstring, str2vlen)
+ * 
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tregister(H5T_PERS_SOFT, ((char *)"vlen2str"), __pyx_v_vlstring, __pyx_v_pyobj, __pyx_f_4h5py_5_conv_vlen2str); if (unlikely(__pyx_t_2 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 910, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":911
+ * 
+ *     H5Tregister(H5T_PERS_SOFT, "vlen2str", vlstring, pyobj, vlen2str)
+ *     H5Tregister(H5T_PERS_SOFT, "str2vlen", pyobj, vlstring, str2vlen)             # <<<<<<<<<<<<<<
+ * 
+ *     H5Tclose(vlstring)
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tregister(H5T_PERS_SOFT, ((char *)"str2vlen"), __pyx_v_pyobj, __pyx_v_vlstring, __pyx_f_4h5py_5_conv_str2vlen); if (unlikely(__pyx_t_2 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 911, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":913
+ *     H5Tregister(H5T_PERS_SOFT, "str2vlen", pyobj, vlstring, str2vlen)
+ * 
+ *     H5Tclose(vlstring)             # <<<<<<<<<<<<<<
+ *     H5Tclose(vlentype)
+ *     H5Tclose(enum)
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tclose(__pyx_v_vlstring); if (unlikely(__pyx_t_2 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 913, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":914
+ * 
+ *     H5Tclose(vlstring)
+ *     H5Tclose(vlentype)             # <<<<<<<<<<<<<<
+ *     H5Tclose(enum)
+ *     H5Tclose(boolenum)
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tclose(__pyx_v_vlentype); if (unlikely(__pyx_t_2 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 914, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":915
+ *     H5Tclose(vlstring)
+ *     H5Tclose(vlentype)
+ *     H5Tclose(enum)             # <<<<<<<<<<<<<<
+ *     H5Tclose(boolenum)
+ * 
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tclose(__pyx_v_enum); if (unlikely(__pyx_t_2 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 915, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":916
+ *     H5Tclose(vlentype)
+ *     H5Tclose(enum)
+ *     H5Tclose(boolenum)             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+  __pyx_t_2 = __pyx_f_4h5py_4defs_H5Tclose(__pyx_v_boolenum); if (unlikely(__pyx_t_2 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 916, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":918
+ *     H5Tclose(boolenum)
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * cpdef int unregister_converters() except -1:
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":866
+ * # =============================================================================
+ * 
+ * cpdef int register_converters() except -1:             # <<<<<<<<<<<<<<
+ *     cdef:
+ *         hid_t vlstring
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("h5py._conv.register_converters", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4h5py_5_conv_1register_converters(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_4h5py_5_conv_1register_converters(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("register_converters (wrapper)", 0);
+  __pyx_r = __pyx_pf_4h5py_5_conv_register_converters(__pyx_self);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4h5py_5_conv_register_converters(CYTHON_UNUSED PyObject *__pyx_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("register_converters", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_4h5py_5_conv_register_converters(0); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 866, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 866, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("h5py._conv.register_converters", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "h5py/_conv.pyx":920
+ *     return 0
+ * 
+ * cpdef int unregister_converters() except -1:             # <<<<<<<<<<<<<<
+ * 
+ *     H5Tunregister(H5T_PERS_SOFT, "vlen2str", -1, -1, vlen2str)
+ */
+
+static PyObject *__pyx_pw_4h5py_5_conv_3unregister_converters(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static int __pyx_f_4h5py_5_conv_unregister_converters(CYTHON_UNUSED int __pyx_skip_dispatch) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  herr_t __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("unregister_converters", 0);
+
+  /* "h5py/_conv.pyx":922
+ * cpdef int unregister_converters() except -1:
+ * 
+ *     H5Tunregister(H5T_PERS_SOFT, "vlen2str", -1, -1, vlen2str)             # <<<<<<<<<<<<<<
+ *     H5Tunregister(H5T_PERS_SOFT, "str2vlen", -1, -1, str2vlen)
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4h5py_4defs_H5Tunregister(H5T_PERS_SOFT, ((char *)"vlen2str"), -1L, -1L, __pyx_f_4h5py_5_conv_vlen2str); if (unlikely(__pyx_t_1 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 922, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":923
+ * 
+ *     H5Tunregister(H5T_PERS_SOFT, "vlen2str", -1, -1, vlen2str)
+ *     H5Tunregister(H5T_PERS_SOFT, "str2vlen", -1, -1, str2vlen)             # <<<<<<<<<<<<<<
+ * 
+ *     H5Tunregister(H5T_PERS_SOFT, "vlen2fixed", -1, -1, vlen2fixed)
+ */
+  __pyx_t_1 = __pyx_f_4h5py_4defs_H5Tunregister(H5T_PERS_SOFT, ((char *)"str2vlen"), -1L, -1L, __pyx_f_4h5py_5_conv_str2vlen); if (unlikely(__pyx_t_1 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 923, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":925
+ *     H5Tunregister(H5T_PERS_SOFT, "str2vlen", -1, -1, str2vlen)
+ * 
+ *     H5Tunregister(H5T_PERS_SOFT, "vlen2fixed", -1, -1, vlen2fixed)             # <<<<<<<<<<<<<<
+ *     H5Tunregister(H5T_PERS_SOFT, "fixed2vlen", -1, -1, fixed2vlen)
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4h5py_4defs_H5Tunregister(H5T_PERS_SOFT, ((char *)"vlen2fixed"), -1L, -1L, __pyx_f_4h5py_5_conv_vlen2fixed); if (unlikely(__pyx_t_1 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 925, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":926
+ * 
+ *     H5Tunregister(H5T_PERS_SOFT, "vlen2fixed", -1, -1, vlen2fixed)
+ *     H5Tunregister(H5T_PERS_SOFT, "fixed2vlen", -1, -1, fixed2vlen)             # <<<<<<<<<<<<<<
+ * 
+ *     H5Tunregister(H5T_PERS_HARD, "objref2pyref", -1, -1, objref2pyref)
+ */
+  __pyx_t_1 = __pyx_f_4h5py_4defs_H5Tunregister(H5T_PERS_SOFT, ((char *)"fixed2vlen"), -1L, -1L, __pyx_f_4h5py_5_conv_fixed2vlen); if (unlikely(__pyx_t_1 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 926, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":928
+ *     H5Tunregister(H5T_PERS_SOFT, "fixed2vlen", -1, -1, fixed2vlen)
+ * 
+ *     H5Tunregister(H5T_PERS_HARD, "objref2pyref", -1, -1, objref2pyref)             # <<<<<<<<<<<<<<
+ *     H5Tunregister(H5T_PERS_HARD, "pyref2objref", -1, -1, pyref2objref)
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4h5py_4defs_H5Tunregister(H5T_PERS_HARD, ((char *)"objref2pyref"), -1L, -1L, __pyx_f_4h5py_5_conv_objref2pyref); if (unlikely(__pyx_t_1 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 928, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":929
+ * 
+ *     H5Tunregister(H5T_PERS_HARD, "objref2pyref", -1, -1, objref2pyref)
+ *     H5Tunregister(H5T_PERS_HARD, "pyref2objref", -1, -1, pyref2objref)             # <<<<<<<<<<<<<<
+ * 
+ *     H5Tunregister(H5T_PERS_HARD, "regref2pyref", -1, -1, regref2pyref)
+ */
+  __pyx_t_1 = __pyx_f_4h5py_4defs_H5Tunregister(H5T_PERS_HARD, ((char *)"pyref2objref"), -1L, -1L, __pyx_f_4h5py_5_conv_pyref2objref); if (unlikely(__pyx_t_1 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 929, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":931
+ *     H5Tunregister(H5T_PERS_HARD, "pyref2objref", -1, -1, pyref2objref)
+ * 
+ *     H5Tunregister(H5T_PERS_HARD, "regref2pyref", -1, -1, regref2pyref)             # <<<<<<<<<<<<<<
+ *     H5Tunregister(H5T_PERS_HARD, "pyref2regref", -1, -1, pyref2regref)
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4h5py_4defs_H5Tunregister(H5T_PERS_HARD, ((char *)"regref2pyref"), -1L, -1L, __pyx_f_4h5py_5_conv_regref2pyref); if (unlikely(__pyx_t_1 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 931, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":932
+ * 
+ *     H5Tunregister(H5T_PERS_HARD, "regref2pyref", -1, -1, regref2pyref)
+ *     H5Tunregister(H5T_PERS_HARD, "pyref2regref", -1, -1, pyref2regref)             # <<<<<<<<<<<<<<
+ * 
+ *     H5Tunregister(H5T_PERS_SOFT, "enum2int", -1, -1, enum2int)
+ */
+  __pyx_t_1 = __pyx_f_4h5py_4defs_H5Tunregister(H5T_PERS_HARD, ((char *)"pyref2regref"), -1L, -1L, __pyx_f_4h5py_5_conv_pyref2regref); if (unlikely(__pyx_t_1 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 932, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":934
+ *     H5Tunregister(H5T_PERS_HARD, "pyref2regref", -1, -1, pyref2regref)
+ * 
+ *     H5Tunregister(H5T_PERS_SOFT, "enum2int", -1, -1, enum2int)             # <<<<<<<<<<<<<<
+ *     H5Tunregister(H5T_PERS_SOFT, "int2enum", -1, -1, int2enum)
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4h5py_4defs_H5Tunregister(H5T_PERS_SOFT, ((char *)"enum2int"), -1L, -1L, __pyx_f_4h5py_5_conv_enum2int); if (unlikely(__pyx_t_1 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 934, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":935
+ * 
+ *     H5Tunregister(H5T_PERS_SOFT, "enum2int", -1, -1, enum2int)
+ *     H5Tunregister(H5T_PERS_SOFT, "int2enum", -1, -1, int2enum)             # <<<<<<<<<<<<<<
+ * 
+ *     H5Tunregister(H5T_PERS_SOFT, "vlen2ndarray", -1, -1, vlen2ndarray)
+ */
+  __pyx_t_1 = __pyx_f_4h5py_4defs_H5Tunregister(H5T_PERS_SOFT, ((char *)"int2enum"), -1L, -1L, __pyx_f_4h5py_5_conv_int2enum); if (unlikely(__pyx_t_1 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 935, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":937
+ *     H5Tunregister(H5T_PERS_SOFT, "int2enum", -1, -1, int2enum)
+ * 
+ *     H5Tunregister(H5T_PERS_SOFT, "vlen2ndarray", -1, -1, vlen2ndarray)             # <<<<<<<<<<<<<<
+ *     H5Tunregister(H5T_PERS_SOFT, "ndarray2vlen", -1, -1, ndarray2vlen)
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4h5py_4defs_H5Tunregister(H5T_PERS_SOFT, ((char *)"vlen2ndarray"), -1L, -1L, __pyx_f_4h5py_5_conv_vlen2ndarray); if (unlikely(__pyx_t_1 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 937, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":938
+ * 
+ *     H5Tunregister(H5T_PERS_SOFT, "vlen2ndarray", -1, -1, vlen2ndarray)
+ *     H5Tunregister(H5T_PERS_SOFT, "ndarray2vlen", -1, -1, ndarray2vlen)             # <<<<<<<<<<<<<<
+ * 
+ *     H5Tunregister(H5T_PERS_HARD, "boolenum2b8", -1, -1, boolenum2b8)
+ */
+  __pyx_t_1 = __pyx_f_4h5py_4defs_H5Tunregister(H5T_PERS_SOFT, ((char *)"ndarray2vlen"), -1L, -1L, __pyx_f_4h5py_5_conv_ndarray2vlen); if (unlikely(__pyx_t_1 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 938, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":940
+ *     H5Tunregister(H5T_PERS_SOFT, "ndarray2vlen", -1, -1, ndarray2vlen)
+ * 
+ *     H5Tunregister(H5T_PERS_HARD, "boolenum2b8", -1, -1, boolenum2b8)             # <<<<<<<<<<<<<<
+ *     H5Tunregister(H5T_PERS_HARD, "b82boolenum", -1, -1, b82boolenum)
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4h5py_4defs_H5Tunregister(H5T_PERS_HARD, ((char *)"boolenum2b8"), -1L, -1L, __pyx_f_4h5py_5_conv_boolenum2b8); if (unlikely(__pyx_t_1 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 940, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":941
+ * 
+ *     H5Tunregister(H5T_PERS_HARD, "boolenum2b8", -1, -1, boolenum2b8)
+ *     H5Tunregister(H5T_PERS_HARD, "b82boolenum", -1, -1, b82boolenum)             # <<<<<<<<<<<<<<
+ * 
+ *     H5Tunregister(H5T_PERS_HARD, "uint82b8", -1, -1, uint82b8)
+ */
+  __pyx_t_1 = __pyx_f_4h5py_4defs_H5Tunregister(H5T_PERS_HARD, ((char *)"b82boolenum"), -1L, -1L, __pyx_f_4h5py_5_conv_b82boolenum); if (unlikely(__pyx_t_1 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 941, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":943
+ *     H5Tunregister(H5T_PERS_HARD, "b82boolenum", -1, -1, b82boolenum)
+ * 
+ *     H5Tunregister(H5T_PERS_HARD, "uint82b8", -1, -1, uint82b8)             # <<<<<<<<<<<<<<
+ *     H5Tunregister(H5T_PERS_HARD, "b82uint8", -1, -1, b82uint8)
+ * 
+ */
+  __pyx_t_1 = __pyx_f_4h5py_4defs_H5Tunregister(H5T_PERS_HARD, ((char *)"uint82b8"), -1L, -1L, __pyx_f_4h5py_5_conv_uint82b8); if (unlikely(__pyx_t_1 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 943, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":944
+ * 
+ *     H5Tunregister(H5T_PERS_HARD, "uint82b8", -1, -1, uint82b8)
+ *     H5Tunregister(H5T_PERS_HARD, "b82uint8", -1, -1, b82uint8)             # <<<<<<<<<<<<<<
+ * 
+ *     return 0
+ */
+  __pyx_t_1 = __pyx_f_4h5py_4defs_H5Tunregister(H5T_PERS_HARD, ((char *)"b82uint8"), -1L, -1L, __pyx_f_4h5py_5_conv_b82uint8); if (unlikely(__pyx_t_1 == ((herr_t)((herr_t)-1L)))) __PYX_ERR(0, 944, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":946
+ *     H5Tunregister(H5T_PERS_HARD, "b82uint8", -1, -1, b82uint8)
+ * 
+ *     return 0             # <<<<<<<<<<<<<<
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "h5py/_conv.pyx":920
+ *     return 0
+ * 
+ * cpdef int unregister_converters() except -1:             # <<<<<<<<<<<<<<
+ * 
+ *     H5Tunregister(H5T_PERS_SOFT, "vlen2str", -1, -1, vlen2str)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("h5py._conv.unregister_converters", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4h5py_5_conv_3unregister_converters(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_4h5py_5_conv_3unregister_converters(PyObject *__pyx_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("unregister_converters (wrapper)", 0);
+  __pyx_r = __pyx_pf_4h5py_5_conv_2unregister_converters(__pyx_self);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4h5py_5_conv_2unregister_converters(CYTHON_UNUSED PyObject *__pyx_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("unregister_converters", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_4h5py_5_conv_unregister_converters(0); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 920, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 920, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("h5py._conv.unregister_converters", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":731
+ * ctypedef npy_cdouble     complex_t
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__pyx_v_a) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew1", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":732
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):
+ *     return PyArray_MultiIterNew(1, <void*>a)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(1, ((void *)__pyx_v_a)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 732, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":731
+ * ctypedef npy_cdouble     complex_t
+ * 
+ * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew1", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":734
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__pyx_v_a, PyObject *__pyx_v_b) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew2", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":735
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(2, ((void *)__pyx_v_a), ((void *)__pyx_v_b)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 735, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":734
+ *     return PyArray_MultiIterNew(1, <void*>a)
+ * 
+ * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew2", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":737
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew3", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":738
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(3, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 738, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":737
+ *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
+ * 
+ * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew3", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":740
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c, PyObject *__pyx_v_d) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew4", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":741
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(4, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 741, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":740
+ *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
+ * 
+ * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew4", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":743
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__pyx_v_a, PyObject *__pyx_v_b, PyObject *__pyx_v_c, PyObject *__pyx_v_d, PyObject *__pyx_v_e) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("PyArray_MultiIterNew5", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":744
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyArray_MultiIterNew(5, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d), ((void *)__pyx_v_e)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 744, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":743
+ *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
+ * 
+ * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("numpy.PyArray_MultiIterNew5", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":746
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
+ *     if PyDataType_HASSUBARRAY(d):
+ *         return <tuple>d.subarray.shape
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__pyx_v_d) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("PyDataType_SHAPE", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":747
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
+ *         return <tuple>d.subarray.shape
+ *     else:
+ */
+  __pyx_t_1 = (PyDataType_HASSUBARRAY(__pyx_v_d) != 0);
+  if (__pyx_t_1) {
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":748
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ *     if PyDataType_HASSUBARRAY(d):
+ *         return <tuple>d.subarray.shape             # <<<<<<<<<<<<<<
+ *     else:
+ *         return ()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(((PyObject*)__pyx_v_d->subarray->shape));
+    __pyx_r = ((PyObject*)__pyx_v_d->subarray->shape);
+    goto __pyx_L0;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":747
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):
+ *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
+ *         return <tuple>d.subarray.shape
+ *     else:
+ */
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":750
+ *         return <tuple>d.subarray.shape
+ *     else:
+ *         return ()             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_empty_tuple);
+    __pyx_r = __pyx_empty_tuple;
+    goto __pyx_L0;
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":746
+ *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
+ * 
+ * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
+ *     if PyDataType_HASSUBARRAY(d):
+ *         return <tuple>d.subarray.shape
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":926
+ *     int _import_umath() except -1
+ * 
+ * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
+ *     Py_INCREF(base) # important to do this before stealing the reference below!
+ *     PyArray_SetBaseObject(arr, base)
+ */
+
+static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_arr, PyObject *__pyx_v_base) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("set_array_base", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":927
+ * 
+ * cdef inline void set_array_base(ndarray arr, object base):
+ *     Py_INCREF(base) # important to do this before stealing the reference below!             # <<<<<<<<<<<<<<
+ *     PyArray_SetBaseObject(arr, base)
+ * 
+ */
+  Py_INCREF(__pyx_v_base);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":928
+ * cdef inline void set_array_base(ndarray arr, object base):
+ *     Py_INCREF(base) # important to do this before stealing the reference below!
+ *     PyArray_SetBaseObject(arr, base)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline object get_array_base(ndarray arr):
+ */
+  __pyx_t_1 = PyArray_SetBaseObject(__pyx_v_arr, __pyx_v_base); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(1, 928, __pyx_L1_error)
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":926
+ *     int _import_umath() except -1
+ * 
+ * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
+ *     Py_INCREF(base) # important to do this before stealing the reference below!
+ *     PyArray_SetBaseObject(arr, base)
+ */
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("numpy.set_array_base", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":930
+ *     PyArray_SetBaseObject(arr, base)
+ * 
+ * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:
+ */
+
+static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__pyx_v_arr) {
+  PyObject *__pyx_v_base;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("get_array_base", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":931
+ * 
+ * cdef inline object get_array_base(ndarray arr):
+ *     base = PyArray_BASE(arr)             # <<<<<<<<<<<<<<
+ *     if base is NULL:
+ *         return None
+ */
+  __pyx_v_base = PyArray_BASE(__pyx_v_arr);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":932
+ * cdef inline object get_array_base(ndarray arr):
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:             # <<<<<<<<<<<<<<
+ *         return None
+ *     return <object>base
+ */
+  __pyx_t_1 = ((__pyx_v_base == NULL) != 0);
+  if (__pyx_t_1) {
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":933
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:
+ *         return None             # <<<<<<<<<<<<<<
+ *     return <object>base
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":932
+ * cdef inline object get_array_base(ndarray arr):
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:             # <<<<<<<<<<<<<<
+ *         return None
+ *     return <object>base
+ */
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":934
+ *     if base is NULL:
+ *         return None
+ *     return <object>base             # <<<<<<<<<<<<<<
+ * 
+ * # Versions of the import_* functions which are more suitable for
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_base));
+  __pyx_r = ((PyObject *)__pyx_v_base);
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":930
+ *     PyArray_SetBaseObject(arr, base)
+ * 
+ * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
+ *     base = PyArray_BASE(arr)
+ *     if base is NULL:
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":938
+ * # Versions of the import_* functions which are more suitable for
+ * # Cython code.
+ * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         __pyx_import_array()
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("import_array", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":939
+ * # Cython code.
+ * cdef inline int import_array() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         __pyx_import_array()
+ *     except Exception:
+ */
+  {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
+    __Pyx_XGOTREF(__pyx_t_1);
+    __Pyx_XGOTREF(__pyx_t_2);
+    __Pyx_XGOTREF(__pyx_t_3);
+    /*try:*/ {
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":940
+ * cdef inline int import_array() except -1:
+ *     try:
+ *         __pyx_import_array()             # <<<<<<<<<<<<<<
+ *     except Exception:
+ *         raise ImportError("numpy.core.multiarray failed to import")
+ */
+      __pyx_t_4 = _import_array(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(1, 940, __pyx_L3_error)
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":939
+ * # Cython code.
+ * cdef inline int import_array() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         __pyx_import_array()
+ *     except Exception:
+ */
+    }
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L8_try_end;
+    __pyx_L3_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":941
+ *     try:
+ *         __pyx_import_array()
+ *     except Exception:             # <<<<<<<<<<<<<<
+ *         raise ImportError("numpy.core.multiarray failed to import")
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
+    if (__pyx_t_4) {
+      __Pyx_AddTraceback("numpy.import_array", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(1, 941, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GOTREF(__pyx_t_7);
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":942
+ *         __pyx_import_array()
+ *     except Exception:
+ *         raise ImportError("numpy.core.multiarray failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int import_umath() except -1:
+ */
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 942, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_Raise(__pyx_t_8, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __PYX_ERR(1, 942, __pyx_L5_except_error)
+    }
+    goto __pyx_L5_except_error;
+    __pyx_L5_except_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":939
+ * # Cython code.
+ * cdef inline int import_array() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         __pyx_import_array()
+ *     except Exception:
+ */
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L1_error;
+    __pyx_L8_try_end:;
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":938
+ * # Versions of the import_* functions which are more suitable for
+ * # Cython code.
+ * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         __pyx_import_array()
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("numpy.import_array", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":944
+ *         raise ImportError("numpy.core.multiarray failed to import")
+ * 
+ * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         _import_umath()
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("import_umath", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":945
+ * 
+ * cdef inline int import_umath() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+  {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
+    __Pyx_XGOTREF(__pyx_t_1);
+    __Pyx_XGOTREF(__pyx_t_2);
+    __Pyx_XGOTREF(__pyx_t_3);
+    /*try:*/ {
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":946
+ * cdef inline int import_umath() except -1:
+ *     try:
+ *         _import_umath()             # <<<<<<<<<<<<<<
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")
+ */
+      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(1, 946, __pyx_L3_error)
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":945
+ * 
+ * cdef inline int import_umath() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+    }
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L8_try_end;
+    __pyx_L3_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":947
+ *     try:
+ *         _import_umath()
+ *     except Exception:             # <<<<<<<<<<<<<<
+ *         raise ImportError("numpy.core.umath failed to import")
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
+    if (__pyx_t_4) {
+      __Pyx_AddTraceback("numpy.import_umath", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(1, 947, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GOTREF(__pyx_t_7);
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":948
+ *         _import_umath()
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int import_ufunc() except -1:
+ */
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 948, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_Raise(__pyx_t_8, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __PYX_ERR(1, 948, __pyx_L5_except_error)
+    }
+    goto __pyx_L5_except_error;
+    __pyx_L5_except_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":945
+ * 
+ * cdef inline int import_umath() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L1_error;
+    __pyx_L8_try_end:;
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":944
+ *         raise ImportError("numpy.core.multiarray failed to import")
+ * 
+ * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         _import_umath()
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("numpy.import_umath", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":950
+ *         raise ImportError("numpy.core.umath failed to import")
+ * 
+ * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         _import_umath()
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("import_ufunc", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":951
+ * 
+ * cdef inline int import_ufunc() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+  {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_1, &__pyx_t_2, &__pyx_t_3);
+    __Pyx_XGOTREF(__pyx_t_1);
+    __Pyx_XGOTREF(__pyx_t_2);
+    __Pyx_XGOTREF(__pyx_t_3);
+    /*try:*/ {
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":952
+ * cdef inline int import_ufunc() except -1:
+ *     try:
+ *         _import_umath()             # <<<<<<<<<<<<<<
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")
+ */
+      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(1, 952, __pyx_L3_error)
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":951
+ * 
+ * cdef inline int import_ufunc() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+    }
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L8_try_end;
+    __pyx_L3_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":953
+ *     try:
+ *         _import_umath()
+ *     except Exception:             # <<<<<<<<<<<<<<
+ *         raise ImportError("numpy.core.umath failed to import")
+ * 
+ */
+    __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
+    if (__pyx_t_4) {
+      __Pyx_AddTraceback("numpy.import_ufunc", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(1, 953, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_GOTREF(__pyx_t_7);
+
+      /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":954
+ *         _import_umath()
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef extern from *:
+ */
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 954, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_Raise(__pyx_t_8, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __PYX_ERR(1, 954, __pyx_L5_except_error)
+    }
+    goto __pyx_L5_except_error;
+    __pyx_L5_except_error:;
+
+    /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":951
+ * 
+ * cdef inline int import_ufunc() except -1:
+ *     try:             # <<<<<<<<<<<<<<
+ *         _import_umath()
+ *     except Exception:
+ */
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __Pyx_XGIVEREF(__pyx_t_2);
+    __Pyx_XGIVEREF(__pyx_t_3);
+    __Pyx_ExceptionReset(__pyx_t_1, __pyx_t_2, __pyx_t_3);
+    goto __pyx_L1_error;
+    __pyx_L8_try_end:;
+  }
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":950
+ *         raise ImportError("numpy.core.umath failed to import")
+ * 
+ * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
+ *     try:
+ *         _import_umath()
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("numpy.import_ufunc", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":964
+ * 
+ * 
+ * cdef inline bint is_timedelta64_object(object obj):             # <<<<<<<<<<<<<<
+ *     """
+ *     Cython equivalent of `isinstance(obj, np.timedelta64)`
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_is_timedelta64_object(PyObject *__pyx_v_obj) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("is_timedelta64_object", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":976
+ *     bool
+ *     """
+ *     return PyObject_TypeCheck(obj, &PyTimedeltaArrType_Type)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = PyObject_TypeCheck(__pyx_v_obj, (&PyTimedeltaArrType_Type));
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":964
+ * 
+ * 
+ * cdef inline bint is_timedelta64_object(object obj):             # <<<<<<<<<<<<<<
+ *     """
+ *     Cython equivalent of `isinstance(obj, np.timedelta64)`
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":979
+ * 
+ * 
+ * cdef inline bint is_datetime64_object(object obj):             # <<<<<<<<<<<<<<
+ *     """
+ *     Cython equivalent of `isinstance(obj, np.datetime64)`
+ */
+
+static CYTHON_INLINE int __pyx_f_5numpy_is_datetime64_object(PyObject *__pyx_v_obj) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("is_datetime64_object", 0);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":991
+ *     bool
+ *     """
+ *     return PyObject_TypeCheck(obj, &PyDatetimeArrType_Type)             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = PyObject_TypeCheck(__pyx_v_obj, (&PyDatetimeArrType_Type));
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":979
+ * 
+ * 
+ * cdef inline bint is_datetime64_object(object obj):             # <<<<<<<<<<<<<<
+ *     """
+ *     Cython equivalent of `isinstance(obj, np.datetime64)`
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":994
+ * 
+ * 
+ * cdef inline npy_datetime get_datetime64_value(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the int64 value underlying scalar numpy datetime64 object
+ */
+
+static CYTHON_INLINE npy_datetime __pyx_f_5numpy_get_datetime64_value(PyObject *__pyx_v_obj) {
+  npy_datetime __pyx_r;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1001
+ *     also needed.  That can be found using `get_datetime64_unit`.
+ *     """
+ *     return (<PyDatetimeScalarObject*>obj).obval             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = ((PyDatetimeScalarObject *)__pyx_v_obj)->obval;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":994
+ * 
+ * 
+ * cdef inline npy_datetime get_datetime64_value(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the int64 value underlying scalar numpy datetime64 object
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1004
+ * 
+ * 
+ * cdef inline npy_timedelta get_timedelta64_value(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the int64 value underlying scalar numpy timedelta64 object
+ */
+
+static CYTHON_INLINE npy_timedelta __pyx_f_5numpy_get_timedelta64_value(PyObject *__pyx_v_obj) {
+  npy_timedelta __pyx_r;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1008
+ *     returns the int64 value underlying scalar numpy timedelta64 object
+ *     """
+ *     return (<PyTimedeltaScalarObject*>obj).obval             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = ((PyTimedeltaScalarObject *)__pyx_v_obj)->obval;
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1004
+ * 
+ * 
+ * cdef inline npy_timedelta get_timedelta64_value(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the int64 value underlying scalar numpy timedelta64 object
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1011
+ * 
+ * 
+ * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the unit part of the dtype for a numpy datetime64 object.
+ */
+
+static CYTHON_INLINE NPY_DATETIMEUNIT __pyx_f_5numpy_get_datetime64_unit(PyObject *__pyx_v_obj) {
+  NPY_DATETIMEUNIT __pyx_r;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1015
+ *     returns the unit part of the dtype for a numpy datetime64 object.
+ *     """
+ *     return <NPY_DATETIMEUNIT>(<PyDatetimeScalarObject*>obj).obmeta.base             # <<<<<<<<<<<<<<
+ */
+  __pyx_r = ((NPY_DATETIMEUNIT)((PyDatetimeScalarObject *)__pyx_v_obj)->obmeta.base);
+  goto __pyx_L0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1011
+ * 
+ * 
+ * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the unit part of the dtype for a numpy datetime64 object.
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+static PyMethodDef __pyx_methods[] = {
+  {"register_converters", (PyCFunction)__pyx_pw_4h5py_5_conv_1register_converters, METH_NOARGS, 0},
+  {"unregister_converters", (PyCFunction)__pyx_pw_4h5py_5_conv_3unregister_converters, METH_NOARGS, 0},
+  {0, 0, 0, 0}
+};
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec__conv(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec__conv},
+  {0, NULL}
+};
+#endif
+
+static struct PyModuleDef __pyx_moduledef = {
+    PyModuleDef_HEAD_INIT,
+    "_conv",
+    __pyx_k_Low_level_type_conversion_routi, /* m_doc */
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    0, /* m_size */
+  #else
+    -1, /* m_size */
+  #endif
+    __pyx_methods /* m_methods */,
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+    __pyx_moduledef_slots, /* m_slots */
+  #else
+    NULL, /* m_reload */
+  #endif
+    NULL, /* m_traverse */
+    NULL, /* m_clear */
+    NULL /* m_free */
+};
+#endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_kp_b_, __pyx_k_, sizeof(__pyx_k_), 0, 0, 0, 0},
+  {&__pyx_kp_u_Can_t_convert_incompatible_objec, __pyx_k_Can_t_convert_incompatible_objec, sizeof(__pyx_k_Can_t_convert_incompatible_objec), 0, 1, 0, 0},
+  {&__pyx_kp_u_Can_t_convert_incompatible_objec_2, __pyx_k_Can_t_convert_incompatible_objec_2, sizeof(__pyx_k_Can_t_convert_incompatible_objec_2), 0, 1, 0, 0},
+  {&__pyx_kp_u_Can_t_implicitly_convert_non_str, __pyx_k_Can_t_implicitly_convert_non_str, sizeof(__pyx_k_Can_t_implicitly_convert_non_str), 0, 1, 0, 0},
+  {&__pyx_kp_u_Creating_converter_from_s_to_s, __pyx_k_Creating_converter_from_s_to_s, sizeof(__pyx_k_Creating_converter_from_s_to_s), 0, 1, 0, 0},
+  {&__pyx_n_s_ImportError, __pyx_k_ImportError, sizeof(__pyx_k_ImportError), 0, 0, 1, 1},
+  {&__pyx_n_s_MemoryError, __pyx_k_MemoryError, sizeof(__pyx_k_MemoryError), 0, 0, 1, 1},
+  {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
+  {&__pyx_kp_u_VLEN_strings_do_not_support_embe, __pyx_k_VLEN_strings_do_not_support_embe, sizeof(__pyx_k_VLEN_strings_do_not_support_embe), 0, 1, 0, 0},
+  {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
+  {&__pyx_n_u_ascii, __pyx_k_ascii, sizeof(__pyx_k_ascii), 0, 1, 0, 1},
+  {&__pyx_n_s_cfg, __pyx_k_cfg, sizeof(__pyx_k_cfg), 0, 0, 1, 1},
+  {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+  {&__pyx_n_s_debug, __pyx_k_debug, sizeof(__pyx_k_debug), 0, 0, 1, 1},
+  {&__pyx_n_s_dtype, __pyx_k_dtype, sizeof(__pyx_k_dtype), 0, 0, 1, 1},
+  {&__pyx_n_s_encode, __pyx_k_encode, sizeof(__pyx_k_encode), 0, 0, 1, 1},
+  {&__pyx_n_s_f_name, __pyx_k_f_name, sizeof(__pyx_k_f_name), 0, 0, 1, 1},
+  {&__pyx_n_s_getLogger, __pyx_k_getLogger, sizeof(__pyx_k_getLogger), 0, 0, 1, 1},
+  {&__pyx_n_s_get_config, __pyx_k_get_config, sizeof(__pyx_k_get_config), 0, 0, 1, 1},
+  {&__pyx_n_s_get_size, __pyx_k_get_size, sizeof(__pyx_k_get_size), 0, 0, 1, 1},
+  {&__pyx_n_s_h5, __pyx_k_h5, sizeof(__pyx_k_h5), 0, 0, 1, 1},
+  {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_logger, __pyx_k_logger, sizeof(__pyx_k_logger), 0, 0, 1, 1},
+  {&__pyx_n_s_logging, __pyx_k_logging, sizeof(__pyx_k_logging), 0, 0, 1, 1},
+  {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_n_s_num, __pyx_k_num, sizeof(__pyx_k_num), 0, 0, 1, 1},
+  {&__pyx_kp_u_numpy_core_multiarray_failed_to, __pyx_k_numpy_core_multiarray_failed_to, sizeof(__pyx_k_numpy_core_multiarray_failed_to), 0, 1, 0, 0},
+  {&__pyx_kp_u_numpy_core_umath_failed_to_impor, __pyx_k_numpy_core_umath_failed_to_impor, sizeof(__pyx_k_numpy_core_umath_failed_to_impor), 0, 1, 0, 0},
+  {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
+  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_s_t_name, __pyx_k_t_name, sizeof(__pyx_k_t_name), 0, 0, 1, 1},
+  {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_kp_u_utf_8, __pyx_k_utf_8, sizeof(__pyx_k_utf_8), 0, 1, 0, 0},
+  {0, 0, 0, 0, 0, 0, 0}
+};
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 93, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 248, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 255, __pyx_L1_error)
+  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(0, 547, __pyx_L1_error)
+  __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(1, 942, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "h5py/_conv.pyx":248
+ * 
+ *     elif not isinstance(temp_object, bytes):
+ *         raise TypeError("Can't implicitly convert non-string objects to strings")             # <<<<<<<<<<<<<<
+ * 
+ *     # temp_object is bytes
+ */
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_u_Can_t_implicitly_convert_non_str); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 248, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
+
+  /* "h5py/_conv.pyx":255
+ * 
+ *     if strlen(temp_string) != temp_string_len:
+ *         raise ValueError("VLEN strings do not support embedded NULLs")             # <<<<<<<<<<<<<<
+ *     buf_cstring0 = <char*>emalloc(temp_string_len+1)
+ *     memcpy(buf_cstring0, temp_string, temp_string_len+1)
+ */
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_u_VLEN_strings_do_not_support_embe); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+
+  /* "h5py/_conv.pyx":376
+ *         obj = <object>(buf_obj0)
+ *         if not isinstance(obj, Reference):
+ *             raise TypeError("Can't convert incompatible object to HDF5 object reference")             # <<<<<<<<<<<<<<
+ *         ref = <Reference>(buf_obj0)
+ *         buf_ref[0] = ref.ref.obj_ref
+ */
+  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_u_Can_t_convert_incompatible_objec); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 376, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+
+  /* "h5py/_conv.pyx":419
+ *         obj = <object>(buf_obj0)
+ *         if not isinstance(obj, RegionReference):
+ *             raise TypeError("Can't convert incompatible object to HDF5 region reference")             # <<<<<<<<<<<<<<
+ *         ref = <RegionReference>(buf_obj0)
+ *         IF HDF5_VERSION >= (1, 12, 0):
+ */
+  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_Can_t_convert_incompatible_objec_2); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 419, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":942
+ *         __pyx_import_array()
+ *     except Exception:
+ *         raise ImportError("numpy.core.multiarray failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int import_umath() except -1:
+ */
+  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_u_numpy_core_multiarray_failed_to); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(1, 942, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":948
+ *         _import_umath()
+ *     except Exception:
+ *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int import_ufunc() except -1:
+ */
+  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_u_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(1, 948, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_7cpython_4type_type = __Pyx_ImportType_0_29_37(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type", 
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyTypeObject),
+  #else
+  sizeof(PyHeapTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyHeapTypeObject),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_7cpython_4type_type) __PYX_ERR(2, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("numpy"); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 199, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_5numpy_dtype = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "dtype", sizeof(PyArray_Descr), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyArray_Descr),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_dtype) __PYX_ERR(1, 199, __pyx_L1_error)
+  __pyx_ptype_5numpy_flatiter = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "flatiter", sizeof(PyArrayIterObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyArrayIterObject),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_flatiter) __PYX_ERR(1, 222, __pyx_L1_error)
+  __pyx_ptype_5numpy_broadcast = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "broadcast", sizeof(PyArrayMultiIterObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyArrayMultiIterObject),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_broadcast) __PYX_ERR(1, 226, __pyx_L1_error)
+  __pyx_ptype_5numpy_ndarray = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "ndarray", sizeof(PyArrayObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyArrayObject),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_ndarray) __PYX_ERR(1, 238, __pyx_L1_error)
+  __pyx_ptype_5numpy_generic = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "generic", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_generic) __PYX_ERR(1, 767, __pyx_L1_error)
+  __pyx_ptype_5numpy_number = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "number", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_number) __PYX_ERR(1, 769, __pyx_L1_error)
+  __pyx_ptype_5numpy_integer = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "integer", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_integer) __PYX_ERR(1, 771, __pyx_L1_error)
+  __pyx_ptype_5numpy_signedinteger = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "signedinteger", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_signedinteger) __PYX_ERR(1, 773, __pyx_L1_error)
+  __pyx_ptype_5numpy_unsignedinteger = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "unsignedinteger", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_unsignedinteger) __PYX_ERR(1, 775, __pyx_L1_error)
+  __pyx_ptype_5numpy_inexact = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "inexact", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_inexact) __PYX_ERR(1, 777, __pyx_L1_error)
+  __pyx_ptype_5numpy_floating = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "floating", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_floating) __PYX_ERR(1, 779, __pyx_L1_error)
+  __pyx_ptype_5numpy_complexfloating = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "complexfloating", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_complexfloating) __PYX_ERR(1, 781, __pyx_L1_error)
+  __pyx_ptype_5numpy_flexible = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "flexible", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_flexible) __PYX_ERR(1, 783, __pyx_L1_error)
+  __pyx_ptype_5numpy_character = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "character", sizeof(PyObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyObject),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_5numpy_character) __PYX_ERR(1, 785, __pyx_L1_error)
+  __pyx_ptype_5numpy_ufunc = __Pyx_ImportType_0_29_37(__pyx_t_1, "numpy", "ufunc", sizeof(PyUFuncObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyUFuncObject),__Pyx_ImportType_CheckSize_Ignore_0_29_37); if (!__pyx_ptype_5numpy_ufunc) __PYX_ERR(1, 824, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("h5py.h5r"); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 27, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_4h5py_3h5r_Reference = __Pyx_ImportType_0_29_37(__pyx_t_1, "h5py.h5r", "Reference", sizeof(struct __pyx_obj_4h5py_3h5r_Reference), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4h5py_3h5r_Reference),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4h5py_3h5r_Reference) __PYX_ERR(3, 27, __pyx_L1_error)
+  __pyx_ptype_4h5py_3h5r_RegionReference = __Pyx_ImportType_0_29_37(__pyx_t_1, "h5py.h5r", "RegionReference", sizeof(struct __pyx_obj_4h5py_3h5r_RegionReference), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4h5py_3h5r_RegionReference),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4h5py_3h5r_RegionReference) __PYX_ERR(3, 33, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("h5py._objects"); if (unlikely(!__pyx_t_1)) __PYX_ERR(4, 12, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_4h5py_8_objects_ObjectID = __Pyx_ImportType_0_29_37(__pyx_t_1, "h5py._objects", "ObjectID", sizeof(struct __pyx_obj_4h5py_8_objects_ObjectID), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4h5py_8_objects_ObjectID),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4h5py_8_objects_ObjectID) __PYX_ERR(4, 12, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("h5py.h5t"); if (unlikely(!__pyx_t_1)) __PYX_ERR(5, 15, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_4h5py_3h5t_TypeID = __Pyx_ImportType_0_29_37(__pyx_t_1, "h5py.h5t", "TypeID", sizeof(struct __pyx_obj_4h5py_3h5t_TypeID), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4h5py_3h5t_TypeID),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4h5py_3h5t_TypeID) __PYX_ERR(5, 15, __pyx_L1_error)
+  __pyx_vtabptr_4h5py_3h5t_TypeID = (struct __pyx_vtabstruct_4h5py_3h5t_TypeID*)__Pyx_GetVtable(__pyx_ptype_4h5py_3h5t_TypeID->tp_dict); if (unlikely(!__pyx_vtabptr_4h5py_3h5t_TypeID)) __PYX_ERR(5, 15, __pyx_L1_error)
+  __pyx_ptype_4h5py_3h5t_TypeArrayID = __Pyx_ImportType_0_29_37(__pyx_t_1, "h5py.h5t", "TypeArrayID", sizeof(struct __pyx_obj_4h5py_3h5t_TypeArrayID), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4h5py_3h5t_TypeArrayID),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4h5py_3h5t_TypeArrayID) __PYX_ERR(5, 21, __pyx_L1_error)
+  __pyx_vtabptr_4h5py_3h5t_TypeArrayID = (struct __pyx_vtabstruct_4h5py_3h5t_TypeArrayID*)__Pyx_GetVtable(__pyx_ptype_4h5py_3h5t_TypeArrayID->tp_dict); if (unlikely(!__pyx_vtabptr_4h5py_3h5t_TypeArrayID)) __PYX_ERR(5, 21, __pyx_L1_error)
+  __pyx_ptype_4h5py_3h5t_TypeOpaqueID = __Pyx_ImportType_0_29_37(__pyx_t_1, "h5py.h5t", "TypeOpaqueID", sizeof(struct __pyx_obj_4h5py_3h5t_TypeOpaqueID), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4h5py_3h5t_TypeOpaqueID),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4h5py_3h5t_TypeOpaqueID) __PYX_ERR(5, 24, __pyx_L1_error)
+  __pyx_vtabptr_4h5py_3h5t_TypeOpaqueID = (struct __pyx_vtabstruct_4h5py_3h5t_TypeOpaqueID*)__Pyx_GetVtable(__pyx_ptype_4h5py_3h5t_TypeOpaqueID->tp_dict); if (unlikely(!__pyx_vtabptr_4h5py_3h5t_TypeOpaqueID)) __PYX_ERR(5, 24, __pyx_L1_error)
+  __pyx_ptype_4h5py_3h5t_TypeStringID = __Pyx_ImportType_0_29_37(__pyx_t_1, "h5py.h5t", "TypeStringID", sizeof(struct __pyx_obj_4h5py_3h5t_TypeStringID), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4h5py_3h5t_TypeStringID),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4h5py_3h5t_TypeStringID) __PYX_ERR(5, 27, __pyx_L1_error)
+  __pyx_vtabptr_4h5py_3h5t_TypeStringID = (struct __pyx_vtabstruct_4h5py_3h5t_TypeStringID*)__Pyx_GetVtable(__pyx_ptype_4h5py_3h5t_TypeStringID->tp_dict); if (unlikely(!__pyx_vtabptr_4h5py_3h5t_TypeStringID)) __PYX_ERR(5, 27, __pyx_L1_error)
+  __pyx_ptype_4h5py_3h5t_TypeVlenID = __Pyx_ImportType_0_29_37(__pyx_t_1, "h5py.h5t", "TypeVlenID", sizeof(struct __pyx_obj_4h5py_3h5t_TypeVlenID), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4h5py_3h5t_TypeVlenID),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4h5py_3h5t_TypeVlenID) __PYX_ERR(5, 31, __pyx_L1_error)
+  __pyx_vtabptr_4h5py_3h5t_TypeVlenID = (struct __pyx_vtabstruct_4h5py_3h5t_TypeVlenID*)__Pyx_GetVtable(__pyx_ptype_4h5py_3h5t_TypeVlenID->tp_dict); if (unlikely(!__pyx_vtabptr_4h5py_3h5t_TypeVlenID)) __PYX_ERR(5, 31, __pyx_L1_error)
+  __pyx_ptype_4h5py_3h5t_TypeTimeID = __Pyx_ImportType_0_29_37(__pyx_t_1, "h5py.h5t", "TypeTimeID", sizeof(struct __pyx_obj_4h5py_3h5t_TypeTimeID), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4h5py_3h5t_TypeTimeID),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4h5py_3h5t_TypeTimeID) __PYX_ERR(5, 35, __pyx_L1_error)
+  __pyx_vtabptr_4h5py_3h5t_TypeTimeID = (struct __pyx_vtabstruct_4h5py_3h5t_TypeTimeID*)__Pyx_GetVtable(__pyx_ptype_4h5py_3h5t_TypeTimeID->tp_dict); if (unlikely(!__pyx_vtabptr_4h5py_3h5t_TypeTimeID)) __PYX_ERR(5, 35, __pyx_L1_error)
+  __pyx_ptype_4h5py_3h5t_TypeBitfieldID = __Pyx_ImportType_0_29_37(__pyx_t_1, "h5py.h5t", "TypeBitfieldID", sizeof(struct __pyx_obj_4h5py_3h5t_TypeBitfieldID), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4h5py_3h5t_TypeBitfieldID),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4h5py_3h5t_TypeBitfieldID) __PYX_ERR(5, 38, __pyx_L1_error)
+  __pyx_vtabptr_4h5py_3h5t_TypeBitfieldID = (struct __pyx_vtabstruct_4h5py_3h5t_TypeBitfieldID*)__Pyx_GetVtable(__pyx_ptype_4h5py_3h5t_TypeBitfieldID->tp_dict); if (unlikely(!__pyx_vtabptr_4h5py_3h5t_TypeBitfieldID)) __PYX_ERR(5, 38, __pyx_L1_error)
+  __pyx_ptype_4h5py_3h5t_TypeReferenceID = __Pyx_ImportType_0_29_37(__pyx_t_1, "h5py.h5t", "TypeReferenceID", sizeof(struct __pyx_obj_4h5py_3h5t_TypeReferenceID), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4h5py_3h5t_TypeReferenceID),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4h5py_3h5t_TypeReferenceID) __PYX_ERR(5, 41, __pyx_L1_error)
+  __pyx_vtabptr_4h5py_3h5t_TypeReferenceID = (struct __pyx_vtabstruct_4h5py_3h5t_TypeReferenceID*)__Pyx_GetVtable(__pyx_ptype_4h5py_3h5t_TypeReferenceID->tp_dict); if (unlikely(!__pyx_vtabptr_4h5py_3h5t_TypeReferenceID)) __PYX_ERR(5, 41, __pyx_L1_error)
+  __pyx_ptype_4h5py_3h5t_TypeAtomicID = __Pyx_ImportType_0_29_37(__pyx_t_1, "h5py.h5t", "TypeAtomicID", sizeof(struct __pyx_obj_4h5py_3h5t_TypeAtomicID), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4h5py_3h5t_TypeAtomicID),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4h5py_3h5t_TypeAtomicID) __PYX_ERR(5, 46, __pyx_L1_error)
+  __pyx_vtabptr_4h5py_3h5t_TypeAtomicID = (struct __pyx_vtabstruct_4h5py_3h5t_TypeAtomicID*)__Pyx_GetVtable(__pyx_ptype_4h5py_3h5t_TypeAtomicID->tp_dict); if (unlikely(!__pyx_vtabptr_4h5py_3h5t_TypeAtomicID)) __PYX_ERR(5, 46, __pyx_L1_error)
+  __pyx_ptype_4h5py_3h5t_TypeIntegerID = __Pyx_ImportType_0_29_37(__pyx_t_1, "h5py.h5t", "TypeIntegerID", sizeof(struct __pyx_obj_4h5py_3h5t_TypeIntegerID), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4h5py_3h5t_TypeIntegerID),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4h5py_3h5t_TypeIntegerID) __PYX_ERR(5, 49, __pyx_L1_error)
+  __pyx_vtabptr_4h5py_3h5t_TypeIntegerID = (struct __pyx_vtabstruct_4h5py_3h5t_TypeIntegerID*)__Pyx_GetVtable(__pyx_ptype_4h5py_3h5t_TypeIntegerID->tp_dict); if (unlikely(!__pyx_vtabptr_4h5py_3h5t_TypeIntegerID)) __PYX_ERR(5, 49, __pyx_L1_error)
+  __pyx_ptype_4h5py_3h5t_TypeFloatID = __Pyx_ImportType_0_29_37(__pyx_t_1, "h5py.h5t", "TypeFloatID", sizeof(struct __pyx_obj_4h5py_3h5t_TypeFloatID), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4h5py_3h5t_TypeFloatID),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4h5py_3h5t_TypeFloatID) __PYX_ERR(5, 52, __pyx_L1_error)
+  __pyx_vtabptr_4h5py_3h5t_TypeFloatID = (struct __pyx_vtabstruct_4h5py_3h5t_TypeFloatID*)__Pyx_GetVtable(__pyx_ptype_4h5py_3h5t_TypeFloatID->tp_dict); if (unlikely(!__pyx_vtabptr_4h5py_3h5t_TypeFloatID)) __PYX_ERR(5, 52, __pyx_L1_error)
+  __pyx_ptype_4h5py_3h5t_TypeCompositeID = __Pyx_ImportType_0_29_37(__pyx_t_1, "h5py.h5t", "TypeCompositeID", sizeof(struct __pyx_obj_4h5py_3h5t_TypeCompositeID), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4h5py_3h5t_TypeCompositeID),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4h5py_3h5t_TypeCompositeID) __PYX_ERR(5, 57, __pyx_L1_error)
+  __pyx_vtabptr_4h5py_3h5t_TypeCompositeID = (struct __pyx_vtabstruct_4h5py_3h5t_TypeCompositeID*)__Pyx_GetVtable(__pyx_ptype_4h5py_3h5t_TypeCompositeID->tp_dict); if (unlikely(!__pyx_vtabptr_4h5py_3h5t_TypeCompositeID)) __PYX_ERR(5, 57, __pyx_L1_error)
+  __pyx_ptype_4h5py_3h5t_TypeEnumID = __Pyx_ImportType_0_29_37(__pyx_t_1, "h5py.h5t", "TypeEnumID", sizeof(struct __pyx_obj_4h5py_3h5t_TypeEnumID), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4h5py_3h5t_TypeEnumID),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4h5py_3h5t_TypeEnumID) __PYX_ERR(5, 60, __pyx_L1_error)
+  __pyx_vtabptr_4h5py_3h5t_TypeEnumID = (struct __pyx_vtabstruct_4h5py_3h5t_TypeEnumID*)__Pyx_GetVtable(__pyx_ptype_4h5py_3h5t_TypeEnumID->tp_dict); if (unlikely(!__pyx_vtabptr_4h5py_3h5t_TypeEnumID)) __PYX_ERR(5, 60, __pyx_L1_error)
+  __pyx_ptype_4h5py_3h5t_TypeCompoundID = __Pyx_ImportType_0_29_37(__pyx_t_1, "h5py.h5t", "TypeCompoundID", sizeof(struct __pyx_obj_4h5py_3h5t_TypeCompoundID), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4h5py_3h5t_TypeCompoundID),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4h5py_3h5t_TypeCompoundID) __PYX_ERR(5, 64, __pyx_L1_error)
+  __pyx_vtabptr_4h5py_3h5t_TypeCompoundID = (struct __pyx_vtabstruct_4h5py_3h5t_TypeCompoundID*)__Pyx_GetVtable(__pyx_ptype_4h5py_3h5t_TypeCompoundID->tp_dict); if (unlikely(!__pyx_vtabptr_4h5py_3h5t_TypeCompoundID)) __PYX_ERR(5, 64, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __pyx_t_1 = PyImport_ImportModule("h5py.h5t"); if (!__pyx_t_1) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "H5PY_OBJ", (void **)&__pyx_vp_4h5py_3h5t_H5PY_OBJ, "hid_t") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportVoidPtr_0_29_37(__pyx_t_1, "H5PY_PYTHON_OPAQUE_TAG", (void **)&__pyx_vp_4h5py_3h5t_H5PY_PYTHON_OPAQUE_TAG, "char *") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __pyx_t_1 = PyImport_ImportModule("h5py.defs"); if (!__pyx_t_1) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "H5free_memory", (void (**)(void))&__pyx_f_4h5py_4defs_H5free_memory, "herr_t (void *)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "H5Tcopy", (void (**)(void))&__pyx_f_4h5py_4defs_H5Tcopy, "hid_t (hid_t)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "H5Tequal", (void (**)(void))&__pyx_f_4h5py_4defs_H5Tequal, "htri_t (hid_t, hid_t)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "H5Tget_class", (void (**)(void))&__pyx_f_4h5py_4defs_H5Tget_class, "enum H5T_class_t (hid_t)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "H5Tget_size", (void (**)(void))&__pyx_f_4h5py_4defs_H5Tget_size, "size_t (hid_t)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "H5Tget_super", (void (**)(void))&__pyx_f_4h5py_4defs_H5Tget_super, "hid_t (hid_t)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "H5Tclose", (void (**)(void))&__pyx_f_4h5py_4defs_H5Tclose, "herr_t (hid_t)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "H5Tconvert", (void (**)(void))&__pyx_f_4h5py_4defs_H5Tconvert, "herr_t (hid_t, hid_t, size_t, void *, void *, hid_t)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "H5Tregister", (void (**)(void))&__pyx_f_4h5py_4defs_H5Tregister, "herr_t (H5T_pers_t, char *, hid_t, hid_t, H5T_conv_t)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "H5Tunregister", (void (**)(void))&__pyx_f_4h5py_4defs_H5Tunregister, "herr_t (H5T_pers_t, char *, hid_t, hid_t, H5T_conv_t)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "H5Tset_size", (void (**)(void))&__pyx_f_4h5py_4defs_H5Tset_size, "herr_t (hid_t, size_t)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "H5Tget_cset", (void (**)(void))&__pyx_f_4h5py_4defs_H5Tget_cset, "H5T_cset_t (hid_t)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "H5Tvlen_create", (void (**)(void))&__pyx_f_4h5py_4defs_H5Tvlen_create, "hid_t (hid_t)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "H5Tis_variable_str", (void (**)(void))&__pyx_f_4h5py_4defs_H5Tis_variable_str, "htri_t (hid_t)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "H5Tenum_create", (void (**)(void))&__pyx_f_4h5py_4defs_H5Tenum_create, "hid_t (hid_t)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "H5Tenum_insert", (void (**)(void))&__pyx_f_4h5py_4defs_H5Tenum_insert, "herr_t (hid_t, char *, void *)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "H5Tget_tag", (void (**)(void))&__pyx_f_4h5py_4defs_H5Tget_tag, "char *(hid_t)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("h5py.h5t"); if (!__pyx_t_1) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "typewrap", (void (**)(void))&__pyx_f_4h5py_3h5t_typewrap, "struct __pyx_obj_4h5py_3h5t_TypeID *(hid_t, int __pyx_skip_dispatch)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "py_create", (void (**)(void))&__pyx_f_4h5py_3h5t_py_create, "struct __pyx_obj_4h5py_3h5t_TypeID *(PyObject *, int __pyx_skip_dispatch, struct __pyx_opt_args_4h5py_3h5t_py_create *__pyx_optional_args)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("h5py.utils"); if (!__pyx_t_1) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "emalloc", (void (**)(void))&__pyx_f_4h5py_5utils_emalloc, "void *(size_t)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "efree", (void (**)(void))&__pyx_f_4h5py_5utils_efree, "void (void *)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC init_conv(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC init_conv(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit__conv(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit__conv(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec__conv(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module '_conv' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit__conv(void)", 0);
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("_conv", __pyx_methods, __pyx_k_Low_level_type_conversion_routi, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  #endif
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_b);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_h5py___conv) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "h5py._conv")) {
+      if (unlikely(PyDict_SetItemString(modules, "h5py._conv", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  (void)__Pyx_modinit_function_export_code();
+  (void)__Pyx_modinit_type_init_code();
+  if (unlikely(__Pyx_modinit_type_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely(__Pyx_modinit_variable_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely(__Pyx_modinit_function_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+
+  /* "h5py/_conv.pyx":17
+ * include "config.pxi"
+ * 
+ * from logging import getLogger             # <<<<<<<<<<<<<<
+ * 
+ * from .h5 import get_config
+ */
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_getLogger);
+  __Pyx_GIVEREF(__pyx_n_s_getLogger);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_getLogger);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_logging, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_getLogger); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 17, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_getLogger, __pyx_t_1) < 0) __PYX_ERR(0, 17, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "h5py/_conv.pyx":19
+ * from logging import getLogger
+ * 
+ * from .h5 import get_config             # <<<<<<<<<<<<<<
+ * from .h5r cimport Reference, RegionReference, hobj_ref_t, hdset_reg_ref_t
+ * from .h5t cimport H5PY_OBJ, typewrap, py_create, TypeID, H5PY_PYTHON_OPAQUE_TAG
+ */
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_n_s_get_config);
+  __Pyx_GIVEREF(__pyx_n_s_get_config);
+  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_get_config);
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_h5, __pyx_t_2, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_get_config); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_get_config, __pyx_t_2) < 0) __PYX_ERR(0, 19, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "h5py/_conv.pyx":25
+ * from libc.string cimport strcmp
+ * from .utils cimport emalloc, efree
+ * cfg = get_config()             # <<<<<<<<<<<<<<
+ * 
+ * # Initialization of numpy
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_get_config); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 25, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 25, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_cfg, __pyx_t_2) < 0) __PYX_ERR(0, 25, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "h5py/_conv.pyx":30
+ * cimport numpy as cnp
+ * from numpy cimport npy_intp, NPY_WRITEABLE, NPY_C_CONTIGUOUS, NPY_OWNDATA
+ * cnp._import_array()             # <<<<<<<<<<<<<<
+ * 
+ * from cpython.buffer cimport (
+ */
+  __pyx_t_3 = _import_array(); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 30, __pyx_L1_error)
+
+  /* "h5py/_conv.pyx":38
+ * from cpython.ref cimport Py_INCREF, Py_XDECREF, Py_XINCREF
+ * 
+ * logger = getLogger(__name__)             # <<<<<<<<<<<<<<
+ * 
+ * cdef PyObject* Py_None = <PyObject*> None
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_getLogger); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_name); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_logger, __pyx_t_4) < 0) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "h5py/_conv.pyx":40
+ * logger = getLogger(__name__)
+ * 
+ * cdef PyObject* Py_None = <PyObject*> None             # <<<<<<<<<<<<<<
+ * 
+ * cdef extern from "numpy/arrayobject.h":
+ */
+  __pyx_v_4h5py_5_conv_Py_None = ((PyObject *)Py_None);
+
+  /* "h5py/_conv.pyx":1
+ * # cython: profile=False             # <<<<<<<<<<<<<<
+ * # cython: language_level=3
+ * # This file is part of h5py, a Python interface to the HDF5 library.
+ */
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_4) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+  /* "../.pyenv/versions/3.11.7/lib/python3.11/site-packages/numpy/__init__.pxd":1011
+ * 
+ * 
+ * cdef inline NPY_DATETIMEUNIT get_datetime64_unit(object obj) nogil:             # <<<<<<<<<<<<<<
+ *     """
+ *     returns the unit part of the dtype for a numpy datetime64 object.
+ */
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  if (__pyx_m) {
+    if (__pyx_d) {
+      __Pyx_AddTraceback("init h5py._conv", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    Py_CLEAR(__pyx_m);
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init h5py._conv");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStr(__pyx_b, name);
+    if (unlikely(!result)) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+#if 1 || PY_VERSION_HEX < 0x030600B1
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    if (Py_EnterRecursiveCall((char*)" while calling a Python object")) {
+        return NULL;
+    }
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+#endif
+
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* WriteUnraisableException */
+static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
+                                  CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
+                                  int full_traceback, CYTHON_UNUSED int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+    __Pyx_PyThreadState_declare
+#ifdef WITH_THREAD
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+    else state = (PyGILState_STATE)0;
+#endif
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(1);
+    }
+    #if PY_MAJOR_VERSION < 3
+    ctx = PyString_FromString(name);
+    #else
+    ctx = PyUnicode_FromString(name);
+    #endif
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+#ifdef WITH_THREAD
+    if (nogil)
+        PyGILState_Release(state);
+#endif
+}
+
+/* GetException */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
+#endif
+{
+    PyObject *local_type, *local_value, *local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    local_type = tstate->curexc_type;
+    local_value = tstate->curexc_value;
+    local_tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#else
+    PyErr_Fetch(&local_type, &local_value, &local_tb);
+#endif
+    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+#if CYTHON_FAST_THREAD_STATE
+    if (unlikely(tstate->curexc_type))
+#else
+    if (unlikely(PyErr_Occurred()))
+#endif
+        goto bad;
+    #if PY_MAJOR_VERSION >= 3
+    if (local_tb) {
+        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+            goto bad;
+    }
+    #endif
+    Py_XINCREF(local_tb);
+    Py_XINCREF(local_type);
+    Py_XINCREF(local_value);
+    *type = local_type;
+    *value = local_value;
+    *tb = local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_USE_EXC_INFO_STACK
+    {
+        _PyErr_StackItem *exc_info = tstate->exc_info;
+        tmp_type = exc_info->exc_type;
+        tmp_value = exc_info->exc_value;
+        tmp_tb = exc_info->exc_traceback;
+        exc_info->exc_type = local_type;
+        exc_info->exc_value = local_value;
+        exc_info->exc_traceback = local_tb;
+    }
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = local_type;
+    tstate->exc_value = local_value;
+    tstate->exc_traceback = local_tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#else
+    PyErr_SetExcInfo(local_type, local_value, local_tb);
+#endif
+    return 0;
+bad:
+    *type = 0;
+    *value = 0;
+    *tb = 0;
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_tb);
+    return -1;
+}
+
+/* SwapException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = *type;
+    exc_info->exc_value = *value;
+    exc_info->exc_traceback = *tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = *type;
+    tstate->exc_value = *value;
+    tstate->exc_traceback = *tb;
+    #endif
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyErr_GetExcInfo(&tmp_type, &tmp_value, &tmp_tb);
+    PyErr_SetExcInfo(*type, *value, *tb);
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
+#endif
+
+/* GetTopmostException */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem *
+__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
+{
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    while ((exc_info->exc_type == NULL || exc_info->exc_type == Py_None) &&
+           exc_info->previous_item != NULL)
+    {
+        exc_info = exc_info->previous_item;
+    }
+    return exc_info;
+}
+#endif
+
+/* SaveResetException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    *type = exc_info->exc_type;
+    *value = exc_info->exc_value;
+    *tb = exc_info->exc_traceback;
+    #else
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    #endif
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+}
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = type;
+    exc_info->exc_value = value;
+    exc_info->exc_traceback = tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+#endif
+
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = PyCFunction_GET_FUNCTION(func);
+    self = PyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallOneArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_New(1);
+    if (unlikely(!args)) return NULL;
+    Py_INCREF(arg);
+    PyTuple_SET_ITEM(args, 0, arg);
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, &arg, 1);
+    }
+#endif
+    if (likely(PyCFunction_Check(func))) {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
+            return __Pyx_PyObject_CallMethO(func, arg);
+#if CYTHON_FAST_PYCCALL
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
+            return __Pyx_PyCFunction_FastCall(func, &arg, 1);
+#endif
+        }
+    }
+    return __Pyx__PyObject_CallOneArg(func, arg);
+}
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *result;
+    PyObject *args = PyTuple_Pack(1, arg);
+    if (unlikely(!args)) return NULL;
+    result = __Pyx_PyObject_Call(func, args, NULL);
+    Py_DECREF(args);
+    return result;
+}
+#endif
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
+                        CYTHON_UNUSED PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+#endif
+
+/* PyObjectCallNoArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
+/* ExtTypeTest */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    if (likely(__Pyx_TypeCheck(obj, type)))
+        return 1;
+    PyErr_Format(PyExc_TypeError, "Cannot convert %.200s to %.200s",
+                 Py_TYPE(obj)->tp_name, type->tp_name);
+    return 0;
+}
+
+/* PyErrExceptionMatches */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    PyObject *exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+    if (unlikely(PyTuple_Check(err)))
+        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+}
+#endif
+
+/* TypeImport */
+#ifndef __PYX_HAVE_RT_ImportType_0_29_37
+#define __PYX_HAVE_RT_ImportType_0_29_37
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size)
+{
+    PyObject *result = 0;
+    char warning[200];
+    Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
+#ifdef Py_LIMITED_API
+    PyObject *py_basicsize;
+    PyObject *py_itemsize;
+#endif
+    result = PyObject_GetAttrString(module, class_name);
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s.%.200s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+#ifndef Py_LIMITED_API
+    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
+#else
+    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
+    if (!py_basicsize)
+        goto bad;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = 0;
+    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+#endif
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    if (check_size == __Pyx_ImportType_CheckSize_Error_0_29_37 && (size_t)basicsize != size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn_0_29_37 && (size_t)basicsize > size) {
+        PyOS_snprintf(warning, sizeof(warning),
+            "%s.%s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(result);
+    return NULL;
+}
+#endif
+
+/* GetVTable */
+static void* __Pyx_GetVtable(PyObject *dict) {
+    void* ptr;
+    PyObject *ob = PyObject_GetItem(dict, __pyx_n_s_pyx_vtable);
+    if (!ob)
+        goto bad;
+#if PY_VERSION_HEX >= 0x02070000
+    ptr = PyCapsule_GetPointer(ob, 0);
+#else
+    ptr = PyCObject_AsVoidPtr(ob);
+#endif
+    if (!ptr && !PyErr_Occurred())
+        PyErr_SetString(PyExc_RuntimeError, "invalid vtable found for imported type");
+    Py_DECREF(ob);
+    return ptr;
+bad:
+    Py_XDECREF(ob);
+    return NULL;
+}
+
+/* Import */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+    PyObject *empty_list = 0;
+    PyObject *module = 0;
+    PyObject *global_dict = 0;
+    PyObject *empty_dict = 0;
+    PyObject *list;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_import;
+    py_import = __Pyx_PyObject_GetAttrStr(__pyx_b, __pyx_n_s_import);
+    if (!py_import)
+        goto bad;
+    #endif
+    if (from_list)
+        list = from_list;
+    else {
+        empty_list = PyList_New(0);
+        if (!empty_list)
+            goto bad;
+        list = empty_list;
+    }
+    global_dict = PyModule_GetDict(__pyx_m);
+    if (!global_dict)
+        goto bad;
+    empty_dict = PyDict_New();
+    if (!empty_dict)
+        goto bad;
+    {
+        #if PY_MAJOR_VERSION >= 3
+        if (level == -1) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
+                module = PyImport_ImportModuleLevelObject(
+                    name, global_dict, empty_dict, list, 1);
+                if (!module) {
+                    if (!PyErr_ExceptionMatches(PyExc_ImportError))
+                        goto bad;
+                    PyErr_Clear();
+                }
+            }
+            level = 0;
+        }
+        #endif
+        if (!module) {
+            #if PY_MAJOR_VERSION < 3
+            PyObject *py_level = PyInt_FromLong(level);
+            if (!py_level)
+                goto bad;
+            module = PyObject_CallFunctionObjArgs(py_import,
+                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
+            Py_DECREF(py_level);
+            #else
+            module = PyImport_ImportModuleLevelObject(
+                name, global_dict, empty_dict, list, level);
+            #endif
+        }
+    }
+bad:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_import);
+    #endif
+    Py_XDECREF(empty_list);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+/* ImportFrom */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Format(PyExc_ImportError,
+        #if PY_MAJOR_VERSION < 3
+            "cannot import name %.230s", PyString_AS_STRING(name));
+        #else
+            "cannot import name %S", name);
+        #endif
+    }
+    return value;
+}
+
+/* CLineInTraceback */
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
+    PyObject *use_cline;
+    PyObject *ptype, *pvalue, *ptraceback;
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject **cython_runtime_dict;
+#endif
+    if (unlikely(!__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+#if CYTHON_COMPILING_IN_CPYTHON
+    cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
+    } else
+#endif
+    {
+      PyObject *use_cline_obj = __Pyx_PyObject_GetAttrStr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback);
+      if (use_cline_obj) {
+        use_cline = PyObject_Not(use_cline_obj) ? Py_False : Py_True;
+        Py_DECREF(use_cline_obj);
+      } else {
+        PyErr_Clear();
+        use_cline = NULL;
+      }
+    }
+    if (!use_cline) {
+        c_line = 0;
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+    }
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
+    }
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
+    }
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
+}
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
+    py_srcfile = PyString_FromString(filename);
+    if (!py_srcfile) goto bad;
+    #endif
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        if (!py_funcname) goto bad;
+        #endif
+    }
+    #if PY_MAJOR_VERSION < 3
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* Declarations */
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
+      return ::std::complex< float >(x, y);
+    }
+  #else
+    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
+      return x + y*(__pyx_t_float_complex)_Complex_I;
+    }
+  #endif
+#else
+    static CYTHON_INLINE __pyx_t_float_complex __pyx_t_float_complex_from_parts(float x, float y) {
+      __pyx_t_float_complex z;
+      z.real = x;
+      z.imag = y;
+      return z;
+    }
+#endif
+
+/* Arithmetic */
+#if CYTHON_CCOMPLEX
+#else
+    static CYTHON_INLINE int __Pyx_c_eq_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+       return (a.real == b.real) && (a.imag == b.imag);
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_sum_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        __pyx_t_float_complex z;
+        z.real = a.real + b.real;
+        z.imag = a.imag + b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_diff_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        __pyx_t_float_complex z;
+        z.real = a.real - b.real;
+        z.imag = a.imag - b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_prod_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        __pyx_t_float_complex z;
+        z.real = a.real * b.real - a.imag * b.imag;
+        z.imag = a.real * b.imag + a.imag * b.real;
+        return z;
+    }
+    #if 1
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_quot_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        if (b.imag == 0) {
+            return __pyx_t_float_complex_from_parts(a.real / b.real, a.imag / b.real);
+        } else if (fabsf(b.real) >= fabsf(b.imag)) {
+            if (b.real == 0 && b.imag == 0) {
+                return __pyx_t_float_complex_from_parts(a.real / b.real, a.imag / b.imag);
+            } else {
+                float r = b.imag / b.real;
+                float s = (float)(1.0) / (b.real + b.imag * r);
+                return __pyx_t_float_complex_from_parts(
+                    (a.real + a.imag * r) * s, (a.imag - a.real * r) * s);
+            }
+        } else {
+            float r = b.real / b.imag;
+            float s = (float)(1.0) / (b.imag + b.real * r);
+            return __pyx_t_float_complex_from_parts(
+                (a.real * r + a.imag) * s, (a.imag * r - a.real) * s);
+        }
+    }
+    #else
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_quot_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+        if (b.imag == 0) {
+            return __pyx_t_float_complex_from_parts(a.real / b.real, a.imag / b.real);
+        } else {
+            float denom = b.real * b.real + b.imag * b.imag;
+            return __pyx_t_float_complex_from_parts(
+                (a.real * b.real + a.imag * b.imag) / denom,
+                (a.imag * b.real - a.real * b.imag) / denom);
+        }
+    }
+    #endif
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_neg_float(__pyx_t_float_complex a) {
+        __pyx_t_float_complex z;
+        z.real = -a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    static CYTHON_INLINE int __Pyx_c_is_zero_float(__pyx_t_float_complex a) {
+       return (a.real == 0) && (a.imag == 0);
+    }
+    static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_conj_float(__pyx_t_float_complex a) {
+        __pyx_t_float_complex z;
+        z.real =  a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    #if 1
+        static CYTHON_INLINE float __Pyx_c_abs_float(__pyx_t_float_complex z) {
+          #if !defined(HAVE_HYPOT) || defined(_MSC_VER)
+            return sqrtf(z.real*z.real + z.imag*z.imag);
+          #else
+            return hypotf(z.real, z.imag);
+          #endif
+        }
+        static CYTHON_INLINE __pyx_t_float_complex __Pyx_c_pow_float(__pyx_t_float_complex a, __pyx_t_float_complex b) {
+            __pyx_t_float_complex z;
+            float r, lnr, theta, z_r, z_theta;
+            if (b.imag == 0 && b.real == (int)b.real) {
+                if (b.real < 0) {
+                    float denom = a.real * a.real + a.imag * a.imag;
+                    a.real = a.real / denom;
+                    a.imag = -a.imag / denom;
+                    b.real = -b.real;
+                }
+                switch ((int)b.real) {
+                    case 0:
+                        z.real = 1;
+                        z.imag = 0;
+                        return z;
+                    case 1:
+                        return a;
+                    case 2:
+                        return __Pyx_c_prod_float(a, a);
+                    case 3:
+                        z = __Pyx_c_prod_float(a, a);
+                        return __Pyx_c_prod_float(z, a);
+                    case 4:
+                        z = __Pyx_c_prod_float(a, a);
+                        return __Pyx_c_prod_float(z, z);
+                }
+            }
+            if (a.imag == 0) {
+                if (a.real == 0) {
+                    return a;
+                } else if ((b.imag == 0) && (a.real >= 0)) {
+                    z.real = powf(a.real, b.real);
+                    z.imag = 0;
+                    return z;
+                } else if (a.real > 0) {
+                    r = a.real;
+                    theta = 0;
+                } else {
+                    r = -a.real;
+                    theta = atan2f(0.0, -1.0);
+                }
+            } else {
+                r = __Pyx_c_abs_float(a);
+                theta = atan2f(a.imag, a.real);
+            }
+            lnr = logf(r);
+            z_r = expf(lnr * b.real - theta * b.imag);
+            z_theta = theta * b.real + lnr * b.imag;
+            z.real = z_r * cosf(z_theta);
+            z.imag = z_r * sinf(z_theta);
+            return z;
+        }
+    #endif
+#endif
+
+/* Declarations */
+#if CYTHON_CCOMPLEX
+  #ifdef __cplusplus
+    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
+      return ::std::complex< double >(x, y);
+    }
+  #else
+    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
+      return x + y*(__pyx_t_double_complex)_Complex_I;
+    }
+  #endif
+#else
+    static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(double x, double y) {
+      __pyx_t_double_complex z;
+      z.real = x;
+      z.imag = y;
+      return z;
+    }
+#endif
+
+/* Arithmetic */
+#if CYTHON_CCOMPLEX
+#else
+    static CYTHON_INLINE int __Pyx_c_eq_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+       return (a.real == b.real) && (a.imag == b.imag);
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_sum_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        __pyx_t_double_complex z;
+        z.real = a.real + b.real;
+        z.imag = a.imag + b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_diff_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        __pyx_t_double_complex z;
+        z.real = a.real - b.real;
+        z.imag = a.imag - b.imag;
+        return z;
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_prod_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        __pyx_t_double_complex z;
+        z.real = a.real * b.real - a.imag * b.imag;
+        z.imag = a.real * b.imag + a.imag * b.real;
+        return z;
+    }
+    #if 1
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_quot_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        if (b.imag == 0) {
+            return __pyx_t_double_complex_from_parts(a.real / b.real, a.imag / b.real);
+        } else if (fabs(b.real) >= fabs(b.imag)) {
+            if (b.real == 0 && b.imag == 0) {
+                return __pyx_t_double_complex_from_parts(a.real / b.real, a.imag / b.imag);
+            } else {
+                double r = b.imag / b.real;
+                double s = (double)(1.0) / (b.real + b.imag * r);
+                return __pyx_t_double_complex_from_parts(
+                    (a.real + a.imag * r) * s, (a.imag - a.real * r) * s);
+            }
+        } else {
+            double r = b.real / b.imag;
+            double s = (double)(1.0) / (b.imag + b.real * r);
+            return __pyx_t_double_complex_from_parts(
+                (a.real * r + a.imag) * s, (a.imag * r - a.real) * s);
+        }
+    }
+    #else
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_quot_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+        if (b.imag == 0) {
+            return __pyx_t_double_complex_from_parts(a.real / b.real, a.imag / b.real);
+        } else {
+            double denom = b.real * b.real + b.imag * b.imag;
+            return __pyx_t_double_complex_from_parts(
+                (a.real * b.real + a.imag * b.imag) / denom,
+                (a.imag * b.real - a.real * b.imag) / denom);
+        }
+    }
+    #endif
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_neg_double(__pyx_t_double_complex a) {
+        __pyx_t_double_complex z;
+        z.real = -a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    static CYTHON_INLINE int __Pyx_c_is_zero_double(__pyx_t_double_complex a) {
+       return (a.real == 0) && (a.imag == 0);
+    }
+    static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_conj_double(__pyx_t_double_complex a) {
+        __pyx_t_double_complex z;
+        z.real =  a.real;
+        z.imag = -a.imag;
+        return z;
+    }
+    #if 1
+        static CYTHON_INLINE double __Pyx_c_abs_double(__pyx_t_double_complex z) {
+          #if !defined(HAVE_HYPOT) || defined(_MSC_VER)
+            return sqrt(z.real*z.real + z.imag*z.imag);
+          #else
+            return hypot(z.real, z.imag);
+          #endif
+        }
+        static CYTHON_INLINE __pyx_t_double_complex __Pyx_c_pow_double(__pyx_t_double_complex a, __pyx_t_double_complex b) {
+            __pyx_t_double_complex z;
+            double r, lnr, theta, z_r, z_theta;
+            if (b.imag == 0 && b.real == (int)b.real) {
+                if (b.real < 0) {
+                    double denom = a.real * a.real + a.imag * a.imag;
+                    a.real = a.real / denom;
+                    a.imag = -a.imag / denom;
+                    b.real = -b.real;
+                }
+                switch ((int)b.real) {
+                    case 0:
+                        z.real = 1;
+                        z.imag = 0;
+                        return z;
+                    case 1:
+                        return a;
+                    case 2:
+                        return __Pyx_c_prod_double(a, a);
+                    case 3:
+                        z = __Pyx_c_prod_double(a, a);
+                        return __Pyx_c_prod_double(z, a);
+                    case 4:
+                        z = __Pyx_c_prod_double(a, a);
+                        return __Pyx_c_prod_double(z, z);
+                }
+            }
+            if (a.imag == 0) {
+                if (a.real == 0) {
+                    return a;
+                } else if ((b.imag == 0) && (a.real >= 0)) {
+                    z.real = pow(a.real, b.real);
+                    z.imag = 0;
+                    return z;
+                } else if (a.real > 0) {
+                    r = a.real;
+                    theta = 0;
+                } else {
+                    r = -a.real;
+                    theta = atan2(0.0, -1.0);
+                }
+            } else {
+                r = __Pyx_c_abs_double(a);
+                theta = atan2(a.imag, a.real);
+            }
+            lnr = log(r);
+            z_r = exp(lnr * b.real - theta * b.imag);
+            z_theta = theta * b.real + lnr * b.imag;
+            z.real = z_r * cos(z_theta);
+            z.imag = z_r * sin(z_theta);
+            return z;
+        }
+    #endif
+#endif
+
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int) -1;
+        }
+    } else {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_enum__H5T_class_t(enum H5T_class_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const enum H5T_class_t neg_one = (enum H5T_class_t) -1, const_zero = (enum H5T_class_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(enum H5T_class_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(enum H5T_class_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(enum H5T_class_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(enum H5T_class_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(enum H5T_class_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(enum H5T_class_t),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_htri_t(htri_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const htri_t neg_one = (htri_t) -1, const_zero = (htri_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(htri_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(htri_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(htri_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(htri_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(htri_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(htri_t),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const size_t neg_one = (size_t) -1, const_zero = (size_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(size_t) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(size_t, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (size_t) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (size_t) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(size_t, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(size_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 2 * PyLong_SHIFT) {
+                            return (size_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(size_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 3 * PyLong_SHIFT) {
+                            return (size_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(size_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 4 * PyLong_SHIFT) {
+                            return (size_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (size_t) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(size_t) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(size_t) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (size_t) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(size_t, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(size_t,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(size_t) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(size_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (size_t) ((((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(size_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (size_t) ((((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(size_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (size_t) ((((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(size_t) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(size_t) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            size_t val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (size_t) -1;
+        }
+    } else {
+        size_t val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (size_t) -1;
+        val = __Pyx_PyInt_As_size_t(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to size_t");
+    return (size_t) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to size_t");
+    return (size_t) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(long) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(long, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (long) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(long, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 2 * PyLong_SHIFT) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 3 * PyLong_SHIFT) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) >= 4 * PyLong_SHIFT) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (long) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(long) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (long) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(long, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(long,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(long) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(long) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(long) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(long) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(long) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            long val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (long) -1;
+        }
+    } else {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyInt_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = a->tp_base;
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
+        }
+    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
+}
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    int res = exc_type1 ? __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type1) : 0;
+    if (!res) {
+        res = __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+    return res;
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
+        char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
+        PyOS_snprintf(message, sizeof(message),
+                      "compiletime version %s of module '%.100s' "
+                      "does not match runtime version %s",
+                      ctversion, __Pyx_MODULE_NAME, rtversion);
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+    return 0;
+}
+
+/* VoidPtrImport */
+#ifndef __PYX_HAVE_RT_ImportVoidPtr_0_29_37
+#define __PYX_HAVE_RT_ImportVoidPtr_0_29_37
+static int __Pyx_ImportVoidPtr_0_29_37(PyObject *module, const char *name, void **p, const char *sig) {
+    PyObject *d = 0;
+    PyObject *cobj = 0;
+    d = PyObject_GetAttrString(module, (char *)"__pyx_capi__");
+    if (!d)
+        goto bad;
+    cobj = PyDict_GetItemString(d, name);
+    if (!cobj) {
+        PyErr_Format(PyExc_ImportError,
+            "%.200s does not export expected C variable %.200s",
+                PyModule_GetName(module), name);
+        goto bad;
+    }
+#if PY_VERSION_HEX >= 0x02070000
+    if (!PyCapsule_IsValid(cobj, sig)) {
+        PyErr_Format(PyExc_TypeError,
+            "C variable %.200s.%.200s has wrong signature (expected %.500s, got %.500s)",
+             PyModule_GetName(module), name, sig, PyCapsule_GetName(cobj));
+        goto bad;
+    }
+    *p = PyCapsule_GetPointer(cobj, sig);
+#else
+    {const char *desc, *s1, *s2;
+    desc = (const char *)PyCObject_GetDesc(cobj);
+    if (!desc)
+        goto bad;
+    s1 = desc; s2 = sig;
+    while (*s1 != '\0' && *s1 == *s2) { s1++; s2++; }
+    if (*s1 != *s2) {
+        PyErr_Format(PyExc_TypeError,
+            "C variable %.200s.%.200s has wrong signature (expected %.500s, got %.500s)",
+             PyModule_GetName(module), name, sig, desc);
+        goto bad;
+    }
+    *p = PyCObject_AsVoidPtr(cobj);}
+#endif
+    if (!(*p))
+        goto bad;
+    Py_DECREF(d);
+    return 0;
+bad:
+    Py_XDECREF(d);
+    return -1;
+}
+#endif
+
+/* FunctionImport */
+#ifndef __PYX_HAVE_RT_ImportFunction_0_29_37
+#define __PYX_HAVE_RT_ImportFunction_0_29_37
+static int __Pyx_ImportFunction_0_29_37(PyObject *module, const char *funcname, void (**f)(void), const char *sig) {
+    PyObject *d = 0;
+    PyObject *cobj = 0;
+    union {
+        void (*fp)(void);
+        void *p;
+    } tmp;
+    d = PyObject_GetAttrString(module, (char *)"__pyx_capi__");
+    if (!d)
+        goto bad;
+    cobj = PyDict_GetItemString(d, funcname);
+    if (!cobj) {
+        PyErr_Format(PyExc_ImportError,
+            "%.200s does not export expected C function %.200s",
+                PyModule_GetName(module), funcname);
+        goto bad;
+    }
+#if PY_VERSION_HEX >= 0x02070000
+    if (!PyCapsule_IsValid(cobj, sig)) {
+        PyErr_Format(PyExc_TypeError,
+            "C function %.200s.%.200s has wrong signature (expected %.500s, got %.500s)",
+             PyModule_GetName(module), funcname, sig, PyCapsule_GetName(cobj));
+        goto bad;
+    }
+    tmp.p = PyCapsule_GetPointer(cobj, sig);
+#else
+    {const char *desc, *s1, *s2;
+    desc = (const char *)PyCObject_GetDesc(cobj);
+    if (!desc)
+        goto bad;
+    s1 = desc; s2 = sig;
+    while (*s1 != '\0' && *s1 == *s2) { s1++; s2++; }
+    if (*s1 != *s2) {
+        PyErr_Format(PyExc_TypeError,
+            "C function %.200s.%.200s has wrong signature (expected %.500s, got %.500s)",
+             PyModule_GetName(module), funcname, sig, desc);
+        goto bad;
+    }
+    tmp.p = PyCObject_AsVoidPtr(cobj);}
+#endif
+    *f = tmp.fp;
+    if (!(*f))
+        goto bad;
+    Py_DECREF(d);
+    return 0;
+bad:
+    Py_XDECREF(d);
+    return -1;
+}
+#endif
+
+/* InitStrings */
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+    while (t->p) {
+        #if PY_MAJOR_VERSION < 3
+        if (t->is_unicode) {
+            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
+        } else if (t->intern) {
+            *t->p = PyString_InternFromString(t->s);
+        } else {
+            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
+        }
+        #else
+        if (t->is_unicode | t->is_str) {
+            if (t->intern) {
+                *t->p = PyUnicode_InternFromString(t->s);
+            } else if (t->encoding) {
+                *t->p = PyUnicode_Decode(t->s, t->n - 1, t->encoding, NULL);
+            } else {
+                *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
+            }
+        } else {
+            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
+        }
+        #endif
+        if (!*t->p)
+            return -1;
+        if (PyObject_Hash(*t->p) == -1)
+            return -1;
+        ++t;
+    }
+    return 0;
+}
+
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, (Py_ssize_t)strlen(c_str));
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+#if !CYTHON_PEP393_ENABLED
+static const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    char* defenc_c;
+    PyObject* defenc = _PyUnicode_AsDefaultEncodedString(o, NULL);
+    if (!defenc) return NULL;
+    defenc_c = PyBytes_AS_STRING(defenc);
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    {
+        char* end = defenc_c + PyBytes_GET_SIZE(defenc);
+        char* c;
+        for (c = defenc_c; c < end; c++) {
+            if ((unsigned char) (*c) >= 128) {
+                PyUnicode_AsASCIIString(o);
+                return NULL;
+            }
+        }
+    }
+#endif
+    *length = PyBytes_GET_SIZE(defenc);
+    return defenc_c;
+}
+#else
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+}
+#endif
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT
+    if (
+#if PY_MAJOR_VERSION < 3 && __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+            __Pyx_sys_getdefaultencoding_not_ascii &&
+#endif
+            PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+#if (!CYTHON_COMPILING_IN_PYPY) || (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE))
+    if (PyByteArray_Check(o)) {
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+    } else
+#endif
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
+#if PY_MAJOR_VERSION >= 3
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type %.200s).  "
+                "The ability to return an instance of a strict subclass of int "
+                "is deprecated, and may be removed in a future version of Python.",
+                Py_TYPE(result)->tp_name)) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        return result;
+    }
+#endif
+    PyErr_Format(PyExc_TypeError,
+                 "__%.4s__ returned non-%.4s (type %.200s)",
+                 type_name, type_name, Py_TYPE(result)->tp_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  const char *name = NULL;
+  PyObject *res = NULL;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_Check(x) || PyLong_Check(x)))
+#else
+  if (likely(PyLong_Check(x)))
+#endif
+    return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  #if PY_MAJOR_VERSION < 3
+  if (m && m->nb_int) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  else if (m && m->nb_long) {
+    name = "long";
+    res = m->nb_long(x);
+  }
+  #else
+  if (likely(m && m->nb_int)) {
+    name = "int";
+    res = m->nb_int(x);
+  }
+  #endif
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+    res = PyNumber_Int(x);
+  }
+#endif
+  if (likely(res)) {
+#if PY_MAJOR_VERSION < 3
+    if (unlikely(!PyInt_Check(res) && !PyLong_Check(res))) {
+#else
+    if (unlikely(!PyLong_CheckExact(res))) {
+#endif
+        return __Pyx_PyNumber_IntOrLongWrongResultType(res, name);
+    }
+  }
+  else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_TypeError,
+                    "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+#if PY_MAJOR_VERSION < 3
+  if (likely(PyInt_CheckExact(b))) {
+    if (sizeof(Py_ssize_t) >= sizeof(long))
+        return PyInt_AS_LONG(b);
+    else
+        return PyInt_AsSsize_t(b);
+  }
+#endif
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    const digit* digits = ((PyLongObject*)b)->ob_digit;
+    const Py_ssize_t size = Py_SIZE(b);
+    if (likely(__Pyx_sst_abs(size) <= 1)) {
+        ival = likely(size) ? digits[0] : 0;
+        if (size == -1) ival = -ival;
+        return ival;
+    } else {
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyInt_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t ival) {
+    return PyInt_FromSize_t(ival);
+}
+
+
+#endif /* Py_PYTHON_H */
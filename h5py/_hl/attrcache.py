@@ -0,0 +1,191 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2020 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Cache of decoded attribute values, for files opened with attr_cache_bytes.
+
+    Reading an attribute opens it, builds its HDF5 type, and reads and
+    decodes its value.  For files with a cache, the decoded values are kept,
+    by the address of the object they are attached to and their name, up to
+    a limit on their total size.  Only files opened read-only have a cache,
+    as attributes can also be written by HDF5 itself (e.g. for dimension
+    scales) without going through AttributeManager.
+
+    HDF5 shares a file opened more than once, so File objects for the same
+    file share its cache, sized for the largest attr_cache_bytes among them.
+    The cache is dropped when the last of them is closed or garbage
+    collected.
+"""
+
+from collections import OrderedDict
+import itertools
+import sys
+import weakref
+
+import numpy
+
+from .. import h5g
+
+# Cache of each file opened with a cache, by file number
+_files = {}
+
+# Sizes asked for by the File objects using each cache, by file number and
+# registration
+_requests = {}
+_tokens = itertools.count()
+
+# Returned by AttributeCache.get() when a value isn't cached
+MISSING = object()
+
+
+def _nbytes(value):
+    """ Approximate memory used by a decoded attribute value """
+    if isinstance(value, numpy.ndarray):
+        size = value.nbytes
+        if value.dtype.hasobject:
+            size += sum(sys.getsizeof(x) for x in value.flat)
+        return size
+    return sys.getsizeof(value)
+
+
+def _copy(value):
+    """ Arrays are mutable, so the cache keeps and returns its own copies """
+    if isinstance(value, numpy.ndarray):
+        return value.copy()
+    return value
+
+
+class AttributeCache(object):
+
+    """ LRU cache of decoded attribute values, limited to max_bytes.
+
+    Counters:
+
+    hits, misses
+        Reads answered from the cache, and reads of the file.
+    nbytes
+        Approximate size of the cached values.
+    """
+
+    def __init__(self, max_bytes):
+        if max_bytes < 1:
+            raise ValueError("The attribute cache size must be at least 1 byte")
+        self.max_bytes = int(max_bytes)
+        self._values = OrderedDict()  # (objno, name): (value, nbytes)
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return "<AttributeCache: %d values, %d of %d bytes, %d hits, %d misses>" % (
+            len(self._values), self.nbytes, self.max_bytes, self.hits, self.misses)
+
+    def get(self, key):
+        """ The value cached for key, or MISSING """
+        entry = self._values.get(key)
+        if entry is None:
+            self.misses += 1
+            return MISSING
+        self._values.move_to_end(key)
+        self.hits += 1
+        return _copy(entry[0])
+
+    def put(self, key, value):
+        """ Cache a value, evicting the least recently used ones to stay
+        within max_bytes.  Values larger than that aren't cached.
+        """
+        size = _nbytes(value)
+        if size > self.max_bytes:
+            return
+        self._remove(key)
+        self._values[key] = (_copy(value), size)
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            _, (_, evicted) = self._values.popitem(last=False)
+            self.nbytes -= evicted
+
+    def _remove(self, key):
+        entry = self._values.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[1]
+
+    def resize(self, max_bytes):
+        """ Change the size limit, evicting values if needed """
+        self.max_bytes = int(max_bytes)
+        while self.nbytes > self.max_bytes:
+            _, (_, evicted) = self._values.popitem(last=False)
+            self.nbytes -= evicted
+
+    def clear(self):
+        """ Empty the cache (the counters are kept) """
+        self._values.clear()
+        self.nbytes = 0
+
+    def reset_stats(self):
+        """ Zero the hit and miss counters """
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """ The counters and the current and maximum sizes, as a dict """
+        return {'hits': self.hits, 'misses': self.misses, 'values': len(self._values),
+                'nbytes': self.nbytes, 'max_bytes': self.max_bytes}
+
+
+def register(f, max_bytes):
+    """ Set up a cache for a File, or share the cache of the same file opened
+    by another File.  Returns a callable to release it when the File is
+    closed, which is also called if the File is garbage collected.
+    """
+    fileno = h5g.get_objinfo(f.id).fileno
+    cache = _files.get(fileno)
+    if cache is None:
+        cache = _files[fileno] = AttributeCache(max_bytes)
+        _requests[fileno] = {}
+    elif max_bytes > cache.max_bytes:
+        cache.resize(max_bytes)
+    token = next(_tokens)
+    _requests[fileno][token] = int(max_bytes)
+    release = weakref.finalize(f, _release, fileno, token)
+    release.atexit = False
+    return release
+
+
+def _release(fileno, token):
+    requests = _requests.get(fileno)
+    if requests is None or requests.pop(token, None) is None:
+        return
+    if requests:
+        _files[fileno].resize(max(requests.values()))
+    else:
+        del _files[fileno]
+        del _requests[fileno]
+
+
+def get_cache(fid):
+    """ The cache of a file, or None """
+    if not _files:
+        return None
+    return _files.get(h5g.get_objinfo(fid).fileno)
+
+
+def lookup(oid):
+    """ The cache of the file containing an object, and the object's address
+    (its key in the cache), or (None, None).
+    """
+    if not _files:
+        return None, None
+    info = h5g.get_objinfo(oid)
+    cache = _files.get(info.fileno)
+    if cache is None:
+        return None, None
+    return cache, info.objno
@@ -18,7 +18,7 @@ import numpy
 import uuid
 
 from .. import h5, h5s, h5t, h5a, h5p
-from . import base
+from . import attrcache, base, typecache
 from .base import phil, with_phil, Empty, is_empty_dataspace, product
 from .datatype import Datatype
 
@@ -53,6 +53,19 @@ class AttributeManager(base.MutableMappingHDF5, base.CommonStateObject):
     def __getitem__(self, name):
         """ Read the value of an attribute.
         """
+        cache, objno = attrcache.lookup(self._id)
+        if cache is None:
+            return self._read(name)
+
+        key = (objno, self._e(name))
+        value = cache.get(key)
+        if value is attrcache.MISSING:
+            value = self._read(name)
+            cache.put(key, value)
+        return value
+
+    def _read(self, name):
+        """ Read and decode the value of an attribute from the file """
         attr = h5a.open(self._id, self._e(name))
 
         if is_empty_dataspace(attr):
@@ -63,7 +76,7 @@ class AttributeManager(base.MutableMappingHDF5, base.CommonStateObject):
 
         # Do this first, as we'll be fiddling with the dtype for top-level
         # array types
-        htype = h5t.py_create(dtype)
+        htype = typecache.py_create(dtype)
 
         # NumPy doesn't support top-level array types, so we have to "fake"
         # the correct type and shape for the array.  For example, consider
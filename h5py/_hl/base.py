@@ -277,6 +277,10 @@ class HLObject(CommonStateObject):
         Base class for high-level interface objects.
     """
 
+    # Set on objects held in a file's handle cache (see handlecache.py)
+    _handle_cache = None
+    _cache_path = ''
+
     @property
     def file(self):
         """ Return a File instance associated with this object """
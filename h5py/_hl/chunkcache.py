@@ -0,0 +1,329 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2020 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Process-wide cache of decoded chunks, for files opened with
+    shared_chunk_cache=True.
+
+    HDF5 gives every open dataset a chunk cache of its own, sized when the
+    file or dataset is opened, so memory is either wasted on datasets which
+    are little used or too short for those which are.  Slicing a dataset in a
+    file using the shared cache instead reads each chunk it touches whole
+    (HDF5 reads the stored chunk and runs the filter pipeline on it), and
+    keeps the decoded chunks of all such datasets in one LRU cache with a
+    single limit on its size.  The HDF5 chunk caches of these files are
+    disabled by default so chunks aren't held twice.
+
+    Selections other than integers, slices with positive steps and Ellipsis,
+    and datasets which aren't chunked or have object (e.g. variable-length)
+    types, are read the normal way.
+"""
+
+from collections import OrderedDict
+import threading
+
+import numpy
+
+from .. import h5f, h5g, h5i, h5s
+from .chunkgrid import ChunkGrid
+from .compat import filename_decode
+
+# Files using the cache, by file number
+_files = set()
+
+DEFAULT_BYTES = 256 * 1024 * 1024
+
+
+class UnsupportedSelection(Exception):
+
+    """ Raised by read() for selections which are read the normal way """
+
+
+class _DatasetStats(object):
+
+    """ Occupancy and counters for the chunks of one dataset """
+
+    def __init__(self, filename, name):
+        self.filename = filename
+        self.name = name
+        self.chunks = 0
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def as_dict(self):
+        lookups = self.hits + self.misses
+        return {'chunks': self.chunks, 'nbytes': self.nbytes,
+                'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0}
+
+
+class SharedChunkCache(object):
+
+    """ LRU cache of decoded chunks from any number of datasets, limited to
+    max_bytes in total.  All methods are thread-safe.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_BYTES):
+        self._lock = threading.Lock()
+        self._chunks = OrderedDict()  # (fileno, objno, offset): ndarray
+        self._datasets = {}  # (fileno, objno): _DatasetStats
+        self.max_bytes = int(max_bytes)
+        self.nbytes = 0
+
+    def __repr__(self):
+        with self._lock:
+            return "<SharedChunkCache: %d chunks, %d of %d bytes>" % (
+                len(self._chunks), self.nbytes, self.max_bytes)
+
+    def _dataset(self, dsid, dskey):
+        stats = self._datasets.get(dskey)
+        if stats is None:
+            name = h5i.get_name(dsid)
+            stats = _DatasetStats(filename_decode(h5f.get_name(dsid)),
+                                  name.decode('utf-8', 'surrogateescape') if name else None)
+            self._datasets[dskey] = stats
+        return stats
+
+    def _evict(self):
+        """ Drop least recently used chunks until within max_bytes """
+        while self.nbytes > self.max_bytes:
+            key, arr = self._chunks.popitem(last=False)
+            self._forget(key, arr)
+
+    def _forget(self, key, arr):
+        self.nbytes -= arr.nbytes
+        stats = self._datasets.get(key[:2])
+        if stats is not None:
+            stats.chunks -= 1
+            stats.nbytes -= arr.nbytes
+
+    def get(self, dsid, key, load):
+        """ The decoded chunk for key, calling load() to read it if it isn't
+        cached.
+        """
+        dskey = key[:2]
+        with self._lock:
+            stats = self._dataset(dsid, dskey)
+            arr = self._chunks.get(key)
+            if arr is not None:
+                self._chunks.move_to_end(key)
+                stats.hits += 1
+                return arr
+            stats.misses += 1
+
+        arr = load()
+        arr.setflags(write=False)
+
+        with self._lock:
+            if arr.nbytes <= self.max_bytes and key not in self._chunks:
+                self._chunks[key] = arr
+                self.nbytes += arr.nbytes
+                stats = self._dataset(dsid, dskey)
+                stats.chunks += 1
+                stats.nbytes += arr.nbytes
+                self._evict()
+        return arr
+
+    def resize(self, max_bytes):
+        """ Change the size limit, evicting chunks if needed """
+        with self._lock:
+            self.max_bytes = int(max_bytes)
+            self._evict()
+
+    def discard(self, fileno, objno=None):
+        """ Drop the chunks and statistics of a file, or one dataset in it """
+        with self._lock:
+            for key in [k for k in self._chunks
+                        if k[0] == fileno and (objno is None or k[1] == objno)]:
+                self._forget(key, self._chunks.pop(key))
+            for dskey in [k for k in self._datasets
+                          if k[0] == fileno and (objno is None or k[1] == objno)]:
+                del self._datasets[dskey]
+
+    def clear(self):
+        """ Empty the cache (the counters are kept) """
+        with self._lock:
+            for key, arr in self._chunks.items():
+                self._forget(key, arr)
+            self._chunks.clear()
+
+    def reset_stats(self):
+        with self._lock:
+            for stats in self._datasets.values():
+                stats.hits = stats.misses = 0
+
+    def dataset_stats(self, fileno, objno):
+        with self._lock:
+            stats = self._datasets.get((fileno, objno))
+            if stats is None:
+                return _DatasetStats(None, None).as_dict()
+            return stats.as_dict()
+
+    def stats(self):
+        with self._lock:
+            datasets = {(s.filename, s.name): s.as_dict()
+                        for s in self._datasets.values()}
+            hits = sum(s.hits for s in self._datasets.values())
+            misses = sum(s.misses for s in self._datasets.values())
+            return {'max_bytes': self.max_bytes, 'nbytes': self.nbytes,
+                    'chunks': len(self._chunks), 'hits': hits, 'misses': misses,
+                    'datasets': datasets}
+
+
+_cache = SharedChunkCache()
+
+
+# Public interface, as h5py.chunkcache
+
+def configure(max_bytes):
+    """ Set the size limit of the shared chunk cache, in bytes """
+    if max_bytes < 0:
+        raise ValueError("max_bytes must not be negative")
+    _cache.resize(max_bytes)
+
+
+def stats():
+    """ Statistics of the shared chunk cache, as a dict with its size limit
+    (max_bytes), total size of the cached chunks (nbytes), number of chunks,
+    and hits and misses, with the same for each dataset (but the size limit)
+    and its hit_rate in datasets, keyed by (filename, dataset name).
+    """
+    return _cache.stats()
+
+
+def dataset_stats(dset):
+    """ Statistics of the shared chunk cache for one dataset: the chunks
+    cached, their size (nbytes), hits, misses and hit_rate.
+    """
+    info = h5g.get_objinfo(dset.id)
+    return _cache.dataset_stats(info.fileno, info.objno)
+
+
+def reset_stats():
+    """ Zero the hit and miss counters """
+    _cache.reset_stats()
+
+
+def clear():
+    """ Drop all the chunks in the shared cache """
+    _cache.clear()
+
+
+# Used by File and Dataset
+
+def register(fid):
+    """ Read the datasets of an open file through the shared cache """
+    _files.add(h5g.get_objinfo(fid).fileno)
+
+
+def unregister(fid):
+    """ Drop the chunks of a file which is about to be closed """
+    if _files:
+        fileno = h5g.get_objinfo(fid).fileno
+        if fileno in _files:
+            _files.discard(fileno)
+            _cache.discard(fileno)
+
+
+def dataset_key(dset):
+    """ (fileno, objno) of a dataset read through the shared cache, or None
+    if its file doesn't use the cache or the dataset can't.  Datasets look
+    this up once, when first read.
+    """
+    if not _files:
+        return None
+    info = h5g.get_objinfo(dset.id)
+    if info.fileno not in _files:
+        return None
+    if dset.chunks is None or not dset.shape or dset.dtype.hasobject:
+        return None
+    return (info.fileno, info.objno)
+
+
+def invalidate(key):
+    """ Drop the chunks of a dataset, e.g. after it is refreshed """
+    _cache.discard(*key)
+
+
+def _simple_selection(shape, args):
+    """ (start, stop, step) for each axis of a selection of integers, slices
+    and Ellipsis, and the axes indexed by an integer.  Raises
+    UnsupportedSelection for other selections.
+    """
+    if any(a is Ellipsis for a in args):
+        if sum(a is Ellipsis for a in args) > 1:
+            raise UnsupportedSelection("Multiple Ellipsis")
+        i = next(i for i, a in enumerate(args) if a is Ellipsis)
+        args = args[:i] + (slice(None),) * (len(shape) - len(args) + 1) + args[i+1:]
+    if len(args) > len(shape):
+        raise UnsupportedSelection("Too many indices")
+    args = args + (slice(None),) * (len(shape) - len(args))
+
+    sel = []
+    scalar_axes = []
+    for dim, (a, n) in enumerate(zip(args, shape)):
+        if isinstance(a, slice):
+            start, stop, step = a.indices(n)
+            if step < 1:
+                raise UnsupportedSelection("Negative steps are read the normal way")
+            stop = max(stop, start)
+        elif isinstance(a, (int, numpy.integer)) and not isinstance(a, (bool, numpy.bool_)):
+            start = int(a) + n if a < 0 else int(a)
+            if not 0 <= start < n:
+                raise UnsupportedSelection("Out of range indices are read the normal way")
+            stop, step = start + 1, 1
+            scalar_axes.append(dim)
+        else:
+            raise UnsupportedSelection("Unsupported selection")
+        sel.append((start, stop, step))
+    return sel, scalar_axes
+
+
+def _load_chunk(dset, offset, count):
+    """ Read one whole chunk; HDF5 reads and decodes the stored chunk """
+    arr = numpy.empty(count, dtype=dset.dtype)
+    fspace = dset.id.get_space()
+    fspace.select_hyperslab(tuple(offset), count)
+    mspace = h5s.create_simple(count)
+    dset.id.read(mspace, fspace, arr, dxpl=dset._dxpl)
+    return arr
+
+
+def read(dset, key, args):
+    """ Read a selection from a dataset through the shared cache, with key
+    from dataset_key().
+
+    Raises UnsupportedSelection if the selection isn't supported, so the
+    caller can read it the normal way.
+    """
+    chunks = dset.chunks
+    shape = dset.shape
+    sel, scalar_axes = _simple_selection(shape, args)
+    out_shape = tuple(len(range(*s)) for s in sel)
+    out = numpy.empty(out_shape, dtype=dset.dtype)
+
+    if out.size:
+        grid = ChunkGrid(shape, chunks, tuple(slice(*s) for s in sel))
+        starts, stops = grid.bounds()
+        for offset, lo, hi in zip(grid.offsets().tolist(), starts.tolist(), stops.tolist()):
+            count = tuple(min(c, n - o) for o, c, n in zip(offset, chunks, shape))
+            chunk = _cache.get(dset.id, key + (tuple(offset),),
+                               lambda: _load_chunk(dset, offset, count))
+            src = tuple(slice(a - o, b - o, s[2]) for a, b, o, s in zip(lo, hi, offset, sel))
+            dst = tuple(slice((a - s[0]) // s[2], (a - s[0]) // s[2] + len(range(a, b, s[2])))
+                        for a, b, s in zip(lo, hi, sel))
+            out[dst] = chunk[src]
+
+    if scalar_axes:
+        out = out.reshape(tuple(n for dim, n in enumerate(out_shape)
+                                if dim not in scalar_axes))
+        if out.ndim == 0:
+            return out[()]
+    return out
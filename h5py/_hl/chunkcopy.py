@@ -0,0 +1,160 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2020 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Copying chunked data between datasets without decompressing it.
+"""
+
+import numpy
+
+from .. import h5d, h5t
+from .base import phil
+from .chunkgrid import ChunkGrid, _normalize_sel
+
+# Upper limit on the raw chunk data held in memory at once while copying
+COPY_BUFFER_BYTES = 64 * 1024 * 1024
+
+
+def _filter_pipeline(dcpl):
+    """ Filters of a DCPL as a tuple of (code, flags, values) """
+    return tuple(dcpl.get_filter(i)[:3] for i in range(dcpl.get_nfilters()))
+
+
+def raw_copy_compatible(source, dest):
+    """ Check if raw chunks of source can be written to dest as they are.
+
+    This needs both datasets chunked with the same chunk shape, the same
+    HDF5 datatype, and the same filter pipeline.  Variable-length data and
+    references are stored as pointers into the file, so datasets containing
+    them can't be copied raw.
+    """
+    with phil:
+        if source.chunks is None or source.chunks != dest.chunks:
+            return False
+        tid = source.id.get_type()
+        if tid != dest.id.get_type():
+            return False
+        if source.dtype.hasobject or tid.detect_class(h5t.VLEN) \
+                or tid.detect_class(h5t.REFERENCE):
+            return False
+        return (_filter_pipeline(source.id.get_create_plist())
+                == _filter_pipeline(dest.id.get_create_plist()))
+
+
+def _chunk_allocated(dsid, offset):
+    """ (stored size, filter mask) of a chunk, or None if unallocated """
+    info = dsid.get_chunk_info_by_coord(offset)
+    if info.byte_offset is None:
+        return None
+    return info.size, info.filter_mask
+
+
+def _fill_bytes(dset):
+    """ The fill value of a dataset, as raw bytes """
+    if dset.dtype.hasobject:
+        raise TypeError("Fill values of object types can't be compared as bytes")
+    return numpy.asarray(dset.fillvalue, dtype=dset.dtype).tobytes()
+
+
+def copy_chunks(source, dest, sel=None, dest_sel=None):
+    """ Copy data from one chunked dataset to another, chunk by chunk.
+
+    Where the two datasets have the same chunk shape, datatype and filter
+    pipeline, whole chunks are copied in their stored (e.g. compressed) form
+    with the direct chunk read and write functions, so the data is never
+    decompressed and recompressed.  The datasets may be in different files.
+
+    sel
+        Region of ``source`` to copy, as a slice or tuple of slices with
+        unit step.  The whole dataset is copied by default.
+    dest_sel
+        Region of ``dest`` to write to, of the same shape.  By default the
+        data goes to the same coordinates as in ``source``.
+
+    Chunks only partly covered by the region, or not aligned with chunks of
+    ``dest``, are copied by reading and writing the data in the usual way,
+    as is everything if the datasets are not compatible for a raw copy.
+    Chunks never written in ``source`` are not copied, unless the matching
+    chunk in ``dest`` holds data or ``dest`` has a different fill value, in
+    which case the source's fill values are written.
+    """
+    with phil:
+        if not source.chunks:
+            raise TypeError("Chunked dataset required")
+
+        if sel is None:
+            sel = (slice(None),) * source.ndim
+        src_ranges = _normalize_sel(source.shape, sel)
+        dst_ranges = _normalize_sel(dest.shape, sel if dest_sel is None else dest_sel)
+        if any(step != 1 for _, _, step in src_ranges + dst_ranges):
+            raise ValueError("Only selections with unit step can be copied")
+        if [b - a for a, b, _ in src_ranges] != [b - a for a, b, _ in dst_ranges]:
+            raise ValueError("Source and destination selections differ in shape")
+
+        shift = numpy.array([d[0] - s[0] for s, d in zip(src_ranges, dst_ranges)],
+                            dtype=numpy.int64)
+        grid = ChunkGrid(source.shape, source.chunks, sel)
+        starts, stops = grid.bounds()
+        offsets = grid.offsets()
+
+        if raw_copy_compatible(source, dest) and \
+                hasattr(h5d.DatasetID, 'get_chunk_info_by_coord'):
+            chunks = numpy.array(source.chunks, dtype=numpy.int64)
+            src_shape = numpy.array(source.shape, dtype=numpy.int64)
+            dst_shape = numpy.array(dest.shape, dtype=numpy.int64)
+
+            # A chunk can be copied raw if the region covers all of its data,
+            # and it maps onto all the data of one chunk in dest.
+            extent = numpy.minimum(offsets + chunks, src_shape) - offsets
+            dst_offsets = offsets + shift
+            raw = (starts == offsets).all(axis=1) \
+                & (stops == offsets + extent).all(axis=1) \
+                & (dst_offsets % chunks == 0).all(axis=1) \
+                & (numpy.minimum(chunks, dst_shape - dst_offsets) == extent).all(axis=1)
+        else:
+            raw = numpy.zeros((len(grid),), dtype=bool)
+
+        # Unallocated chunks read as the fill value, so can only be skipped
+        # if both datasets have the same one.
+        same_fill = raw.any() and _fill_bytes(source) == _fill_bytes(dest)
+
+        batch = []
+        batch_bytes = 0
+        for i in range(len(grid)):
+            offset = tuple(offsets[i].tolist())
+            if raw[i]:
+                dst_offset = tuple((offsets[i] + shift).tolist())
+                stored = _chunk_allocated(source.id, offset)
+                if stored is not None:
+                    if batch and batch_bytes + stored[0] > COPY_BUFFER_BYTES:
+                        _copy_raw_batch(source, dest, batch)
+                        batch, batch_bytes = [], 0
+                    batch.append((offset, dst_offset, stored[0]))
+                    batch_bytes += stored[0]
+                    continue
+                if same_fill and _chunk_allocated(dest.id, dst_offset) is None:
+                    continue  # Nothing to copy; both hold fill values
+
+            src_slices = tuple(slice(a, b) for a, b in
+                               zip(starts[i].tolist(), stops[i].tolist()))
+            dst_slices = tuple(slice(a + d, b + d) for a, b, d in
+                               zip(starts[i].tolist(), stops[i].tolist(), shift.tolist()))
+            dest[dst_slices] = source[src_slices]
+
+        if batch:
+            _copy_raw_batch(source, dest, batch)
+
+
+def _copy_raw_batch(source, dest, batch):
+    """ Copy a list of (offset, dest offset, size) raw chunks """
+    src_offsets = numpy.array([item[0] for item in batch], dtype=numpy.uint64)
+    dst_offsets = numpy.array([item[1] for item in batch], dtype=numpy.uint64)
+    buf = numpy.empty(sum(item[2] for item in batch), dtype=numpy.uint8)
+    sizes, masks = source.id.read_direct_chunks(src_offsets, buf)
+    dest.id.write_direct_chunks(dst_offsets, buf, sizes, masks)
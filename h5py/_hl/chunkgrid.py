@@ -0,0 +1,270 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2020 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Vectorized computation of the chunk grid covering a selection.
+
+    A ChunkGrid describes the chunks of a dataset touched by a hyperslab
+    selection.  Because a regular chunk grid is the cartesian product of
+    one chunk sequence per axis, it is stored as one set of NumPy arrays
+    per axis; per-chunk bounds for the whole grid (or any block of it)
+    are then produced in one shot rather than with a Python loop per chunk.
+"""
+
+import itertools
+
+import numpy
+
+
+def _normalize_sel(shape, sel):
+    """ Normalize a selection into a tuple of (start, stop, step) per axis.
+
+    sel may be None (everything), a slice or integer for 1D datasets, or a
+    tuple of slices and integers with one entry per axis.
+    """
+    rank = len(shape)
+    if sel is None:
+        return tuple((0, n, 1) for n in shape)
+    if not isinstance(sel, tuple):
+        sel = (sel,)
+    if len(sel) != rank:
+        raise ValueError("Invalid selection - selection region must have same rank as dataset")
+
+    out = []
+    for s, n in zip(sel, shape):
+        if isinstance(s, slice):
+            start = 0 if s.start is None else s.start
+            stop = n if s.stop is None else s.stop
+            step = 1 if s.step is None else s.step
+        else:
+            try:
+                start = int(s)
+            except TypeError:
+                raise TypeError("Selection must be slices or integers, not %r" % (s,))
+            stop, step = start + 1, 1
+        if step < 1:
+            raise ValueError("Invalid selection - step must be a positive integer")
+        if start < 0 or stop > n or stop < start:
+            raise ValueError("Invalid selection - selection region must be within dataset space")
+        out.append((start, stop, step))
+    return tuple(out)
+
+
+def _axis_chunks(start, stop, step, chunk):
+    """ Chunks along one axis touched by range(start, stop, step).
+
+    Returns (index, first, stop) arrays: the chunk number along the axis,
+    the first selected coordinate in that chunk, and the end of the
+    selection within that chunk.
+    """
+    npoints = len(range(start, stop, step))
+    if npoints == 0:
+        empty = numpy.empty((0,), dtype=numpy.int64)
+        return empty, empty, empty
+
+    last = start + (npoints - 1) * step
+    nchunks = last // chunk - start // chunk + 1
+    if step == 1 or nchunks <= npoints:
+        index = numpy.arange(start // chunk, last // chunk + 1, dtype=numpy.int64)
+    else:
+        # Sparse stride: far fewer points than chunks spanned
+        points = numpy.arange(start, stop, step, dtype=numpy.int64)
+        index = numpy.unique(points // chunk)
+
+    lo = index * chunk
+    hi = numpy.minimum(lo + chunk, stop)
+    # First selected coordinate at or after the start of each chunk
+    first = start + numpy.maximum(-((start - lo) // step), 0) * step
+    keep = first < hi
+    if not keep.all():
+        index, first, hi = index[keep], first[keep], hi[keep]
+    return index, first, hi
+
+
+class ChunkGrid(object):
+
+    """
+        Chunks of a dataset touched by a hyperslab selection.
+
+        The grid is indexed like an array of shape ``grid_shape``, in C
+        order.  Slicing it (``grid[1:3, :]``) restricts it to a block of
+        chunks; ``intersect`` restricts it to another selection.
+    """
+
+    def __init__(self, shape, chunks, sel=None):
+        shape = tuple(shape)
+        chunks = tuple(chunks)
+        if len(chunks) != len(shape):
+            raise ValueError("Chunk shape must have same rank as dataset")
+        sel = _normalize_sel(shape, sel)
+
+        self._shape = shape
+        self._chunks = chunks
+        self._steps = tuple(step for _, _, step in sel)
+        self._axes = tuple(
+            _axis_chunks(start, stop, step, chunk)
+            for (start, stop, step), chunk in zip(sel, chunks)
+        )
+
+    @classmethod
+    def _from_axes(cls, shape, chunks, steps, axes):
+        """ Build a grid directly from per-axis arrays """
+        grid = cls.__new__(cls)
+        grid._shape = shape
+        grid._chunks = chunks
+        grid._steps = steps
+        grid._axes = tuple(axes)
+        return grid
+
+    @property
+    def shape(self):
+        """Shape of the dataspace the grid covers"""
+        return self._shape
+
+    @property
+    def chunks(self):
+        """Chunk shape"""
+        return self._chunks
+
+    @property
+    def rank(self):
+        """Number of dimensions"""
+        return len(self._shape)
+
+    @property
+    def grid_shape(self):
+        """Number of chunks touched along each axis"""
+        return tuple(len(index) for index, _, _ in self._axes)
+
+    def __len__(self):
+        """Total number of chunks in the grid"""
+        return int(numpy.prod(self.grid_shape, dtype=numpy.int64))
+
+    def axis(self, dim):
+        """ (INT dim) => (index, start, stop) arrays
+
+        Chunk numbers along axis ``dim``, with the first selected coordinate
+        and the end of the selection within each of them.
+        """
+        return self._axes[dim]
+
+    def _unravel(self, start, stop):
+        """ Grid coordinates of the chunks in flat range [start, stop) """
+        flat = numpy.arange(start, stop, dtype=numpy.int64)
+        return numpy.unravel_index(flat, self.grid_shape)
+
+    def indices(self, start=0, stop=None):
+        """ Chunk numbers along each axis, as an (N, rank) array.
+
+        start and stop give a range of chunks in C order, by default the
+        whole grid.
+        """
+        stop = len(self) if stop is None else stop
+        pos = self._unravel(start, stop)
+        out = numpy.empty((len(pos[0]), self.rank), dtype=numpy.int64)
+        for dim, (p, (index, _, _)) in enumerate(zip(pos, self._axes)):
+            out[:, dim] = index[p]
+        return out
+
+    def offsets(self, start=0, stop=None):
+        """ Dataspace coordinates of the origin of each chunk, as an
+        (N, rank) array.  These are the offsets used by the direct chunk
+        read and write functions.
+        """
+        return self.indices(start, stop) * numpy.asarray(self._chunks, dtype=numpy.int64)
+
+    def bounds(self, start=0, stop=None):
+        """ Intersection of each chunk with the selection.
+
+        Returns (starts, stops), two (N, rank) arrays; along each axis the
+        selection within the chunk is ``slice(starts, stops, step)``.
+        """
+        stop = len(self) if stop is None else stop
+        pos = self._unravel(start, stop)
+        n = len(pos[0])
+        starts = numpy.empty((n, self.rank), dtype=numpy.int64)
+        stops = numpy.empty((n, self.rank), dtype=numpy.int64)
+        for dim, (p, (_, first, hi)) in enumerate(zip(pos, self._axes)):
+            starts[:, dim] = first[p]
+            stops[:, dim] = hi[p]
+        return starts, stops
+
+    def _axis_slices(self, dim):
+        """ Slice objects for each chunk along one axis """
+        _, first, hi = self._axes[dim]
+        step = self._steps[dim]
+        return [slice(a, b, step) for a, b in zip(first.tolist(), hi.tolist())]
+
+    def slices(self, start=0, stop=None):
+        """ List of slice tuples, one per chunk, as yielded by iteration """
+        return list(itertools.islice(iter(self), start, stop))
+
+    def __iter__(self):
+        """ Yield a tuple of slices for each chunk, in C order """
+        # The grid is the cartesian product of the per-axis chunk sequences,
+        # so only sum(grid_shape) slice objects need to be built in Python.
+        return itertools.product(*(self._axis_slices(dim)
+                                   for dim in range(self.rank)))
+
+    def __getitem__(self, key):
+        """ Restrict the grid to a block of chunks.
+
+        key is a slice or integer (or tuple of them, one per axis) indexing
+        the grid positions, as for an array of shape ``grid_shape``.  The
+        result is always a grid of the same rank.
+        """
+        if not isinstance(key, tuple):
+            key = (key,)
+        if len(key) > self.rank:
+            raise IndexError("Too many indices for chunk grid")
+        key = key + (slice(None),) * (self.rank - len(key))
+
+        axes = []
+        for k, arrays, n in zip(key, self._axes, self.grid_shape):
+            if not isinstance(k, slice):
+                k = int(k)
+                if k < 0:
+                    k += n
+                if not 0 <= k < n:
+                    raise IndexError("Chunk grid index out of range")
+                k = slice(k, k + 1)
+            axes.append(tuple(a[k] for a in arrays))
+        return self._from_axes(self._shape, self._chunks, self._steps, axes)
+
+    def intersect(self, sel):
+        """ Grid of the chunks touched by hyperslab ``sel`` which also lie in
+        this grid, with the bounds of each chunk clipped to this grid's.
+        """
+        other = ChunkGrid(self._shape, self._chunks, sel)
+        axes = []
+        for dim, step in enumerate(other._steps):
+            index, first, hi = other._axes[dim]
+            mine, my_first, my_hi = self._axes[dim]
+            # Both index arrays are sorted and unique
+            pos = numpy.searchsorted(mine, index)
+            pos_ok = numpy.minimum(pos, max(len(mine) - 1, 0))
+            keep = (pos < len(mine))
+            if len(mine):
+                keep &= (mine[pos_ok] == index)
+            index, first, hi, pos = index[keep], first[keep], hi[keep], pos[keep]
+
+            # Move first up to the lattice of sel, past the start of our bounds
+            lo = my_first[pos]
+            behind = first < lo
+            first = numpy.where(
+                behind, first + (-((first - lo) // step)) * step, first
+            )
+            hi = numpy.minimum(hi, my_hi[pos])
+            keep = first < hi
+            axes.append((index[keep], first[keep], hi[keep]))
+        return self._from_axes(self._shape, self._chunks, other._steps, axes)
+
+    def __repr__(self):
+        return "<ChunkGrid: %d chunks %s of %s over shape %s>" % (
+            len(self), self.grid_shape, self._chunks, self._shape)
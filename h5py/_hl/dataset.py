@@ -17,19 +17,22 @@ except ImportError:
     from cached_property import cached_property
 import posixpath as pp
 import sys
+from collections import namedtuple
 
 from threading import local
 
 import numpy
 
-from .. import h5, h5s, h5t, h5r, h5d, h5p, h5fd, h5ds, _selector
+from .. import h5, h5f, h5i, h5s, h5t, h5r, h5d, h5p, h5fd, h5ds, _selector
 from .base import HLObject, phil, with_phil, Empty, find_item_type
-from . import filters
+from . import chunkcache, filters, iostats, typecache
 from . import selections as sel
 from . import selections2 as sel2
 from .datatype import Datatype
 from .compat import filename_decode
 from .vds import VDSmap, vds_support
+from .chunkgrid import ChunkGrid
+from .reductions import reduce_dataset
 
 _LEGACY_GZIP_COMPRESSION_VALS = frozenset(range(10))
 MPI = h5.get_config().mpi
@@ -40,7 +43,7 @@ def make_new_dset(parent, shape=None, dtype=None, data=None, name=None,
                   fletcher32=None, maxshape=None, compression_opts=None,
                   fillvalue=None, scaleoffset=None, track_times=None,
                   external=None, track_order=None, dcpl=None,
-                  allow_unknown_filter=False):
+                  allow_unknown_filter=False, access=None, cache_bytes=None):
     """ Return a new low-level dataset identifier """
 
     # Convert data to a C-contiguous ndarray
@@ -104,10 +107,15 @@ def make_new_dset(parent, shape=None, dtype=None, data=None, name=None,
             raise TypeError("Conflict in compression options")
         compression_opts = compression
         compression = 'gzip'
+    # Automatic chunk shapes should fit in the file's chunk cache
+    if access is not None and cache_bytes is None:
+        cache_bytes = parent.file.id.get_access_plist().get_cache()[2]
+
     dcpl = filters.fill_dcpl(
         dcpl or h5p.create(h5p.DATASET_CREATE), shape, dtype,
         chunks, compression, compression_opts, shuffle, fletcher32,
-        maxshape, scaleoffset, external, allow_unknown_filter)
+        maxshape, scaleoffset, external, allow_unknown_filter,
+        access, cache_bytes)
 
     if fillvalue is not None:
         fillvalue = numpy.array(fillvalue)
@@ -142,6 +150,29 @@ def make_new_dset(parent, shape=None, dtype=None, data=None, name=None,
     return dset_id
 
 
+def make_dapl(dset, rdcc_nbytes=None, rdcc_nslots=None, rdcc_w0=None, access=None):
+    """ Return a dataset access property list with chunk cache settings for
+    an open dataset, keeping its current settings where none are given.
+    """
+    nslots, nbytes, w0 = dset.id.get_access_plist().get_chunk_cache()
+    if access is not None and rdcc_nbytes is None and rdcc_nslots is None:
+        if dset.chunks is None:
+            raise TypeError("Only chunked datasets have a chunk cache")
+        auto_nslots, auto_nbytes = filters.chunk_cache_for_access(
+            dset.shape, dset.chunks, dset.dtype.itemsize, access)
+        if auto_nbytes > nbytes:
+            nslots, nbytes = max(nslots, auto_nslots), auto_nbytes
+    if rdcc_nslots is not None:
+        nslots = rdcc_nslots
+    if rdcc_nbytes is not None:
+        nbytes = rdcc_nbytes
+    if rdcc_w0 is not None:
+        w0 = rdcc_w0
+    dapl = h5p.create(h5p.DATASET_ACCESS)
+    dapl.set_chunk_cache(nslots, nbytes, w0)
+    return dapl
+
+
 def make_new_virtual_dset(parent, shape, sources, dtype, name=None,
                           maxshape=None, fillvalue=None):
     """ Return a new low-level dataset identifier for a virtual dataset """
@@ -264,78 +295,155 @@ if MPI:
             self._dset._dxpl.set_dxpl_mpio(h5fd.MPIO_INDEPENDENT)
 
 
+ChunkInfo = namedtuple('ChunkInfo',
+                       'chunk_offset, filter_mask, byte_offset, size, allocated')
+
+
 class ChunkIterator(object):
     """
     Class to iterate through list of chunks of a given dataset
     """
-    def __init__(self, dset, source_sel=None):
+    def __init__(self, dset, source_sel=None, order='logical',
+                 with_info=False, skip_unallocated=False):
         self._shape = dset.shape
-        rank = len(dset.shape)
 
         if not dset.chunks:
             # can only use with chunked datasets
             raise TypeError("Chunked dataset required")
 
+        if order not in ('logical', 'file'):
+            raise ValueError("Invalid chunk order %r; must be 'logical' or 'file'" % order)
+
         self._layout = dset.chunks
-        if source_sel is None:
-            # select over entire dataset
-            slices = []
-            for dim in range(rank):
-                slices.append(slice(0, self._shape[dim]))
-            self._sel = tuple(slices)
-        else:
-            if isinstance(source_sel, slice):
-                self._sel = (source_sel,)
-            else:
-                self._sel = source_sel
-        if len(self._sel) != rank:
-            raise ValueError("Invalid selection - selection region must have same rank as dataset")
-        self._chunk_index = []
-        for dim in range(rank):
-            s = self._sel[dim]
-            if s.start < 0 or s.stop > self._shape[dim] or s.stop <= s.start:
-                raise ValueError("Invalid selection - selection region must be within dataset space")
-            index = s.start // self._layout[dim]
-            self._chunk_index.append(index)
+        # The bounds of every chunk are computed up front as arrays
+        self._grid = ChunkGrid(self._shape, self._layout, source_sel)
+        if len(self._grid) == 0:
+            raise ValueError("Invalid selection - selection region must be within dataset space")
+        self._logical = iter(self._grid)
+
+        self._with_info = with_info
+        self._stored = None
+        if order == 'file' or with_info or skip_unallocated:
+            if not hasattr(h5d.DatasetID, 'get_chunk_info_by_coord'):
+                raise ValueError("HDF5 1.10.5 or later required for chunk "
+                                 "storage information")
+            self._dsid = dset.id
+            self._stored = self._iter_stored(order, skip_unallocated)
+
+    def _chunk_info(self, offset):
+        """Storage information for the chunk at the given offset"""
+        info = self._dsid.get_chunk_info_by_coord(offset)
+        if info.byte_offset is None:
+            return ChunkInfo(offset, 0, None, 0, False)
+        return ChunkInfo(offset, info.filter_mask, info.byte_offset,
+                         info.size, True)
+
+    def _iter_stored(self, order, skip_unallocated):
+        """Yield (slices, ChunkInfo) pairs, sorted by file address if
+        order is 'file'"""
+        offsets = (tuple(o) for o in self._grid.offsets().tolist())
+        items = ((slices, self._chunk_info(offset))
+                 for slices, offset in zip(self._logical, offsets))
+        if skip_unallocated:
+            items = (item for item in items if item[1].allocated)
+        if order == 'file':
+            # Unallocated chunks (if any) go last, in logical order
+            items = sorted(items, key=lambda item: (not item[1].allocated,
+                                                    item[1].byte_offset or 0))
+        return iter(items)
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        rank = len(self._shape)
-        slices = []
-        if rank == 0 or self._chunk_index[0] * self._layout[0] >= self._sel[0].stop:
-            # ran past the last chunk, end iteration
-            raise StopIteration()
-
-        for dim in range(rank):
-            s = self._sel[dim]
-            start = self._chunk_index[dim] * self._layout[dim]
-            stop = (self._chunk_index[dim] + 1) * self._layout[dim]
-            # adjust the start if this is an edge chunk
-            if start < s.start:
-                start = s.start
-            if stop > s.stop:
-                stop = s.stop  # trim to end of the selection
-            s = slice(start, stop, 1)
-            slices.append(s)
-
-        # bump up the last index and carry forward if we run outside the selection
-        dim = rank - 1
-        while dim >= 0:
-            s = self._sel[dim]
-            self._chunk_index[dim] += 1
-
-            chunk_end = self._chunk_index[dim] * self._layout[dim]
-            if chunk_end < s.stop:
-                # we still have room to extend along this dimensions
-                return tuple(slices)
-
-            if dim > 0:
-                # reset to the start and continue iterating with higher dimension
-                self._chunk_index[dim] = 0
-            dim -= 1
-        return tuple(slices)
+        if self._stored is None:
+            return next(self._logical)
+
+        slices, info = next(self._stored)
+        if self._with_info:
+            return slices, info
+        return slices
+
+
+class FrozenDataset(object):
+
+    """ Immutable snapshot of a dataset in a read-only file, from
+    Dataset.freeze().
+
+    The layout and filter properties (shape, dtype, chunks, compression,
+    fillvalue, etc.) are read from the file once, when the snapshot is made,
+    and are plain attributes afterwards.  Slicing uses a fast reader made at
+    the same time where possible, and the dataset otherwise.  The snapshot
+    isn't updated by Dataset.refresh().
+    """
+
+    __slots__ = ('_dset', 'id', 'name', 'shape', 'dtype', 'ndim', 'size',
+                 'nbytes', 'maxshape', 'chunks', 'compression',
+                 'compression_opts', 'shuffle', 'fletcher32', 'scaleoffset',
+                 'fillvalue', 'external', 'is_virtual', '_selector',
+                 '_fast_reader')
+
+    def __init__(self, dset):
+        values = {'_dset': dset, 'id': dset.id, 'name': dset.name}
+        for name in ('shape', 'dtype', 'ndim', 'size', 'nbytes', 'maxshape',
+                     'chunks', 'compression', 'compression_opts', 'shuffle',
+                     'fletcher32', 'scaleoffset', 'fillvalue', 'external'):
+            values[name] = getattr(dset, name)
+        values['is_virtual'] = dset.is_virtual if vds_support else False
+        values['_selector'] = None if dset._is_empty else dset._selector
+        # Reads in files using the shared chunk cache go through the dataset
+        values['_fast_reader'] = None
+        if dset._fast_read_ok and dset._shared_chunk_key is None:
+            try:
+                values['_fast_reader'] = dset._fast_reader
+            except TypeError:
+                pass  # Read through the dataset, as Dataset.__getitem__ does
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Frozen datasets are read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError("Frozen datasets are read-only")
+
+    @property
+    def dataset(self):
+        """ The Dataset this snapshot was taken from """
+        return self._dset
+
+    def __len__(self):
+        """ The size of the first axis.  TypeError if scalar. """
+        if len(self.shape) == 0:
+            raise TypeError("Attempt to take len() of scalar dataset")
+        return self.shape[0]
+
+    @iostats.measured('read')
+    def __getitem__(self, args):
+        """ Read a slice, as for Dataset """
+        if self._fast_reader is not None:
+            args = args if isinstance(args, tuple) else (args,)
+            try:
+                with phil:
+                    return self._fast_reader.read(args)
+            except TypeError:
+                pass  # Read through the dataset
+        return self._dset[args]
+
+    def __array__(self, dtype=None):
+        return self._dset.__array__(dtype)
+
+    def __repr__(self):
+        if not self.id:
+            return '<Frozen closed HDF5 dataset>'
+        if self.name is None:
+            namestr = '("anonymous")'
+        else:
+            name = pp.basename(pp.normpath(self.name))
+            namestr = '"%s"' % (name if name != '' else '/')
+        return '<Frozen HDF5 dataset %s: shape %s, type "%s">' % (
+            namestr, self.shape, self.dtype.str)
+
 
 class Dataset(HLObject):
 
@@ -496,7 +604,7 @@ class Dataset(HLObject):
     @with_phil
     def compression(self):
         """Compression strategy (or None)"""
-        for x in ('gzip','lzf','szip'):
+        for x in ('gzip','lzf','szip','bslz4'):
             if x in self._filters:
                 return x
         return None
@@ -504,7 +612,8 @@ class Dataset(HLObject):
     @property
     @with_phil
     def compression_opts(self):
-        """ Compression setting.  Int(0-9) for gzip, 2-tuple for szip. """
+        """ Compression setting.  Int(0-9) for gzip, 2-tuple for szip, block
+        size for bslz4. """
         return self._filters.get(self.compression, None)
 
     @property
@@ -661,7 +770,8 @@ class Dataset(HLObject):
             yield self[i]
 
     @with_phil
-    def iter_chunks(self, sel=None):
+    def iter_chunks(self, sel=None, order='logical', with_info=False,
+                    skip_unallocated=False):
         """ Return chunk iterator.  If set, the sel argument is a slice or
         tuple of slices that defines the region to be used. If not set, the
         entire dataspace will be used for the iterator.
@@ -670,12 +780,136 @@ class Dataset(HLObject):
         slices that gives the intersection of the given chunk with the
         selection area.
 
+        order
+            'logical' (default) yields chunks in C order of their position
+            in the dataspace.  'file' yields them sorted by their address
+            in the file, so that reading them in turn is sequential on
+            disk.  Unallocated chunks come last.
+        with_info
+            If True, yield (slices, ChunkInfo) pairs instead, where the
+            ChunkInfo gives the chunk offset, filter mask, byte offset and
+            stored size of the chunk, and whether it is allocated.
+        skip_unallocated
+            If True, skip chunks which have no storage allocated in the file.
+
         A TypeError will be raised if the dataset is not chunked.
 
         A ValueError will be raised if the selection region is invalid.
 
         """
-        return ChunkIterator(self, sel)
+        return ChunkIterator(self, sel, order=order, with_info=with_info,
+                             skip_unallocated=skip_unallocated)
+
+    def reduce(self, op, axis=None, sel=None, workers=None, **kwargs):
+        """ Reduce the dataset (or a region of it) without reading it all
+        into memory.
+
+        The data is read one chunk at a time, as for ``iter_chunks``; each
+        chunk is reduced with NumPy and the partial results combined.
+        Contiguous datasets are read in blocks of the size chunked storage
+        would use.
+
+        op
+            'sum', 'min', 'max', 'mean', 'argmax', 'argmin' or
+            'histogram'.  The matching NumPy functions are also accepted.
+        axis
+            Axis to reduce along, or None (default) to reduce over all of
+            them.  Indices from 'argmax' and 'argmin' are relative to the
+            selection, and flat if axis is None.
+        sel
+            Slice or tuple of slices giving the region to reduce.
+        workers
+            Number of threads reading and reducing chunks.  At most two
+            chunks per thread are held in memory at once.
+
+        'histogram' takes ``bins`` and ``range`` keywords as for
+        numpy.histogram (bin estimators like 'auto' are not supported), and
+        returns ``(counts, bin_edges)``.  Without a range, the data is read
+        an extra time to find the minimum and maximum.
+        """
+        return reduce_dataset(self, op, axis=axis, sel=sel, workers=workers,
+                              **kwargs)
+
+    @with_phil
+    def io_stats(self, reset=False):
+        """ I/O statistics for this dataset, if the file was opened with
+        ``io_stats=True``.
+
+        Returns a dict with the number of ``reads`` and ``writes`` and the
+        total time taken by them (``read_time``, ``write_time``, in
+        seconds), and under ``filters``, for each filter implemented in
+        h5py which processed data, separate ``decode`` and ``encode``
+        entries giving the number of ``chunks``, their size in the file
+        (``raw_bytes``) and decoded (``decoded_bytes``), and the ``time``
+        spent in the filter.  Time in other filters, the file driver and
+        type conversion is included in the read and write times only.
+
+        Chunks compressed when they are flushed from the chunk cache by
+        ``File.flush()`` count towards the file's statistics rather than the
+        dataset's.  If reset is True, the counters are set to zero after
+        reading them.
+        """
+        return iostats.dataset_stats(self, reset)
+
+    @with_phil
+    def get_cache(self):
+        """ The chunk cache settings of this dataset, as a tuple
+        (rdcc_nslots, rdcc_nbytes, rdcc_w0).
+        """
+        return self.id.get_access_plist().get_chunk_cache()
+
+    @with_phil
+    def set_cache(self, rdcc_nbytes=None, rdcc_nslots=None, rdcc_w0=None,
+                  access=None):
+        """ Change the size of the chunk cache of this dataset, by reopening
+        it.  Settings which aren't given are kept.
+
+        rdcc_nbytes, rdcc_nslots, rdcc_w0
+            As for File.  These apply to this dataset only.
+        access
+            Size the cache to hold all the chunks touched by one read in this
+            pattern, if rdcc_nbytes and rdcc_nslots aren't given: 'rows'
+            (a full row of chunks along the last axis), 'columns' (along the
+            first axis), 'planes' (the last two axes), or a dict of relative
+            weights keyed by axis, or by tuples of axes read together.  The
+            cache is never made smaller than the current one this way.
+
+        The dataset must not be open through any other object, as HDF5 keeps
+        one chunk cache for all the open identifiers of a dataset.  This
+        replaces the dataset's low-level identifier (.id).
+        """
+        dapl = make_dapl(self, rdcc_nbytes, rdcc_nslots, rdcc_w0, access)
+
+        name = h5i.get_name(self.id)
+        if name is None:
+            raise ValueError("Unable to reopen an anonymous dataset")
+        fid = h5i.get_file_id(self.id)
+        # Identifiers of the same dataset compare equal.  The list holds
+        # references to the identifiers, so must be gone before reopening.
+        open_ids = h5f.get_obj_ids(fid, h5f.OBJ_DATASET)
+        shared = any(x.id != self.id.id and x == self.id for x in open_ids)
+        del open_ids
+        if shared:
+            raise ValueError("Unable to change the chunk cache of a dataset "
+                             "which is open elsewhere")
+
+        self.id.close()
+        self._id = h5d.open(fid, name, dapl=dapl)
+        self._cache_props.clear()
+
+    @with_phil
+    def freeze(self):
+        """ An immutable snapshot of this dataset for repeated reads, with
+        its properties (shape, dtype, chunks, compression, fillvalue, etc.)
+        read once, and slicing which skips looking them up again.
+
+        Only datasets in files opened read-only can be frozen.  The snapshot
+        keeps using this dataset's identifier, so call set_cache() first if
+        needed, and isn't updated by refresh().
+        """
+        if self.file.mode != 'r':
+            raise ValueError("Only datasets in read-only files can be frozen")
+        return FrozenDataset(self)
 
     @cached_property
     def _fast_read_ok(self):
@@ -685,7 +919,13 @@ class Dataset(HLObject):
             and isinstance(self.id.get_type(), (h5t.TypeIntegerID, h5t.TypeFloatID))
         )
 
+    @cached_property
+    def _shared_chunk_key(self):
+        """Key of this dataset in the shared chunk cache, if it uses it"""
+        return chunkcache.dataset_key(self)
+
     @with_phil
+    @iostats.measured('read')
     def __getitem__(self, args, new_dtype=None):
         """ Read a slice from the HDF5 dataset.
 
@@ -702,6 +942,12 @@ class Dataset(HLObject):
         if new_dtype is None:
             new_dtype = getattr(self._local, 'astype', None)
 
+        if new_dtype is None and self._shared_chunk_key is not None:
+            try:
+                return chunkcache.read(self, self._shared_chunk_key, args)
+            except chunkcache.UnsupportedSelection:
+                pass  # Read the normal way below
+
         if self._fast_read_ok and (new_dtype is None):
             try:
                 return self._fast_reader.read(args)
@@ -727,7 +973,7 @@ class Dataset(HLObject):
 
         if new_dtype is None:
             new_dtype = self.dtype
-        mtype = h5t.py_create(new_dtype)
+        mtype = typecache.py_create(new_dtype)
 
         # === Special-case region references ====
 
@@ -795,6 +1041,7 @@ class Dataset(HLObject):
         return arr
 
     @with_phil
+    @iostats.measured('write')
     def __setitem__(self, args, val):
         """ Write to the HDF5 dataset from a Numpy array.
 
@@ -873,7 +1120,7 @@ class Dataset(HLObject):
             valshp = val.shape[-len(shp):]
             if valshp != shp:  # Last dimension has to match
                 raise TypeError("When writing to array types, last N dimensions have to match (got %s, but should be %s)" % (valshp, shp,))
-            mtype = h5t.py_create(numpy.dtype((val.dtype, shp)))
+            mtype = typecache.py_create(numpy.dtype((val.dtype, shp)))
             mshape = val.shape[0:len(val.shape)-len(shp)]
 
         # Make a compound memory type if field-name slicing is required
@@ -891,7 +1138,7 @@ class Dataset(HLObject):
 
             # Write non-compound source into a single dataset field
             if len(names) == 1 and val.dtype.fields is None:
-                subtype = h5t.py_create(val.dtype)
+                subtype = typecache.py_create(val.dtype)
                 mtype = h5t.create(h5t.COMPOUND, subtype.get_size())
                 mtype.insert(self._e(names[0]), 0, subtype)
 
@@ -900,14 +1147,14 @@ class Dataset(HLObject):
                 fieldnames = [x for x in val.dtype.names if x in names] # Keep source order
                 mtype = h5t.create(h5t.COMPOUND, val.dtype.itemsize)
                 for fieldname in fieldnames:
-                    subtype = h5t.py_create(val.dtype.fields[fieldname][0])
+                    subtype = typecache.py_create(val.dtype.fields[fieldname][0])
                     offset = val.dtype.fields[fieldname][1]
                     mtype.insert(self._e(fieldname), offset, subtype)
 
-        # Use mtype derived from array (let DatasetID.write figure it out)
+        # Use mtype derived from array
         else:
             mshape = val.shape
-            mtype = None
+            mtype = typecache.py_create(val.dtype)
 
         # Perform the dataspace selection
         selection = sel.select(self.shape, args, dataset=self)
@@ -947,6 +1194,8 @@ class Dataset(HLObject):
         for fspace in selection.broadcast(mshape):
             self.id.write(mspace, fspace, val, mtype, dxpl=self._dxpl)
 
+    @with_phil
+    @iostats.measured('read')
     def read_direct(self, dest, source_sel=None, dest_sel=None):
         """ Read data directly from HDF5 into an existing NumPy array.
 
@@ -972,6 +1221,8 @@ class Dataset(HLObject):
             for mspace in dest_sel.broadcast(source_sel.mshape):
                 self.id.read(mspace, fspace, dest, dxpl=self._dxpl)
 
+    @with_phil
+    @iostats.measured('write')
     def write_direct(self, source, source_sel=None, dest_sel=None):
         """ Write data directly to HDF5 from a NumPy array.
 
@@ -1037,6 +1288,10 @@ class Dataset(HLObject):
             """
             self._id.refresh()
             self._cache_props.clear()
+            if self._shared_chunk_key is not None:
+                chunkcache.invalidate(self._shared_chunk_key)
+            if self._handle_cache is not None:
+                self._handle_cache.discard(self)
 
     if hasattr(h5d.DatasetID, "flush"):
         @with_phil
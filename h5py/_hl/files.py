@@ -11,14 +11,21 @@
     Implements high-level support for HDF5 file objects.
 """
 
+import itertools
 import sys
 import os
 
+import numpy
+
 from .compat import filename_decode, filename_encode
 
 from .base import phil, with_phil
 from .group import Group
-from .. import h5, h5f, h5p, h5i, h5fd, _objects
+from . import attrcache, chunkcache, iostats
+from .handlecache import HandleCache
+from .mdc import MetadataCache
+from .ranged import RangedReader
+from .. import h5, h5a, h5ac, h5d, h5f, h5fd, h5i, h5o, h5p, h5s, h5t, _objects
 from .. import version
 
 mpi = h5.get_config().mpi
@@ -28,6 +35,9 @@ swmr_support = False
 if hdf5_version >= h5.get_config().swmr_min_hdf5_version:
     swmr_support = True
 
+# Unique names for files opened from buffers, which the core driver compares
+_buffer_names = itertools.count()
+
 
 libver_dict = {'earliest': h5f.LIBVER_EARLIEST, 'latest': h5f.LIBVER_LATEST}
 libver_dict_r = dict((y, x) for x, y in libver_dict.items())
@@ -50,15 +60,46 @@ def _set_fapl_mpio(plist, **kwargs):
     plist.set_fapl_mpio(**kwargs)
 
 
+def _set_fapl_core(plist, **kwargs):
+    """Set the core driver, with its memory managed by h5py"""
+    plist.set_fapl_core(**kwargs)
+    h5fd.set_image_callbacks(plist)
+
+
 def _set_fapl_fileobj(plist, **kwargs):
     """Set the Python file object driver in a file access property list"""
-    plist.set_fileobj_driver(h5fd.fileobj_driver, kwargs.get('fileobj'))
+    plist.set_fileobj_driver(h5fd.fileobj_driver, kwargs.get('fileobj'),
+                             kwargs.get('page_size', 0),
+                             kwargs.get('cache_bytes', 0))
+
+
+def _set_fapl_mmap(plist, **kwargs):
+    """Set the read-only memory-mapped file driver in a file access property list"""
+    if h5fd.mmap_driver < 0:
+        raise ValueError("The mmap driver is not available on this platform")
+    plist.set_driver(h5fd.mmap_driver)
+
+
+def _set_fapl_ranged(plist, fetch=None, reader=None, **kwargs):
+    """Set the driver reading through a fetch(offset, length) callable"""
+    if reader is None:
+        if fetch is None:
+            raise TypeError("The ranged driver needs a fetch callable or a reader")
+        reader = RangedReader(fetch, **kwargs)
+    elif fetch is not None or kwargs:
+        raise TypeError("Options can't be given with an existing reader")
+    plist.set_fileobj_driver(h5fd.ranged_driver, reader)
+
+
+def _set_fapl_trace(plist, trace_file):
+    """Set the I/O recording driver in a file access property list"""
+    plist.set_trace_driver(h5fd.trace_driver, filename_encode(trace_file))
 
 
 _drivers = {
     'sec2': lambda plist, **kwargs: plist.set_fapl_sec2(**kwargs),
     'stdio': lambda plist, **kwargs: plist.set_fapl_stdio(**kwargs),
-    'core': lambda plist, **kwargs: plist.set_fapl_core(**kwargs),
+    'core': _set_fapl_core,
     'family': lambda plist, **kwargs: plist.set_fapl_family(
         memb_fapl=plist.copy(),
         **kwargs
@@ -93,13 +134,19 @@ def unregister_driver(name):
     del _drivers[name]
 
 
+register_driver('mmap', _set_fapl_mmap)
+register_driver('trace', _set_fapl_trace)
+register_driver('ranged', _set_fapl_ranged)
+
+
 def registered_drivers():
     """Return a frozenset of the names of all of the registered drivers.
     """
     return frozenset(_drivers)
 
 
-def make_fapl(driver, libver, rdcc_nslots, rdcc_nbytes, rdcc_w0, **kwds):
+def make_fapl(driver, libver, rdcc_nslots, rdcc_nbytes, rdcc_w0,
+              page_buf_size=None, min_meta_perc=0, min_raw_perc=0, **kwds):
     """ Set up a file access property list """
     plist = h5p.create(h5p.FILE_ACCESS)
 
@@ -123,6 +170,12 @@ def make_fapl(driver, libver, rdcc_nslots, rdcc_nbytes, rdcc_w0, **kwds):
         cache_settings[3] = rdcc_w0
     plist.set_cache(*cache_settings)
 
+    if page_buf_size:
+        plist.set_page_buffer_size(int(page_buf_size), int(min_meta_perc),
+                                   int(min_raw_perc))
+    elif min_meta_perc or min_raw_perc:
+        raise ValueError("min_meta_perc and min_raw_perc require page_buf_size")
+
     if driver is None or (driver == 'windows' and sys.platform == 'win32'):
         # Prevent swallowing unused key arguments
         if kwds:
@@ -141,9 +194,10 @@ def make_fapl(driver, libver, rdcc_nslots, rdcc_nbytes, rdcc_w0, **kwds):
     return plist
 
 
-def make_fcpl(track_order=False, fs_strategy=None, fs_persist=False, fs_threshold=1):
+def make_fcpl(track_order=False, fs_strategy=None, fs_persist=False,
+              fs_threshold=1, fs_page_size=None):
     """ Set up a file creation property list """
-    if track_order or fs_strategy:
+    if track_order or fs_strategy or fs_page_size:
         plist = h5p.create(h5p.FILE_CREATE)
         if track_order:
             plist.set_link_creation_order(
@@ -162,11 +216,62 @@ def make_fcpl(track_order=False, fs_strategy=None, fs_persist=False, fs_threshol
                 raise ValueError("Invalid file space strategy type")
 
             plist.set_file_space_strategy(fs_strat_num, fs_persist, fs_threshold)
+        if fs_page_size:
+            plist.set_file_space_page_size(int(fs_page_size))
     else:
         plist = None
     return plist
 
 
+def _keep_metadata(plist):
+    """ Stop the metadata cache of files opened with a file access property
+    list evicting anything, so all metadata read stays in memory.
+    """
+    config = plist.get_mdc_config()
+    config.evictions_enabled = False
+    # The cache can't resize itself without evicting
+    config.incr_mode = h5ac.INCR_OFF
+    config.flash_incr_mode = h5ac.FLASH_INCR_OFF
+    config.decr_mode = h5ac.DECR_OFF
+    plist.set_mdc_config(config)
+
+
+def _load_attrs(oid):
+    """ Read the value of each attribute of an object, for the metadata """
+    for i in range(h5a.get_num_attrs(oid)):
+        attr = h5a.open(oid, index=i)
+        if attr.get_space().get_simple_extent_type() == h5s.NULL:
+            continue
+        dtype = attr.dtype
+        shape = attr.shape
+        try:
+            htype = h5t.py_create(dtype)
+        except TypeError:
+            continue  # Opening the attribute read its message
+        if dtype.subdtype is not None:
+            shape = shape + dtype.subdtype[1]
+            dtype = dtype.subdtype[0]
+        attr.read(numpy.ndarray(shape, dtype=dtype), mtype=htype)
+
+
+def _preload_metadata(fid):
+    """ Read all the metadata of a file into its metadata cache: the header
+    and attributes of every object reached by hard links, the storage of the
+    links in each group and the chunk index of each chunked dataset.
+
+    Use with _keep_metadata(), so none of it is evicted again.
+    """
+    def load(name):
+        oid = h5o.open(fid, name)
+        _load_attrs(oid)
+        if (isinstance(oid, h5d.DatasetID) and hasattr(oid, 'get_num_chunks')
+                and oid.get_create_plist().get_layout() == h5d.CHUNKED):
+            oid.get_num_chunks()  # Visits the whole index
+
+    load(b'.')
+    h5o.visit(fid, load)
+
+
 def make_fid(name, mode, userblock_size, fapl, fcpl=None, swmr=False):
     """ Get a new FileID by opening or creating a file.
     Also validates mode argument."""
@@ -223,6 +328,8 @@ class File(Group):
         Represents an HDF5 file.
     """
 
+    _attr_cache_release = None
+
     @property
     def attrs(self):
         """ Attributes attached to this object """
@@ -249,7 +356,10 @@ class File(Group):
                    h5fd.WINDOWS: 'windows',
                    h5fd.MPIO: 'mpio',
                    h5fd.MPIPOSIX: 'mpiposix',
-                   h5fd.fileobj_driver: 'fileobj'}
+                   h5fd.fileobj_driver: 'fileobj',
+                   h5fd.mmap_driver: 'mmap',
+                   h5fd.trace_driver: 'trace',
+                   h5fd.ranged_driver: 'ranged'}
         return drivers.get(self.id.get_access_plist().get_driver(), 'unknown')
 
     @property
@@ -312,7 +422,10 @@ class File(Group):
                  libver=None, userblock_size=None, swmr=False,
                  rdcc_nslots=None, rdcc_nbytes=None, rdcc_w0=None,
                  track_order=None, fs_strategy=None, fs_persist=False, fs_threshold=1,
-                 **kwds):
+                 fs_page_size=None, page_buf_size=None, min_meta_perc=0, min_raw_perc=0,
+                 io_stats=False, metadata_preload=False, handle_cache=0,
+                 attr_cache_bytes=0, shared_chunk_cache=False, mdc=None,
+                 mdc_autotune=False, **kwds):
         """Create a new file object.
 
         See the h5py user guide for a detailed explanation of the options.
@@ -382,19 +495,72 @@ class File(Group):
             The smallest free-space section size that the free space manager
             will track.  Only allowed when creating a new file.  The default
             value is 1.
+        fs_page_size
+            File space page size in bytes.  Only used when fs_strategy="page".
+            If None use the HDF5 default (4096 bytes).
+        page_buf_size
+            Page buffer size in bytes.  Only allowed for HDF5 files created
+            with fs_strategy="page".  Must be a power of two value and greater
+            or equal than the file space page size when creating the file.  It
+            is not used by default.
+        min_meta_perc
+            Minimum percentage of metadata to keep in the page buffer before
+            allowing pages containing metadata to be evicted.  Applicable only
+            if page_buf_size is set.  Default value is zero.
+        min_raw_perc
+            Minimum percentage of raw data to keep in the page buffer before
+            allowing pages containing raw data to be evicted.  Applicable only
+            if page_buf_size is set.  Default value is zero.
+        io_stats
+            Collect I/O statistics for the datasets in this file, available
+            from Dataset.io_stats() and File.io_stats().  Default False.
+        metadata_preload
+            Read all the metadata of the file (object headers, attributes,
+            group links and chunk indexes) into memory when it is opened, and
+            keep it there, so later lookups don't read the file.  Only for
+            mode 'r'.  Default False.
+        handle_cache
+            Number of objects looked up by name (e.g. f['a/b']) to keep open,
+            so that looking them up again returns the same object without
+            reading the file.  Only for mode 'r'.  Default 0 (disabled).
+        attr_cache_bytes
+            Keep the values of attributes read from this file, up to this
+            many bytes, so that reading them again doesn't read the file.
+            Only for mode 'r'.  Default 0 (disabled).
+        shared_chunk_cache
+            Keep the chunks read from datasets in this file in the cache
+            shared by all such files (see h5py.chunkcache), rather than a
+            cache for each dataset.  Unless rdcc_nbytes is given, HDF5's own
+            chunk caches are disabled.  Only for mode 'r'.  Default False.
+        mdc
+            Metadata cache settings: 'small' (little memory), 'bulk_read'
+            (reading or walking many objects), 'bulk_write' (creating many
+            objects), or a dict of h5ac.CacheConfig fields.  Default is
+            HDF5's default configuration.
+        mdc_autotune
+            Grow the metadata cache while its hit rate is below a target:
+            True for a target of 0.95, or the target as a float.  See
+            File.metadata_cache.autotune().  Default False.
         Additional keywords
             Passed on to the selected file driver.
 
         """
-        if fs_strategy and hdf5_version < (1, 10, 1):
-            raise ValueError("HDF version 1.10.1 or greater required for file space strategy support.")
+        if (fs_strategy or page_buf_size) and hdf5_version < (1, 10, 1):
+            raise ValueError("HDF version 1.10.1 or greater required for file space strategy "
+                             "and page buffering support.")
 
         if swmr and not swmr_support:
             raise ValueError("The SWMR feature is not available in this version of the HDF5 library")
 
+        if metadata_preload and (mdc is not None or mdc_autotune):
+            raise ValueError("metadata_preload can't be combined with other "
+                             "metadata cache settings")
+
         if isinstance(name, _objects.ObjectID):
-            if fs_strategy:
+            if fs_strategy or fs_page_size:
                 raise ValueError("Unable to set file space strategy of an existing file")
+            if metadata_preload:
+                raise ValueError("Unable to preload metadata of a file which is already open")
 
             with phil:
                 fid = h5i.get_file_id(name)
@@ -416,15 +582,36 @@ class File(Group):
             if mode is None:
                 mode = h5.get_config().default_file_mode  # default: 'r'
 
-            if fs_strategy and mode not in ('w', 'w-', 'x'):
+            if (fs_strategy or fs_page_size) and mode not in ('w', 'w-', 'x'):
                 raise ValueError("Unable to set file space strategy of an existing file")
+            if metadata_preload and mode != 'r':
+                raise ValueError("metadata_preload is only supported in mode 'r'")
+            if handle_cache and mode != 'r':
+                raise ValueError("handle_cache is only supported in mode 'r'")
+            if attr_cache_bytes and mode != 'r':
+                raise ValueError("attr_cache_bytes is only supported in mode 'r'")
+            if shared_chunk_cache:
+                if mode != 'r':
+                    raise ValueError("shared_chunk_cache is only supported in mode 'r'")
+                if rdcc_nbytes is None:
+                    rdcc_nbytes = 0
 
             with phil:
-                fapl = make_fapl(driver, libver, rdcc_nslots, rdcc_nbytes, rdcc_w0, **kwds)
+                fapl = make_fapl(driver, libver, rdcc_nslots, rdcc_nbytes, rdcc_w0,
+                                 page_buf_size, min_meta_perc, min_raw_perc, **kwds)
+                if metadata_preload:
+                    _keep_metadata(fapl)
                 fid = make_fid(name, mode, userblock_size,
                                fapl, fcpl=make_fcpl(track_order=track_order, fs_strategy=fs_strategy,
-                               fs_persist=fs_persist, fs_threshold=fs_threshold),
+                               fs_persist=fs_persist, fs_threshold=fs_threshold,
+                               fs_page_size=fs_page_size),
                                swmr=swmr)
+                if metadata_preload:
+                    try:
+                        _preload_metadata(fid)
+                    except Exception:
+                        fid.close()
+                        raise
 
             if isinstance(libver, tuple):
                 self._libver = libver
@@ -433,11 +620,68 @@ class File(Group):
 
         super(File, self).__init__(fid)
 
+        if handle_cache:
+            if self.mode != 'r':
+                raise ValueError("handle_cache is only supported in mode 'r'")
+            self._handle_cache = HandleCache(handle_cache)
+
+        if mdc is not None or mdc_autotune:
+            with phil:
+                if mdc is not None:
+                    self.metadata_cache.configure(mdc)
+                if mdc_autotune:
+                    target = 0.95 if mdc_autotune is True else mdc_autotune
+                    self.metadata_cache.autotune(target)
+
+        if shared_chunk_cache:
+            if self.mode != 'r':
+                raise ValueError("shared_chunk_cache is only supported in mode 'r'")
+            with phil:
+                chunkcache.register(self.id)
+
+        if attr_cache_bytes:
+            if self.mode != 'r':
+                raise ValueError("attr_cache_bytes is only supported in mode 'r'")
+            with phil:
+                self._attr_cache_release = attrcache.register(self, attr_cache_bytes)
+
+        if io_stats:
+            with phil:
+                iostats.register(self.id)
+
+    @classmethod
+    def from_buffer(cls, buf, mode='r', rdcc_nslots=None, rdcc_nbytes=None,
+                    rdcc_w0=None, io_stats=False):
+        """Open the HDF5 file image held in an object supporting the buffer
+        protocol, such as bytes, a NumPy array, an mmap or shared memory.
+
+        HDF5 reads from the buffer directly rather than a copy of it, so the
+        object can't be resized or closed while the file is open.  Only
+        mode 'r' (read-only) is supported.  The other keywords are as for
+        File.
+        """
+        if mode != 'r':
+            raise ValueError("Files in buffers can only be opened read-only (mode 'r')")
+        with phil:
+            fapl = make_fapl(None, None, rdcc_nslots, rdcc_nbytes, rdcc_w0)
+            fapl.set_fapl_core(backing_store=False)
+            h5fd.set_image_callbacks(fapl, buf)
+            name = b'h5py-buffer-%d' % next(_buffer_names)
+            fid = h5f.open(name, h5f.ACC_RDONLY, fapl=fapl)
+        return cls(fid, io_stats=io_stats)
+
     def close(self):
         """ Close the file.  All open objects become invalid """
         with phil:
             # Check that the file is still open, otherwise skip
             if self.id.valid:
+                iostats.unregister(self.id)
+                if self._attr_cache_release is not None:
+                    self._attr_cache_release()
+                chunkcache.unregister(self.id)
+                if self._handle_cache is not None:
+                    self._handle_cache.clear()
+
                 # We have to explicitly murder all open objects related to the file
 
                 # Close file-resident objects first, then the files.
@@ -463,7 +707,56 @@ class File(Group):
         """ Tell the HDF5 library to flush its buffers.
         """
         with phil:
-            h5f.flush(self.id)
+            iostats.measure_flush(self.id, h5f.flush, self.id)
+
+    def to_buffer(self):
+        """Return the image of a file opened with the core driver as a
+        read-only memoryview, flushing it first.
+
+        This is a view of the driver's memory rather than a copy, unless the
+        file was opened with a file access property list set up outside
+        h5py.  It keeps its contents if the file is then changed or closed.
+        """
+        with phil:
+            if self.driver != 'core':
+                raise ValueError("Only files opened with the core driver can be "
+                                 "returned as a buffer")
+            if self.mode == 'r+':
+                self.flush()
+            view = h5fd.get_core_image(self.id)
+            if view is None:
+                view = memoryview(self.id.get_file_image())
+            return view
+
+    @property
+    def metadata_cache(self):
+        """ The metadata cache of this file (a MetadataCache object), giving
+        its hit rate and size, and changing its settings.
+        """
+        return MetadataCache(self.id)
+
+    @property
+    def handle_cache(self):
+        """ The HandleCache of a file opened with ``handle_cache=N``, with
+        its hit and miss counters, or None.
+        """
+        return self._handle_cache
+
+    @property
+    @with_phil
+    def attr_cache(self):
+        """ The AttributeCache of a file opened with ``attr_cache_bytes``,
+        with its hit and miss counters, or None.
+        """
+        return attrcache.get_cache(self.id)
+
+    @with_phil
+    def io_stats(self, reset=False):
+        """ I/O statistics summed over the datasets of this file, which
+        must have been opened with ``io_stats=True``.  This includes chunks
+        compressed by flush().  See Dataset.io_stats() for the contents.
+        """
+        return iostats.file_stats(self, reset)
 
     @with_phil
     def __enter__(self):
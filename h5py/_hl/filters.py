@@ -48,11 +48,13 @@ from .. import h5z, h5p, h5d, h5f
 _COMP_FILTERS = {'gzip': h5z.FILTER_DEFLATE,
                 'szip': h5z.FILTER_SZIP,
                 'lzf': h5z.FILTER_LZF,
+                'bslz4': h5z.FILTER_BSLZ4,
                 'shuffle': h5z.FILTER_SHUFFLE,
                 'fletcher32': h5z.FILTER_FLETCHER32,
                 'scaleoffset': h5z.FILTER_SCALEOFFSET }
 
 DEFAULT_GZIP = 4
+BSLZ4_COMPRESS_LZ4 = 2  # Compression setting of the bitshuffle filter
 DEFAULT_SZIP = ('nn', 8)
 
 def _gen_filter_tuples():
@@ -136,9 +138,13 @@ class Gzip(FilterRefBase):
     def __init__(self, level=DEFAULT_GZIP):
         self.filter_options = (level,)
 
+def _is_auto(chunks):
+    """ Check for chunks='auto' """
+    return isinstance(chunks, str) and chunks == 'auto'
+
 def fill_dcpl(plist, shape, dtype, chunks, compression, compression_opts,
               shuffle, fletcher32, maxshape, scaleoffset, external,
-              allow_unknown_filter=False):
+              allow_unknown_filter=False, access=None, cache_bytes=None):
     """ Generate a dataset creation property list.
 
     Undocumented and subject to change without warning.
@@ -147,7 +153,7 @@ def fill_dcpl(plist, shape, dtype, chunks, compression, compression_opts,
     if shape is None or shape == ():
         shapetype = 'Empty' if shape is None else 'Scalar'
         if any((chunks, compression, compression_opts, shuffle, fletcher32,
-                scaleoffset is not None)):
+                scaleoffset is not None, access is not None)):
             raise TypeError(
                 f"{shapetype} datasets don't support chunk/filter options"
             )
@@ -157,7 +163,7 @@ def fill_dcpl(plist, shape, dtype, chunks, compression, compression_opts,
 
     def rq_tuple(tpl, name):
         """ Check if chunks/maxshape match dataset rank """
-        if tpl in (None, True):
+        if tpl is None or tpl is True or _is_auto(tpl):
             return
         try:
             tpl = tuple(tpl)
@@ -189,6 +195,20 @@ def fill_dcpl(plist, shape, dtype, chunks, compression, compression_opts,
             if compression_opts is not None:
                 raise ValueError("LZF compression filter accepts no options")
 
+        elif compression == 'bslz4':
+            # Block size in elements; 0 picks the default
+            if compression_opts is None:
+                compression_opts = 0
+            else:
+                try:
+                    block_size = operator.index(compression_opts)
+                except TypeError:
+                    block_size = -1
+                if block_size < 0 or block_size % 8 != 0:
+                    raise ValueError("Bitshuffle block size must be a non-negative "
+                                     "multiple of 8, not %r" % compression_opts)
+                compression_opts = block_size
+
         elif compression == 'szip':
             if compression_opts is None:
                 compression_opts = DEFAULT_SZIP
@@ -237,7 +257,16 @@ def fill_dcpl(plist, shape, dtype, chunks, compression, compression_opts,
     external = _normalize_external(external)
     # End argument validation
 
-    if (chunks is True) or \
+    if access is not None or cache_bytes is not None:
+        if chunks is None:
+            chunks = 'auto'
+        elif not _is_auto(chunks):
+            raise TypeError('"access" and "cache_bytes" require chunks="auto"')
+
+    if _is_auto(chunks):
+        chunks = guess_chunk_access(shape, maxshape, dtype.itemsize, access,
+                                    cache_bytes)
+    elif (chunks is True) or \
     (chunks is None and any((shuffle, fletcher32, compression, maxshape,
                              scaleoffset is not None))):
         chunks = guess_chunk(shape, maxshape, dtype.itemsize)
@@ -266,6 +295,9 @@ def fill_dcpl(plist, shape, dtype, chunks, compression, compression_opts,
         plist.set_deflate(gzip_level)
     elif compression == 'lzf':
         plist.set_filter(h5z.FILTER_LZF, h5z.FLAG_OPTIONAL)
+    elif compression == 'bslz4':
+        plist.set_filter(h5z.FILTER_BSLZ4, h5z.FLAG_OPTIONAL,
+                         (compression_opts, BSLZ4_COMPRESS_LZ4))
     elif compression == 'szip':
         opts = {'ec': h5z.SZIP_EC_OPTION_MASK, 'nn': h5z.SZIP_NN_OPTION_MASK}
         plist.set_szip(opts[szmethod], szpix)
@@ -316,6 +348,9 @@ def get_filters(plist):
             vals = (mask, pixels)
         elif code == h5z.FILTER_LZF:
             vals = None
+        elif code == h5z.FILTER_BSLZ4 and len(vals) > 4 and vals[4] == BSLZ4_COMPRESS_LZ4:
+            pipeline['bslz4'] = vals[3]  # block size
+            continue
         else:
             if len(vals) == 0:
                 vals = None
@@ -328,6 +363,19 @@ CHUNK_BASE = 16*1024    # Multiplier by which chunks are adjusted
 CHUNK_MIN = 8*1024      # Soft lower limit (8k)
 CHUNK_MAX = 1024*1024   # Hard upper limit (1M)
 
+def _chunk_target(shape, typesize):
+    """ Optimal chunk size in bytes for a dataset, as a float, using a
+    PyTables expression.
+    """
+    dset_size = np.product(np.asarray(shape, dtype='=f8'))*typesize
+    target_size = CHUNK_BASE * (2**np.log10(dset_size/(1024.*1024)))
+
+    if target_size > CHUNK_MAX:
+        target_size = CHUNK_MAX
+    elif target_size < CHUNK_MIN:
+        target_size = CHUNK_MIN
+    return target_size
+
 def guess_chunk(shape, maxshape, typesize):
     """ Guess an appropriate chunk layout for a dataset, given its shape and
     the size of each element in bytes.  Will allocate chunks only as large
@@ -349,15 +397,7 @@ def guess_chunk(shape, maxshape, typesize):
     if not np.all(np.isfinite(chunks)):
         raise ValueError("Illegal value in chunk tuple")
 
-    # Determine the optimal chunk size in bytes using a PyTables expression.
-    # This is kept as a float.
-    dset_size = np.product(chunks)*typesize
-    target_size = CHUNK_BASE * (2**np.log10(dset_size/(1024.*1024)))
-
-    if target_size > CHUNK_MAX:
-        target_size = CHUNK_MAX
-    elif target_size < CHUNK_MIN:
-        target_size = CHUNK_MIN
+    target_size = _chunk_target(chunks, typesize)
 
     idx = 0
     while True:
@@ -380,3 +420,135 @@ def guess_chunk(shape, maxshape, typesize):
         idx += 1
 
     return tuple(int(x) for x in chunks)
+
+ACCESS_PATTERNS = ('rows', 'columns', 'planes')
+
+def _access_weights(access, ndims):
+    """ Normalize an access pattern into a dict mapping tuples of axes, read
+    in full together, to relative weights.
+    """
+    if isinstance(access, str):
+        if access == 'rows':
+            return {(ndims-1,): 1}
+        if access == 'columns':
+            return {(0,): 1}
+        if access == 'planes':
+            return {tuple(range(max(ndims-2, 0), ndims)): 1}
+        raise ValueError("access must be one of %s or a dict of axis weights, not %r"
+                         % (ACCESS_PATTERNS, access))
+
+    if not isinstance(access, Mapping):
+        raise TypeError("access must be a string or a dict of axis weights")
+    weights = {}
+    for axes, weight in access.items():
+        if not isinstance(axes, tuple):
+            axes = (axes,)
+        norm = []
+        for axis in axes:
+            axis = operator.index(axis)
+            if not -ndims <= axis < ndims:
+                raise ValueError("Axis %d out of range for %d dimensions" % (axis, ndims))
+            norm.append(axis % ndims)
+        if weight < 0:
+            raise ValueError("Access weights must not be negative")
+        if weight > 0:
+            key = tuple(sorted(set(norm)))
+            weights[key] = weights.get(key, 0) + weight
+    if not weights:
+        raise ValueError("access must give a positive weight to at least one axis")
+    return weights
+
+def guess_chunk_access(shape, maxshape, typesize, access, cache_bytes=None):
+    """ Guess a chunk layout for a dataset which will mostly be read in the
+    given pattern: 'rows' (along the last axis), 'columns' (along the first
+    axis), 'planes' (the last two axes) or a dict of relative weights keyed
+    by axis, or tuple of axes read together.
+
+    Axes not read in full are shrunk first, to reach the same target chunk
+    size as guess_chunk and so that the chunks touched by one read fit in
+    cache_bytes.  The axes which are read are then only halved as far as
+    needed to keep chunks within CHUNK_MAX and cache_bytes, picking at each
+    step the axis which least increases the (weighted) number of chunks a
+    read touches.
+
+    Undocumented and subject to change without warning.
+    """
+    if access is None:
+        return guess_chunk(shape, maxshape, typesize)
+
+    # For unlimited dimensions we have to guess 1024
+    shape = tuple((x if x!=0 else 1024) for x in shape)
+
+    ndims = len(shape)
+    if ndims == 0:
+        raise ValueError("Chunks not allowed for scalar datasets.")
+
+    weights = _access_weights(access, ndims)
+    read_axes = set(ax for axes in weights for ax in axes)
+
+    target_size = _chunk_target(shape, typesize)
+    max_size = CHUNK_MAX
+    if cache_bytes is not None:
+        # Chunks bigger than the cache bypass it
+        max_size = min(max_size, max(cache_bytes, CHUNK_MIN))
+        target_size = min(target_size, max_size)
+
+    def touched(chunks):
+        """ Chunks touched by each kind of read """
+        return {axes: np.prod([-(-shape[ax] // chunks[ax]) for ax in axes])
+                for axes in weights}
+
+    def cost(chunks):
+        return sum(weights[axes]*n for axes, n in touched(chunks).items())
+
+    chunks = list(shape)
+    while True:
+        chunk_bytes = np.prod(chunks)*typesize
+        over_cache = cache_bytes is not None and \
+            max(touched(chunks).values())*chunk_bytes > cache_bytes
+
+        # Halve the largest axis which isn't read in full, earliest first
+        free = [ax for ax in range(ndims) if ax not in read_axes and chunks[ax] > 1]
+        if free and (chunk_bytes > target_size or over_cache):
+            ax = max(free, key=lambda a: chunks[a])
+        elif chunk_bytes > max_size:
+            candidates = [ax for ax in sorted(read_axes) if chunks[ax] > 1]
+            if not candidates:
+                break  # Element size larger than CHUNK_MAX
+
+            def halved_cost(a):
+                trial = list(chunks)
+                trial[a] = -(-trial[a] // 2)
+                return cost(trial)
+            ax = min(candidates, key=halved_cost)
+        else:
+            break
+
+        chunks[ax] = -(-chunks[ax] // 2)
+
+    return tuple(int(x) for x in chunks)
+
+def _next_prime(n):
+    """ Smallest prime >= n """
+    n = max(int(n), 2)
+    while True:
+        if n == 2 or (n % 2 and all(n % d for d in range(3, int(n**0.5) + 1, 2))):
+            return n
+        n += 1
+
+def chunk_cache_for_access(shape, chunks, typesize, access):
+    """ Chunk cache settings (nslots, nbytes) which hold every chunk touched
+    by one read in the given pattern (as for guess_chunk_access), e.g. one
+    full row of chunks for 'rows'.
+
+    nslots is a prime about 100 times the number of chunks which fit, as
+    the HDF5 documentation recommends.
+
+    Undocumented and subject to change without warning.
+    """
+    ndims = len(shape)
+    weights = _access_weights(access, ndims)
+    nchunks = max(int(np.prod([max(-(-shape[ax] // chunks[ax]), 1) for ax in axes]))
+                  for axes in weights)
+    nbytes = nchunks * int(np.prod(chunks)) * typesize
+    return _next_prime(100 * nchunks), nbytes
@@ -86,14 +86,22 @@ class Group(HLObject, MutableMappingHDF5):
 
         chunks
             (Tuple or int) Chunk shape, or True to enable auto-chunking. Integers can
-            be used for 1D shape.
+            be used for 1D shape. Use 'auto' to pick a shape suited to "access".
+        access
+            How the data will mostly be read, for chunks='auto': 'rows' (along
+            the last axis), 'columns' (along the first axis), 'planes' (the
+            last two axes), or a dict of relative weights keyed by axis, or by
+            tuples of axes read together.
+        cache_bytes
+            (Integer) Chunk cache size the automatic chunk shape should fit
+            in. Defaults to the file's chunk cache size.
 
         maxshape
             (Tuple or int) Make the dataset resizable up to this shape. Use None for
             axes you want to be unlimited. Integers can be used for 1D shape.
         compression
             (String or int) Compression strategy.  Legal values are 'gzip',
-            'szip', 'lzf'.  If an integer in range(10), this indicates gzip
+            'szip', 'lzf', 'bslz4'.  If an integer in range(10), this indicates gzip
             compression level. Otherwise, an integer indicates the number of a
             dynamically loaded compression filter.
         compression_opts
@@ -194,22 +202,31 @@ class Group(HLObject, MutableMappingHDF5):
 
             return dset
 
-    def require_dataset(self, name, shape, dtype, exact=False, **kwds):
+    def require_dataset(self, name, shape, dtype, exact=False, *,
+                        rdcc_nbytes=None, rdcc_nslots=None, rdcc_w0=None, **kwds):
         """ Open a dataset, creating it if it doesn't exist.
 
         If keyword "exact" is False (default), an existing dataset must have
         the same shape and a conversion-compatible dtype to be returned.  If
         True, the shape and dtype must match exactly.
 
+        The chunk cache settings "rdcc_nbytes", "rdcc_nslots" and "rdcc_w0"
+        are applied to the dataset whether or not it is created (see
+        Dataset.set_cache).
+
         Other dataset keywords (see create_dataset) may be provided, but are
         only used if a new dataset is to be created.
 
         Raises TypeError if an incompatible object already exists, or if the
         shape or dtype don't match according to the above rules.
         """
+        cache = (rdcc_nbytes, rdcc_nslots, rdcc_w0)
         with phil:
             if not name in self:
-                return self.create_dataset(name, *(shape, dtype), **kwds)
+                dset = self.create_dataset(name, *(shape, dtype), **kwds)
+                if cache != (None,)*3:
+                    dset.set_cache(*cache)
+                return dset
 
             if isinstance(shape, int):
                 shape = (shape,)
@@ -227,6 +244,8 @@ class Group(HLObject, MutableMappingHDF5):
             elif not numpy.can_cast(dtype, dset.dtype):
                 raise TypeError("Datatypes cannot be safely cast (existing %s vs new %s)" % (dset.dtype, dtype))
 
+            if cache != (None,)*3:
+                dset.set_cache(*cache)
             return dset
 
     def create_dataset_like(self, name, other, **kwupdate):
@@ -284,9 +303,21 @@ class Group(HLObject, MutableMappingHDF5):
             oid = h5r.dereference(name, self.id)
             if oid is None:
                 raise ValueError("Invalid HDF5 object reference")
-        else:
-            oid = h5o.open(self.id, self._e(name), lapl=self._lapl)
+            return self._wrap(oid)
+
+        cache = self._handle_cache
+        if cache is None:
+            return self._wrap(h5o.open(self.id, self._e(name), lapl=self._lapl))
 
+        key = cache.key(self, name)
+        obj = cache.get(key)
+        if obj is None:
+            obj = self._wrap(h5o.open(self.id, self._e(name), lapl=self._lapl))
+            cache.put(key, obj)
+        return obj
+
+    def _wrap(self, oid):
+        """ Make the high-level object for an ObjectID opened from this group """
         otype = h5i.get_type(oid)
         if otype == h5i.GROUP:
             return Group(oid)
@@ -297,12 +328,17 @@ class Group(HLObject, MutableMappingHDF5):
         else:
             raise TypeError("Unknown object type")
 
-    def get(self, name, default=None, getclass=False, getlink=False):
+    def get(self, name, default=None, getclass=False, getlink=False, *,
+            rdcc_nbytes=None, rdcc_nslots=None, rdcc_w0=None, access=None):
         """ Retrieve an item or other information.
 
         "name" given only:
             Return the item, or "default" if it doesn't exist
 
+        "rdcc_nbytes", "rdcc_nslots", "rdcc_w0" or "access" given:
+            Open a dataset with its own chunk cache settings (see
+            Dataset.set_cache).  Return "default" if it doesn't exist.
+
         "getclass" is True:
             Return the class of object (Group, Dataset, etc.), or "default"
             if nothing with that name exists
@@ -325,9 +361,14 @@ class Group(HLObject, MutableMappingHDF5):
         with phil:
             if not (getclass or getlink):
                 try:
-                    return self[name]
+                    obj = self[name]
                 except KeyError:
                     return default
+                if (rdcc_nbytes, rdcc_nslots, rdcc_w0, access) != (None,)*4:
+                    if not isinstance(obj, dataset.Dataset):
+                        raise TypeError("Chunk cache settings only apply to datasets")
+                    obj.set_cache(rdcc_nbytes, rdcc_nslots, rdcc_w0, access)
+                return obj
 
             if not name in self:
                 return default
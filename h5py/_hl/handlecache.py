@@ -0,0 +1,98 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2020 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Cache of objects opened by path in read-only files.
+
+    Opening an object by name costs a path lookup in HDF5 and a new
+    identifier and wrapper object in h5py, which also loses anything the
+    previous wrapper had cached (e.g. a dataset's shape and fast reader).
+    Files opened with handle_cache=N keep the N objects looked up most
+    recently through Group.__getitem__, by path, and return them again.
+"""
+
+from collections import OrderedDict
+
+
+class HandleCache(object):
+
+    """ LRU cache of open objects in a file, by path.
+
+    Counters:
+
+    hits, misses
+        Lookups answered from the cache, and lookups which opened the
+        object.
+    """
+
+    def __init__(self, maxsize):
+        if maxsize < 1:
+            raise ValueError("The handle cache size must be at least 1")
+        self.maxsize = int(maxsize)
+        self._objects = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __repr__(self):
+        return "<HandleCache: %d of %d objects, %d hits, %d misses>" % (
+            len(self._objects), self.maxsize, self.hits, self.misses)
+
+    @staticmethod
+    def key(group, name):
+        """ Path used as the key for name looked up in group """
+        if isinstance(name, bytes):
+            name = name.decode('utf-8', 'surrogateescape')
+        if name.startswith('/'):
+            return name
+        return group._cache_path + '/' + name
+
+    def get(self, key):
+        """ The object cached for key, or None """
+        obj = self._objects.get(key)
+        if obj is not None:
+            if obj.id.valid:
+                self._objects.move_to_end(key)
+                self.hits += 1
+                return obj
+            del self._objects[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, obj):
+        """ Cache an object opened from key, evicting the least recently
+        used ones if the cache is full.
+        """
+        obj._handle_cache = self
+        obj._cache_path = key
+        self._objects[key] = obj
+        self._objects.move_to_end(key)
+        while len(self._objects) > self.maxsize:
+            self._objects.popitem(last=False)
+
+    def discard(self, obj):
+        """ Remove all entries for an object """
+        for key in [k for k, v in self._objects.items() if v is obj]:
+            del self._objects[key]
+
+    def clear(self):
+        """ Empty the cache (the counters are kept) """
+        self._objects.clear()
+
+    def reset_stats(self):
+        """ Zero the hit and miss counters """
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """ The counters and the current and maximum sizes, as a dict """
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self._objects), 'maxsize': self.maxsize}
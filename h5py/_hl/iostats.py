@@ -0,0 +1,205 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2020 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Per-dataset I/O statistics, for files opened with io_stats=True.
+
+    Reads and writes of datasets in those files are timed, and the work done
+    by filters during each call (as counted by h5z.get_filter_stats) is
+    attributed to the dataset.  Only filters implemented in h5py can be
+    counted; time spent in HDF5's own filters, in the file driver and in
+    type conversion is part of the read or write time.
+"""
+
+import functools
+import threading
+import time
+
+from .. import h5g, h5z
+from .filters import _COMP_FILTERS
+
+# Statistics for each profiled file, by file number
+_files = {}
+
+# Reads and writes may call each other (e.g. reading fields), so only the
+# outermost call on each thread is measured.
+_local = threading.local()
+
+_FILTER_NAMES = {code: name for name, code in _COMP_FILTERS.items()}
+
+
+def _snapshot():
+    return {(code, reverse): tuple(counts)
+            for code, reverse, *counts in h5z.get_filter_stats()}
+
+
+class _Stats(object):
+
+    """ Counters for one dataset, or for file flushes """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.reads = 0
+        self.writes = 0
+        self.read_time = 0.0
+        self.write_time = 0.0
+        self.filters = {}  # (code, reverse) -> [calls, bytes_in, bytes_out, seconds]
+
+    def add(self, kind, seconds, before, after):
+        if kind == 'read':
+            self.reads += 1
+            self.read_time += seconds
+        elif kind == 'write':
+            self.writes += 1
+            self.write_time += seconds
+        for key, counts in after.items():
+            old = before.get(key, (0, 0, 0, 0.0))
+            if counts[0] != old[0]:
+                total = self.filters.setdefault(key, [0, 0, 0, 0.0])
+                for i in range(4):
+                    total[i] += counts[i] - old[i]
+
+    def merge(self, other):
+        self.reads += other.reads
+        self.writes += other.writes
+        self.read_time += other.read_time
+        self.write_time += other.write_time
+        for key, counts in other.filters.items():
+            total = self.filters.setdefault(key, [0, 0, 0, 0.0])
+            for i in range(4):
+                total[i] += counts[i]
+
+    def as_dict(self):
+        filters = {}
+        for (code, reverse), (calls, bytes_in, bytes_out, seconds) in sorted(self.filters.items()):
+            name = _FILTER_NAMES.get(code, str(code))
+            if reverse:
+                entry = {'chunks': calls, 'raw_bytes': bytes_in,
+                         'decoded_bytes': bytes_out, 'time': seconds}
+            else:
+                entry = {'chunks': calls, 'raw_bytes': bytes_out,
+                         'decoded_bytes': bytes_in, 'time': seconds}
+            filters.setdefault(name, {})['decode' if reverse else 'encode'] = entry
+        return {'reads': self.reads, 'read_time': self.read_time,
+                'writes': self.writes, 'write_time': self.write_time,
+                'filters': filters}
+
+
+class _FileStats(object):
+
+    """ Counters for the datasets of one file """
+
+    def __init__(self):
+        self.datasets = {}  # objno -> _Stats
+        self.flushes = _Stats()
+
+
+def register(fid):
+    """ Start collecting statistics for an open file """
+    fileno = h5g.get_objinfo(fid).fileno
+    if fileno not in _files:
+        _files[fileno] = _FileStats()
+        h5z.set_filter_stats(True)
+
+
+def unregister(fid):
+    """ Forget the statistics of a file which is about to be closed """
+    if not _files:
+        return
+    if _files.pop(h5g.get_objinfo(fid).fileno, None) is not None and not _files:
+        h5z.set_filter_stats(False)
+
+
+def _file_entry(obj):
+    entry = _files.get(h5g.get_objinfo(obj.id).fileno)
+    if entry is None:
+        raise ValueError("I/O statistics are not enabled for this file "
+                         "(open it with io_stats=True)")
+    return entry
+
+
+def _measure(kind, stats_for, func, args, kwds):
+    if getattr(_local, 'active', False):
+        return func(*args, **kwds)
+    stats = stats_for()
+    if stats is None:
+        return func(*args, **kwds)
+
+    _local.active = True
+    before = _snapshot()
+    start = time.perf_counter()
+    try:
+        return func(*args, **kwds)
+    finally:
+        seconds = time.perf_counter() - start
+        _local.active = False
+        stats.add(kind, seconds, before, _snapshot())
+
+
+def measured(kind):
+    """ Decorator for Dataset methods which read ('read') or write ('write')
+    data, recording them if statistics are enabled for the file.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwds):
+            if not _files:
+                return func(self, *args, **kwds)
+
+            def stats_for():
+                info = h5g.get_objinfo(self.id)
+                entry = _files.get(info.fileno)
+                if entry is None:
+                    return None
+                return entry.datasets.setdefault(info.objno, _Stats())
+
+            return _measure(kind, stats_for, func, (self,) + args, kwds)
+        return wrapper
+    return decorator
+
+
+def measure_flush(fid, func, *args):
+    """ Call func(*args), attributing filter work to flushes of the file """
+    if not _files:
+        return func(*args)
+
+    def stats_for():
+        entry = _files.get(h5g.get_objinfo(fid).fileno)
+        return None if entry is None else entry.flushes
+
+    return _measure('flush', stats_for, func, args, {})
+
+
+def dataset_stats(dset, reset=False):
+    """ Statistics for one dataset, as a dict """
+    entry = _file_entry(dset)
+    objno = h5g.get_objinfo(dset.id).objno
+    stats = entry.datasets.get(objno)
+    if stats is None:
+        return _Stats().as_dict()
+    result = stats.as_dict()
+    if reset:
+        stats.clear()
+    return result
+
+
+def file_stats(f, reset=False):
+    """ Statistics summed over all datasets of a file, and its flushes """
+    entry = _file_entry(f)
+    total = _Stats()
+    for stats in entry.datasets.values():
+        total.merge(stats)
+    total.merge(entry.flushes)
+    result = total.as_dict()
+    if reset:
+        entry.datasets.clear()
+        entry.flushes.clear()
+    return result
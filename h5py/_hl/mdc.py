@@ -0,0 +1,181 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2020 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Metadata cache settings for File: presets, and a view of the cache.
+
+    The HDF5 metadata cache holds object headers, B-tree nodes, heaps and
+    other metadata.  Its configuration (h5ac.CacheConfig) has some thirty
+    fields; the presets here set the ones which matter for common workloads,
+    and autotune() sets up HDF5's adaptive resizing to grow the cache while
+    the hit rate is below a target.
+"""
+
+from .. import h5ac
+
+KiB = 1024
+MiB = 1024 * KiB
+
+# Largest size HDF5 allows for the metadata cache
+MAX_SIZE = 128 * MiB
+
+PRESETS = {
+    # Little memory, e.g. many files open at once
+    'small': {
+        'set_initial_size': True,
+        'initial_size': 256 * KiB,
+        'min_size': 128 * KiB,
+        'max_size': 1 * MiB,
+    },
+    # Walking or reading many objects: start large, grow quickly on misses
+    'bulk_read': {
+        'set_initial_size': True,
+        'initial_size': 16 * MiB,
+        'min_size': 4 * MiB,
+        'max_size': MAX_SIZE,
+        'epoch_length': 10000,
+        'lower_hr_threshold': 0.95,
+        'increment': 2.0,
+        'max_increment': 16 * MiB,
+        'flash_incr_mode': h5ac.FLASH_INCR_ADD_SPACE,
+    },
+    # Creating many objects: keep dirty metadata in memory, and don't shrink
+    'bulk_write': {
+        'set_initial_size': True,
+        'initial_size': 32 * MiB,
+        'min_size': 16 * MiB,
+        'max_size': MAX_SIZE,
+        'min_clean_fraction': 0.05,
+        'max_increment': 32 * MiB,
+        'decr_mode': h5ac.DECR_OFF,
+    },
+}
+
+
+def _fields():
+    return set(name for name in dir(h5ac.CacheConfig) if not name.startswith('_'))
+
+
+def apply_settings(config, mdc):
+    """ Update a CacheConfig from a preset name or a dict of CacheConfig
+    fields, returning it.
+    """
+    if isinstance(mdc, str):
+        try:
+            settings = PRESETS[mdc]
+        except KeyError:
+            raise ValueError("Unknown metadata cache preset %r (use one of %s)"
+                             % (mdc, ', '.join(sorted(PRESETS))))
+    else:
+        settings = dict(mdc)
+        unknown = set(settings) - _fields()
+        if unknown:
+            raise ValueError("Unknown metadata cache settings: %s"
+                             % ', '.join(sorted(unknown)))
+
+    for name, value in settings.items():
+        setattr(config, name, value)
+
+    # Keep the initial size within the limits
+    if not config.min_size <= config.initial_size <= config.max_size:
+        config.initial_size = min(max(config.initial_size, config.min_size), config.max_size)
+        config.set_initial_size = True
+    return config
+
+
+def apply_autotune(config, target=0.95, max_size=None):
+    """ Set a CacheConfig to grow the cache whenever the hit rate over an
+    epoch is below target, up to max_size, without shrinking it.
+    """
+    if not 0 < target <= 1:
+        raise ValueError("The target hit rate must be in (0, 1]")
+    if max_size is None:
+        max_size = MAX_SIZE
+    config.max_size = max_size
+    config.min_size = min(config.min_size, max_size)
+    config.initial_size = min(config.initial_size, max_size)
+    config.incr_mode = h5ac.INCR_THRESHOLD
+    config.lower_hr_threshold = target
+    config.increment = 2.0
+    config.apply_max_increment = True
+    config.max_increment = max(config.max_increment, 16 * MiB)
+    config.flash_incr_mode = h5ac.FLASH_INCR_ADD_SPACE
+    config.decr_mode = h5ac.DECR_OFF
+    config.epoch_length = min(config.epoch_length, 10000)
+    return config
+
+
+class MetadataCache(object):
+
+    """ The metadata cache of an open file.
+
+    Properties report its current state; configure() and autotune() change
+    its settings until the file is closed.
+    """
+
+    def __init__(self, fid):
+        self._fid = fid
+
+    def __repr__(self):
+        if not self._fid:
+            return "<Metadata cache of closed HDF5 file>"
+        return "<Metadata cache: %d of %d bytes, %d entries, hit rate %.3f>" % (
+            self.size, self.max_size, self.entries, self.hit_rate)
+
+    @property
+    def hit_rate(self):
+        """ Fraction of lookups found in the cache since the statistics were
+        last reset (0 if there were none)
+        """
+        return self._fid.get_mdc_hit_rate()
+
+    @property
+    def size(self):
+        """ Bytes of metadata in the cache """
+        return self._fid.get_mdc_size()[2]
+
+    @property
+    def max_size(self):
+        """ Current size limit of the cache, in bytes """
+        return self._fid.get_mdc_size()[0]
+
+    @property
+    def entries(self):
+        """ Number of entries in the cache """
+        return self._fid.get_mdc_size()[3]
+
+    @property
+    def config(self):
+        """ Current settings, as an h5ac.CacheConfig """
+        return self._fid.get_mdc_config()
+
+    def stats(self):
+        """ hit_rate, size, max_size and entries, as a dict """
+        max_size, _, size, entries = self._fid.get_mdc_size()
+        return {'hit_rate': self.hit_rate, 'size': size, 'max_size': max_size,
+                'entries': entries}
+
+    def reset_stats(self):
+        """ Reset the hit rate statistics """
+        self._fid.reset_mdc_hit_rate_stats()
+
+    def configure(self, mdc):
+        """ Apply a preset ('small', 'bulk_read' or 'bulk_write') or a dict
+        of h5ac.CacheConfig fields.
+        """
+        self._fid.set_mdc_config(apply_settings(self._fid.get_mdc_config(), mdc))
+
+    def autotune(self, target=0.95, max_size=None):
+        """ Let HDF5 grow the cache, doubling it whenever the hit rate over
+        an epoch of lookups is below target, up to max_size bytes (default
+        128 MiB, the largest HDF5 allows).  The cache is not shrunk again
+        while the file is open.
+        """
+        self._fid.set_mdc_config(apply_autotune(self._fid.get_mdc_config(),
+                                                target, max_size))
@@ -0,0 +1,379 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2020 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Reading HDF5 files from storage which only supports ranged reads.
+
+    RangedReader presents a fetch(offset, length) callable, such as a function
+    making HTTP range requests to a blob store, as a read-only file for the
+    'ranged' file driver.  Reads are answered from a cache of fixed-size
+    pages.  Missing pages are fetched in runs of adjacent pages, and when one
+    read needs several requests they are made at once from a pool of worker
+    threads.  The start of the file, which holds the superblock and usually
+    much of the metadata, is fetched when the reader is created, and while
+    the file is read sequentially the following pages are fetched in the
+    background.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import io
+import os
+import threading
+
+
+class FileBackend(object):
+
+    """ A fetch(offset, length) callable reading a local file, standing in
+    for a remote store in tests and benchmarks.
+
+    latency adds a delay (in seconds) to each request.  The number of
+    requests and bytes returned are counted in requests and nbytes.
+    """
+
+    def __init__(self, name, latency=0):
+        self._fd = os.open(name, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        self._lock = threading.Lock()
+        self.size = os.fstat(self._fd).st_size
+        self.latency = latency
+        self.requests = 0
+        self.nbytes = 0
+
+    def __call__(self, offset, length):
+        if self.latency:
+            threading.Event().wait(self.latency)
+        if hasattr(os, 'pread'):
+            data = os.pread(self._fd, length, offset)
+        else:
+            with self._lock:
+                os.lseek(self._fd, offset, os.SEEK_SET)
+                data = os.read(self._fd, length)
+        with self._lock:
+            self.requests += 1
+            self.nbytes += len(data)
+        return data
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class RangedReader(object):
+
+    """ Read-only file object over a fetch(offset, length) callable, for
+    the 'ranged' file driver.
+
+    fetch
+        Callable returning length bytes of the file from offset, as bytes
+        or another object supporting the buffer protocol.  It is called
+        from worker threads, so must be thread-safe.
+    size
+        Size of the file in bytes.  Default is fetch.size, if it exists.
+    page_size
+        Size in bytes of the pages fetched and cached.
+    cache_bytes
+        Maximum size of the page cache.  Reads larger than this bypass it.
+    max_request
+        Largest request to make, in bytes; longer runs of pages are split
+        into several requests, made concurrently.
+    max_workers
+        Number of worker threads making requests.  1 makes requests in turn
+        from the calling thread.
+    prefetch
+        Number of bytes from the start of the file to fetch immediately.
+    readahead
+        When reads are sequential, the number of bytes after each read to
+        start fetching in the background.  0 to disable.
+    """
+
+    def __init__(self, fetch, size=None, page_size=1 << 16, cache_bytes=1 << 26,
+                 max_request=1 << 23, max_workers=8, prefetch=1 << 20,
+                 readahead=1 << 22):
+        if size is None:
+            size = getattr(fetch, 'size', None)
+            if size is None:
+                raise TypeError("The size of the file must be given")
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self._fetch = fetch
+        self.size = int(size)
+        self.page_size = int(page_size)
+        self.cache_bytes = int(cache_bytes)
+        self.max_request = max(int(max_request), self.page_size)
+        self.max_workers = int(max_workers)
+        self.readahead = int(readahead)
+        self._max_pages = max(self.cache_bytes // self.page_size, 1)
+        self._pages = OrderedDict()
+        self._inflight = {}  # page: (future, run) for read-ahead requests
+        self._last_end = 0
+        self._lock = threading.RLock()
+        self._pool = None
+        self._pos = 0
+        self.closed = False
+        self.reset_stats()
+
+        if prefetch:
+            self.prefetch([(0, prefetch)])
+
+    def __repr__(self):
+        return "<RangedReader of %d bytes, %d of %d pages cached>" % (
+            self.size, len(self._pages), self._max_pages)
+
+    # Statistics
+
+    def reset_stats(self):
+        """ Zero the counters returned by stats() """
+        self.hits = 0
+        self.misses = 0
+        self.requests = 0
+        self.fetched_bytes = 0
+
+    def stats(self):
+        """ Page cache hits and misses, and requests made and bytes fetched
+        (including prefetching), as a dict.
+        """
+        return {'hits': self.hits, 'misses': self.misses,
+                'requests': self.requests, 'fetched_bytes': self.fetched_bytes}
+
+    # Fetching
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self.max_workers,
+                                            thread_name_prefix='h5py-ranged')
+        return self._pool
+
+    def _checked(self, request, data):
+        """ Count a completed request, returning its data as a memoryview """
+        offset, length = request
+        data = memoryview(data).cast('B')
+        if len(data) < length:
+            raise OSError("Fetched %d bytes at offset %d, expected %d"
+                          % (len(data), offset, length))
+        self.requests += 1
+        self.fetched_bytes += len(data)
+        return data[:length]
+
+    def _map(self, requests):
+        """ Make (offset, length) requests, returning a memoryview for each """
+        if len(requests) > 1 and self.max_workers > 1:
+            results = list(self._get_pool().map(lambda r: self._fetch(*r), requests))
+        else:
+            results = [self._fetch(*r) for r in requests]
+        return [self._checked(r, data) for r, data in zip(requests, results)]
+
+    def _runs(self, pages):
+        """ Group sorted page numbers into runs of adjacent pages, each at
+        most max_request long, as [first page, number of pages] lists.
+        """
+        per_request = self.max_request // self.page_size
+        runs = []
+        for p in pages:
+            if runs and runs[-1][0] + runs[-1][1] == p and runs[-1][1] < per_request:
+                runs[-1][1] += 1
+            else:
+                runs.append([p, 1])
+        return runs
+
+    def _request(self, run):
+        ps = self.page_size
+        return (run[0]*ps, min(run[1]*ps, self.size - run[0]*ps))
+
+    def _split(self, run, data):
+        ps = self.page_size
+        return {run[0] + i: bytes(data[i*ps:(i+1)*ps]) for i in range(run[1])}
+
+    def _fetch_pages(self, pages):
+        """ Fetch pages (a sorted list of page numbers), returning a dict of
+        page number: bytes.
+        """
+        runs = self._runs(pages)
+        fetched = {}
+        for run, data in zip(runs, self._map([self._request(r) for r in runs])):
+            fetched.update(self._split(run, data))
+        return fetched
+
+    def _store(self, fetched):
+        for p in sorted(fetched):
+            self._pages[p] = fetched[p]
+            self._pages.move_to_end(p)
+        while len(self._pages) > self._max_pages:
+            self._pages.popitem(last=False)
+
+    def _collect(self, wait_for=None):
+        """ Store the pages of finished read-ahead requests, first waiting
+        for the one fetching page wait_for, if given.  Returns the pages
+        stored.
+
+        Failed requests are dropped; the error is only raised if it was the
+        request for wait_for.
+        """
+        waiting = self._inflight.get(wait_for, (None,))[0]
+        runs = {}
+        for future, run in self._inflight.values():
+            if future is waiting or future.done():
+                runs[run[0]] = (future, run)
+        collected = {}
+        error = None
+        for future, run in runs.values():
+            for p in range(run[0], run[0] + run[1]):
+                del self._inflight[p]
+            try:
+                data = self._checked(self._request(run), future.result())
+            except Exception as e:
+                if future is waiting:
+                    error = e
+                continue
+            collected.update(self._split(run, data))
+        self._store(collected)
+        if error is not None:
+            raise error
+        return collected
+
+    def _read_ahead(self, last):
+        """ Start fetching the pages after page last in the background """
+        # Leave at least half the cache for pages which have been read
+        count = min(self.readahead // self.page_size, self._max_pages // 2)
+        stop = min(last + 1 + count, (self.size - 1) // self.page_size + 1)
+        wanted = [p for p in range(last + 1, stop)
+                  if p not in self._pages and p not in self._inflight]
+        for run in self._runs(wanted):
+            future = self._get_pool().submit(self._fetch, *self._request(run))
+            for p in range(run[0], run[0] + run[1]):
+                self._inflight[p] = (future, run)
+
+    def prefetch(self, ranges):
+        """ Fetch the pages covering a sequence of (offset, length) ranges
+        into the cache, as concurrent requests.  Only as much as fits in the
+        cache is fetched.
+        """
+        ps = self.page_size
+        with self._lock:
+            wanted = set()
+            for offset, length in ranges:
+                end = min(offset + length, self.size)
+                if end > offset:
+                    wanted.update(range(offset // ps, (end - 1) // ps + 1))
+            missing = sorted(p for p in wanted
+                             if p not in self._pages and p not in self._inflight)
+            missing = missing[:self._max_pages]
+            if missing:
+                self._store(self._fetch_pages(missing))
+
+    def clear(self):
+        """ Empty the page cache """
+        with self._lock:
+            self._pages.clear()
+
+    # File interface used by the driver
+
+    def readinto_at(self, offset, buf):
+        """ Read into buf from offset in the file, returning the number of
+        bytes read (fewer than len(buf) only at the end of the file).
+        """
+        view = memoryview(buf).cast('B')
+        end = min(offset + len(view), self.size)
+        if end <= offset:
+            return 0
+        ps = self.page_size
+        first, last = offset // ps, (end - 1) // ps
+
+        with self._lock:
+            sequential = self._last_end - ps <= offset <= self._last_end + ps
+            self._last_end = end
+
+            if last - first + 1 > self._max_pages:
+                # Too large to cache: fetch straight into buf
+                requests = [(o, min(self.max_request, end - o))
+                            for o in range(offset, end, self.max_request)]
+                for (o, n), data in zip(requests, self._map(requests)):
+                    view[o - offset:o - offset + n] = data
+                return end - offset
+
+            if self._inflight:
+                self._collect()
+            pages = {}
+            missing = []
+            for p in range(first, last + 1):
+                page = self._pages.get(p)
+                if page is None and p in self._inflight:
+                    page = self._collect(p)[p]
+                    self.hits += 1
+                elif page is None:
+                    missing.append(p)
+                    continue
+                else:
+                    self._pages.move_to_end(p)
+                    self.hits += 1
+                pages[p] = page
+            self.misses += len(missing)
+            if missing:
+                fetched = self._fetch_pages(missing)
+                pages.update(fetched)
+                self._store(fetched)
+            if sequential and self.readahead and self.max_workers > 1:
+                self._read_ahead(last)
+
+            pos = 0
+            for p in range(first, last + 1):
+                start = offset - p*ps if p == first else 0
+                stop = min(end - p*ps, ps)
+                view[pos:pos + stop - start] = pages[p][start:stop]
+                pos += stop - start
+        return end - offset
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def writable(self):
+        return False
+
+    def seek(self, pos, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            pos += self._pos
+        elif whence == io.SEEK_END:
+            pos += self.size
+        self._pos = pos
+        return pos
+
+    def tell(self):
+        return self._pos
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = max(self.size - self._pos, 0)
+        buf = bytearray(size)
+        n = self.readinto_at(self._pos, buf)
+        self._pos += n
+        return bytes(buf[:n])
+
+    def write(self, data):
+        raise io.UnsupportedOperation("Ranged files are read-only")
+
+    def truncate(self, size=None):
+        raise io.UnsupportedOperation("Ranged files are read-only")
+
+    def flush(self):
+        pass
+
+    def close(self):
+        """ Stop the worker threads and empty the cache """
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        self._inflight.clear()
+        self.clear()
+        self.closed = True
@@ -0,0 +1,289 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2020 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Chunk-wise reductions (sum, min, max, ...) over datasets.
+
+    Data is read one chunk at a time, reduced with NumPy, and the partial
+    results combined, so memory use is bounded by a few chunks per worker
+    regardless of the size of the dataset.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import numpy
+
+from . import filters
+from .chunkgrid import ChunkGrid, _normalize_sel
+
+# Aliases for NumPy functions which can be passed as the operation
+_OP_ALIASES = {'amin': 'min', 'amax': 'max'}
+
+
+def _iter_partials(dset, grid, func, workers):
+    """ Yield (slices, func(data)) for each chunk of the grid.
+
+    With several workers, chunks are read and reduced in a thread pool, with
+    at most two chunks per worker in flight; results come back in
+    completion order.
+    """
+    def task(slices):
+        return slices, func(dset[slices])
+
+    if not workers or workers <= 1:
+        for slices in grid:
+            yield task(slices)
+        return
+
+    with ThreadPoolExecutor(workers) as executor:
+        pending = set()
+        for slices in grid:
+            pending.add(executor.submit(task, slices))
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in pending:
+            yield future.result()
+
+
+def _sel_shape(sel_ranges):
+    """ Shape of a selection given as (start, stop, step) per axis """
+    return tuple(len(range(*r)) for r in sel_ranges)
+
+
+class _Reducer(object):
+
+    """ Combines per-chunk partial results for one operation.
+
+    sel_ranges gives (start, stop, step) of the selection on each axis, so
+    that a chunk's slices can be mapped to positions in the selection.
+    """
+
+    def __init__(self, dtype, sel_ranges, axis):
+        self.dtype = dtype
+        self.sel_ranges = sel_ranges
+        self.sel_shape = _sel_shape(sel_ranges)
+        self.axis = axis
+        if axis is not None:
+            shape = self.sel_shape[:axis] + self.sel_shape[axis + 1:]
+            self.out_shape = shape
+
+    def positions(self, slices):
+        """ Start and length of a chunk's slices in selection coordinates """
+        pos = []
+        for s, (start, _, step) in zip(slices, self.sel_ranges):
+            pos.append(((s.start - start) // step, len(range(s.start, s.stop, step))))
+        return pos
+
+    def out_region(self, slices):
+        """ Region of the output array a chunk contributes to """
+        pos = self.positions(slices)
+        del pos[self.axis]
+        return tuple(slice(a, a + n) for a, n in pos)
+
+
+class _UfuncReducer(_Reducer):
+
+    """ sum, min and max, built on a NumPy ufunc's reduce method """
+
+    def __init__(self, dtype, sel_ranges, axis, ufunc):
+        super().__init__(dtype, sel_ranges, axis)
+        self.ufunc = ufunc
+        self.result = None
+        self.seen = set()
+        # Small integers are summed in a wider type, as numpy.sum does
+        self.acc_dtype = None
+        if ufunc is numpy.add:
+            self.acc_dtype = numpy.sum(numpy.zeros((1,), dtype=dtype)).dtype
+
+    def chunk(self, arr):
+        return self.ufunc.reduce(arr, axis=self.axis, dtype=self.acc_dtype)
+
+    def add(self, slices, partial):
+        if self.axis is None:
+            if self.result is None:
+                self.result = partial
+            else:
+                self.result = self.ufunc(self.result, partial)
+            return
+
+        if self.result is None:
+            self.result = numpy.empty(self.out_shape, dtype=partial.dtype)
+        region = self.out_region(slices)
+        key = tuple((s.start, s.stop) for s in region)
+        if key in self.seen:
+            self.ufunc(self.result[region], partial, out=self.result[region])
+        else:
+            self.result[region] = partial
+            self.seen.add(key)
+
+    def finish(self):
+        return self.result
+
+
+class _MeanReducer(_UfuncReducer):
+
+    """ mean, as a sum divided by the number of elements """
+
+    def __init__(self, dtype, sel_ranges, axis):
+        super().__init__(dtype, sel_ranges, axis, numpy.add)
+        self.result_dtype = numpy.mean(numpy.zeros((1,), dtype=dtype)).dtype
+
+    def chunk(self, arr):
+        return numpy.add.reduce(arr, axis=self.axis, dtype=numpy.float64
+                                if self.dtype.kind in 'biuf' else None)
+
+    def finish(self):
+        if self.axis is None:
+            count = numpy.prod(self.sel_shape, dtype=numpy.float64)
+        else:
+            count = self.sel_shape[self.axis]
+        return (self.result / count).astype(self.result_dtype)[()]
+
+
+class _ArgReducer(_Reducer):
+
+    """ argmax and argmin, keeping the best value seen with its index """
+
+    def __init__(self, dtype, sel_ranges, axis, which):
+        super().__init__(dtype, sel_ranges, axis)
+        self.arg = getattr(numpy, which)
+        self.compare = numpy.greater if which == 'argmax' else numpy.less
+        self.best = None
+        self.best_index = None
+
+    def chunk(self, arr):
+        local = self.arg(arr, axis=self.axis)
+        if self.axis is None:
+            values = arr.flat[local]
+        else:
+            values = numpy.take_along_axis(
+                arr, numpy.expand_dims(local, self.axis), self.axis
+            ).squeeze(self.axis)
+        return values, local
+
+    def better(self, values, index, best, best_index):
+        """ Mask of entries where (values, index) beat (best, best_index).
+
+        Like NumPy, the first occurrence wins ties, and NaN wins over
+        everything else.
+        """
+        earlier = index < best_index
+        wins = self.compare(values, best) | ((values == best) & earlier)
+        if self.dtype.kind == 'f':
+            vnan = numpy.isnan(values)
+            bnan = numpy.isnan(best)
+            wins = (wins & ~vnan & ~bnan) | (vnan & ~bnan) | (vnan & bnan & earlier)
+        return wins
+
+    def add(self, slices, partial):
+        values, local = partial
+        pos = self.positions(slices)
+        if self.axis is None:
+            coords = numpy.unravel_index(local, [n for _, n in pos])
+            index = numpy.ravel_multi_index(
+                [c + a for c, (a, _) in zip(coords, pos)], self.sel_shape
+            )
+            if self.best is None or self.better(values, index, self.best, self.best_index):
+                self.best, self.best_index = values, index
+            return
+
+        index = local + pos[self.axis][0]
+        if self.best is None:
+            self.best = numpy.empty(self.out_shape, dtype=values.dtype)
+            self.best_index = numpy.full(self.out_shape, -1, dtype=numpy.intp)
+        region = self.out_region(slices)
+        best, best_index = self.best[region], self.best_index[region]
+        wins = (best_index == -1) | self.better(values, index, best, best_index)
+        best[wins] = values[wins]
+        best_index[wins] = index[wins]
+
+    def finish(self):
+        return self.best_index
+
+
+class _HistogramReducer(_Reducer):
+
+    """ histogram over fixed bin edges, adding up counts """
+
+    def __init__(self, dtype, sel_ranges, axis, edges):
+        super().__init__(dtype, sel_ranges, axis)
+        self.edges = edges
+        self.counts = numpy.zeros((len(edges) - 1,), dtype=numpy.intp)
+
+    def chunk(self, arr):
+        return numpy.histogram(arr, bins=self.edges)[0]
+
+    def add(self, slices, partial):
+        self.counts += partial
+
+    def finish(self):
+        return self.counts, self.edges
+
+
+def reduce_dataset(dset, op, axis=None, sel=None, workers=None, bins=10,
+                   range=None):
+    """ Reduce a dataset chunk by chunk; see Dataset.reduce """
+    # pylint: disable=redefined-builtin
+    if callable(op):
+        op = op.__name__
+    op = _OP_ALIASES.get(op, op)
+    if op not in ('sum', 'min', 'max', 'mean', 'argmax', 'argmin', 'histogram'):
+        raise ValueError("Unknown reduction %r" % op)
+
+    shape = dset.shape
+    if shape is None or shape == ():
+        raise TypeError("Reductions need a dataset with at least one dimension")
+    if axis is not None:
+        if op == 'histogram':
+            raise ValueError("histogram does not take an axis")
+        axis = int(axis)
+        if axis < 0:
+            axis += len(shape)
+        if not 0 <= axis < len(shape):
+            raise ValueError("Invalid axis %d for dataset of rank %d" % (axis, len(shape)))
+
+    dtype = dset.dtype
+    sel_ranges = _normalize_sel(shape, sel)
+    sel_shape = _sel_shape(sel_ranges)
+
+    if 0 in sel_shape:
+        # Nothing to read; let NumPy decide what reducing nothing means
+        empty = numpy.empty(sel_shape, dtype=dtype)
+        if op == 'histogram':
+            return numpy.histogram(empty, bins=bins, range=range)
+        return getattr(numpy, op)(empty, axis=axis)
+
+    if op == 'histogram':
+        if isinstance(bins, str):
+            raise ValueError("Bin estimators are not supported; pass a number "
+                             "of bins or the bin edges")
+        if numpy.ndim(bins) == 0 and range is None:
+            # Needs a first pass to find the range, as NumPy would
+            range = (reduce_dataset(dset, 'min', sel=sel, workers=workers),
+                     reduce_dataset(dset, 'max', sel=sel, workers=workers))
+        edges = numpy.histogram_bin_edges(numpy.empty((0,), dtype=dtype),
+                                          bins=bins, range=range)
+        reducer = _HistogramReducer(dtype, sel_ranges, axis, edges)
+    elif op == 'mean':
+        reducer = _MeanReducer(dtype, sel_ranges, axis)
+    elif op in ('argmax', 'argmin'):
+        reducer = _ArgReducer(dtype, sel_ranges, axis, op)
+    else:
+        ufunc = {'sum': numpy.add, 'min': numpy.minimum, 'max': numpy.maximum}[op]
+        reducer = _UfuncReducer(dtype, sel_ranges, axis, ufunc)
+
+    # Contiguous datasets are read in blocks the size auto-chunking would pick
+    chunks = dset.chunks or filters.guess_chunk(shape, None, dtype.itemsize)
+    grid = ChunkGrid(shape, chunks, sel)
+
+    for slices, partial in _iter_partials(dset, grid, reducer.chunk, workers):
+        reducer.add(slices, partial)
+    return reducer.finish()
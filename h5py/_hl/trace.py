@@ -0,0 +1,178 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2020 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Reading and replaying logs of file I/O from the 'trace' driver.
+
+    A file opened with driver='trace' and trace_file=<log> records each read
+    and write the HDF5 library makes.  load() reads such a log, replay()
+    repeats its I/O on a file opened with another driver, and simulate()
+    models a page cache over it, so settings can be compared offline.
+"""
+
+from collections import namedtuple, OrderedDict
+import struct
+
+import numpy
+
+from .. import h5fd, h5p
+from .compat import filename_encode
+from .files import make_fapl
+
+# Operation codes in the 'op' field
+READ = h5fd.TRACE_READ
+WRITE = h5fd.TRACE_WRITE
+
+# Fields of each record, in the byte order of the machine which wrote it
+TRACE_DTYPE = numpy.dtype([
+    ('start', 'f8'),     # seconds since the file was opened
+    ('duration', 'f8'),  # seconds
+    ('addr', 'u8'),
+    ('size', 'u8'),
+    ('op', 'u1'),        # READ or WRITE
+    ('type', 'u1'),      # h5fd.MEM_* memory type
+])
+
+Trace = namedtuple('Trace', ['filename', 'records'])
+Trace.__doc__ = """\
+A loaded I/O log: the name of the HDF5 file, and a NumPy structured array
+of records with the fields of TRACE_DTYPE.
+"""
+
+ReplayResult = namedtuple('ReplayResult',
+                          ['reads', 'writes', 'nbytes', 'seconds', 'traced_seconds'])
+ReplayResult.__doc__ = """\
+Outcome of replaying a trace: the numbers of reads and writes made, bytes
+transferred, the time they took, and the time the same operations took
+when the trace was recorded.
+"""
+
+CacheResult = namedtuple('CacheResult', ['hits', 'misses', 'reads', 'nbytes'])
+CacheResult.__doc__ = """\
+Outcome of simulate(): page hits and misses, and the number of reads of the
+file and bytes read to fill the cache.
+"""
+
+
+def load(log):
+    """ Read a log written by the trace driver, returning a Trace """
+    with open(log, 'rb') as f:
+        data = f.read()
+    if data[:8] != h5fd.TRACE_MAGIC:
+        raise ValueError("%s is not an h5py trace log" % (log,))
+
+    for order in '<>':
+        marker, record_size, name_len = struct.unpack(order + '3I', data[8:20])
+        if marker == 0x01020304:
+            break
+    else:
+        raise ValueError("Corrupt header in trace log %s" % (log,))
+    dtype = TRACE_DTYPE.newbyteorder(order)
+    if record_size != dtype.itemsize:
+        raise ValueError("Unsupported record size %d in trace log %s" % (record_size, log))
+
+    offset = 20 + name_len
+    filename = data[20:offset].decode('utf-8', 'surrogateescape')
+    nrecords = (len(data) - offset) // record_size
+    records = numpy.frombuffer(data, dtype, nrecords, offset).astype(TRACE_DTYPE)
+    return Trace(filename, records)
+
+
+def _as_trace(log):
+    return log if isinstance(log, Trace) else load(log)
+
+
+def replay(log, candidate_fapl=None, name=None, writes=False):
+    """ Repeat the I/O of a trace, and time it.
+
+    The reads in the trace (and the writes, if writes=True) are made at the
+    same addresses in the file, through the file driver of candidate_fapl.
+    This measures the file driver and the storage; caches above the driver,
+    such as the chunk cache, metadata cache and page buffer, are not used.
+
+    log
+        Name of a trace log, or a Trace from load().
+    candidate_fapl
+        File access property list (h5p.PropFAID) selecting the driver to
+        test, or a dict of File keywords such as ``{'driver': 'core'}``.
+        Default is the sec2 driver.
+    name
+        File to replay the trace on.  Default is the file it was recorded
+        from.
+    writes
+        Repeat writes as well as reads.  Writes store zeros, so the file is
+        destroyed; replay them only on a scratch copy.
+    """
+    trace = _as_trace(log)
+    records = trace.records
+    if name is None:
+        name = trace.filename
+
+    if candidate_fapl is None:
+        candidate_fapl = h5p.create(h5p.FILE_ACCESS)
+        candidate_fapl.set_fapl_sec2()
+    elif isinstance(candidate_fapl, dict):
+        kwds = dict(candidate_fapl)
+        candidate_fapl = make_fapl(kwds.pop('driver', None), None, None, None, None, **kwds)
+
+    durations = numpy.zeros(len(records), dtype='f8')
+    h5fd.replay(candidate_fapl, filename_encode(name),
+                numpy.ascontiguousarray(records['addr']),
+                numpy.ascontiguousarray(records['size']),
+                numpy.ascontiguousarray(records['op']),
+                numpy.ascontiguousarray(records['type']),
+                durations, writes)
+
+    done = (records['op'] == READ) | bool(writes)
+    return ReplayResult(
+        reads=int(numpy.count_nonzero(records['op'] == READ)),
+        writes=int(numpy.count_nonzero(records['op'] == WRITE)) if writes else 0,
+        nbytes=int(records['size'][done].sum()),
+        seconds=float(durations[done].sum()),
+        traced_seconds=float(records['duration'][done].sum()),
+    )
+
+
+def simulate(log, page_size, cache_bytes):
+    """ Model reading a trace through an LRU cache of fixed-size pages, like
+    the fileobj driver's page cache, returning a CacheResult.
+
+    Each read touches the pages it overlaps; runs of adjacent missing pages
+    are read from the file together.  Writes are ignored, as they only update
+    pages already in the cache.
+    """
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+    max_pages = max(cache_bytes // page_size, 1)
+    pages = OrderedDict()
+    hits = misses = reads = 0
+
+    for addr, size, op in _as_trace(log).records[['addr', 'size', 'op']].tolist():
+        if size == 0 or op != READ:
+            continue
+        first, last = addr // page_size, (addr + size - 1) // page_size
+        if last - first + 1 > max_pages:
+            reads += 1  # Read directly, bypassing the cache
+            continue
+        in_run = False
+        for p in range(first, last + 1):
+            if p in pages:
+                hits += 1
+                pages.move_to_end(p)
+                in_run = False
+                continue
+            misses += 1
+            if not in_run:
+                reads += 1
+                in_run = True
+            pages[p] = None
+            if len(pages) > max_pages:
+                pages.popitem(last=False)
+
+    return CacheResult(hits, misses, reads, misses * page_size)
@@ -0,0 +1,215 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2020 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Empirical tuning of dataset creation settings.
+
+    suggest() writes a sample array with a number of candidate chunk shapes
+    and filter pipelines to an in-memory HDF5 file, times writing it and
+    reading it back in the expected access pattern, and ranks the candidates.
+"""
+
+from collections import namedtuple
+import itertools
+import time
+
+import numpy
+
+from . import filters
+from .files import File
+
+Suggestion = namedtuple('Suggestion',
+                        ['settings', 'write_speed', 'read_speed', 'ratio'])
+Suggestion.__doc__ = """\
+Measured performance of one set of dataset creation settings.
+
+settings is a dict of keywords for Group.create_dataset; write_speed and
+read_speed are in bytes of (uncompressed) data per second, and ratio is the
+size of the data divided by the space it takes in the file.
+"""
+
+OBJECTIVES = ('read_speed', 'write_speed', 'ratio')
+
+# Read at most this many selections of an access pattern, spread evenly
+_MAX_READS = 200
+
+_counter = itertools.count()
+
+
+# Filter pipelines tried by default, as keywords for create_dataset
+_PIPELINES = (
+    {},
+    {'compression': 'lzf'},
+    {'compression': 'lzf', 'shuffle': True},
+    {'compression': 'bslz4'},
+    {'compression': 'gzip', 'compression_opts': 1},
+    {'compression': 'gzip', 'compression_opts': 1, 'shuffle': True},
+    {'compression': 'gzip', 'compression_opts': 4, 'shuffle': True},
+)
+
+
+def default_pipelines(dtype):
+    """ Candidate filter pipelines for data of the given NumPy dtype, as
+    dicts of create_dataset keywords.  Only filters available for encoding
+    are included, and shuffling is left out for 1-byte types.
+    """
+    itemsize = numpy.dtype(dtype).itemsize
+    return [dict(p) for p in _PIPELINES
+            if p.get('compression') in filters.encode + (None,)
+            and not (p.get('shuffle') and itemsize == 1)]
+
+
+def _full_axes(ndim, access_pattern):
+    """ Axes read in full by each selection of a named access pattern """
+    if access_pattern == 'all' or ndim == 1:
+        return tuple(range(ndim))
+    if access_pattern == 'rows':
+        return (ndim-1,)
+    if access_pattern == 'columns':
+        return (0,)
+    if access_pattern == 'planes':
+        return tuple(range(max(ndim-2, 0), ndim))
+    raise ValueError("Unknown access pattern %r" % (access_pattern,))
+
+
+def _access_selections(shape, access_pattern):
+    """ Selections to read for an access pattern, either one of the names
+    in _full_axes or a sequence of index expressions.
+    """
+    if access_pattern is None:
+        access_pattern = 'all'
+    if not isinstance(access_pattern, str):
+        sels = list(access_pattern)
+        if not sels:
+            raise ValueError("access_pattern must contain at least one selection")
+        return sels
+
+    full = _full_axes(len(shape), access_pattern)
+    fixed = [ax for ax in range(len(shape)) if ax not in full]
+    positions = list(itertools.product(*[range(shape[ax]) for ax in fixed]))
+    if len(positions) > _MAX_READS:
+        idx = numpy.linspace(0, len(positions)-1, _MAX_READS).round().astype(int)
+        positions = [positions[i] for i in idx]
+
+    sels = []
+    for pos in positions:
+        sel = [slice(None)]*len(shape)
+        for ax, i in zip(fixed, pos):
+            sel[ax] = i
+        sels.append(tuple(sel))
+    return sels
+
+
+def default_chunks(shape, dtype, access_pattern='all'):
+    """ Candidate chunk shapes for a dataset of the given shape and dtype:
+    the guess_chunk() default, plus the guess_chunk_access() shape for a
+    named access pattern.
+    """
+    itemsize = numpy.dtype(dtype).itemsize
+    candidates = [filters.guess_chunk(shape, None, itemsize)]
+    if access_pattern in filters.ACCESS_PATTERNS:
+        chunks = filters.guess_chunk_access(shape, None, itemsize, access_pattern)
+        if chunks not in candidates:
+            candidates.append(chunks)
+    return candidates
+
+
+def _measure(sample, settings, selections, repeat):
+    """ Best write time, best read time and storage size for one candidate """
+    best_write = best_read = float('inf')
+    for _ in range(repeat):
+        name = 'h5py-tune-%d' % next(_counter)
+        with File(name, 'w', driver='core', backing_store=False) as f:
+            dset = f.create_dataset('x', shape=sample.shape, dtype=sample.dtype,
+                                    **settings)
+            start = time.perf_counter()
+            dset[...] = sample
+            f.flush()
+            best_write = min(best_write, time.perf_counter() - start)
+            storage = dset.id.get_storage_size()
+
+            # Reopen the dataset so reads start with an empty chunk cache
+            dset.id.close()
+            dset = f['x']
+            start = time.perf_counter()
+            for sel in selections:
+                dset[sel]
+            best_read = min(best_read, time.perf_counter() - start)
+    return best_write, best_read, storage
+
+
+def suggest(sample, access_pattern='all', objective='read_speed',
+            chunks=None, pipelines=None, repeat=3):
+    """ Benchmark dataset creation settings on a sample of data.
+
+    Each combination of a candidate chunk shape and filter pipeline is used
+    to write the sample to an in-memory file and read it back, and the
+    results are returned as a list of Suggestion tuples, best first.  Pass
+    the settings of one to Group.create_dataset, e.g.::
+
+        best = h5py.tune.suggest(frames[:16], access_pattern='planes')[0]
+        f.create_dataset('frames', data=frames, **best.settings)
+
+    sample
+        NumPy array representative of the data to be stored, with the same
+        dtype and spanning at least a few chunks.  Chunk shapes are chosen
+        relative to its shape.
+    access_pattern
+        How the data will be read: 'all' (the whole array at once), 'rows'
+        (1D slices along the last axis), 'columns' (1D slices along the
+        first axis), 'planes' (2D slices over the last two axes), or a
+        sequence of index expressions to read in turn.
+    objective
+        Which measurement to rank by: 'read_speed', 'write_speed' or
+        'ratio' (compression ratio, ties broken by read speed).
+    chunks
+        Sequence of chunk shapes to try, rather than default_chunks().
+    pipelines
+        Sequence of dicts of filter keywords for create_dataset (e.g.
+        ``{'compression': 'gzip', 'shuffle': True}``) to try, rather than
+        default_pipelines().  Use ``{}`` for no filters.
+    repeat
+        Number of times to time each candidate, keeping the best.
+    """
+    sample = numpy.asarray(sample)
+    if sample.dtype.hasobject:
+        raise TypeError("Can't tune storage of object arrays")
+    if sample.ndim == 0 or sample.size == 0:
+        raise ValueError("Sample must be a non-empty array")
+    if objective not in OBJECTIVES:
+        raise ValueError("objective must be one of %s, not %r" % (OBJECTIVES, objective))
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1")
+
+    selections = _access_selections(sample.shape, access_pattern)
+    if chunks is None:
+        chunks = default_chunks(sample.shape, sample.dtype, access_pattern)
+    if pipelines is None:
+        pipelines = default_pipelines(sample.dtype)
+
+    read_bytes = sum(numpy.asarray(sample[sel]).nbytes for sel in selections)
+
+    results = []
+    for chunk_shape in chunks:
+        for pipeline in pipelines:
+            settings = dict(pipeline, chunks=tuple(chunk_shape))
+            t_write, t_read, storage = _measure(sample, settings, selections, repeat)
+            results.append(Suggestion(
+                settings=settings,
+                write_speed=sample.nbytes/t_write if t_write else float('inf'),
+                read_speed=read_bytes/t_read if t_read else float('inf'),
+                ratio=sample.nbytes/storage if storage else float('inf'),
+            ))
+
+    if objective == 'ratio':
+        key = lambda s: (s.ratio, s.read_speed)
+    else:
+        key = lambda s: getattr(s, objective)
+    results.sort(key=key, reverse=True)
+    return results
@@ -0,0 +1,74 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2020 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Cache of HDF5 memory types made from NumPy dtypes.
+
+    h5t.py_create() builds a new HDF5 type each time it is called; for a
+    compound dtype, that means creating and inserting a type for every field.
+    Reading and writing datasets and attributes through the high-level API
+    converts the same few dtypes over and over, so the types are made once
+    here, locked so they can't be modified, and shared.
+
+    Locked types can't be closed, so cached types are never evicted: once
+    MAX_TYPES dtypes are cached, others are converted without caching.
+"""
+
+import numpy
+
+from .. import h5t
+from .base import phil
+
+# Number of dtypes to keep types for
+MAX_TYPES = 512
+
+_types = {}  # key: TypeID
+_hits = 0
+_misses = 0
+
+
+def _metadata(dt):
+    """ h5py's hints in a dtype (e.g. for enums and vlen strings) and its
+    fields, which dtype equality ignores.
+    """
+    parts = []
+    if dt.metadata:
+        parts.append(repr(sorted(dt.metadata.items())))
+    if dt.names is not None:
+        parts.extend(_metadata(dt.fields[name][0]) for name in dt.names)
+    elif dt.subdtype is not None:
+        parts.append(_metadata(dt.subdtype[0]))
+    return tuple(parts)
+
+
+def py_create(dt, logical=False, aligned=False):
+    """ The HDF5 type for a NumPy dtype, as h5t.py_create(), but locked and
+    shared with other callers, so it must not be modified.
+    """
+    global _hits, _misses
+    dt = numpy.dtype(dt)
+    key = (dt, dt.isalignedstruct or bool(aligned), bool(logical), _metadata(dt))
+    tid = _types.get(key)
+    if tid is not None:
+        _hits += 1
+        return tid
+
+    with phil:
+        _misses += 1
+        tid = h5t.py_create(dt, logical=logical, aligned=aligned)
+        if len(_types) < MAX_TYPES and key not in _types:
+            tid.lock()
+            _types[key] = tid
+        return tid
+
+
+def stats():
+    """ The number of cached types, and hits and misses, as a dict """
+    return {'types': len(_types), 'max_types': MAX_TYPES,
+            'hits': _hits, 'misses': _misses}
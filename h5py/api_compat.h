@@ -45,4 +45,23 @@ typedef void *PyMPI_MPI_Message;
 #define h5py_offset_n256_imag (HOFFSET(npy_complex256, imag))
 #endif
 
+/* Monotonic clock in seconds, usable without the GIL */
+
+#ifdef _WIN32
+#include <windows.h>
+Py_LOCAL_INLINE(double) h5py_perf_counter(void){
+    LARGE_INTEGER freq, count;
+    QueryPerformanceFrequency(&freq);
+    QueryPerformanceCounter(&count);
+    return (double)count.QuadPart / (double)freq.QuadPart;
+}
+#else
+#include <time.h>
+Py_LOCAL_INLINE(double) h5py_perf_counter(void){
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + 1e-9*(double)ts.tv_nsec;
+}
+#endif
+
 #endif
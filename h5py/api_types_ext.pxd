@@ -54,7 +54,15 @@ cdef extern from "api_compat.h":
         size_t h5py_offset_n256_real
         size_t h5py_offset_n256_imag
 
+    double h5py_perf_counter() nogil
+
 cdef extern from "lzf_filter.h":
 
     int H5PY_FILTER_LZF
     int register_lzf() except *
+
+cdef extern from "bslz4_filter.h":
+
+    int H5PY_FILTER_BSLZ4
+    int register_bslz4() except *
+    const char *bslz4_simd()
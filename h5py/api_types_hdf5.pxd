@@ -175,6 +175,26 @@ cdef extern from "hdf5.h":
     H5FD_MEM_OHDR       = 6,
     H5FD_MEM_NTYPES
 
+  ctypedef enum H5FD_file_image_op_t:
+    H5FD_FILE_IMAGE_OP_NO_OP,
+    H5FD_FILE_IMAGE_OP_PROPERTY_LIST_SET,
+    H5FD_FILE_IMAGE_OP_PROPERTY_LIST_COPY,
+    H5FD_FILE_IMAGE_OP_PROPERTY_LIST_GET,
+    H5FD_FILE_IMAGE_OP_PROPERTY_LIST_CLOSE,
+    H5FD_FILE_IMAGE_OP_FILE_OPEN,
+    H5FD_FILE_IMAGE_OP_FILE_RESIZE,
+    H5FD_FILE_IMAGE_OP_FILE_CLOSE
+
+  # Callbacks for allocating and copying file images (core driver)
+  ctypedef struct H5FD_file_image_callbacks_t:
+    void *(*image_malloc)(size_t size, H5FD_file_image_op_t file_image_op, void *udata)
+    void *(*image_memcpy)(void *dest, const void *src, size_t size, H5FD_file_image_op_t file_image_op, void *udata)
+    void *(*image_realloc)(void *ptr, size_t size, H5FD_file_image_op_t file_image_op, void *udata)
+    herr_t (*image_free)(void *ptr, H5FD_file_image_op_t file_image_op, void *udata)
+    void *(*udata_copy)(void *udata)
+    herr_t (*udata_free)(void *udata)
+    void *udata
+
   # HDF5 uses a clever scheme wherein these are actually init() calls
   # Hopefully Cython won't have a problem with this.
   # Thankfully they are defined but -1 if unavailable
@@ -731,6 +751,24 @@ cdef extern from "hdf5.h":
       H5Z_SO_FLOAT_ESCALE = 1,
       H5Z_SO_INT          = 2
 
+  int H5Z_CLASS_T_VERS
+
+  ctypedef htri_t (*H5Z_can_apply_func_t)(hid_t dcpl_id, hid_t type_id, hid_t space_id)
+  ctypedef herr_t (*H5Z_set_local_func_t)(hid_t dcpl_id, hid_t type_id, hid_t space_id)
+  ctypedef size_t (*H5Z_func_t)(unsigned int flags, size_t cd_nelmts,
+      const unsigned int cd_values[], size_t nbytes, size_t *buf_size,
+      void **buf) except? 0
+
+  ctypedef struct H5Z_class2_t:
+      int version
+      H5Z_filter_t id
+      unsigned encoder_present
+      unsigned decoder_present
+      const char *name
+      H5Z_can_apply_func_t can_apply
+      H5Z_set_local_func_t set_local
+      H5Z_func_t filter
+
 # === H5A - Attributes API ====================================================
 
   ctypedef herr_t (*H5A_operator_t)(hid_t loc_id, char *attr_name, void* operator_data) except 2
@@ -0,0 +1,10 @@
+# This file is automatically generated by the h5py setup script.  Don't modify.
+
+DEF MPI = False
+DEF HDF5_VERSION = (1, 10, 8)
+DEF SWMR_MIN_HDF5_VERSION = (1,9,178)
+DEF VDS_MIN_HDF5_VERSION = (1,9,233)
+DEF VOL_MIN_HDF5_VERSION = (1,11,5)
+DEF COMPLEX256_SUPPORT = True
+DEF NUMPY_BUILD_VERSION = '1.26.4'
+DEF CYTHON_BUILD_VERSION = '0.29.37'
@@ -12,6 +12,16 @@
     Low-level HDF5 "H5AC" cache configuration interface.
 """
 
+# Modes for CacheConfig.incr_mode, flash_incr_mode and decr_mode
+INCR_OFF = H5C_incr__off
+INCR_THRESHOLD = H5C_incr__threshold
+FLASH_INCR_OFF = H5C_flash_incr__off
+FLASH_INCR_ADD_SPACE = H5C_flash_incr__add_space
+DECR_OFF = H5C_decr__off
+DECR_THRESHOLD = H5C_decr__threshold
+DECR_AGE_OUT = H5C_decr__age_out
+DECR_AGE_OUT_WITH_THRESHOLD = H5C_decr__age_out_with_threshold
+
 
 cdef class CacheConfig:
     """Represents H5AC_cache_config_t objects
@@ -24,11 +24,15 @@ from .h5t cimport TypeID, typewrap, py_create
 from .h5s cimport SpaceID
 from .h5p cimport PropID, propwrap
 from ._proxy cimport dset_rw
+from . cimport _hdf5 # to loop over raw chunks without the GIL
+from ._errors cimport set_exception, set_default_error_handler
 
 from ._objects import phil, with_phil
 from cpython cimport PyObject_GetBuffer, \
                      PyBUF_ANY_CONTIGUOUS, \
+                     PyBUF_WRITABLE, \
                      PyBuffer_Release
+import numpy
 
 
 # Initialization
@@ -103,6 +107,19 @@ def open(ObjectID loc not None, char* name, PropID dapl=None):
 
 # --- Proxy functions for safe(r) threading -----------------------------------
 
+cdef ndarray _chunk_offsets(object offsets, int rank):
+    """ Convert offsets to a C-contiguous (N, rank) array of hsize_t """
+    cdef ndarray arr = numpy.ascontiguousarray(offsets, dtype=numpy.uint64)
+    if arr.ndim != 2 or arr.shape[1] != rank:
+        raise TypeError("offsets must be an (N, %d) array of chunk offsets" % rank)
+    return arr
+
+cdef int _chunk_error(str msg) except -1:
+    """ Raise the pending HDF5 error, or RuntimeError(msg) if there is none """
+    if set_exception():
+        return -1
+    raise RuntimeError(msg)
+
 
 cdef class DatasetID(ObjectID):
 
@@ -466,6 +483,82 @@ cdef class DatasetID(ObjectID):
                 if space_id:
                     H5Sclose(space_id)
 
+        @with_phil
+        def write_direct_chunks(self, offsets, data, sizes, filter_mask=0x00000000,
+                                PropID dxpl=None):
+            """ (offsets, data, sizes, filter_mask=0x00000000, PropID dxpl=None)
+
+            Write many raw chunks in one call, bypassing any filters HDF5
+            would normally apply, like `write_direct_chunk`.
+
+            `offsets` is an (N, rank) array of the logical positions of the
+            chunks.  `data` is a contiguous Python object implementing the
+            buffer interface, holding the chunks back to back in the same
+            order, and `sizes` gives the size of each chunk in bytes; this
+            is the layout produced by `read_direct_chunks`.
+
+            `filter_mask` is either a single value applied to every chunk, or
+            an array with one value per chunk (e.g. as returned by
+            `read_direct_chunks`).
+
+            The loop over chunks runs without the GIL.
+
+            Feature requires: 1.8.11 HDF5
+            """
+            cdef hid_t dset_id = self.id
+            cdef hid_t dxpl_id = pdefault(dxpl)
+            cdef hid_t space_id
+            cdef int rank
+            cdef ndarray offs, size_arr, masks
+            cdef hsize_t *offset_buf
+            cdef hsize_t *size_buf
+            cdef uint32_t *mask_buf
+            cdef Py_ssize_t i, nchunks
+            cdef hsize_t total = 0
+            cdef herr_t err = 0
+            cdef const char *buf
+            cdef Py_buffer view
+
+            space_id = H5Dget_space(dset_id)
+            try:
+                rank = H5Sget_simple_extent_ndims(space_id)
+            finally:
+                H5Sclose(space_id)
+
+            offs = _chunk_offsets(offsets, rank)
+            nchunks = offs.shape[0]
+            size_arr = numpy.ascontiguousarray(sizes, dtype=numpy.uint64)
+            masks = numpy.ascontiguousarray(
+                numpy.broadcast_to(numpy.asarray(filter_mask, dtype=numpy.uint32), (nchunks,)))
+            if size_arr.ndim != 1 or size_arr.shape[0] != nchunks:
+                raise TypeError("sizes must have one entry per chunk")
+            offset_buf = <hsize_t*>PyArray_DATA(offs)
+            size_buf = <hsize_t*>PyArray_DATA(size_arr)
+            mask_buf = <uint32_t*>PyArray_DATA(masks)
+
+            PyObject_GetBuffer(data, &view, PyBUF_ANY_CONTIGUOUS)
+            try:
+                for i in range(nchunks):
+                    total += size_buf[i]
+                if total > <hsize_t>view.len:
+                    raise ValueError("Data buffer too small (%d bytes needed, %d given)"
+                                     % (total, view.len))
+
+                buf = <const char*>view.buf
+                with nogil:
+                    set_default_error_handler()
+                    for i in range(nchunks):
+                        err = _hdf5.H5DOwrite_chunk(dset_id, dxpl_id, mask_buf[i],
+                                                    offset_buf + i * rank,
+                                                    size_buf[i], buf)
+                        if err < 0:
+                            break
+                        buf += size_buf[i]
+                if err < 0:
+                    _chunk_error("Can't write chunk %s" % (tuple(offs[i]),))
+            finally:
+                PyBuffer_Release(&view)
+
     IF HDF5_VERSION >= (1, 10, 2):
 
         def read_direct_chunk(self, offsets, PropID dxpl=None):
@@ -528,6 +621,91 @@ cdef class DatasetID(ObjectID):
 
             return filters, ret
 
+        @with_phil
+        def read_direct_chunks(self, offsets, out, PropID dxpl=None):
+            """ (offsets, out, PropID dxpl=None) => (sizes, filter_masks)
+
+            Read many raw chunks in one call, bypassing any filters HDF5
+            would normally apply, like `read_direct_chunk`.
+
+            `offsets` is an (N, rank) array of the logical positions of the
+            chunks to read.  `out` is a writable, contiguous Python object
+            implementing the buffer interface, e.g. a bytearray or NumPy
+            array.  The chunks are stored in it back to back, in the order
+            given; chunk ``i`` starts at ``sum(sizes[:i])``.  ValueError is
+            raised, before anything is read, if `out` is too small.
+
+            Returns two arrays of length N: the stored size of each chunk in
+            bytes (uint64), and its `filter_mask` (uint32).
+
+            All chunks must have storage allocated in the file.  The loop
+            over chunks runs without the GIL.
+
+            Feature requires: 1.10.2 HDF5
+            """
+            cdef hid_t dset_id = self.id
+            cdef hid_t dxpl_id = pdefault(dxpl)
+            cdef hid_t space_id
+            cdef int rank
+            cdef ndarray offs, sizes, masks
+            cdef hsize_t *offset_buf
+            cdef hsize_t *size_buf
+            cdef uint32_t *mask_buf
+            cdef Py_ssize_t i, nchunks
+            cdef hsize_t total = 0
+            cdef herr_t err = 0
+            cdef char *buf
+            cdef Py_buffer view
+
+            space_id = H5Dget_space(dset_id)
+            try:
+                rank = H5Sget_simple_extent_ndims(space_id)
+            finally:
+                H5Sclose(space_id)
+
+            offs = _chunk_offsets(offsets, rank)
+            nchunks = offs.shape[0]
+            sizes = numpy.zeros((nchunks,), dtype=numpy.uint64)
+            masks = numpy.zeros((nchunks,), dtype=numpy.uint32)
+            offset_buf = <hsize_t*>PyArray_DATA(offs)
+            size_buf = <hsize_t*>PyArray_DATA(sizes)
+            mask_buf = <uint32_t*>PyArray_DATA(masks)
+
+            PyObject_GetBuffer(out, &view, PyBUF_ANY_CONTIGUOUS | PyBUF_WRITABLE)
+            try:
+                with nogil:
+                    set_default_error_handler()
+                    for i in range(nchunks):
+                        err = _hdf5.H5Dget_chunk_storage_size(
+                            dset_id, offset_buf + i * rank, size_buf + i)
+                        if err < 0:
+                            break
+                        total += size_buf[i]
+                if err < 0:
+                    _chunk_error("Can't get storage size of chunk %s" % (tuple(offs[i]),))
+                if total > <hsize_t>view.len:
+                    raise ValueError("Output buffer too small (%d bytes needed, %d given)"
+                                     % (total, view.len))
+
+                buf = <char*>view.buf
+                with nogil:
+                    for i in range(nchunks):
+                        IF HDF5_VERSION >= (1, 10, 3):
+                            err = _hdf5.H5Dread_chunk(dset_id, dxpl_id, offset_buf + i * rank,
+                                                      mask_buf + i, buf)
+                        ELSE:
+                            err = _hdf5.H5DOread_chunk(dset_id, dxpl_id, offset_buf + i * rank,
+                                                       mask_buf + i, buf)
+                        if err < 0:
+                            break
+                        buf += size_buf[i]
+                if err < 0:
+                    _chunk_error("Can't read chunk %s" % (tuple(offs[i]),))
+            finally:
+                PyBuffer_Release(&view)
+
+            return sizes, masks
+
     IF HDF5_VERSION >= (1, 10, 5):
 
         @with_phil
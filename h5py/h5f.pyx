@@ -520,6 +520,40 @@ cdef class FileID(GroupID):
         # I feel this should have some sanity checking to make sure that
         H5Fset_mdc_config(self.id, &config.cache_config)
 
+    IF HDF5_VERSION >= (1, 10, 1):
+
+        @with_phil
+        def get_page_buffering_stats(self):
+            """ () => DICT
+
+            Statistics of the page buffer, as a dict with keys 'accesses',
+            'hits', 'misses', 'evictions' and 'bypasses'.  Each value is a
+            tuple of counts for (metadata, raw data) pages.
+
+            Feature requires: 1.10.1 HDF5
+            """
+            cdef unsigned int accesses[2]
+            cdef unsigned int hits[2]
+            cdef unsigned int misses[2]
+            cdef unsigned int evictions[2]
+            cdef unsigned int bypasses[2]
+            H5Fget_page_buffering_stats(self.id, accesses, hits, misses, evictions, bypasses)
+            return {'accesses': (accesses[0], accesses[1]),
+                    'hits': (hits[0], hits[1]),
+                    'misses': (misses[0], misses[1]),
+                    'evictions': (evictions[0], evictions[1]),
+                    'bypasses': (bypasses[0], bypasses[1])}
+
+        @with_phil
+        def reset_page_buffering_stats(self):
+            """ ()
+
+            Reset the page buffer statistics.
+
+            Feature requires: 1.10.1 HDF5
+            """
+            H5Freset_page_buffering_stats(self.id)
+
     IF HDF5_VERSION >= SWMR_MIN_HDF5_VERSION:
 
         @with_phil
@@ -88,34 +88,306 @@ LOG_ALL       = H5FD_LOG_ALL        # (H5FD_LOG_ALLOC|H5FD_LOG_TIME_IO|H5FD_LOG_
 # registered as the handler for 'fileobj' driver via H5FDregister.
 
 # File-like object is passed from Python side via FAPL with
-# PropFAID.set_fileobj_driver. Then H5FD_fileobj_open callback acts,
-# taking file-like object from FAPL and returning struct
-# H5FD_fileobj_t (descendant of base H5FD_t) which will hold file
-# state. Other callbacks receive H5FD_fileobj_t and operate on
-# f.fileobj. If successful, callbacks must return zero; otherwise
-# non-zero value.
+# PropFAID.set_fileobj_driver, as a tuple (fileobj, page_size,
+# cache_bytes). Then H5FD_fileobj_open callback acts, taking file-like
+# object from FAPL and returning struct H5FD_fileobj_t (descendant of
+# base H5FD_t) which will hold file state. Other callbacks receive
+# H5FD_fileobj_t and operate on f.fileobj. If successful, callbacks
+# must return zero; otherwise non-zero value.
+
+# If page_size is non-zero, reads go through a FileObjCache: the file is
+# read in whole pages, which are kept (up to cache_bytes) and used to
+# answer later requests. Opening a file makes many small metadata
+# reads, so this saves a lot of Python calls. Writes go straight to the
+# file object and update any cached pages they touch.
+
+
+# How the driver reads and writes the file object: by seek() then
+# readinto()/read() or write(); with readinto_at()/write_at() methods of
+# the object; or directly on its file descriptor with pread()/pwrite()
+# (not on Windows), which needs no Python calls at all.
+cdef enum:
+    FILEOBJ_IO_SEEK = 0
+    FILEOBJ_IO_AT = 1
+    FILEOBJ_IO_FD = 2
 
 
 # H5FD_t of file-like object
 ctypedef struct H5FD_fileobj_t:
     H5FD_t base  # must be first
+    PyObject* fa  # driver info tuple from the FAPL
     PyObject* fileobj
+    PyObject* cache  # FileObjCache, or None
     haddr_t eoa
+    int read_io  # FILEOBJ_IO_*
+    int write_io
+    int fd  # for FILEOBJ_IO_FD
 
 
 # A minimal subset of callbacks is implemented. Non-essential
 # parameters (dxpl, type) are ignored.
 
 from cpython cimport Py_INCREF, Py_DECREF
+from cpython.bytearray cimport PyByteArray_AS_STRING
+from cpython.buffer cimport PyBuffer_FillInfo
+from cpython.exc cimport PyErr_Occurred
 from libc.stdlib cimport malloc as stdlib_malloc
 from libc.stdlib cimport free as stdlib_free
+from libc.errno cimport errno, EINTR
 cimport libc.stdio
 cimport libc.stdint
+IF UNAME_SYSNAME != "Windows":
+    from posix.unistd cimport pread, pwrite
+    from posix.types cimport off_t
+ELSE:
+    ctypedef libc.stdint.int64_t off_t
+
+# Largest file offset, as for the sec2 driver
+cdef haddr_t OFF_T_MAXADDR = ((<haddr_t>1) << (8 * sizeof(off_t) - 1)) - 1
+
+import io
+import os
+from collections import OrderedDict
+
+from .h5f cimport FileID
+from .h5p cimport PropFAID
+from ._objects import with_phil
+
+
+def _os_file(fileobj):
+    """ Return the FileIO object under a Python file object, or None.
+
+    fileno() alone isn't trusted: e.g. a GzipFile returns the descriptor of
+    the compressed file.
+    """
+    for obj in (fileobj, getattr(fileobj, 'file', None)):  # tempfile wrappers
+        raw = getattr(obj, 'raw', obj)
+        if isinstance(raw, io.FileIO) and not raw.closed:
+            return raw
+    return None
+
+
+cdef int _fileobj_setup_io(H5FD_fileobj_t *f) except -1:
+    """ Choose how to read and write the file object """
+    fileobj = <object>f.fileobj
+    f.read_io = f.write_io = FILEOBJ_IO_SEEK
+    f.fd = -1
+
+    IF UNAME_SYSNAME != "Windows":
+        raw = _os_file(fileobj)
+        if raw is not None:
+            # Anything buffered must reach the file before we bypass it
+            fileobj.flush()
+            f.fd = raw.fileno()
+            # Unreadable/unwritable objects keep the seek path, which
+            # raises io.UnsupportedOperation
+            if raw.readable():
+                f.read_io = FILEOBJ_IO_FD
+            if raw.writable():
+                f.write_io = FILEOBJ_IO_FD
+            return 0
+
+    if hasattr(fileobj, 'readinto_at'):
+        f.read_io = FILEOBJ_IO_AT
+    if hasattr(fileobj, 'write_at'):
+        f.write_io = FILEOBJ_IO_AT
+    return 0
+
+
+cdef Py_ssize_t _fileobj_readinto(H5FD_fileobj_t *f, haddr_t addr, size_t size, void *buf) except -1:
+    """ Read size bytes at addr into buf, returning the number read """
+    cdef unsigned char[:] mview
+    cdef size_t done = 0
+    cdef ssize_t n = 0
+    fileobj = <object>f.fileobj
+
+    IF UNAME_SYSNAME != "Windows":
+        if f.read_io == FILEOBJ_IO_FD:
+            with nogil:
+                while done < size:
+                    n = pread(f.fd, <char *>buf + done, size - done, addr + done)
+                    if n < 0 and errno == EINTR:
+                        continue
+                    if n <= 0:
+                        break
+                    done += n
+            if n < 0:
+                raise OSError(errno, os.strerror(errno))
+            return done
+
+    mview = <unsigned char[:size]>(buf)
+    if f.read_io == FILEOBJ_IO_AT:
+        return fileobj.readinto_at(addr, mview) or 0
+    fileobj.seek(addr)
+    if hasattr(fileobj, 'readinto'):
+        return fileobj.readinto(mview) or 0
+    b = fileobj.read(size)
+    memcpy(buf, <unsigned char *>b, len(b))
+    return len(b)
+
+
+cdef int _fileobj_write(H5FD_fileobj_t *f, haddr_t addr, size_t size, const void *buf) except -1:
+    """ Write size bytes from buf at addr """
+    cdef unsigned char[:] mview
+    cdef size_t done = 0
+    cdef ssize_t n = 0
+    fileobj = <object>f.fileobj
+
+    IF UNAME_SYSNAME != "Windows":
+        if f.write_io == FILEOBJ_IO_FD:
+            with nogil:
+                while done < size:
+                    n = pwrite(f.fd, <const char *>buf + done, size - done, addr + done)
+                    if n < 0 and errno == EINTR:
+                        continue
+                    if n < 0:
+                        break
+                    done += n
+            if n < 0:
+                raise OSError(errno, os.strerror(errno))
+            return 0
+
+    mview = <unsigned char[:size]>buf
+    if f.write_io == FILEOBJ_IO_AT:
+        fileobj.write_at(addr, mview)
+    else:
+        fileobj.seek(addr)
+        fileobj.write(mview)
+    return 0
+
+
+cdef class FileObjCache:
+
+    """
+        Page cache of a file opened with the fileobj driver.
+
+        Counters:
+
+        hits, misses
+            Pages found and not found in the cache.
+        reads
+            Calls made to read the file object, both to fill the cache and
+            for requests too large to cache.
+    """
+
+    cdef readonly size_t page_size
+    cdef readonly size_t nbytes
+    cdef readonly unsigned long long hits
+    cdef readonly unsigned long long misses
+    cdef readonly unsigned long long reads
+    cdef size_t max_pages
+    cdef object pages  # OrderedDict: page index -> bytearray, oldest first
+
+    def __init__(self, size_t page_size, size_t nbytes):
+        if page_size == 0:
+            raise ValueError("page_size must be positive")
+        self.page_size = page_size
+        self.nbytes = nbytes
+        self.max_pages = max(nbytes // page_size, 1)
+        self.pages = OrderedDict()
+
+    def __repr__(self):
+        return "<FileObjCache: %d of %d pages of %d bytes, %d hits, %d misses>" % (
+            len(self.pages), self.max_pages, self.page_size, self.hits, self.misses)
+
+    def clear(self):
+        """ () => None
+
+        Discard all cached pages.
+        """
+        self.pages.clear()
+
+    def reset_stats(self):
+        """ () => None
+
+        Set the hit, miss and read counters to zero.
+        """
+        self.hits = self.misses = self.reads = 0
+
+    cdef int _fill(self, H5FD_fileobj_t *f, size_t first, size_t count) except -1:
+        # Read a run of missing pages with one call
+        cdef size_t ps = self.page_size
+        cdef size_t i, got
+        data = bytearray(ps*count)
+        got = _fileobj_readinto(f, first*ps, ps*count, PyByteArray_AS_STRING(data))
+        self.reads += 1
+        self.misses += count
+        for i in range(count):
+            self.pages[first+i] = data[i*ps:min((i+1)*ps, got)] if i*ps < got else bytearray()
+            if len(self.pages) > self.max_pages:
+                self.pages.popitem(last=False)
+        return 0
+
+    cdef int read(self, H5FD_fileobj_t *f, haddr_t addr, size_t size, void *buf) except -1:
+        cdef size_t ps = self.page_size
+        cdef size_t first = addr // ps
+        cdef size_t last = (addr + size - 1) // ps
+        cdef size_t p, run, start, end, offset, n
+        cdef unsigned char *out = <unsigned char *>buf
+
+        if size == 0:
+            return 0
+        if last - first + 1 > self.max_pages:
+            # Too large to cache; cached pages are never dirty
+            self.reads += 1
+            n = _fileobj_readinto(f, addr, size, buf)
+            if n < size:
+                memset(out + n, 0, size - n)
+            return 0
+
+        # Fetch runs of adjacent missing pages
+        p = first
+        while p <= last:
+            if p in self.pages:
+                self.hits += 1
+                self.pages.move_to_end(p)
+                p += 1
+                continue
+            run = 1
+            while p + run <= last and (p + run) not in self.pages:
+                run += 1
+            self._fill(f, p, run)
+            p += run
+
+        # Copy out; pages short of page_size end at the end of file
+        for p in range(first, last + 1):
+            page = self.pages[p]
+            start = addr - p*ps if p == first else 0
+            end = addr + size - p*ps if p == last else ps
+            offset = p*ps + start - addr
+            # Bytes [start, n) of the page are in the file
+            n = min(end, len(page)) if len(page) > start else start
+            if n > start:
+                memcpy(out + offset, PyByteArray_AS_STRING(page) + start, n - start)
+            if n < end:
+                memset(out + offset + (n - start), 0, end - n)
+        return 0
+
+    cdef int write(self, haddr_t addr, size_t size, const void *buf) except -1:
+        # Update cached pages after data was written to the file
+        cdef size_t ps = self.page_size
+        cdef size_t p, start, end
+        cdef const unsigned char *src = <const unsigned char *>buf
+
+        if size == 0:
+            return 0
+        for p in range(addr // ps, (addr + size - 1) // ps + 1):
+            page = self.pages.get(p)
+            if page is None:
+                continue
+            start = addr - p*ps if p*ps < addr else 0
+            end = min(addr + size - p*ps, ps)
+            if len(page) < end:
+                page.extend(bytes(end - len(page)))
+            memcpy(PyByteArray_AS_STRING(page) + start, src + (p*ps + start - addr), end - start)
+        return 0
 
 
 cdef void *H5FD_fileobj_fapl_get(H5FD_fileobj_t *f) with gil:
-    Py_INCREF(<object>f.fileobj)
-    return f.fileobj
+    # The settings of an open file, with its page cache for get_fileobj_cache
+    fa = (<object>f.fa)[:3] + (<object>f.cache,)
+    Py_INCREF(fa)
+    return <PyObject *>fa
 
 cdef void *H5FD_fileobj_fapl_copy(PyObject *old_fa) with gil:
     cdef PyObject *new_fa = old_fa
@@ -127,15 +399,28 @@ cdef herr_t H5FD_fileobj_fapl_free(PyObject *fa) except -1 with gil:
     return 0
 
 cdef H5FD_fileobj_t *H5FD_fileobj_open(const char *name, unsigned flags, hid_t fapl, haddr_t maxaddr) except * with gil:
-    cdef PyObject *fileobj = <PyObject *>H5Pget_driver_info(fapl)
+    cdef PyObject *fa = <PyObject *>H5Pget_driver_info(fapl)
+    fileobj, page_size, cache_bytes = (<object>fa)[:3]
+    cache = FileObjCache(page_size, cache_bytes) if page_size else None
     f = <H5FD_fileobj_t *>stdlib_malloc(sizeof(H5FD_fileobj_t))
-    f.fileobj = fileobj
+    f.fa = fa
+    f.fileobj = <PyObject *>fileobj
+    f.cache = <PyObject *>cache
+    Py_INCREF(<object>f.fa)
     Py_INCREF(<object>f.fileobj)
+    Py_INCREF(<object>f.cache)
     f.eoa = 0
+    try:
+        _fileobj_setup_io(f)
+    except:
+        H5FD_fileobj_close(f)
+        raise
     return f
 
 cdef herr_t H5FD_fileobj_close(H5FD_fileobj_t *f) except -1 with gil:
+    Py_DECREF(<object>f.cache)
     Py_DECREF(<object>f.fileobj)
+    Py_DECREF(<object>f.fa)
     stdlib_free(f)
     return 0
 
@@ -147,32 +432,42 @@ cdef herr_t H5FD_fileobj_set_eoa(H5FD_fileobj_t *f, H5FD_mem_t type, haddr_t add
     return 0
 
 cdef haddr_t H5FD_fileobj_get_eof(const H5FD_fileobj_t *f, H5FD_mem_t type) except -1 with gil:  # HADDR_UNDEF
+    if f.fd >= 0:
+        return os.fstat(f.fd).st_size
     (<object>f.fileobj).seek(0, libc.stdio.SEEK_END)
     return (<object>f.fileobj).tell()
 
+cdef herr_t H5FD_fileobj_get_handle(H5FD_fileobj_t *f, hid_t fapl, void **handle):
+    # The file descriptor, for file objects read and written through one
+    if f.fd < 0:
+        return -1
+    handle[0] = &f.fd
+    return 0
+
 cdef herr_t H5FD_fileobj_read(H5FD_fileobj_t *f, H5FD_mem_t type, hid_t dxpl, haddr_t addr, size_t size, void *buf) except -1 with gil:
-    cdef unsigned char[:] mview
-    (<object>f.fileobj).seek(addr)
-    if hasattr(<object>f.fileobj, 'readinto'):
-        mview = <unsigned char[:size]>(buf)
-        (<object>f.fileobj).readinto(mview)
-    else:
-        b = (<object>f.fileobj).read(size)
-        if len(b) == size:
-            memcpy(buf, <unsigned char *>b, size)
-        else:
-            return 1
+    cdef Py_ssize_t got
+    if <object>f.cache is not None:
+        (<FileObjCache>f.cache).read(f, addr, size, buf)
+        return 0
+    got = _fileobj_readinto(f, addr, size, buf)
+    if got < size:
+        # Past the end of the file, as with the page cache
+        memset(<unsigned char *>buf + got, 0, size - got)
     return 0
 
 cdef herr_t H5FD_fileobj_write(H5FD_fileobj_t *f, H5FD_mem_t type, hid_t dxpl, haddr_t addr, size_t size, void *buf) except -1 with gil:
-    cdef unsigned char[:] mview
-    (<object>f.fileobj).seek(addr)
-    mview = <unsigned char[:size]>buf
-    (<object>f.fileobj).write(mview)
+    _fileobj_write(f, addr, size, buf)
+    if <object>f.cache is not None:
+        (<FileObjCache>f.cache).write(addr, size, buf)
     return 0
 
 cdef herr_t H5FD_fileobj_truncate(H5FD_fileobj_t *f, hid_t dxpl, hbool_t closing) except -1 with gil:
-    (<object>f.fileobj).truncate(f.eoa)
+    if f.write_io == FILEOBJ_IO_FD:
+        os.ftruncate(f.fd, f.eoa)
+    else:
+        (<object>f.fileobj).truncate(f.eoa)
+    if <object>f.cache is not None:
+        (<FileObjCache>f.cache).clear()
     return 0
 
 cdef herr_t H5FD_fileobj_flush(H5FD_fileobj_t *f, hid_t dxpl, hbool_t closing) except -1 with gil:
@@ -198,6 +493,7 @@ info.close = <herr_t (*)(H5FD_t *)>H5FD_fileobj_close
 info.get_eoa = <haddr_t (*)(const H5FD_t *, H5FD_mem_t)>H5FD_fileobj_get_eoa
 info.set_eoa = <herr_t (*)(H5FD_t *, H5FD_mem_t, haddr_t)>H5FD_fileobj_set_eoa
 info.get_eof = <haddr_t (*)(const H5FD_t *, H5FD_mem_t)>H5FD_fileobj_get_eof
+info.get_handle = <herr_t (*)(H5FD_t *, hid_t, void**)>H5FD_fileobj_get_handle
 info.read = <herr_t (*)(H5FD_t *, H5FD_mem_t, hid_t, haddr_t, size_t, void *)>H5FD_fileobj_read
 info.write = <herr_t (*)(H5FD_t *, H5FD_mem_t, hid_t, haddr_t, size_t, const void *)>H5FD_fileobj_write
 info.truncate = <herr_t (*)(H5FD_t *, hid_t, hbool_t)>H5FD_fileobj_truncate
@@ -213,3 +509,750 @@ info.fl_map = [H5FD_MEM_SUPER,  # default
 	       ]
 
 fileobj_driver = H5FDregister(&info)
+
+# The 'ranged' driver is the fileobj driver under another name, used with an
+# h5py.ranged.RangedReader as the file object, which is read-only.
+
+cdef H5FD_fileobj_t *H5FD_ranged_open(const char *name, unsigned flags, hid_t fapl, haddr_t maxaddr) except * with gil:
+    if flags & (H5F_ACC_RDWR | H5F_ACC_TRUNC | H5F_ACC_CREAT | H5F_ACC_EXCL):
+        if PyErr_Occurred():
+            # HDF5 retries with different flags after a failed open
+            return NULL
+        raise ValueError("The ranged driver can only open files read-only")
+    return H5FD_fileobj_open(name, flags, fapl, maxaddr)
+
+cdef H5FD_class_t ranged_info
+ranged_info = info
+ranged_info.name = 'ranged'
+ranged_info.open = <H5FD_t *(*)(const char *name, unsigned flags, hid_t fapl, haddr_t maxaddr)>H5FD_ranged_open
+
+ranged_driver = H5FDregister(&ranged_info)
+
+
+@with_phil
+def get_fileobj_cache(FileID fid not None):
+    """ (FileID fid) => FileObjCache or None
+
+    Page cache of a file opened with the fileobj driver, or None if it
+    was opened without one (page_size=0).
+    """
+    cdef hid_t fapl
+    fapl = H5Fget_access_plist(fid.id)
+    try:
+        if H5Pget_driver(fapl) != fileobj_driver:
+            raise ValueError("File was not opened with the fileobj driver")
+        # The driver info of an open file includes its cache
+        return (<object>H5Pget_driver_info(fapl))[3]
+    finally:
+        H5Pclose(fapl)
+
+
+# Implementation of read-only 'mmap' Virtual File Driver: the file is
+# mapped into memory when it is opened, and reads are a memcpy from the
+# mapping. If it can't be mapped (e.g. it's larger than the address
+# space), reads fall back to pread(). The mapping is owned by a
+# _MappedFile object, so buffers from get_mmap_buffer stay valid after
+# the file is closed.
+
+IF UNAME_SYSNAME != "Windows":
+
+    from posix.fcntl cimport open as posix_open, O_RDONLY
+    from posix.unistd cimport close as posix_close
+    from posix.stat cimport struct_stat, fstat
+    from posix.mman cimport mmap, munmap, PROT_READ, MAP_SHARED, MAP_FAILED
+
+    cdef class _MappedFile:
+
+        """ Read-only mapping of a whole file, as a buffer """
+
+        cdef void *addr
+        cdef size_t size
+
+        def __cinit__(self):
+            self.addr = NULL
+            self.size = 0
+
+        def __dealloc__(self):
+            if self.addr != NULL:
+                munmap(self.addr, self.size)
+
+        def __getbuffer__(self, Py_buffer *view, int flags):
+            PyBuffer_FillInfo(view, self, self.addr, self.size, 1, flags)
+
+    # Mapped files, by the file descriptor returned by get_handle.  The
+    # mapping is shared with other processes, so if the file is truncated
+    # while it is mapped, reading the missing pages raises SIGBUS.
+    _mmap_regions = {}
+
+    ctypedef struct H5FD_mmap_t:
+        H5FD_t base  # must be first
+        int fd
+        const unsigned char *addr  # of the mapping in _mmap_regions, or NULL
+        size_t mapsize
+        haddr_t eof
+        haddr_t eoa
+        libc.stdint.uint64_t device
+        libc.stdint.uint64_t inode
+
+    cdef H5FD_mmap_t *H5FD_mmap_open(const char *name, unsigned flags, hid_t fapl, haddr_t maxaddr) except * with gil:
+        cdef struct_stat st
+        cdef int fd
+        cdef void *addr = MAP_FAILED
+        cdef _MappedFile region
+
+        if flags & (H5F_ACC_RDWR | H5F_ACC_TRUNC | H5F_ACC_CREAT | H5F_ACC_EXCL):
+            if PyErr_Occurred():
+                # HDF5 retries with different flags after a failed open
+                return NULL
+            raise ValueError("The mmap driver can only open files read-only")
+
+        fd = posix_open(name, O_RDONLY)
+        if fd < 0 or fstat(fd, &st) < 0:
+            err = errno
+            if fd >= 0:
+                posix_close(fd)
+            raise OSError(err, os.strerror(err), name.decode('utf-8', 'replace'))
+
+        region = _MappedFile()
+        if 0 < st.st_size <= <libc.stdint.uint64_t>libc.stdint.SIZE_MAX:
+            addr = mmap(NULL, st.st_size, PROT_READ, MAP_SHARED, fd, 0)
+            if addr != MAP_FAILED:
+                region.addr = addr
+                region.size = st.st_size
+
+        f = <H5FD_mmap_t *>stdlib_malloc(sizeof(H5FD_mmap_t))
+        if f == NULL:
+            posix_close(fd)
+            raise MemoryError("Can't allocate mmap driver state")
+        f.fd = fd
+        if region.addr != NULL:
+            _mmap_regions[fd] = region
+            f.addr = <const unsigned char *>region.addr
+            f.mapsize = region.size
+        else:
+            f.addr = NULL
+            f.mapsize = 0
+        f.eof = st.st_size
+        f.eoa = 0
+        f.device = st.st_dev
+        f.inode = st.st_ino
+        return f
+
+    cdef herr_t H5FD_mmap_close(H5FD_mmap_t *f) except -1 with gil:
+        _mmap_regions.pop(f.fd, None)
+        posix_close(f.fd)
+        stdlib_free(f)
+        return 0
+
+    cdef int H5FD_mmap_cmp(const H5FD_mmap_t *f1, const H5FD_mmap_t *f2) nogil:
+        if f1.device != f2.device:
+            return -1 if f1.device < f2.device else 1
+        if f1.inode != f2.inode:
+            return -1 if f1.inode < f2.inode else 1
+        return 0
+
+    cdef haddr_t H5FD_mmap_get_eoa(const H5FD_mmap_t *f, H5FD_mem_t type) nogil:
+        return f.eoa
+
+    cdef herr_t H5FD_mmap_set_eoa(H5FD_mmap_t *f, H5FD_mem_t type, haddr_t addr) nogil:
+        f.eoa = addr
+        return 0
+
+    cdef haddr_t H5FD_mmap_get_eof(const H5FD_mmap_t *f, H5FD_mem_t type) nogil:
+        return f.eof
+
+    cdef herr_t H5FD_mmap_get_handle(H5FD_mmap_t *f, hid_t fapl, void **handle) nogil:
+        # The file descriptor, like sec2; see also get_mmap_buffer
+        handle[0] = &f.fd
+        return 0
+
+    cdef herr_t H5FD_mmap_read(H5FD_mmap_t *f, H5FD_mem_t type, hid_t dxpl, haddr_t addr, size_t size, void *buf) nogil:
+        cdef size_t avail = 0, done = 0
+        cdef ssize_t n
+        cdef unsigned char *out = <unsigned char *>buf
+
+        if addr < f.eof:
+            avail = <size_t>min(<haddr_t>size, f.eof - addr)
+        if f.addr != NULL and addr + avail <= f.mapsize:
+            memcpy(out, f.addr + addr, avail)
+            done = avail
+        else:
+            while done < avail:
+                n = pread(f.fd, out + done, avail - done, addr + done)
+                if n < 0 and errno == EINTR:
+                    continue
+                if n < 0:
+                    return -1
+                if n == 0:
+                    break
+                done += n
+        # Past the end of the file
+        memset(out + done, 0, size - done)
+        return 0
+
+    cdef herr_t H5FD_mmap_write(H5FD_mmap_t *f, H5FD_mem_t type, hid_t dxpl, haddr_t addr, size_t size, const void *buf) nogil:
+        return -1  # Files are only opened read-only
+
+    cdef H5FD_class_t mmap_info
+    memset(&mmap_info, 0, sizeof(mmap_info))
+
+    mmap_info.name = 'mmap'
+    # Files which can't be mapped are read with pread()
+    mmap_info.maxaddr = OFF_T_MAXADDR
+    mmap_info.fc_degree = H5F_CLOSE_WEAK
+    mmap_info.open = <H5FD_t *(*)(const char *name, unsigned flags, hid_t fapl, haddr_t maxaddr)>H5FD_mmap_open
+    mmap_info.close = <herr_t (*)(H5FD_t *)>H5FD_mmap_close
+    mmap_info.cmp = <int (*)(const H5FD_t *, const H5FD_t *)>H5FD_mmap_cmp
+    mmap_info.get_eoa = <haddr_t (*)(const H5FD_t *, H5FD_mem_t)>H5FD_mmap_get_eoa
+    mmap_info.set_eoa = <herr_t (*)(H5FD_t *, H5FD_mem_t, haddr_t)>H5FD_mmap_set_eoa
+    mmap_info.get_eof = <haddr_t (*)(const H5FD_t *, H5FD_mem_t)>H5FD_mmap_get_eof
+    mmap_info.get_handle = <herr_t (*)(H5FD_t *, hid_t, void**)>H5FD_mmap_get_handle
+    mmap_info.read = <herr_t (*)(H5FD_t *, H5FD_mem_t, hid_t, haddr_t, size_t, void *)>H5FD_mmap_read
+    mmap_info.write = <herr_t (*)(H5FD_t *, H5FD_mem_t, hid_t, haddr_t, size_t, const void *)>H5FD_mmap_write
+    # H5FD_FLMAP_DICHOTOMY
+    mmap_info.fl_map = [H5FD_MEM_SUPER,  # default
+                        H5FD_MEM_SUPER,  # super
+                        H5FD_MEM_SUPER,  # btree
+                        H5FD_MEM_DRAW,   # draw
+                        H5FD_MEM_DRAW,   # gheap
+                        H5FD_MEM_SUPER,  # lheap
+                        H5FD_MEM_SUPER   # ohdr
+                        ]
+
+    mmap_driver = H5FDregister(&mmap_info)
+
+ELSE:
+    mmap_driver = -1
+
+
+# Implementation of 'trace' Virtual File Driver: a pass-through to the
+# sec2 driver (opened with H5FDopen) which records every read and write.
+# The callbacks don't use Python, as reads of datasets are made without
+# the GIL. Records are buffered in memory and appended to the log file,
+# which is only created when the first records are written out; HDF5
+# may open and close the file without any I/O, e.g. to find out if it is
+# already open, and that mustn't overwrite the log.
+#
+# Log format, in native byte order:
+#   8 bytes   magic b'H5PYTRC\\x01'
+#   uint32    0x01020304, to detect the byte order
+#   uint32    size of each record
+#   uint32    length of the HDF5 file name, followed by the name
+#   records   TRACE_RECORD: start time (since the file was opened) and
+#             duration in seconds (float64), address and size (uint64),
+#             operation (TRACE_READ or TRACE_WRITE) and H5FD_mem_t (uint8)
+
+cdef extern from "hdf5.h" nogil:
+    H5FD_t *raw_H5FDopen "H5FDopen" (const char *name, unsigned flags, hid_t fapl_id, haddr_t maxaddr)
+    herr_t raw_H5FDclose "H5FDclose" (H5FD_t *file)
+    int raw_H5FDcmp "H5FDcmp" (const H5FD_t *f1, const H5FD_t *f2)
+    int raw_H5FDquery "H5FDquery" (const H5FD_t *f, unsigned long *flags)
+    haddr_t raw_H5FDget_eoa "H5FDget_eoa" (H5FD_t *file, H5FD_mem_t type)
+    herr_t raw_H5FDset_eoa "H5FDset_eoa" (H5FD_t *file, H5FD_mem_t type, haddr_t eoa)
+    haddr_t raw_H5FDget_eof "H5FDget_eof" (H5FD_t *file, H5FD_mem_t type)
+    herr_t raw_H5FDget_vfd_handle "H5FDget_vfd_handle" (H5FD_t *file, hid_t fapl, void **file_handle)
+    herr_t raw_H5FDread "H5FDread" (H5FD_t *file, H5FD_mem_t type, hid_t dxpl_id, haddr_t addr, size_t size, void *buf)
+    herr_t raw_H5FDwrite "H5FDwrite" (H5FD_t *file, H5FD_mem_t type, hid_t dxpl_id, haddr_t addr, size_t size, const void *buf)
+    herr_t raw_H5FDflush "H5FDflush" (H5FD_t *file, hid_t dxpl_id, hbool_t closing)
+    herr_t raw_H5FDtruncate "H5FDtruncate" (H5FD_t *file, hid_t dxpl_id, hbool_t closing)
+
+    unsigned long H5FD_FEAT_POSIX_COMPAT_HANDLE
+    unsigned long H5FD_FEAT_DEFAULT_VFD_COMPATIBLE
+
+from ._errors cimport set_exception
+
+cdef enum:
+    TRACE_OP_READ = 0
+    TRACE_OP_WRITE = 1
+
+TRACE_READ = TRACE_OP_READ
+TRACE_WRITE = TRACE_OP_WRITE
+TRACE_MAGIC = b'H5PYTRC\x01'
+
+cdef packed struct trace_record_t:
+    double start
+    double duration
+    libc.stdint.uint64_t addr
+    libc.stdint.uint64_t size
+    libc.stdint.uint8_t op
+    libc.stdint.uint8_t type
+
+TRACE_RECORD_SIZE = sizeof(trace_record_t)
+
+DEF TRACE_BUFFER_RECORDS = 4096
+
+ctypedef struct H5FD_trace_t:
+    H5FD_t base  # must be first
+    PyObject* fa  # driver info (log file name) from the FAPL
+    H5FD_t *inner  # sec2 file
+    char *name  # HDF5 file name
+    char *log_name
+    libc.stdio.FILE *log  # NULL until records are first written out
+    double t0
+    size_t nrecords
+    trace_record_t *records
+    bint failed  # writing the log failed; stop recording
+
+
+cdef int _trace_write_out(H5FD_trace_t *f) nogil:
+    """ Append buffered records to the log, creating it first if needed """
+    cdef libc.stdint.uint32_t header[3]
+    if f.failed:
+        f.nrecords = 0
+        return -1
+    if f.log == NULL:
+        f.log = libc.stdio.fopen(f.log_name, "wb")
+        if f.log == NULL:
+            f.failed = True
+            return -1
+        header[0] = 0x01020304
+        header[1] = sizeof(trace_record_t)
+        header[2] = strlen(f.name)
+        if (libc.stdio.fwrite(b'H5PYTRC\x01', 1, 8, f.log) != 8 or
+                libc.stdio.fwrite(header, sizeof(header), 1, f.log) != 1 or
+                libc.stdio.fwrite(f.name, 1, header[2], f.log) != header[2]):
+            f.failed = True
+    if not f.failed and f.nrecords and \
+            libc.stdio.fwrite(f.records, sizeof(trace_record_t), f.nrecords, f.log) != f.nrecords:
+        f.failed = True
+    f.nrecords = 0
+    return -1 if f.failed else 0
+
+cdef void _trace_record(H5FD_trace_t *f, int op, H5FD_mem_t type, haddr_t addr, size_t size, double start) nogil:
+    cdef trace_record_t *rec
+    if f.nrecords == TRACE_BUFFER_RECORDS:
+        _trace_write_out(f)
+    rec = &f.records[f.nrecords]
+    rec.start = start - f.t0
+    rec.duration = h5py_perf_counter() - start
+    rec.addr = addr
+    rec.size = size
+    rec.op = op
+    rec.type = <int>type
+    f.nrecords += 1
+
+cdef void *H5FD_trace_fapl_get(H5FD_trace_t *f) with gil:
+    Py_INCREF(<object>f.fa)
+    return f.fa
+
+cdef H5FD_trace_t *H5FD_trace_open(const char *name, unsigned flags, hid_t fapl, haddr_t maxaddr) except * with gil:
+    cdef PyObject *fa = <PyObject *>H5Pget_driver_info(fapl)
+    cdef bytes log_name = <object>fa
+    cdef hid_t inner_fapl
+    cdef H5FD_t *inner
+
+    inner_fapl = H5Pcreate(H5P_FILE_ACCESS)
+    try:
+        H5Pset_fapl_sec2(inner_fapl)
+        inner = raw_H5FDopen(name, flags, inner_fapl, HADDR_UNDEF)
+    finally:
+        H5Pclose(inner_fapl)
+    if inner == NULL:
+        return NULL  # Error is on the HDF5 stack
+
+    f = <H5FD_trace_t *>stdlib_malloc(sizeof(H5FD_trace_t))
+    if f == NULL:
+        raw_H5FDclose(inner)
+        raise MemoryError("Can't allocate trace driver state")
+    memset(f, 0, sizeof(H5FD_trace_t))
+    f.name = strdup(name)
+    f.log_name = strdup(log_name)
+    f.records = <trace_record_t *>stdlib_malloc(TRACE_BUFFER_RECORDS * sizeof(trace_record_t))
+    if f.name == NULL or f.log_name == NULL or f.records == NULL:
+        raw_H5FDclose(inner)
+        stdlib_free(f.records)
+        stdlib_free(f.log_name)
+        stdlib_free(f.name)
+        stdlib_free(f)
+        raise MemoryError("Can't allocate trace driver buffers")
+    f.fa = fa
+    Py_INCREF(<object>f.fa)
+    f.inner = inner
+    f.t0 = h5py_perf_counter()
+    return f
+
+cdef herr_t H5FD_trace_close(H5FD_trace_t *f) with gil:
+    cdef herr_t ret = raw_H5FDclose(f.inner)
+    if f.nrecords:
+        _trace_write_out(f)
+    if f.log != NULL and libc.stdio.fclose(f.log) != 0:
+        f.failed = True
+    if f.failed:
+        ret = -1
+    Py_DECREF(<object>f.fa)
+    stdlib_free(f.records)
+    stdlib_free(f.log_name)
+    stdlib_free(f.name)
+    stdlib_free(f)
+    return ret
+
+cdef int H5FD_trace_cmp(const H5FD_trace_t *f1, const H5FD_trace_t *f2) nogil:
+    return raw_H5FDcmp(f1.inner, f2.inner)
+
+cdef herr_t H5FD_trace_query(const H5FD_trace_t *f, unsigned long *flags) nogil:
+    if f == NULL:
+        flags[0] = 0
+        return 0
+    if raw_H5FDquery(f.inner, flags) < 0:
+        return -1
+    # This driver's handle isn't a sec2 one
+    flags[0] &= ~(H5FD_FEAT_POSIX_COMPAT_HANDLE | H5FD_FEAT_DEFAULT_VFD_COMPATIBLE)
+    return 0
+
+cdef haddr_t H5FD_trace_get_eoa(const H5FD_trace_t *f, H5FD_mem_t type) nogil:
+    return raw_H5FDget_eoa(f.inner, type)
+
+cdef herr_t H5FD_trace_set_eoa(H5FD_trace_t *f, H5FD_mem_t type, haddr_t addr) nogil:
+    return raw_H5FDset_eoa(f.inner, type, addr)
+
+cdef haddr_t H5FD_trace_get_eof(const H5FD_trace_t *f, H5FD_mem_t type) nogil:
+    return raw_H5FDget_eof(f.inner, type)
+
+cdef herr_t H5FD_trace_get_handle(H5FD_trace_t *f, hid_t fapl, void **handle) nogil:
+    return raw_H5FDget_vfd_handle(f.inner, fapl, handle)
+
+cdef herr_t H5FD_trace_read(H5FD_trace_t *f, H5FD_mem_t type, hid_t dxpl, haddr_t addr, size_t size, void *buf) nogil:
+    cdef double start = h5py_perf_counter()
+    cdef herr_t ret = raw_H5FDread(f.inner, type, dxpl, addr, size, buf)
+    _trace_record(f, TRACE_OP_READ, type, addr, size, start)
+    return ret
+
+cdef herr_t H5FD_trace_write(H5FD_trace_t *f, H5FD_mem_t type, hid_t dxpl, haddr_t addr, size_t size, const void *buf) nogil:
+    cdef double start = h5py_perf_counter()
+    cdef herr_t ret = raw_H5FDwrite(f.inner, type, dxpl, addr, size, buf)
+    _trace_record(f, TRACE_OP_WRITE, type, addr, size, start)
+    return ret
+
+cdef herr_t H5FD_trace_flush(H5FD_trace_t *f, hid_t dxpl, hbool_t closing) nogil:
+    return raw_H5FDflush(f.inner, dxpl, closing)
+
+cdef herr_t H5FD_trace_truncate(H5FD_trace_t *f, hid_t dxpl, hbool_t closing) nogil:
+    return raw_H5FDtruncate(f.inner, dxpl, closing)
+
+
+cdef H5FD_class_t trace_info
+memset(&trace_info, 0, sizeof(trace_info))
+
+trace_info.name = 'trace'
+trace_info.maxaddr = OFF_T_MAXADDR
+trace_info.fc_degree = H5F_CLOSE_WEAK
+trace_info.fapl_size = sizeof(PyObject *)
+trace_info.fapl_get = <void *(*)(H5FD_t *)>H5FD_trace_fapl_get
+trace_info.fapl_copy = <void *(*)(const void *)>H5FD_fileobj_fapl_copy
+trace_info.fapl_free = <herr_t (*)(void *)>H5FD_fileobj_fapl_free
+trace_info.open = <H5FD_t *(*)(const char *name, unsigned flags, hid_t fapl, haddr_t maxaddr)>H5FD_trace_open
+trace_info.close = <herr_t (*)(H5FD_t *)>H5FD_trace_close
+trace_info.cmp = <int (*)(const H5FD_t *, const H5FD_t *)>H5FD_trace_cmp
+trace_info.query = <herr_t (*)(const H5FD_t *, unsigned long *)>H5FD_trace_query
+trace_info.get_eoa = <haddr_t (*)(const H5FD_t *, H5FD_mem_t)>H5FD_trace_get_eoa
+trace_info.set_eoa = <herr_t (*)(H5FD_t *, H5FD_mem_t, haddr_t)>H5FD_trace_set_eoa
+trace_info.get_eof = <haddr_t (*)(const H5FD_t *, H5FD_mem_t)>H5FD_trace_get_eof
+trace_info.get_handle = <herr_t (*)(H5FD_t *, hid_t, void**)>H5FD_trace_get_handle
+trace_info.read = <herr_t (*)(H5FD_t *, H5FD_mem_t, hid_t, haddr_t, size_t, void *)>H5FD_trace_read
+trace_info.write = <herr_t (*)(H5FD_t *, H5FD_mem_t, hid_t, haddr_t, size_t, const void *)>H5FD_trace_write
+trace_info.flush = <herr_t (*)(H5FD_t *, hid_t, hbool_t)>H5FD_trace_flush
+trace_info.truncate = <herr_t (*)(H5FD_t *, hid_t, hbool_t)>H5FD_trace_truncate
+# H5FD_FLMAP_DICHOTOMY, as for sec2
+trace_info.fl_map = [H5FD_MEM_SUPER,  # default
+                     H5FD_MEM_SUPER,  # super
+                     H5FD_MEM_SUPER,  # btree
+                     H5FD_MEM_DRAW,   # draw
+                     H5FD_MEM_DRAW,   # gheap
+                     H5FD_MEM_SUPER,  # lheap
+                     H5FD_MEM_SUPER   # ohdr
+                     ]
+
+trace_driver = H5FDregister(&trace_info)
+
+
+cdef int _raise_hdf5_error(msg) except -1:
+    """ Raise the error from the HDF5 error stack, or OSError(msg) """
+    if set_exception():
+        return -1
+    raise OSError(msg)
+
+
+@with_phil
+def replay(PropFAID fapl not None, char *name, const libc.stdint.uint64_t[:] addr,
+           const libc.stdint.uint64_t[:] size, const libc.stdint.uint8_t[:] op,
+           const libc.stdint.uint8_t[:] mem_type, double[:] durations, bint writes=False):
+    """ (PropFAID fapl, BYTES name, addr, size, op, mem_type, durations, BOOL writes=False)
+
+    Repeat the reads (and writes, if writes is True) of a trace on the file
+    name, opened with the file driver from fapl.  The remaining arguments
+    are arrays with one element per operation, as in a log recorded by the
+    trace driver; the time each operation takes is stored in durations.
+    Writes store zeros, so should only be replayed on a scratch copy.
+    """
+    cdef Py_ssize_t i, n = addr.shape[0]
+    cdef H5FD_t *f
+    cdef haddr_t eoa = 0
+    cdef size_t bufsize = 0
+    cdef void *buf
+    cdef herr_t ret = 0
+    cdef double start
+
+    if not (size.shape[0] == op.shape[0] == mem_type.shape[0] == durations.shape[0] == n):
+        raise ValueError("Trace arrays must have the same length")
+    for i in range(n):
+        eoa = max(eoa, <haddr_t>(addr[i] + size[i]))
+        bufsize = max(bufsize, <size_t>size[i])
+
+    buf = stdlib_malloc(max(bufsize, 1))
+    if buf == NULL:
+        raise MemoryError("Unable to allocate a %d byte replay buffer" % bufsize)
+    memset(buf, 0, max(bufsize, 1))
+    f = raw_H5FDopen(name, H5F_ACC_RDWR if writes else H5F_ACC_RDONLY, fapl.id, HADDR_UNDEF)
+    if f == NULL:
+        stdlib_free(buf)
+        _raise_hdf5_error("Unable to open %r for replay" % name)
+    try:
+        # Reads mustn't go beyond the end of the allocated space
+        if raw_H5FDset_eoa(f, H5FD_MEM_DEFAULT, max(eoa, raw_H5FDget_eof(f, H5FD_MEM_DEFAULT))) < 0:
+            _raise_hdf5_error("Unable to set the end of the file for replay")
+        with nogil:
+            for i in range(n):
+                start = h5py_perf_counter()
+                if op[i] == TRACE_OP_READ:
+                    ret = raw_H5FDread(f, <H5FD_mem_t>mem_type[i], H5P_DEFAULT, addr[i], size[i], buf)
+                elif writes:
+                    ret = raw_H5FDwrite(f, <H5FD_mem_t>mem_type[i], H5P_DEFAULT, addr[i], size[i], buf)
+                durations[i] = h5py_perf_counter() - start
+                if ret < 0:
+                    break
+        if ret < 0:
+            _raise_hdf5_error("Replaying operation %d failed" % i)
+    finally:
+        stdlib_free(buf)
+        if raw_H5FDclose(f) < 0 and ret >= 0:
+            _raise_hdf5_error("Unable to close %r after replay" % name)
+
+
+@with_phil
+def get_mmap_buffer(FileID fid not None):
+    """ (FileID fid) => MEMORYVIEW or None
+
+    Read-only view of the whole of a file opened with the mmap driver, or
+    None if it could not be mapped.  Data stored contiguously without
+    filters can be used from this without copying, at the offset from
+    DatasetID.get_offset().  The view remains valid after the file is
+    closed.
+
+    The mapping is shared, so changes to the file by other processes are
+    visible through it, and if the file is truncated, reading past its new
+    end raises SIGBUS and kills the process.  Only use this for files which
+    won't be modified while they are open.
+    """
+    cdef hid_t fapl
+    cdef void *handle
+    fapl = H5Fget_access_plist(fid.id)
+    try:
+        if mmap_driver < 0 or H5Pget_driver(fapl) != mmap_driver:
+            raise ValueError("File was not opened with the mmap driver")
+    finally:
+        H5Pclose(fapl)
+    IF UNAME_SYSNAME != "Windows":
+        H5Fget_vfd_handle(fid.id, H5P_DEFAULT, &handle)
+        region = _mmap_regions.get((<int *>handle)[0])
+        return None if region is None else memoryview(region)
+
+
+# === Core driver file images =================================================
+
+# The core driver allocates, resizes and frees the memory holding a file
+# through file image callbacks if they are set in the file access property
+# list.  Those below keep the memory in _ImageBlock objects, so it can be
+# exported as a buffer which stays valid however the file changes, and let a
+# read-only file use memory belonging to another Python object.
+
+from libc.stdlib cimport calloc, realloc
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release, PyBUF_SIMPLE
+
+cdef class _ImageBlock:
+
+    """ Memory holding the image of a file, as a read-only buffer """
+
+    cdef char *data
+    cdef size_t size
+    cdef bint borrowed  # data belongs to the object in source
+    cdef Py_buffer source
+    cdef Py_ssize_t exports
+
+    def __cinit__(self):
+        self.data = NULL
+        self.size = 0
+        self.borrowed = False
+        self.exports = 0
+
+    def __dealloc__(self):
+        if self.borrowed:
+            PyBuffer_Release(&self.source)
+        else:
+            stdlib_free(self.data)
+
+    def __getbuffer__(self, Py_buffer *view, int flags):
+        PyBuffer_FillInfo(view, self, self.data, self.size, 1, flags)
+        self.exports += 1
+
+    def __releasebuffer__(self, Py_buffer *view):
+        self.exports -= 1
+
+
+# Blocks in use by HDF5, by address: [block, number of users].  The image of
+# a borrowed block is used by the property list it was set on, copies of the
+# property list and the file opened from it.
+cdef dict _image_blocks = {}
+
+cdef void *_image_use(_ImageBlock block):
+    entry = _image_blocks.setdefault(<size_t>block.data, [block, 0])
+    entry[1] += 1
+    return block.data
+
+cdef void _image_release(void *ptr):
+    entry = _image_blocks.get(<size_t>ptr)
+    if entry is not None:
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del _image_blocks[<size_t>ptr]
+
+cdef _ImageBlock _image_alloc(size_t size):
+    cdef _ImageBlock block = _ImageBlock()
+    block.data = <char *>calloc(max(size, 1), 1)
+    if block.data == NULL:
+        raise MemoryError()
+    block.size = size
+    return block
+
+cdef void *_image_malloc(size_t size, H5FD_file_image_op_t op, void *udata) noexcept with gil:
+    try:
+        if udata != NULL:
+            if size > (<_ImageBlock>udata).size:
+                return NULL
+            return _image_use(<_ImageBlock>udata)
+        return _image_use(_image_alloc(size))
+    except MemoryError:
+        return NULL
+
+cdef void *_image_memcpy(void *dest, const void *src, size_t size, H5FD_file_image_op_t op, void *udata) noexcept nogil:
+    if dest != src:
+        memcpy(dest, src, size)
+    return dest
+
+cdef void *_image_realloc(void *ptr, size_t size, H5FD_file_image_op_t op, void *udata) noexcept with gil:
+    cdef _ImageBlock block, new
+    cdef void *data
+
+    if ptr == NULL:
+        return _image_malloc(size, op, udata)
+    entry = _image_blocks.get(<size_t>ptr)
+    if entry is None:
+        return NULL
+    block = entry[0]
+    if block.borrowed:
+        # The core driver only shrinks images it isn't allowed to write
+        return ptr if size <= block.size else NULL
+
+    try:
+        if block.exports == 0 and entry[1] == 1:
+            data = realloc(block.data, max(size, 1))
+            if data == NULL:
+                return NULL
+            if size > block.size:
+                memset(<char *>data + block.size, 0, size - block.size)
+            del _image_blocks[<size_t>ptr]
+            block.data = <char *>data
+            block.size = size
+            return _image_use(block)
+
+        # Views of the old memory remain valid, with the old contents
+        new = _image_alloc(size)
+        memcpy(new.data, block.data, min(size, block.size))
+        _image_release(ptr)
+        return _image_use(new)
+    except MemoryError:
+        return NULL
+
+cdef herr_t _image_free(void *ptr, H5FD_file_image_op_t op, void *udata) noexcept with gil:
+    _image_release(ptr)
+    return 0
+
+cdef void *_image_udata_copy(void *udata) noexcept with gil:
+    Py_INCREF(<object>udata)
+    return udata
+
+cdef herr_t _image_udata_free(void *udata) noexcept with gil:
+    Py_DECREF(<object>udata)
+    return 0
+
+
+def set_image_callbacks(PropFAID fapl not None, image=None):
+    """ (PropFAID fapl, BUFFER image=None)
+
+    Let h5py manage the memory used by the core driver for files opened
+    with this property list, so get_core_image() can return it without
+    copying.  If image is given, it is an object supporting the buffer
+    protocol, such as bytes, a NumPy array or an mmap, holding a file
+    image which is then used directly instead of being copied.  Files can
+    only be opened read-only from such an image, and the object can't be
+    resized or closed while they are open.
+
+    Must be called before any file image is set in the property list.
+    """
+    cdef H5FD_file_image_callbacks_t callbacks
+    cdef _ImageBlock block = None
+
+    if image is not None:
+        block = _ImageBlock()
+        PyObject_GetBuffer(image, &block.source, PyBUF_SIMPLE)
+        block.borrowed = True
+        block.data = <char *>block.source.buf
+        block.size = block.source.len
+
+    callbacks.image_malloc = _image_malloc
+    callbacks.image_memcpy = _image_memcpy
+    callbacks.image_realloc = _image_realloc
+    callbacks.image_free = _image_free
+    if block is None:
+        callbacks.udata_copy = NULL
+        callbacks.udata_free = NULL
+        callbacks.udata = NULL
+    else:
+        callbacks.udata_copy = _image_udata_copy
+        callbacks.udata_free = _image_udata_free
+        callbacks.udata = <void *>block
+    H5Pset_file_image_callbacks(fapl.id, &callbacks)
+
+    if block is not None:
+        # HDF5 now holds a reference to block through udata_copy
+        H5Pset_file_image(fapl.id, block.data, block.size)
+
+
+@with_phil
+def get_core_image(FileID fid not None):
+    """ (FileID fid) => MEMORYVIEW or None
+
+    Read-only view of the image of a file opened with the core driver,
+    without copying it, or None if its memory isn't managed by h5py (see
+    set_image_callbacks()) or doesn't hold the whole image.  Flush the file
+    first for the image to be complete.  The view keeps its contents if the
+    file is later changed or closed.
+    """
+    cdef hid_t fapl
+    cdef void *handle
+    cdef char *mem
+    cdef ssize_t size
+
+    fapl = H5Fget_access_plist(fid.id)
+    try:
+        if H5Pget_driver(fapl) != H5FD_CORE:
+            raise ValueError("File was not opened with the core driver")
+    finally:
+        H5Pclose(fapl)
+
+    H5Fget_vfd_handle(fid.id, H5P_DEFAULT, &handle)
+    mem = (<char **>handle)[0]
+    size = H5Fget_file_image(fid.id, NULL, 0)
+    entry = _image_blocks.get(<size_t>mem)
+    if entry is None or <size_t>size > (<_ImageBlock>entry[0]).size:
+        return None
+    return memoryview(entry[0])[:size]
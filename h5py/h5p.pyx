@@ -399,6 +399,25 @@ cdef class PropFCID(PropOCID):
             H5Pget_file_space_strategy(self.id, &strategy, &persist, &threshold)
             return (strategy, persist, threshold)
 
+        @with_phil
+        def set_file_space_page_size(self, hsize_t fsp_size):
+            """ (LONG fsp_size)
+
+            Set the file space page size, used with the paged file space
+            strategy.
+            """
+            H5Pset_file_space_page_size(self.id, fsp_size)
+
+        @with_phil
+        def get_file_space_page_size(self):
+            """ () => LONG fsp_size
+
+            Get the file space page size.
+            """
+            cdef hsize_t fsp_size
+            H5Pget_file_space_page_size(self.id, &fsp_size)
+            return fsp_size
+
 
 # Dataset creation
 cdef class PropDCID(PropOCID):
@@ -1080,12 +1099,27 @@ cdef class PropFAID(PropInstanceID):
 
 
     @with_phil
-    def set_fileobj_driver(self, hid_t driver_id, object fileobj):
-        """(INT driver_id, OBJECT fileobj)
+    def set_fileobj_driver(self, hid_t driver_id, object fileobj,
+                           size_t page_size=0, size_t cache_bytes=0):
+        """(INT driver_id, OBJECT fileobj, UINT page_size=0, UINT cache_bytes=0)
 
         Select the "fileobj" file driver (h5py-specific).
+
+        If page_size is non-zero, the file object is read in pages of that
+        many bytes, and up to cache_bytes of them are kept in memory.
         """
-        return H5Pset_driver(self.id, driver_id, <PyObject *>fileobj)
+        fa = (fileobj, page_size, cache_bytes)
+        return H5Pset_driver(self.id, driver_id, <PyObject *>fa)
+
+
+    @with_phil
+    def set_trace_driver(self, hid_t driver_id, bytes log_name not None):
+        """(INT driver_id, BYTES log_name)
+
+        Select the "trace" file driver (h5py-specific), recording the file's
+        reads and writes to the file log_name.
+        """
+        return H5Pset_driver(self.id, driver_id, <PyObject *>log_name)
 
 
     @with_phil
@@ -1306,6 +1340,36 @@ cdef class PropFAID(PropInstanceID):
             finally:
                 PyBuffer_Release(&buf)
 
+    IF HDF5_VERSION >= (1, 10, 1):
+
+        @with_phil
+        def set_page_buffer_size(self, size_t buf_size, unsigned int min_meta_per=0,
+                                 unsigned int min_raw_per=0):
+            """ (UINT buf_size, UINT min_meta_per=0, UINT min_raw_per=0)
+
+            Set the maximum size in bytes of the page buffer, and the minimum
+            percentages of it kept for metadata and raw data pages.  The page
+            buffer is only used for files created with the paged file space
+            strategy; buf_size must be at least one file space page.
+
+            Feature requires: 1.10.1 HDF5
+            """
+            H5Pset_page_buffer_size(self.id, buf_size, min_meta_per, min_raw_per)
+
+        @with_phil
+        def get_page_buffer_size(self):
+            """ () => TUPLE(UINT buf_size, UINT min_meta_per, UINT min_raw_per)
+
+            Get the page buffer size and minimum metadata and raw data
+            percentages.
+
+            Feature requires: 1.10.1 HDF5
+            """
+            cdef size_t buf_size
+            cdef unsigned int min_meta_per, min_raw_per
+            H5Pget_page_buffer_size(self.id, &buf_size, &min_meta_per, &min_raw_per)
+            return (buf_size, min_meta_per, min_raw_per)
+
 
 # Link creation
 cdef class PropLCID(PropCreateID):
@@ -11,12 +11,21 @@
     Filter API and constants.
 """
 
+from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy, memset
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release, PyBUF_SIMPLE
+
 from ._objects import phil, with_phil
 
+cdef extern from "Python.h":
+    object PyMemoryView_FromMemory(char *mem, Py_ssize_t size, int flags)
+    int PyBUF_READ
+
 
 # === Public constants and data structures ====================================
 
 FILTER_LZF = H5PY_FILTER_LZF
+FILTER_BSLZ4 = H5PY_FILTER_BSLZ4
 
 FILTER_ERROR    = H5Z_FILTER_ERROR
 FILTER_NONE     = H5Z_FILTER_NONE
@@ -103,8 +112,324 @@ def unregister_filter(int filter_code):
     Unregister a filter
 
     '''
-    return <int>H5Zunregister(<H5Z_filter_t>filter_code) >= 0
+    cdef int slot
+    retval = <int>H5Zunregister(<H5Z_filter_t>filter_code) >= 0
+    for slot in range(MAX_PYTHON_FILTERS):
+        if _py_filters[slot] is not None and _py_filters[slot][0] == filter_code:
+            _py_filters[slot] = None
+    return retval
 
 
 def _register_lzf():
     register_lzf()
+
+
+def _register_bslz4():
+    register_bslz4()
+
+
+def _bslz4_simd():
+    """() => STRING
+
+    Instruction set used by the bundled bitshuffle filter, chosen when it is
+    registered: "avx2", "sse2" or "scalar".
+    """
+    return bslz4_simd().decode('ascii')
+
+
+# === Filter statistics =======================================================
+
+cdef extern from "lzf_filter.h":
+    size_t lzf_filter(unsigned int flags, size_t cd_nelmts,
+                      const unsigned int cd_values[], size_t nbytes,
+                      size_t *buf_size, void **buf) nogil
+    herr_t lzf_set_local(hid_t dcpl, hid_t type, hid_t space)
+
+cdef extern from "bslz4_filter.h":
+    size_t bslz4_filter(unsigned int flags, size_t cd_nelmts,
+                        const unsigned int cd_values[], size_t nbytes,
+                        size_t *buf_size, void **buf) nogil
+    herr_t bslz4_set_local(hid_t dcpl, hid_t type, hid_t space)
+
+ctypedef size_t (*_c_filter_t)(unsigned int flags, size_t cd_nelmts,
+    const unsigned int cd_values[], size_t nbytes, size_t *buf_size,
+    void **buf) nogil
+
+cdef struct _filter_stat:
+    int code
+    int reverse
+    unsigned long long calls
+    unsigned long long bytes_in
+    unsigned long long bytes_out
+    double seconds
+
+DEF MAX_FILTER_STATS = 64
+
+# Running totals, updated from filter callbacks.  Filters only run inside
+# library calls, which are serialized by the global lock.
+cdef _filter_stat _filter_stats[MAX_FILTER_STATS]
+cdef int _n_filter_stats = 0
+cdef bint _stats_enabled = False
+
+cdef void _record_filter(int code, unsigned int flags, size_t nbytes_in,
+                         size_t nbytes_out, double seconds) nogil:
+    global _n_filter_stats
+    cdef int reverse = (flags & H5Z_FLAG_REVERSE) != 0
+    cdef int i
+    for i in range(_n_filter_stats):
+        if _filter_stats[i].code == code and _filter_stats[i].reverse == reverse:
+            break
+    else:
+        if _n_filter_stats == MAX_FILTER_STATS:
+            return
+        i = _n_filter_stats
+        _n_filter_stats += 1
+        memset(&_filter_stats[i], 0, sizeof(_filter_stat))
+        _filter_stats[i].code = code
+        _filter_stats[i].reverse = reverse
+    _filter_stats[i].calls += 1
+    _filter_stats[i].bytes_in += nbytes_in
+    _filter_stats[i].bytes_out += nbytes_out
+    _filter_stats[i].seconds += seconds
+
+cdef inline size_t _timed_filter(int code, _c_filter_t func, unsigned int flags,
+                                 size_t cd_nelmts, const unsigned int cd_values[],
+                                 size_t nbytes, size_t *buf_size, void **buf) nogil:
+    cdef double start = h5py_perf_counter()
+    cdef size_t nout = func(flags, cd_nelmts, cd_values, nbytes, buf_size, buf)
+    if nout != 0:
+        _record_filter(code, flags, nbytes, nout, h5py_perf_counter() - start)
+    return nout
+
+cdef size_t _timed_lzf(unsigned int f, size_t n, const unsigned int c[], size_t nb, size_t *bs, void **b) nogil:
+    return _timed_filter(H5PY_FILTER_LZF, lzf_filter, f, n, c, nb, bs, b)
+
+cdef size_t _timed_bslz4(unsigned int f, size_t n, const unsigned int c[], size_t nb, size_t *bs, void **b) nogil:
+    return _timed_filter(H5PY_FILTER_BSLZ4, bslz4_filter, f, n, c, nb, bs, b)
+
+cdef int _register_timed(int code, const char *name, H5Z_set_local_func_t set_local,
+                         _c_filter_t func) except -1:
+    cdef H5Z_class2_t cls
+    memset(&cls, 0, sizeof(cls))
+    cls.version = H5Z_CLASS_T_VERS
+    cls.id = <H5Z_filter_t>code
+    cls.encoder_present = 1
+    cls.decoder_present = 1
+    cls.name = name
+    cls.set_local = set_local
+    cls.filter = <H5Z_func_t>func
+    H5Zregister(&cls)
+    return 0
+
+
+@with_phil
+def set_filter_stats(bint enabled):
+    """(BOOL enabled)
+
+    Start or stop counting the chunks processed by filters implemented in
+    h5py (LZF, bitshuffle/LZ4 and filters registered with
+    register_python_filter), along with the bytes going in and out of them
+    and the time spent in them.  Counts accumulate over the whole process;
+    see get_filter_stats.  Filters built in to HDF5 can't be counted.
+    """
+    global _stats_enabled
+    if enabled == _stats_enabled:
+        return
+    if enabled:
+        _register_timed(H5PY_FILTER_LZF, "lzf", <H5Z_set_local_func_t>lzf_set_local,
+                        _timed_lzf)
+        _register_timed(H5PY_FILTER_BSLZ4, "bitshuffle",
+                        <H5Z_set_local_func_t>bslz4_set_local, _timed_bslz4)
+    else:
+        register_lzf()
+        register_bslz4()
+    _stats_enabled = enabled
+
+
+@with_phil
+def get_filter_stats():
+    """() => LIST of (filter_code, reverse, calls, bytes_in, bytes_out, seconds)
+
+    Totals collected since set_filter_stats(True) was first called, for
+    each filter and direction (reverse is True for decoding).  The totals
+    keep increasing; compare two snapshots to measure an operation.
+    """
+    cdef int i
+    return [(_filter_stats[i].code, bool(_filter_stats[i].reverse),
+             _filter_stats[i].calls, _filter_stats[i].bytes_in,
+             _filter_stats[i].bytes_out, _filter_stats[i].seconds)
+            for i in range(_n_filter_stats)]
+
+
+# === Filters implemented in Python ===========================================
+
+# HDF5 does not tell a filter function which filter it was called for, so each
+# Python filter gets a slot with its own C function, which passes the slot
+# number on to _py_filter.
+MAX_PYTHON_FILTERS = 16
+
+# (filter_code, name, encode, decode) for each slot, or None
+cdef list _py_filters = [None] * MAX_PYTHON_FILTERS
+
+cdef size_t _py_filter(int slot, unsigned int flags, size_t cd_nelmts,
+                       const unsigned int cd_values[], size_t nbytes,
+                       size_t *buf_size, void **buf) except? 0:
+    cdef Py_buffer out
+    cdef void *outbuf
+    cdef size_t nout
+    cdef size_t i
+
+    cdef double start = h5py_perf_counter()
+
+    reverse = flags & H5Z_FLAG_REVERSE
+    code, _, encode, decode = _py_filters[slot]
+    func = decode if reverse else encode
+    opts = tuple([cd_values[i] for i in range(cd_nelmts)])
+
+    # The filter gets a read-only view of HDF5's buffer, without a copy
+    data = PyMemoryView_FromMemory(<char *>buf[0], nbytes, PyBUF_READ)
+    try:
+        result = func(data, opts)
+        PyObject_GetBuffer(result, &out, PyBUF_SIMPLE)
+        try:
+            nout = out.len
+            if nout == 0:
+                raise ValueError("Filter returned no data")
+            outbuf = malloc(nout)
+            if outbuf == NULL:
+                raise MemoryError("Can't allocate filter output buffer")
+            memcpy(outbuf, out.buf, nout)
+        finally:
+            PyBuffer_Release(&out)
+        del result
+    except BaseException:
+        # The exception's traceback keeps the view alive, but HDF5 frees the
+        # buffer once the filter fails.
+        try:
+            data.release()
+        except BufferError:
+            pass
+        if flags & H5Z_FLAG_OPTIONAL and not reverse:
+            # HDF5 stores the chunk unfiltered when an optional filter fails
+            return 0
+        raise
+
+    try:
+        data.release()
+    except BufferError:
+        # The filter kept a reference to its input; leak the buffer rather
+        # than leave that reference pointing to freed memory.
+        pass
+    else:
+        free(buf[0])
+    buf[0] = outbuf
+    buf_size[0] = nout
+    if _stats_enabled:
+        _record_filter(code, flags, nbytes, nout, h5py_perf_counter() - start)
+    return nout
+
+cdef size_t _py_filter_0(unsigned int f, size_t n, const unsigned int c[], size_t nb, size_t *bs, void **b) except? 0 with gil:
+    return _py_filter(0, f, n, c, nb, bs, b)
+cdef size_t _py_filter_1(unsigned int f, size_t n, const unsigned int c[], size_t nb, size_t *bs, void **b) except? 0 with gil:
+    return _py_filter(1, f, n, c, nb, bs, b)
+cdef size_t _py_filter_2(unsigned int f, size_t n, const unsigned int c[], size_t nb, size_t *bs, void **b) except? 0 with gil:
+    return _py_filter(2, f, n, c, nb, bs, b)
+cdef size_t _py_filter_3(unsigned int f, size_t n, const unsigned int c[], size_t nb, size_t *bs, void **b) except? 0 with gil:
+    return _py_filter(3, f, n, c, nb, bs, b)
+cdef size_t _py_filter_4(unsigned int f, size_t n, const unsigned int c[], size_t nb, size_t *bs, void **b) except? 0 with gil:
+    return _py_filter(4, f, n, c, nb, bs, b)
+cdef size_t _py_filter_5(unsigned int f, size_t n, const unsigned int c[], size_t nb, size_t *bs, void **b) except? 0 with gil:
+    return _py_filter(5, f, n, c, nb, bs, b)
+cdef size_t _py_filter_6(unsigned int f, size_t n, const unsigned int c[], size_t nb, size_t *bs, void **b) except? 0 with gil:
+    return _py_filter(6, f, n, c, nb, bs, b)
+cdef size_t _py_filter_7(unsigned int f, size_t n, const unsigned int c[], size_t nb, size_t *bs, void **b) except? 0 with gil:
+    return _py_filter(7, f, n, c, nb, bs, b)
+cdef size_t _py_filter_8(unsigned int f, size_t n, const unsigned int c[], size_t nb, size_t *bs, void **b) except? 0 with gil:
+    return _py_filter(8, f, n, c, nb, bs, b)
+cdef size_t _py_filter_9(unsigned int f, size_t n, const unsigned int c[], size_t nb, size_t *bs, void **b) except? 0 with gil:
+    return _py_filter(9, f, n, c, nb, bs, b)
+cdef size_t _py_filter_10(unsigned int f, size_t n, const unsigned int c[], size_t nb, size_t *bs, void **b) except? 0 with gil:
+    return _py_filter(10, f, n, c, nb, bs, b)
+cdef size_t _py_filter_11(unsigned int f, size_t n, const unsigned int c[], size_t nb, size_t *bs, void **b) except? 0 with gil:
+    return _py_filter(11, f, n, c, nb, bs, b)
+cdef size_t _py_filter_12(unsigned int f, size_t n, const unsigned int c[], size_t nb, size_t *bs, void **b) except? 0 with gil:
+    return _py_filter(12, f, n, c, nb, bs, b)
+cdef size_t _py_filter_13(unsigned int f, size_t n, const unsigned int c[], size_t nb, size_t *bs, void **b) except? 0 with gil:
+    return _py_filter(13, f, n, c, nb, bs, b)
+cdef size_t _py_filter_14(unsigned int f, size_t n, const unsigned int c[], size_t nb, size_t *bs, void **b) except? 0 with gil:
+    return _py_filter(14, f, n, c, nb, bs, b)
+cdef size_t _py_filter_15(unsigned int f, size_t n, const unsigned int c[], size_t nb, size_t *bs, void **b) except? 0 with gil:
+    return _py_filter(15, f, n, c, nb, bs, b)
+
+cdef H5Z_func_t _py_filter_funcs[16]
+_py_filter_funcs[:] = [
+    _py_filter_0, _py_filter_1, _py_filter_2, _py_filter_3,
+    _py_filter_4, _py_filter_5, _py_filter_6, _py_filter_7,
+    _py_filter_8, _py_filter_9, _py_filter_10, _py_filter_11,
+    _py_filter_12, _py_filter_13, _py_filter_14, _py_filter_15,
+]
+
+
+@with_phil
+def register_python_filter(int filter_code, encode, decode, name=None):
+    """(INT filter_code, CALLABLE encode, CALLABLE decode, STRING name=None)
+
+    Register a filter implemented in Python with the library.  The filter
+    can then be used like any other, e.g. with
+    ``create_dataset(compression=filter_code, compression_opts=...)``.
+
+    encode and decode are called as ``func(data, opts)`` with a read-only
+    memoryview of the chunk data, and the filter's client data values
+    (``compression_opts``) as a tuple of integers.  They must return the
+    transformed data as an object supporting the buffer protocol, such as
+    bytes or a contiguous NumPy array, and must not keep a reference to
+    their input.  Exceptions are raised from the read or write which called
+    the filter.  Either may be None for a filter which can only decode, or
+    only encode.
+
+    Registering a filter code again replaces the previous functions.  Up to
+    MAX_PYTHON_FILTERS filters can be registered at once; use
+    unregister_filter to remove one.
+    """
+    cdef H5Z_class2_t cls
+    cdef int slot = -1
+    cdef int i
+
+    if encode is None and decode is None:
+        raise ValueError("At least one of encode and decode must be given")
+    if filter_code < 256 or filter_code > H5Z_FILTER_MAX:
+        raise ValueError("Filter code must be in the range 256-%d" % H5Z_FILTER_MAX)
+
+    for i in range(MAX_PYTHON_FILTERS):
+        if _py_filters[i] is not None and _py_filters[i][0] == filter_code:
+            slot = i
+            break
+    else:
+        for i in range(MAX_PYTHON_FILTERS):
+            if _py_filters[i] is None:
+                slot = i
+                break
+        else:
+            raise RuntimeError("No more than %d Python filters can be registered"
+                               % MAX_PYTHON_FILTERS)
+
+    if name is None:
+        name = "Python filter %d" % filter_code
+    # HDF5 keeps the name pointer, so the bytes object is kept in the table
+    bname = name.encode('utf-8') if isinstance(name, str) else bytes(name)
+
+    memset(&cls, 0, sizeof(cls))
+    cls.version = H5Z_CLASS_T_VERS
+    cls.id = <H5Z_filter_t>filter_code
+    cls.encoder_present = encode is not None
+    cls.decoder_present = decode is not None
+    cls.name = bname
+    cls.filter = _py_filter_funcs[slot]
+
+    old = _py_filters[slot]
+    _py_filters[slot] = (filter_code, bname, encode, decode)
+    try:
+        H5Zregister(&cls)
+    except:
+        _py_filters[slot] = old
+        raise
@@ -15,6 +15,7 @@
     are tested by module test_attrs_data.
 """
 
+import gc
 import numpy as np
 
 from collections.abc import MutableMapping
@@ -23,8 +24,9 @@ from .common import TestCase, ut
 
 import h5py
 from h5py import File
-from h5py import h5a,  h5t
+from h5py import h5a, h5g, h5t
 from h5py import AttributeManager
+from h5py._hl import attrcache
 
 
 class BaseAttrs(TestCase):
@@ -271,3 +273,93 @@ def test_python_int_uint64(writable_file):
     # Check modifying an existing attribute
     f.attrs.modify('a', data)
     np.testing.assert_array_equal(f.attrs['a'], np.array(data, dtype=np.uint64))
+
+
+class TestAttrCache(TestCase):
+
+    """
+        Feature: Attribute values can be cached
+    """
+
+    def setUp(self):
+        self.fname = self.mktemp()
+        with File(self.fname, 'w') as f:
+            f.attrs['scale'] = 2.5
+            f.attrs['name'] = 'calibration'
+            g = f.create_group('g')
+            g.attrs['offsets'] = np.arange(10)
+            g.attrs['scale'] = 7
+
+    def test_hits(self):
+        with File(self.fname, 'r', attr_cache_bytes=1 << 20) as f:
+            cache = f.attr_cache
+            for _ in range(3):
+                self.assertEqual(f.attrs['scale'], 2.5)
+                self.assertEqual(f.attrs['name'], 'calibration')
+                self.assertEqual(f['g'].attrs['scale'], 7)
+                np.testing.assert_array_equal(f['g'].attrs['offsets'], np.arange(10))
+            self.assertEqual(cache.misses, 4)
+            self.assertEqual(cache.hits, 8)
+            self.assertEqual(len(cache), 4)
+
+    def test_copies(self):
+        """ Changing a returned array doesn't change the cached value """
+        with File(self.fname, 'r', attr_cache_bytes=1 << 20) as f:
+            f['g'].attrs['offsets'][:] = 0
+            a = f['g'].attrs['offsets']
+            a[:] = 0
+            np.testing.assert_array_equal(f['g'].attrs['offsets'], np.arange(10))
+
+    def test_budget(self):
+        with File(self.fname, 'r', attr_cache_bytes=100) as f:
+            f['g'].attrs['offsets']
+            f.attrs['scale']
+            f['g'].attrs['scale']
+            cache = f.attr_cache
+            self.assertLessEqual(cache.nbytes, 100)
+            # The array (80 bytes) was evicted to make room
+            f['g'].attrs['offsets']
+            self.assertEqual(cache.stats()['misses'], 4)
+
+    def test_read_only(self):
+        """ Attributes of writable files can change outside .attrs, e.g. for
+        dimension scales, so these can't have a cache """
+        for mode in ('a', 'r+', 'w'):
+            with self.assertRaises(ValueError):
+                File(self.fname, mode, attr_cache_bytes=1 << 20)
+        with File(self.fname, 'r') as f:
+            self.assertEqual(f.attrs['scale'], 2.5)
+
+    def test_opened_twice(self):
+        """ HDF5 shares a file opened twice, so its File objects share one
+        cache, which is kept until both are closed """
+        f1 = File(self.fname, 'r', attr_cache_bytes=100)
+        f2 = File(self.fname, 'r', attr_cache_bytes=1 << 20)
+        cache = f1.attr_cache
+        self.assertIs(f2.attr_cache, cache)
+        self.assertEqual(cache.max_bytes, 1 << 20)
+        f1['g'].attrs['offsets']
+        f2.attrs['scale']
+        self.assertEqual(cache.misses, 2)
+        f2.close()
+        self.assertIs(f1.attr_cache, cache)
+        self.assertEqual(cache.max_bytes, 100)
+        self.assertLessEqual(cache.nbytes, 100)
+        f1.close()
+
+    def test_garbage_collected(self):
+        """ Files which aren't closed don't leave their cache behind """
+        f = File(self.fname, 'r', attr_cache_bytes=1 << 20)
+        f.attrs['scale']
+        fileno = h5g.get_objinfo(f.id).fileno
+        del f
+        gc.collect()
+        self.assertNotIn(fileno, attrcache._files)
+
+    def test_close(self):
+        f = File(self.fname, 'r', attr_cache_bytes=1 << 20)
+        f.attrs['scale']
+        f.close()
+        with File(self.fname, 'r') as f:
+            self.assertIsNone(f.attr_cache)
+            self.assertEqual(f.attrs['scale'], 2.5)
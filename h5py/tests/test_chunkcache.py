@@ -0,0 +1,136 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2020 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Tests for the shared chunk cache, h5py.chunkcache.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import h5py
+from h5py._hl import chunkcache
+
+DATA = np.arange(200 * 300, dtype='f8').reshape(200, 300)
+
+
+@pytest.fixture
+def fname(tmp_path):
+    fname = tmp_path / 'shared.h5'
+    with h5py.File(fname, 'w') as f:
+        f.create_dataset('x', data=DATA, chunks=(20, 30), compression='gzip')
+        f.create_dataset('y', data=DATA[:50], chunks=(50, 100))
+        f.create_dataset('contiguous', data=DATA)
+        f.create_dataset('s', data=['a', 'bc'], dtype=h5py.string_dtype(), chunks=(1,))
+    return fname
+
+
+@pytest.fixture(autouse=True)
+def budget():
+    yield
+    chunkcache.configure(chunkcache.DEFAULT_BYTES)
+    chunkcache.clear()
+    chunkcache.reset_stats()
+
+
+@pytest.mark.parametrize('sel', [
+    np.s_[:], np.s_[5], np.s_[5, 7], np.s_[-1], np.s_[..., 3], np.s_[:, -3:],
+    np.s_[10:150:7, 1::13], np.s_[3:3], np.s_[199, 299], np.s_[[1, 5]],
+])
+def test_read(fname, sel):
+    with h5py.File(fname, 'r', shared_chunk_cache=True) as f:
+        np.testing.assert_array_equal(f['x'][sel], DATA[sel])
+
+
+def test_unsupported(fname):
+    """ Datasets which can't use the cache are read the normal way """
+    with h5py.File(fname, 'r', shared_chunk_cache=True) as f:
+        np.testing.assert_array_equal(f['contiguous'][5:10], DATA[5:10])
+        assert list(f['s'][:]) == [b'a', b'bc']
+        assert f['x'].astype('i4')[1, 1] == 301
+    assert chunkcache.stats()['chunks'] == 0
+
+
+def test_dataset_key(fname):
+    """ Only datasets read through the cache look it up when read """
+    with h5py.File(fname, 'r', shared_chunk_cache=True) as f, \
+            h5py.File(fname, 'r', driver='core') as plain:
+        x = f['x']
+        assert x._shared_chunk_key is not None
+        assert f['contiguous']._shared_chunk_key is None
+        assert f['s']._shared_chunk_key is None
+        assert plain['x']._shared_chunk_key is None
+        with pytest.raises(chunkcache.UnsupportedSelection):
+            chunkcache.read(x, x._shared_chunk_key, ([1, 5],))
+        np.testing.assert_array_equal(x[[1, 5]], DATA[[1, 5]])
+
+
+def test_stats(fname):
+    with h5py.File(fname, 'r', shared_chunk_cache=True) as f:
+        x = f['x']
+        x[0]
+        x[1]
+        assert chunkcache.dataset_stats(x) == {
+            'chunks': 10, 'nbytes': 10 * 20 * 30 * 8,
+            'hits': 10, 'misses': 10, 'hit_rate': 0.5}
+        f['y'][:]
+        stats = chunkcache.stats()
+        assert stats['chunks'] == 13
+        assert stats['nbytes'] == 10 * 20 * 30 * 8 + 3 * 50 * 100 * 8
+        assert (stats['hits'], stats['misses']) == (10, 13)
+        assert stats['datasets'][(f.filename, '/y')]['chunks'] == 3
+    # Closing the file drops its chunks
+    assert chunkcache.stats() == {'max_bytes': chunkcache.DEFAULT_BYTES, 'nbytes': 0,
+                                  'chunks': 0, 'hits': 0, 'misses': 0, 'datasets': {}}
+
+
+def test_budget(fname):
+    chunkcache.configure(5 * 20 * 30 * 8)
+    with h5py.File(fname, 'r', shared_chunk_cache=True) as f:
+        x = f['x']
+        x[:20, :150]
+        assert chunkcache.stats()['chunks'] == 5
+        x[:20, 150:]
+        assert chunkcache.stats()['nbytes'] <= 5 * 20 * 30 * 8
+        # The first chunks were evicted
+        x[0, :30]
+        assert chunkcache.dataset_stats(x)['misses'] == 11
+        # Chunks larger than the whole cache aren't kept
+        np.testing.assert_array_equal(f['y'][:], DATA[:50])
+        assert chunkcache.dataset_stats(f['y'])['chunks'] == 0
+    with pytest.raises(ValueError):
+        chunkcache.configure(-1)
+
+
+def test_threads(fname):
+    chunkcache.configure(20 * 20 * 30 * 8)
+    with h5py.File(fname, 'r', shared_chunk_cache=True) as f:
+        x = f['x']
+
+        def task(i):
+            return np.array_equal(x[i % 200, :], DATA[i % 200])
+
+        with ThreadPoolExecutor(8) as pool:
+            assert all(pool.map(task, range(1000)))
+        assert chunkcache.stats()['nbytes'] <= 20 * 20 * 30 * 8
+
+
+def test_options(fname):
+    with h5py.File(fname, 'r', shared_chunk_cache=True) as f:
+        # HDF5's own chunk caches are disabled
+        assert f.id.get_access_plist().get_cache()[2] == 0
+    with h5py.File(fname, 'r', shared_chunk_cache=True, rdcc_nbytes=1024) as f:
+        assert f.id.get_access_plist().get_cache()[2] == 1024
+    with pytest.raises(ValueError):
+        h5py.File(fname, 'a', shared_chunk_cache=True)
+    with h5py.File(fname, 'r') as f:
+        f['x'][0]
+    assert chunkcache.stats()['chunks'] == 0
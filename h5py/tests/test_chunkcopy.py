@@ -0,0 +1,115 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2020 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Tests for copying raw chunks between datasets.
+"""
+
+import numpy as np
+
+import h5py
+from h5py._hl.chunkcopy import raw_copy_compatible
+from .common import ut, TestCase
+
+
+@ut.skipUnless(h5py.version.hdf5_version_tuple >= (1, 10, 5),
+               'Raw chunk copy requires HDF5 >= 1.10.5')
+@ut.skipIf('gzip' not in h5py.filters.encode, "DEFLATE is not installed")
+class TestCopyChunks(TestCase):
+
+    def setUp(self):
+        self.f = h5py.File(self.mktemp(), 'w')
+        self.f2 = h5py.File(self.mktemp(), 'w')
+        self.data = np.random.randint(0, 10, (100, 37)).astype('i2')
+        self.src = self.f.create_dataset(
+            'src', data=self.data, chunks=(10, 10), compression='gzip',
+            shuffle=True
+        )
+
+    def tearDown(self):
+        self.f.close()
+        self.f2.close()
+
+    def make_dest(self, shape=None, **kwds):
+        kwds.setdefault('chunks', (10, 10))
+        kwds.setdefault('compression', 'gzip')
+        kwds.setdefault('shuffle', True)
+        return self.f2.create_dataset(
+            'dst', shape=shape or self.src.shape, dtype='i2', **kwds
+        )
+
+    def test_whole(self):
+        dst = self.make_dest()
+        self.assertTrue(raw_copy_compatible(self.src, dst))
+        h5py.copy_chunks(self.src, dst)
+        np.testing.assert_array_equal(dst[...], self.data)
+        # Chunks were copied in their compressed form
+        self.assertEqual(dst.id.read_direct_chunk((20, 30)),
+                         self.src.id.read_direct_chunk((20, 30)))
+
+    def test_region(self):
+        dst = self.make_dest(shape=(50, 50))
+        h5py.copy_chunks(self.src, dst, np.s_[20:55, 5:37], np.s_[10:45, 15:47])
+        expected = np.zeros((50, 50), dtype='i2')
+        expected[10:45, 15:47] = self.data[20:55, 5:37]
+        np.testing.assert_array_equal(dst[...], expected)
+        # Aligned chunk fully inside the region is copied raw
+        self.assertEqual(dst.id.read_direct_chunk((10, 20)),
+                         self.src.id.read_direct_chunk((20, 10)))
+
+    def test_unallocated(self):
+        src = self.f.create_dataset('sparse', (100,), dtype='i2', chunks=(10,),
+                                    compression='gzip', shuffle=True)
+        src[15] = 1
+        dst = self.f2.create_dataset('dst', (100,), dtype='i2', chunks=(10,),
+                                     compression='gzip', shuffle=True)
+        dst[50:60] = 7
+        h5py.copy_chunks(src, dst)
+        np.testing.assert_array_equal(dst[...], src[...])
+        # Chunk 0 copied; chunk 5 overwritten with fill values
+        self.assertEqual(dst.id.get_num_chunks(), 2)
+
+    def test_fillvalue(self):
+        """ Unwritten chunks are copied if the fill values differ """
+        src = self.f.create_dataset('sparse', (20,), dtype='i2', chunks=(10,),
+                                    compression='gzip', fillvalue=7)
+        src[:10] = 1
+        dst = self.f2.create_dataset('dst', (20,), dtype='i2', chunks=(10,),
+                                     compression='gzip', fillvalue=0)
+        h5py.copy_chunks(src, dst)
+        np.testing.assert_array_equal(dst[...], [1] * 10 + [7] * 10)
+
+    def test_vlen(self):
+        """ Variable-length data points into the file, so isn't copied raw """
+        data = np.array(['a', 'bc', 'def'] * 10, dtype=object)
+        src = self.f.create_dataset('strings', data=data, chunks=(10,),
+                                    dtype=h5py.string_dtype())
+        dst = self.f2.create_dataset('dst', (30,), chunks=(10,),
+                                     dtype=h5py.string_dtype())
+        self.assertFalse(raw_copy_compatible(src, dst))
+        h5py.copy_chunks(src, dst)
+        self.assertEqual(list(dst.asstr()[...]), list(data))
+
+    def test_incompatible(self):
+        dst = self.make_dest(compression='lzf', chunks=(5, 5))
+        self.assertFalse(raw_copy_compatible(self.src, dst))
+        h5py.copy_chunks(self.src, dst)
+        np.testing.assert_array_equal(dst[...], self.data)
+
+    def test_bad_selection(self):
+        dst = self.make_dest()
+        with self.assertRaises(ValueError):
+            h5py.copy_chunks(self.src, dst, np.s_[0:10, 0:10], np.s_[0:20, 0:10])
+        with self.assertRaises(ValueError):
+            h5py.copy_chunks(self.src, dst, np.s_[0:10:2, 0:10])
+
+    def test_not_chunked(self):
+        src = self.f.create_dataset('contig', data=self.data)
+        with self.assertRaises(TypeError):
+            h5py.copy_chunks(src, self.make_dest())
@@ -0,0 +1,119 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2020 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Tests for the (internal) chunk grid module
+"""
+
+import itertools
+
+import numpy as np
+
+from h5py._hl.chunkgrid import ChunkGrid
+from .common import TestCase
+
+
+def brute_force(shape, chunks, sel):
+    """ Chunk slices for a selection, worked out point by point """
+    mask = np.zeros(shape, dtype=bool)
+    mask[sel] = True
+    out = []
+    ranges = [range(0, n, c) for n, c in zip(shape, chunks)]
+    for origin in itertools.product(*ranges):
+        region = tuple(slice(o, o + c) for o, c in zip(origin, chunks))
+        if not mask[region].any():
+            continue
+        slices = []
+        for dim, (o, s) in enumerate(zip(origin, sel)):
+            step = s.step or 1
+            points = [i for i in range(*s.indices(shape[dim]))
+                      if o <= i < o + chunks[dim]]
+            slices.append(slice(points[0], min(o + chunks[dim], s.indices(shape[dim])[1]), step))
+        out.append(tuple(slices))
+    return out
+
+
+class TestChunkGrid(TestCase):
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def test_full(self):
+        grid = ChunkGrid((100, 100), (32, 64))
+        self.assertEqual(grid.grid_shape, (4, 2))
+        self.assertEqual(len(grid), 8)
+        self.assertEqual(list(grid), brute_force((100, 100), (32, 64),
+                                                 np.s_[0:100, 0:100]))
+
+    def test_offsets(self):
+        grid = ChunkGrid((10, 10), (4, 4), np.s_[5:10, 0:3])
+        np.testing.assert_array_equal(grid.offsets(),
+                                      [[4, 0], [8, 0]])
+        starts, stops = grid.bounds()
+        np.testing.assert_array_equal(starts, [[5, 0], [8, 0]])
+        np.testing.assert_array_equal(stops, [[8, 3], [10, 3]])
+
+    def test_inner_offset(self):
+        """ Selections not starting in the first chunk of an inner axis """
+        sel = np.s_[10:70, 70:100]
+        self.assertEqual(list(ChunkGrid((100, 100), (32, 32), sel)),
+                         brute_force((100, 100), (32, 32), sel))
+
+    def test_strided(self):
+        for sel in (np.s_[1:100:10], np.s_[0:100:3], np.s_[5:6:7]):
+            self.assertEqual(list(ChunkGrid((100,), (4,), sel)),
+                             brute_force((100,), (4,), (sel,)))
+
+    def test_sparse_stride(self):
+        grid = ChunkGrid((10**12,), (1,), np.s_[::10**11])
+        self.assertEqual(len(grid), 10)
+        self.assertEqual(grid.offsets()[:, 0].tolist(),
+                         list(range(0, 10**12, 10**11)))
+
+    def test_integer(self):
+        grid = ChunkGrid((100, 100), (32, 64), (50, slice(None)))
+        self.assertEqual(list(grid), [(slice(50, 51, 1), slice(0, 64, 1)),
+                                      (slice(50, 51, 1), slice(64, 100, 1))])
+
+    def test_getitem(self):
+        grid = ChunkGrid((100, 100), (32, 64))
+        self.assertEqual(list(grid[1:3, 1]), [(slice(32, 64, 1), slice(64, 100, 1)),
+                                              (slice(64, 96, 1), slice(64, 100, 1))])
+        self.assertEqual(grid[-1].grid_shape, (1, 2))
+        with self.assertRaises(IndexError):
+            grid[4]
+
+    def test_intersect(self):
+        grid = ChunkGrid((100, 100), (32, 64))[0:2]
+        sel = np.s_[30:70:3, 60:70]
+        expected = [s for s in brute_force((100, 100), (32, 64), sel)
+                    if s[0].start < 64]
+        self.assertEqual(list(grid.intersect(sel)), expected)
+
+    def test_intersect_clip(self):
+        grid = ChunkGrid((100,), (10,), np.s_[15:35])
+        self.assertEqual(list(grid.intersect(np.s_[0:100:4])),
+                         [(slice(16, 20, 4),), (slice(20, 30, 4),),
+                          (slice(32, 35, 4),)])
+
+    def test_empty(self):
+        grid = ChunkGrid((0, 10), (1, 5))
+        self.assertEqual(len(grid), 0)
+        self.assertEqual(list(grid), [])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            ChunkGrid((10,), (4,), np.s_[5:20])
+        with self.assertRaises(ValueError):
+            ChunkGrid((10,), (4,), np.s_[::-1])
+        with self.assertRaises(ValueError):
+            ChunkGrid((10, 10), (4, 4), np.s_[0:5])
@@ -370,6 +370,40 @@ class TestCreateChunked(BaseDataset):
         dset = self.f.create_dataset('foo', shape=(3,), dtype='S100000000', chunks=True)
         self.assertEqual(dset.chunks, (1,))
 
+    def test_auto_chunks_access(self):
+        """ Auto-chunking for a declared access pattern """
+        dset = self.f.create_dataset('cols', shape=(100000, 1000), dtype='f4',
+                                     chunks='auto', access='columns')
+        self.assertEqual(dset.chunks, (100000, 1))
+
+        dset = self.f.create_dataset('rows', shape=(100000, 1000), dtype='f4',
+                                     access='rows', cache_bytes=2**16)
+        self.assertEqual(dset.chunks[1], 1000)
+        self.assertLessEqual(np.prod(dset.chunks)*4, 2**16)
+
+        dset = self.f.create_dataset('planes', shape=(100, 512, 512), dtype='u2',
+                                     chunks='auto', access='planes',
+                                     maxshape=(None, 512, 512))
+        self.assertEqual(dset.chunks, (1, 512, 512))
+
+        dset = self.f.create_dataset('weighted', shape=(100, 200, 300), dtype='f8',
+                                     chunks='auto', access={0: 3, -1: 1})
+        self.assertEqual(dset.chunks, (100, 1, 300))
+
+        dset = self.f.create_dataset('default', shape=(20, 100), chunks='auto')
+        self.assertEqual(dset.chunks, h5py.filters.guess_chunk((20, 100), None, 4))
+
+    def test_auto_chunks_access_invalid(self):
+        """ Invalid access patterns raise """
+        with self.assertRaises(TypeError):
+            self.f.create_dataset('foo', shape=(10, 10), chunks=(5, 5), access='rows')
+        with self.assertRaises(ValueError):
+            self.f.create_dataset('foo', shape=(10, 10), chunks='auto', access='diagonal')
+        with self.assertRaises(ValueError):
+            self.f.create_dataset('foo', shape=(10, 10), chunks='auto', access={2: 1})
+        with self.assertRaises(ValueError):
+            self.f.create_dataset('foo', shape=(10, 10), chunks='auto', access={0: 0})
+
     def test_scalar_assignment(self):
         """ Test scalar assignment of chunked dataset """
         dset = self.f.create_dataset('foo', shape=(3, 50, 50),
@@ -877,6 +911,175 @@ class TestChunkIterator(BaseDataset):
         expected = ((slice(48, 52, 1), slice(40, 50, 1)),)
         self.assertEqual(list(dset.iter_chunks(np.s_[48:52,40:50])), list(expected))
 
+    def test_2d_inner_offset(self):
+        dset = self.f.create_dataset("foo", (100, 100), chunks=(32, 32))
+        expected = [(slice(10, 32, 1), slice(70, 96, 1)),
+                    (slice(10, 32, 1), slice(96, 100, 1)),
+                    (slice(32, 64, 1), slice(70, 96, 1)),
+                    (slice(32, 64, 1), slice(96, 100, 1)),
+                    (slice(64, 70, 1), slice(70, 96, 1)),
+                    (slice(64, 70, 1), slice(96, 100, 1))]
+        self.assertEqual(list(dset.iter_chunks(np.s_[10:70, 70:100])), expected)
+
+    @ut.skipIf(h5py.version.hdf5_version_tuple < (1, 10, 5),
+               "chunk info requires HDF5 >= 1.10.5")
+    def test_with_info(self):
+        dset = self.f.create_dataset("foo", (10, 10), chunks=(4, 4))
+        dset[0:4, 0:4] = 1
+        dset[8:, 8:] = 2
+        items = list(dset.iter_chunks(with_info=True))
+        self.assertEqual([s for s, _ in items], list(dset.iter_chunks()))
+        allocated = [info.chunk_offset for _, info in items if info.allocated]
+        self.assertEqual(allocated, [(0, 0), (8, 8)])
+        for _, info in items:
+            if info.allocated:
+                self.assertIsNotNone(info.byte_offset)
+                self.assertEqual(info.size, 4 * 4 * dset.dtype.itemsize)
+            else:
+                self.assertIsNone(info.byte_offset)
+                self.assertEqual(info.size, 0)
+
+    @ut.skipIf(h5py.version.hdf5_version_tuple < (1, 10, 5),
+               "chunk info requires HDF5 >= 1.10.5")
+    def test_file_order(self):
+        dset = self.f.create_dataset("foo", (12,), chunks=(4,))
+        # Write chunks back to front, so file order is the reverse of
+        # logical order
+        for start in (8, 4, 0):
+            dset[start:start + 4] = start
+        self.f.flush()
+        expected = [(slice(8, 12, 1),), (slice(4, 8, 1),), (slice(0, 4, 1),)]
+        self.assertEqual(list(dset.iter_chunks(order='file')), expected)
+
+        items = list(dset.iter_chunks(order='file', with_info=True))
+        offsets = [info.byte_offset for _, info in items]
+        self.assertEqual(offsets, sorted(offsets))
+
+    @ut.skipIf(h5py.version.hdf5_version_tuple < (1, 10, 5),
+               "chunk info requires HDF5 >= 1.10.5")
+    def test_skip_unallocated(self):
+        dset = self.f.create_dataset("foo", (100,), chunks=(32,))
+        dset[40:50] = 1
+        self.assertEqual(list(dset.iter_chunks(skip_unallocated=True)),
+                         [(slice(32, 64, 1),)])
+        self.assertEqual(
+            list(dset.iter_chunks(np.s_[50:97], skip_unallocated=True)),
+            [(slice(50, 64, 1),)])
+
+    def test_invalid_order(self):
+        dset = self.f.create_dataset("foo", (100,), chunks=(32,))
+        with self.assertRaises(ValueError):
+            dset.iter_chunks(order='random')
+
+
+class TestChunkCache(BaseDataset):
+
+    """
+        Feature: Datasets can be opened with their own chunk cache settings
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.f.create_dataset('x', (1000, 1000), 'f4', chunks=(100, 100))
+
+    def test_get(self):
+        dset = self.f.get('x', rdcc_nbytes=4 * 1024**2, rdcc_nslots=1009, rdcc_w0=0.5)
+        self.assertEqual(dset.get_cache(), (1009, 4 * 1024**2, 0.5))
+        self.assertIsNone(self.f.get('y', rdcc_nbytes=1024))
+        self.f.create_group('g')
+        with self.assertRaises(TypeError):
+            self.f.get('g', rdcc_nbytes=1024)
+
+    def test_set_cache(self):
+        dset = self.f['x']
+        dset[0, :] = 1
+        nslots, _, w0 = dset.get_cache()
+        dset.set_cache(rdcc_nbytes=8 * 1024**2)
+        self.assertEqual(dset.get_cache(), (nslots, 8 * 1024**2, w0))
+        np.testing.assert_array_equal(dset[0, :], 1)
+
+    def test_auto(self):
+        """ The cache holds a row or column of chunks """
+        self.f.create_dataset('big', (100, 20000), 'f8', chunks=(10, 1000))
+        dset = self.f.get('big', access='rows')
+        nslots, nbytes, _ = dset.get_cache()
+        self.assertEqual(nbytes, 20 * 10 * 1000 * 8)
+        self.assertGreaterEqual(nslots, 2000)
+        # Never shrinks the cache
+        dset.set_cache(rdcc_nbytes=64 * 1024**2)
+        dset.set_cache(access={0: 1})
+        self.assertEqual(dset.get_cache()[1], 64 * 1024**2)
+        with self.assertRaises(TypeError):
+            self.f.create_dataset('c', (10,)).set_cache(access='rows')
+
+    def test_open_elsewhere(self):
+        other = self.f['x']
+        with self.assertRaises(ValueError):
+            self.f['x'].set_cache(rdcc_nbytes=1024)
+        other.id.close()
+        self.f['x'].set_cache(rdcc_nbytes=1024)
+
+    def test_require(self):
+        dset = self.f.require_dataset('x', (1000, 1000), 'f4', rdcc_nbytes=2 * 1024**2)
+        self.assertEqual(dset.get_cache()[1], 2 * 1024**2)
+        dset = self.f.require_dataset('y', (10,), 'f4', chunks=(5,), rdcc_nslots=101)
+        self.assertEqual(dset.get_cache()[0], 101)
+
+
+class TestFreeze(BaseDataset):
+
+    """
+        Feature: Datasets in read-only files can be frozen into snapshots
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.data = np.arange(200, dtype='f4').reshape(20, 10)
+        self.f.create_dataset('x', data=self.data, chunks=(5, 5), maxshape=(None, 10),
+                              compression='gzip', shuffle=True, fillvalue=-1)
+        self.f.create_dataset('s', data=[b'a', b'bc'])
+        self.f.create_dataset('e', data=h5py.Empty('f4'))
+        fname = self.f.filename
+        self.f.close()
+        self.f = File(fname, 'r')
+
+    def test_properties(self):
+        dset = self.f['x']
+        frozen = dset.freeze()
+        for name in ('name', 'shape', 'dtype', 'ndim', 'size', 'nbytes', 'maxshape',
+                     'chunks', 'compression', 'compression_opts', 'shuffle',
+                     'fletcher32', 'scaleoffset', 'fillvalue', 'external'):
+            self.assertEqual(getattr(frozen, name), getattr(dset, name), name)
+        self.assertIs(frozen.dataset, dset)
+        self.assertEqual(len(frozen), 20)
+        self.assertEqual(repr(frozen), '<Frozen HDF5 dataset "x": shape (20, 10), type "<f4">')
+
+    def test_read(self):
+        frozen = self.f['x'].freeze()
+        for sel in (np.s_[()], np.s_[3], np.s_[2:7, ::3], np.s_[..., -1], np.s_[[1, 4]]):
+            np.testing.assert_array_equal(frozen[sel], self.data[sel])
+        np.testing.assert_array_equal(np.asarray(frozen), self.data)
+        self.assertEqual(list(self.f['s'].freeze()[:]), [b'a', b'bc'])
+        empty = self.f['e'].freeze()
+        self.assertIsNone(empty.shape)
+        self.assertEqual(empty[()], h5py.Empty('f4'))
+
+    def test_immutable(self):
+        frozen = self.f['x'].freeze()
+        with self.assertRaises(AttributeError):
+            frozen.shape = (5, 10)
+        with self.assertRaises(AttributeError):
+            frozen.other = 1
+        with self.assertRaises(AttributeError):
+            del frozen.dtype
+
+    def test_writable(self):
+        fname = self.f.filename
+        self.f.close()
+        with File(fname, 'a') as f:
+            with self.assertRaises(ValueError):
+                f['x'].freeze()
+
 
 class TestResize(BaseDataset):
 
@@ -13,11 +13,13 @@
     Tests all aspects of File objects, including their creation.
 """
 
+import numpy as np
 import pytest
 import os
 import stat
 import pickle
 import tempfile
+import io
 from sys import platform
 
 from .common import ut, TestCase, UNICODE_FILENAMES, closed_tempfile
@@ -135,6 +137,15 @@ class TestFileOpen(TestCase):
         with self.assertRaises(ValueError):
             File(self.mktemp(), 'mongoose')
 
+
+class _CountingBytesIO(io.BytesIO):
+    reads = 0
+
+    def readinto(self, b):
+        self.reads += 1
+        return super().readinto(b)
+
+
 @ut.skipIf(h5py.version.hdf5_version_tuple < (1, 10, 1),
                'Requires HDF5 1.10.1 or later')
 class TestSpaceStrategy(TestCase):
@@ -174,6 +185,202 @@ class TestSpaceStrategy(TestCase):
         dset[...] = 1
         fid.close()
 
+    def test_page_buffer(self):
+        """ Paged files can be opened with a page buffer """
+        fname = self.mktemp()
+        with File(fname, 'w', fs_strategy="page", fs_page_size=1024,
+                  page_buf_size=16*1024, min_meta_perc=25, min_raw_perc=10) as f:
+            self.assertEqual(f.id.get_create_plist().get_file_space_page_size(), 1024)
+            self.assertEqual(f.id.get_access_plist().get_page_buffer_size(),
+                             (16*1024, 25, 10))
+            for i in range(20):
+                f['x%d' % i] = np.arange(i)
+
+        with File(fname, 'r', page_buf_size=16*1024) as f:
+            f.id.reset_page_buffering_stats()
+            for i in range(20):
+                np.testing.assert_array_equal(f['x%d' % i][()], np.arange(i))
+            stats = f.id.get_page_buffering_stats()
+            self.assertGreater(stats['accesses'][0], 0)
+            self.assertGreater(stats['hits'][0], 0)
+
+        # The file space page size can only be set for new files
+        with self.assertRaises(ValueError):
+            File(fname, 'a', fs_page_size=1024)
+        # The minimum percentages apply to the page buffer
+        with self.assertRaises(ValueError):
+            File(fname, 'r', min_meta_perc=50)
+        # HDF5 refuses page buffering for files without paged allocation
+        plain = self.mktemp()
+        File(plain, 'w').close()
+        with self.assertRaises(OSError):
+            File(plain, 'r', page_buf_size=16*1024)
+
+
+class TestMetadataPreload(TestCase):
+
+    """
+        Feature: Metadata can be read into memory when a file is opened
+    """
+
+    def test_no_reads_after_open(self):
+        """ Walking a preloaded file doesn't read metadata from it """
+        buf = io.BytesIO()
+        with File(buf, 'w') as f:
+            for i in range(20):
+                g = f.create_group('g%d' % i)
+                g.attrs['index'] = i
+                g.attrs['name'] = 'group %d' % i
+                for j in range(10):
+                    g.attrs['a%d' % j] = np.arange(j)
+                dset = g.create_dataset('d', data=np.arange(1000), chunks=(10,))
+                dset.attrs['units'] = 'm'
+
+        fileobj = _CountingBytesIO(buf.getvalue())
+        with File(fileobj, 'r', metadata_preload=True) as f:
+            reads = fileobj.reads
+            for i in range(20):
+                g = f['g%d' % i]
+                self.assertEqual(g.attrs['name'], 'group %d' % i)
+                self.assertEqual(len(dict(g.attrs)), 12)
+                dset = g['d']
+                self.assertEqual(dset.attrs['units'], 'm')
+                if hasattr(dset.id, 'get_chunk_info'):
+                    dset.id.get_chunk_info(99)
+            self.assertEqual(fileobj.reads, reads)
+            # Reading data still reads the file
+            np.testing.assert_array_equal(f['g0/d'][:], np.arange(1000))
+            self.assertGreater(fileobj.reads, reads)
+
+    def test_modes(self):
+        fname = self.mktemp()
+        File(fname, 'w').close()
+        with self.assertRaises(ValueError):
+            File(fname, 'a', metadata_preload=True)
+        with File(fname, 'r', metadata_preload=True) as f:
+            self.assertFalse(f.id.get_mdc_config().evictions_enabled)
+            with self.assertRaises(ValueError):
+                File(f.id, metadata_preload=True)
+
+
+class TestHandleCache(TestCase):
+
+    """
+        Feature: Objects looked up by name can be kept open and reused
+    """
+
+    def setUp(self):
+        self.fname = self.mktemp()
+        with File(self.fname, 'w') as f:
+            f.create_dataset('a/b/x', data=np.arange(10))
+            f.create_dataset('a/y', data=np.arange(5))
+            f['a/t'] = np.dtype('f4')
+
+    def test_hits(self):
+        with File(self.fname, 'r', handle_cache=10) as f:
+            cache = f.handle_cache
+            x = f['a/b/x']
+            self.assertIs(f['a/b/x'], x)
+            self.assertIs(f['/a/b/x'], x)
+            # Relative to a cached group
+            self.assertIs(f['a']['b/x'], x)
+            self.assertIs(f['a']['b']['x'], x)
+            self.assertIs(f['a/t'], f['a/t'])
+            self.assertEqual(cache.misses, 4)  # a/b/x, a, a/b, a/t
+            self.assertEqual(cache.hits, 6)
+            np.testing.assert_array_equal(x[:], np.arange(10))
+
+    def test_lru(self):
+        with File(self.fname, 'r', handle_cache=2) as f:
+            x = f['a/b/x']
+            f['a/y']
+            f['a']
+            self.assertEqual(len(f.handle_cache), 2)
+            self.assertIsNot(f['a/b/x'], x)
+            f.handle_cache.reset_stats()
+            f['a']
+            self.assertEqual(f.handle_cache.stats(),
+                             {'hits': 1, 'misses': 0, 'size': 2, 'maxsize': 2})
+
+    def test_invalidated(self):
+        with File(self.fname, 'r', handle_cache=10) as f:
+            x = f['a/b/x']
+            x.id.close()
+            y = f['a/b/x']
+            self.assertIsNot(y, x)
+            self.assertTrue(y.id.valid)
+            f.close()
+            self.assertEqual(len(f.handle_cache), 0)
+
+    def test_disabled(self):
+        with File(self.fname, 'r') as f:
+            self.assertIsNone(f.handle_cache)
+            self.assertIsNot(f['a/b/x'], f['a/b/x'])
+
+    def test_modes(self):
+        with self.assertRaises(ValueError):
+            File(self.fname, 'a', handle_cache=10)
+        with self.assertRaises(ValueError):
+            File(self.fname, 'r', handle_cache=-1)
+        with File(self.fname, 'a') as f:
+            with self.assertRaises(ValueError):
+                File(f.id, handle_cache=10)
+
+
+class TestMetadataCacheSettings(TestCase):
+
+    """
+        Feature: The metadata cache can be configured with presets
+    """
+
+    def setUp(self):
+        self.fname = self.mktemp()
+        with File(self.fname, 'w', mdc='bulk_write') as f:
+            self.assertEqual(f.metadata_cache.max_size, 32 * 1024**2)
+            self.assertEqual(f.metadata_cache.config.decr_mode, h5py.h5ac.DECR_OFF)
+            for i in range(2000):
+                f.create_group('g%d' % i).attrs['i'] = i
+
+    def walk(self, f):
+        for _ in range(3):
+            for i in range(2000):
+                f['g%d' % i].attrs['i']
+
+    def test_presets(self):
+        with File(self.fname, 'r', mdc='small') as f:
+            self.walk(f)
+            cache = f.metadata_cache
+            self.assertLessEqual(cache.size, 1024**2)
+            self.assertEqual(cache.config.max_size, 1024**2)
+            self.assertGreater(cache.entries, 0)
+            self.assertTrue(0 < cache.hit_rate < 1)
+            cache.reset_stats()
+            self.assertEqual(cache.stats()['hit_rate'], 0)
+            cache.configure('bulk_read')
+            self.assertEqual(cache.max_size, 16 * 1024**2)  # The initial size
+
+    def test_dict(self):
+        with File(self.fname, 'r', mdc={'max_size': 2 * 1024**2, 'min_size': 1024**2}) as f:
+            config = f.metadata_cache.config
+            self.assertEqual(config.max_size, 2 * 1024**2)
+            self.assertEqual(config.initial_size, 2 * 1024**2)
+        with self.assertRaises(ValueError):
+            File(self.fname, 'r', mdc={'maxsize': 1024})
+        with self.assertRaises(ValueError):
+            File(self.fname, 'r', mdc='large')
+
+    def test_autotune(self):
+        with File(self.fname, 'r', mdc='small', mdc_autotune=0.99) as f:
+            self.assertEqual(f.metadata_cache.config.incr_mode, h5py.h5ac.INCR_THRESHOLD)
+            self.walk(f)
+            # The cache grew from the preset's initial size
+            self.assertGreater(f.metadata_cache.max_size, 256 * 1024)
+        with self.assertRaises(ValueError):
+            File(self.fname, 'r', mdc_autotune=1.5)
+        with self.assertRaises(ValueError):
+            File(self.fname, 'r', mdc='small', metadata_preload=True)
+
+
 class TestModes(TestCase):
 
     """
@@ -304,6 +511,36 @@ class TestDrivers(TestCase):
         with self.assertRaises(ValueError):
             File(tf, 'w', driver='core')
 
+    @ut.skipIf(h5py.h5fd.mmap_driver < 0, "mmap driver not available")
+    def test_mmap(self):
+        """ mmap driver reads files through a read-only mapping """
+        fname = self.mktemp()
+        data = np.arange(1000.)
+        with File(fname, 'w') as f:
+            f['x'] = data
+            f.create_dataset('y', data=data, chunks=(100,))
+
+        with File(fname, 'r', driver='mmap') as f:
+            self.assertEqual(f.driver, 'mmap')
+            np.testing.assert_array_equal(f['x'][:], data)
+            np.testing.assert_array_equal(f['y'][:], data)
+            # Zero-copy view of contiguous data
+            buf = h5py.h5fd.get_mmap_buffer(f.id)
+            self.assertTrue(buf.readonly)
+            view = np.frombuffer(buf, '<f8', 1000, f['x'].id.get_offset())
+        np.testing.assert_array_equal(view, data)
+        # The driver drops its reference to the mapping when closed
+        self.assertEqual(h5py.h5fd._mmap_regions, {})
+
+        with self.assertRaises(ValueError):
+            File(fname, 'r+', driver='mmap')
+        with self.assertRaises(ValueError):
+            File(fname, 'w', driver='mmap')
+        with self.assertRaises(FileNotFoundError):
+            File(fname + '.missing', 'r', driver='mmap')
+        with File(fname, 'r') as f, self.assertRaises(ValueError):
+            h5py.h5fd.get_mmap_buffer(f.id)
+
 
     # TODO: family driver tests
 
@@ -250,6 +250,87 @@ class TestFileObj(TestCase):
         fileobj.readinto = None
         self.assertRaises(Exception, list, f['test'])
 
+    def test_page_cache(self):
+        class CountingBytesIO(io.BytesIO):
+            reads = 0
+            def readinto(self, b):
+                self.reads += 1
+                return super().readinto(b)
+
+        fileobj = CountingBytesIO()
+        with h5py.File(fileobj, 'w', page_size=512, cache_bytes=4096) as f:
+            # Writes must update cached pages, including after eviction
+            for i in range(50):
+                f['x%d' % i] = list(range(i))
+                f['x%d' % i][:] += 1
+                self.assertEqual(list(f['x%d' % i][:]), list(range(1, i+1)))
+
+            cache = h5py.h5fd.get_fileobj_cache(f.id)
+            self.assertEqual(cache.page_size, 512)
+            self.assertEqual(cache.nbytes, 4096)
+
+        fileobj.reads = 0
+        with h5py.File(fileobj, 'r', page_size=65536, cache_bytes=1 << 20) as f:
+            for i in range(50):
+                self.assertEqual(list(f['x%d' % i][:]), list(range(1, i+1)))
+            cache = h5py.h5fd.get_fileobj_cache(f.id)
+            self.assertGreater(cache.hits, 0)
+            self.assertEqual(cache.misses, 1)
+            self.assertEqual(cache.reads, 1)
+            self.assertEqual(fileobj.reads, 1)
+            cache.reset_stats()
+            self.assertEqual(cache.hits, 0)
+
+        with h5py.File(fileobj, 'r') as f:
+            self.assertIsNone(h5py.h5fd.get_fileobj_cache(f.id))
+
+    def test_vfd_handle(self):
+        # The handle is a file descriptor, which only real files have
+        with h5py.File(io.BytesIO(), 'w', page_size=512) as f:
+            with self.assertRaises(RuntimeError):
+                f.id.get_vfd_handle()
+            self.assertIsNotNone(h5py.h5fd.get_fileobj_cache(f.id))
+        if os.name == 'nt':
+            return  # Files are read through the object, not the descriptor
+        with open(self.mktemp(), 'w+b') as fileobj:
+            with h5py.File(fileobj, 'w') as f:
+                self.assertEqual(f.id.get_vfd_handle(), fileobj.fileno())
+
+    def test_positional_io(self):
+        # Objects with readinto_at/write_at don't need seek()
+        class PositionalBytesIO(io.BytesIO):
+            def seek(self, pos, whence=0):
+                if whence != io.SEEK_END:
+                    raise AssertionError("seek() called")
+                return super().seek(pos, whence)
+
+            def readinto_at(self, offset, buf):
+                data = self.getbuffer()[offset:offset + len(buf)]
+                buf[:len(data)] = data
+                return len(data)
+
+            def write_at(self, offset, buf):
+                super().seek(offset)
+                return self.write(buf)
+
+        fileobj = PositionalBytesIO()
+        self.check_write(fileobj)
+        self.check_read(fileobj)
+
+    @ut.skipIf(os.name == 'nt', "pread() is not available on Windows")
+    def test_file_descriptor_io(self):
+        # Real files are read and written with pread/pwrite
+        class NoSeekFileIO(io.FileIO):
+            def seek(self, pos, whence=0):
+                raise AssertionError("seek() called")
+
+        fname = self.mktemp()
+        with NoSeekFileIO(fname, 'w+') as fileobj:
+            self.check_write(fileobj)
+            self.check_read(fileobj)
+        with open(fname, 'rb') as fileobj:
+            self.check_read(fileobj)
+
 
 class TestTrackOrder(TestCase):
     def populate(self, f):
@@ -1,3 +1,7 @@
+import mmap
+
+import numpy as np
+
 import h5py
 from h5py import h5f, h5p
 
@@ -34,3 +38,67 @@ class TestFileImage(TestCase):
         f = h5py.File(fid)
 
         self.assertTrue('test' in f)
+
+
+class TestFileBuffer(TestCase):
+
+    def setUp(self):
+        TestCase.setUp(self)
+        self.data = np.arange(10000)
+        with h5py.File(self.mktemp(), 'w', driver='core', backing_store=False) as f:
+            f['x'] = self.data
+            self.image = f.to_buffer().tobytes()
+
+    def test_from_buffer(self):
+        """ Files are opened from bytes, arrays and mmaps """
+        for buf in (self.image, bytearray(self.image), np.frombuffer(self.image, 'u1')):
+            with self.subTest(type=type(buf)):
+                with h5py.File.from_buffer(buf) as f:
+                    self.assertEqual(f.driver, 'core')
+                    self.assertEqual(f.mode, 'r')
+                    np.testing.assert_array_equal(f['x'][:], self.data)
+
+        fname = self.mktemp()
+        with open(fname, 'wb') as fh:
+            fh.write(self.image)
+        with open(fname, 'rb') as fh:
+            m = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        with h5py.File.from_buffer(m) as f:
+            with self.assertRaises(BufferError):
+                m.close()
+            np.testing.assert_array_equal(f['x'][:], self.data)
+        m.close()
+
+    def test_from_buffer_no_copy(self):
+        """ The file uses the caller's memory """
+        arr = np.frombuffer(self.image, 'u1')
+        with h5py.File.from_buffer(arr) as f:
+            view = np.frombuffer(f.to_buffer(), 'u1')
+            self.assertEqual(view.ctypes.data, arr.ctypes.data)
+            self.assertEqual(view.size, arr.size)
+
+    def test_from_buffer_invalid(self):
+        with self.assertRaises(ValueError):
+            h5py.File.from_buffer(self.image, 'r+')
+        with self.assertRaises(OSError):
+            h5py.File.from_buffer(b'not an HDF5 file')
+
+    def test_to_buffer(self):
+        """ Views are valid after the file grows or is closed """
+        f = h5py.File(self.mktemp(), 'w', driver='core', backing_store=False)
+        f['x'] = self.data
+        before = f.to_buffer()
+        self.assertTrue(before.readonly)
+        f['y'] = np.arange(100000)
+        after = f.to_buffer()
+        f.close()
+
+        with h5py.File.from_buffer(before) as g:
+            self.assertEqual(list(g), ['x'])
+        with h5py.File.from_buffer(after) as g:
+            self.assertEqual(list(g), ['x', 'y'])
+            np.testing.assert_array_equal(g['x'][:], self.data)
+
+    def test_to_buffer_driver(self):
+        with self.assertRaises(ValueError):
+            self.f.to_buffer()
@@ -94,3 +94,175 @@ def test_filters_available():
     assert 'gzip' in h5py.filters.encode
     assert 'lzf' in h5py.filters.decode
     assert 'lzf' in h5py.filters.encode
+
+
+@pytest.fixture
+def python_filter():
+    """ A byte-reversing filter implemented in Python, removed afterwards """
+    calls = []
+
+    def encode(data, opts):
+        calls.append(('encode', opts))
+        return np.frombuffer(data, dtype=np.uint8)[::-1].copy()
+
+    def decode(data, opts):
+        calls.append(('decode', opts))
+        return bytes(data)[::-1]
+
+    h5py.h5z.register_python_filter(32500, encode, decode, name='reverse')
+    yield calls
+    h5py.h5z.unregister_filter(32500)
+
+
+def test_python_filter(python_filter, tmp_path):
+    fname = tmp_path / 'pyfilter.h5'
+    data = np.arange(1000, dtype='i4')
+    with h5py.File(fname, 'w') as f:
+        ds = f.create_dataset('x', data=data, chunks=(100,),
+                              compression=32500, compression_opts=(1, 2))
+        assert ds.id.get_create_plist().get_filter(0)[3] == b'reverse'
+        f.flush()
+        # Stored form is the encoded (reversed) chunk
+        _, raw = ds.id.read_direct_chunk((0,))
+        assert raw == data[:100].tobytes()[::-1]
+
+    with h5py.File(fname, 'r') as f:
+        np.testing.assert_array_equal(f['x'][:], data)
+
+    assert ('encode', (1, 2)) in python_filter
+    assert ('decode', (1, 2)) in python_filter
+
+
+def test_python_filter_error(python_filter, tmp_path):
+    fname = tmp_path / 'pyfilter.h5'
+    with h5py.File(fname, 'w') as f:
+        f.create_dataset('x', data=np.arange(100), chunks=(10,), compression=32500)
+
+    def decode(data, opts):
+        raise KeyError("decode failed")
+
+    h5py.h5z.register_python_filter(32500, None, decode)
+    with h5py.File(fname, 'r') as f:
+        with pytest.raises(KeyError):
+            f['x'][:]
+
+
+def test_python_filter_optional_encode(python_filter, writable_file):
+    """ A failing optional filter leaves chunks unfiltered """
+    def encode(data, opts):
+        raise ValueError("encode failed")
+
+    h5py.h5z.register_python_filter(32500, encode, lambda data, opts: data)
+    ds = writable_file.create_dataset('x', data=np.arange(100), chunks=(10,),
+                                      compression=32500)
+    writable_file.flush()
+    filter_mask, raw = ds.id.read_direct_chunk((0,))
+    assert filter_mask == 1
+    assert raw == np.arange(10).tobytes()
+
+
+def test_register_python_filter_invalid():
+    with pytest.raises(ValueError):
+        h5py.h5z.register_python_filter(1, bytes, bytes)
+    with pytest.raises(ValueError):
+        h5py.h5z.register_python_filter(32500, None, None)
+
+
+@pytest.mark.skipif('bslz4' not in h5py.filters.encode, reason="bitshuffle not available")
+@pytest.mark.parametrize('dtype', ['u1', 'i2', 'f4', 'f8', 'S3'])
+@pytest.mark.parametrize('n', [5, 16, 1000, 20011])
+def test_bslz4_roundtrip(writable_file, dtype, n):
+    data = np.arange(n).astype(dtype)
+    ds = writable_file.create_dataset('x', data=data, chunks=(min(n, 5000),),
+                                      compression='bslz4')
+    assert ds.compression == 'bslz4'
+    assert ds.compression_opts == 0
+    writable_file.flush()
+    np.testing.assert_array_equal(ds[:], data)
+
+
+@pytest.mark.skipif('bslz4' not in h5py.filters.encode, reason="bitshuffle not available")
+def test_bslz4_format(writable_file):
+    """ Chunks are stored in the format of the bitshuffle library """
+    ds = writable_file.create_dataset('x', data=np.arange(20, dtype='<u2'),
+                                      chunks=(20,), compression='bslz4')
+    writable_file.flush()
+    assert ds.id.get_create_plist().get_filter(0)[:3] == (
+        h5py.h5z.FILTER_BSLZ4, h5py.h5z.FLAG_OPTIONAL, (0, 4, 2, 0, 2))
+    filter_mask, raw = ds.id.read_direct_chunk((0,))
+    assert filter_mask == 0
+    assert raw.hex() == ('000000000000002800002000000000129eaaaaccccf0f000ff00'
+                         '01005000000000001000110012001300')
+
+
+@pytest.mark.skipif('bslz4' not in h5py.filters.encode, reason="bitshuffle not available")
+def test_bslz4_options(writable_file):
+    data = np.arange(1000, dtype='i4')
+    ds = writable_file.create_dataset('x', data=data, chunks=(500,),
+                                      compression='bslz4', compression_opts=64)
+    assert ds.compression_opts == 64
+    np.testing.assert_array_equal(ds[:], data)
+    ds = writable_file.create_dataset('z', data=data, chunks=(500,),
+                                      compression='bslz4', compression_opts=np.int64(0))
+    np.testing.assert_array_equal(ds[:], data)
+
+    for opts in (-8, 12, 'fast', 8.0):
+        with pytest.raises(ValueError):
+            writable_file.create_dataset('y', data=data, compression='bslz4',
+                                         compression_opts=opts)
+
+
+@pytest.mark.skipif('bslz4' not in h5py.filters.encode, reason="bitshuffle not available")
+def test_bslz4_corrupt(writable_file):
+    ds = writable_file.create_dataset('x', (100,), dtype='i4', chunks=(100,),
+                                      compression='bslz4')
+    header = np.array([400], '>u8').tobytes() + np.array([64], '>u4').tobytes()
+    ds.id.write_direct_chunk((0,), header + b'\x00\x00\x00\x10' + b'\xff' * 20)
+    with pytest.raises(OSError):
+        ds[:]
+
+
+def test_io_stats(tmp_path):
+    fname = tmp_path / 'stats.h5'
+    data = np.arange(10000, dtype='i4')
+    with h5py.File(fname, 'w') as f:
+        f.create_dataset('x', data=data, chunks=(1000,), compression='lzf', shuffle=True)
+        f.create_dataset('y', data=data, chunks=(1000,), compression='gzip')
+
+    with h5py.File(fname, 'r', io_stats=True) as f:
+        x = f['x']
+        np.testing.assert_array_equal(x[:], data)
+        x.read_direct(np.empty(10, 'i4'), np.s_[:10])
+        f['y'][:]
+
+        stats = x.io_stats()
+        assert stats['reads'] == 2
+        assert stats['read_time'] > 0
+        lzf = stats['filters']['lzf']['decode']
+        assert lzf['chunks'] == 10
+        assert lzf['decoded_bytes'] == data.nbytes
+        assert lzf['raw_bytes'] == sum(x.id.get_chunk_info(i).size for i in range(10))
+        assert lzf['time'] > 0
+        # HDF5's own filters aren't counted
+        assert f['y'].io_stats()['filters'] == {}
+
+        total = f.io_stats(reset=True)
+        assert total['reads'] == 3
+        assert total['filters']['lzf']['decode']['chunks'] == 10
+        assert f.io_stats()['reads'] == 0
+
+    with h5py.File(fname, 'a') as f:
+        with pytest.raises(ValueError):
+            f['x'].io_stats()
+
+
+def test_io_stats_flush(python_filter, tmp_path):
+    with h5py.File(tmp_path / 'stats.h5', 'w', io_stats=True) as f:
+        ds = f.create_dataset('x', (1000,), dtype='i4', chunks=(100,),
+                              compression=32500)
+        ds[:] = np.arange(1000)
+        f.flush()
+        encode = f.io_stats()['filters']['32500']['encode']
+        assert encode['chunks'] == 10
+        assert encode['decoded_bytes'] == 4000
+        assert ds.io_stats()['writes'] == 1
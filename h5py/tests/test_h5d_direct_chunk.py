@@ -113,3 +113,58 @@ class TestReadDirectChunk(TestCase):
         with h5py.File(filename, "r") as filehandle:
             dataset = filehandle["created"][...]
             numpy.testing.assert_array_equal(dataset, frame)
+
+
+@ut.skipUnless(h5py.version.hdf5_version_tuple >= (1, 10, 2), 'Direct Chunk Reading requires HDF5 >= 1.10.2')
+@ut.skipIf('gzip' not in h5py.filters.encode, "DEFLATE is not installed")
+class TestDirectChunks(TestCase):
+
+    def setUp(self):
+        self.f = h5py.File(self.mktemp(), 'w')
+        self.data = numpy.arange(10 * 10, dtype='i4').reshape(10, 10)
+        self.src = self.f.create_dataset("src", data=self.data, chunks=(4, 4),
+                                         compression="gzip")
+        self.offsets = numpy.array([(i, j) for i in range(0, 10, 4)
+                                    for j in range(0, 10, 4)])
+
+    def tearDown(self):
+        self.f.close()
+
+    def test_read_direct_chunks(self):
+        out = numpy.zeros(10000, dtype=numpy.uint8)
+        sizes, masks = self.src.id.read_direct_chunks(self.offsets, out)
+        self.assertEqual(sizes.shape, (9,))
+        self.assertEqual(masks.tolist(), [0] * 9)
+
+        pos = 0
+        for offset, size in zip(self.offsets.tolist(), sizes.tolist()):
+            _, expected = self.src.id.read_direct_chunk(tuple(offset))
+            self.assertEqual(out[pos:pos + size].tobytes(), expected)
+            pos += size
+
+    def test_roundtrip(self):
+        dst = self.f.create_dataset("dst", shape=self.data.shape, dtype='i4',
+                                    chunks=(4, 4), compression="gzip")
+        out = bytearray(10000)
+        sizes, masks = self.src.id.read_direct_chunks(self.offsets, out)
+        dst.id.write_direct_chunks(self.offsets, out, sizes, masks)
+        numpy.testing.assert_array_equal(dst[...], self.data)
+
+    def test_write_filter_mask_scalar(self):
+        dst = self.f.create_dataset("dst", shape=(8,), dtype='i4',
+                                    chunks=(4,), compression="gzip")
+        raw = numpy.arange(8, dtype='i4')
+        dst.id.write_direct_chunks([[0], [4]], raw, [16, 16],
+                                   filter_mask=0xFFFFFFFF)
+        numpy.testing.assert_array_equal(dst[...], raw)
+
+    def test_buffer_too_small(self):
+        with self.assertRaises(ValueError):
+            self.src.id.read_direct_chunks(self.offsets, bytearray(10))
+        with self.assertRaises(ValueError):
+            self.src.id.write_direct_chunks(self.offsets, bytearray(10),
+                                            [4] * 9)
+
+    def test_bad_offsets(self):
+        with self.assertRaises(TypeError):
+            self.src.id.read_direct_chunks([[0, 0, 0]], bytearray(100))
@@ -0,0 +1,135 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2020 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Tests for the 'ranged' file driver and h5py.ranged.
+"""
+
+from concurrent.futures import wait
+
+import numpy as np
+import pytest
+
+import h5py
+from h5py._hl.ranged import FileBackend, RangedReader
+
+
+@pytest.fixture
+def fname(tmp_path):
+    fname = tmp_path / 'ranged.h5'
+    with h5py.File(fname, 'w') as f:
+        f.create_dataset('x', data=np.arange(200000), chunks=(5000,))
+        f['y'] = np.arange(10)
+        f.attrs['a'] = 'text'
+    return fname
+
+
+@pytest.fixture
+def backend(fname):
+    be = FileBackend(fname)
+    yield be
+    be.close()
+
+
+def test_driver(backend):
+    with h5py.File('blob://ranged.h5', 'r', driver='ranged', fetch=backend,
+                   page_size=4096, prefetch=8192) as f:
+        assert f.driver == 'ranged'
+        np.testing.assert_array_equal(f['x'][:], np.arange(200000))
+        np.testing.assert_array_equal(f['y'][:], np.arange(10))
+        assert f.attrs['a'] == 'text'
+    # Runs of pages are fetched together, so far fewer requests than chunks
+    assert backend.requests < 40
+    assert backend.nbytes >= backend.size
+
+
+@pytest.mark.parametrize('options', [
+    {'max_workers': 1},
+    {'readahead': 0},
+    {'cache_bytes': 4096, 'page_size': 4096},   # Chunks bypass the cache
+    {'page_size': 1000, 'max_request': 3000},
+])
+def test_reader_options(backend, options):
+    reader = RangedReader(backend, **options)
+    with h5py.File('blob', 'r', driver='ranged', reader=reader) as f:
+        np.testing.assert_array_equal(f['x'][::7], np.arange(0, 200000, 7))
+    # Read-ahead requests are only counted when their pages are used
+    stats = reader.stats()
+    assert 0 < stats['requests'] <= backend.requests
+    assert 0 < stats['fetched_bytes'] <= backend.nbytes
+    reader.close()
+
+
+def test_readinto_at(fname, backend):
+    reader = RangedReader(backend, page_size=100, cache_bytes=1000, prefetch=0,
+                          max_workers=2)
+    expected = fname.read_bytes()
+    for offset, length in [(0, 10), (95, 10), (150, 350), (1000, 5000),
+                           (len(expected) - 5, 100)]:
+        buf = bytearray(length)
+        n = reader.readinto_at(offset, buf)
+        assert n == min(length, len(expected) - offset)
+        assert bytes(buf[:n]) == expected[offset:offset + n]
+    assert reader.readinto_at(len(expected) + 10, bytearray(10)) == 0
+
+    reader.seek(0)
+    assert reader.read(8) == b'\x89HDF\r\n\x1a\n'
+    assert reader.seek(0, 2) == len(expected)
+
+
+def test_cache_and_prefetch(backend):
+    reader = RangedReader(backend, page_size=1000, prefetch=0, readahead=0)
+    reader.prefetch([(0, 3000), (5000, 1000), (2500, 1000)])
+    # Pages 0-3 coalesce into one request, page 5 is another
+    assert reader.stats()['requests'] == 2
+
+    buf = bytearray(2000)
+    reader.readinto_at(500, buf)
+    assert reader.stats() == {'hits': 3, 'misses': 0, 'requests': 2,
+                              'fetched_bytes': 5000}
+    reader.readinto_at(4500, buf)
+    assert reader.stats()['misses'] == 2
+    assert reader.stats()['requests'] == 4
+    reader.reset_stats()
+    assert reader.stats()['hits'] == 0
+
+
+def test_short_fetch(backend):
+    reader = RangedReader(lambda offset, length: b'\0' * (length // 2),
+                          size=backend.size, prefetch=0)
+    with pytest.raises(OSError):
+        reader.readinto_at(0, bytearray(100))
+
+
+def test_failed_readahead(backend):
+    """ A failed read-ahead only breaks reads of its own pages """
+    def fetch(offset, length):
+        if offset + length > 512 * 1024:
+            raise ConnectionError("Unavailable")
+        return backend(offset, length)
+
+    reader = RangedReader(fetch, size=backend.size, page_size=1 << 16,
+                          max_request=1 << 16, prefetch=0, max_workers=2)
+    buf = bytearray(100)
+    reader.readinto_at(0, buf)
+    wait([future for future, _ in reader._inflight.values()])
+    assert reader.readinto_at(100, buf) == 100
+    assert bytes(buf) == backend(100, 100)
+    with pytest.raises(ConnectionError):
+        reader.readinto_at(600 * 1024, buf)
+    reader.close()
+
+
+def test_read_only(backend):
+    with pytest.raises(ValueError):
+        h5py.File('blob', 'r+', driver='ranged', fetch=backend)
+    with pytest.raises(TypeError):
+        h5py.File('blob', 'r', driver='ranged')
+    with pytest.raises(TypeError):
+        RangedReader(lambda offset, length: b'')
@@ -0,0 +1,105 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2020 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Tests for chunk-wise reductions (Dataset.reduce).
+"""
+
+import numpy as np
+
+from .common import ut, TestCase
+
+
+class TestReduce(TestCase):
+
+    def setUp(self):
+        TestCase.setUp(self)
+        rng = np.random.RandomState(42)
+        self.data = rng.randint(-50, 50, (45, 23, 7)).astype('i2')
+        self.dset = self.f.create_dataset('x', data=self.data, chunks=(10, 6, 4))
+
+    def check(self, op, **kwds):
+        for workers in (None, 3):
+            with self.subTest(op=op, workers=workers, **kwds):
+                sel = kwds.get('sel', Ellipsis)
+                expected = getattr(np, op)(self.data[sel], axis=kwds.get('axis'))
+                result = self.dset.reduce(op, workers=workers, **kwds)
+                self.assertEqual(np.asarray(result).dtype, np.asarray(expected).dtype)
+                np.testing.assert_array_equal(result, expected)
+
+    def test_all_axes(self):
+        """ Reductions over the whole dataset match NumPy """
+        for op in ('sum', 'min', 'max', 'argmax', 'argmin'):
+            self.check(op)
+        self.assertAlmostEqual(self.dset.reduce('mean'), self.data.mean())
+
+    def test_axis(self):
+        """ Reductions along one axis match NumPy """
+        for axis in (0, 1, 2, -1):
+            for op in ('sum', 'min', 'max', 'argmax', 'argmin'):
+                self.check(op, axis=axis)
+            np.testing.assert_allclose(self.dset.reduce('mean', axis=axis),
+                                       self.data.mean(axis=axis))
+
+    def test_sel(self):
+        """ Reductions over a strided region match NumPy """
+        sel = np.s_[3:40:3, 5:, 1:6]
+        for op in ('sum', 'max', 'argmax'):
+            self.check(op, sel=sel)
+            self.check(op, sel=sel, axis=0)
+
+    def test_numpy_function(self):
+        """ NumPy functions are accepted for op """
+        self.assertEqual(self.dset.reduce(np.max), self.data.max())
+        self.assertEqual(self.dset.reduce(np.amin), self.data.min())
+
+    def test_ties_and_nan(self):
+        """ argmax returns the first maximum, or the first NaN """
+        data = np.zeros((30, 4), dtype='f4')
+        data[[7, 25], 1] = 1
+        data[[12, 28], 2] = np.nan
+        dset = self.f.create_dataset('y', data=data, chunks=(5, 2))
+        for workers in (None, 4):
+            np.testing.assert_array_equal(dset.reduce('argmax', axis=0, workers=workers),
+                                          data.argmax(axis=0))
+            self.assertEqual(dset.reduce('argmax', workers=workers), data.argmax())
+            self.assertTrue(np.isnan(dset.reduce('max', workers=workers)))
+
+    def test_histogram(self):
+        """ Histograms match numpy.histogram """
+        counts, edges = self.dset.reduce('histogram', bins=7, workers=2)
+        exp_counts, exp_edges = np.histogram(self.data, bins=7)
+        np.testing.assert_array_equal(counts, exp_counts)
+        np.testing.assert_allclose(edges, exp_edges)
+
+        counts, edges = self.dset.reduce('histogram', bins=[-10, 0, 10], range=None)
+        np.testing.assert_array_equal(counts, np.histogram(self.data, [-10, 0, 10])[0])
+
+    def test_contiguous(self):
+        """ Contiguous datasets are reduced in blocks """
+        dset = self.f.create_dataset('c', data=self.data)
+        self.assertEqual(dset.reduce('sum', workers=2), self.data.sum())
+        np.testing.assert_array_equal(dset.reduce('min', axis=1), self.data.min(axis=1))
+
+    def test_empty_sel(self):
+        """ Empty selections behave as NumPy does for empty arrays """
+        self.assertEqual(self.dset.reduce('sum', sel=np.s_[3:3, :, :]), 0)
+        with self.assertRaises(ValueError):
+            self.dset.reduce('max', sel=np.s_[3:3, :, :])
+
+    def test_invalid(self):
+        """ Unknown operations and axes are rejected """
+        with self.assertRaises(ValueError):
+            self.dset.reduce('median')
+        with self.assertRaises(ValueError):
+            self.dset.reduce('sum', axis=3)
+        with self.assertRaises(ValueError):
+            self.dset.reduce('histogram', axis=0)
+        with self.assertRaises(TypeError):
+            self.f.create_dataset('s', data=1).reduce('sum')
@@ -0,0 +1,110 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2020 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Tests for the 'trace' file driver and h5py.trace.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+import h5py
+from h5py import h5fd
+
+
+@pytest.fixture
+def traced(tmp_path):
+    """ A file written and read with the trace driver, and the read log """
+    fname = str(tmp_path / 'traced.h5')
+    data = np.arange(10000, dtype='f8')
+    with h5py.File(fname, 'w', driver='trace', trace_file=tmp_path / 'write.log') as f:
+        assert f.driver == 'trace'
+        f.create_dataset('x', data=data, chunks=(1000,))
+        f.attrs['a'] = 1
+
+    log = str(tmp_path / 'read.log')
+    with h5py.File(fname, 'r', driver='trace', trace_file=log) as f:
+        np.testing.assert_array_equal(f['x'][:], data)
+        assert f.attrs['a'] == 1
+    return fname, log
+
+
+def test_load(traced):
+    fname, log = traced
+    trace = h5py.trace.load(log)
+    assert os.path.samefile(trace.filename, fname)
+
+    rec = trace.records
+    assert rec.dtype == h5py.trace.TRACE_DTYPE
+    assert np.all(rec['op'] == h5py.trace.READ)
+    assert np.all(np.diff(rec['start']) >= 0)
+    assert np.all(rec['addr'] + rec['size'] <= os.path.getsize(fname))
+    # Each chunk is read once, as raw data
+    raw = rec[rec['type'] == h5fd.MEM_DRAW]
+    assert len(raw) == 10
+    assert raw['size'].sum() == 80000
+
+
+def test_load_writes(traced, tmp_path):
+    rec = h5py.trace.load(tmp_path / 'write.log').records
+    assert np.count_nonzero(rec['op'] == h5py.trace.WRITE) > 0
+
+
+def test_load_invalid(tmp_path):
+    bad = tmp_path / 'bad.log'
+    bad.write_bytes(b'not a trace')
+    with pytest.raises(ValueError):
+        h5py.trace.load(bad)
+
+
+@pytest.mark.parametrize('candidate', [None, {'driver': 'core'}, {'driver': 'stdio'}])
+def test_replay(traced, candidate):
+    fname, log = traced
+    before = open(fname, 'rb').read()
+    trace = h5py.trace.load(log)
+
+    result = h5py.trace.replay(log, candidate)
+    assert result.reads == len(trace.records)
+    assert result.writes == 0
+    assert result.nbytes == trace.records['size'].sum()
+    assert result.seconds > 0
+    # Reads don't change the file
+    assert open(fname, 'rb').read() == before
+
+
+def test_replay_fapl(traced, tmp_path):
+    fname, log = traced
+    copy = tmp_path / 'copy.h5'
+    copy.write_bytes(open(fname, 'rb').read())
+    fapl = h5py.h5p.create(h5py.h5p.FILE_ACCESS)
+    fapl.set_fapl_sec2()
+    result = h5py.trace.replay(h5py.trace.load(log), fapl, name=copy)
+    assert result.reads > 0
+
+
+def test_replay_writes(traced, tmp_path):
+    fname, _ = traced
+    copy = tmp_path / 'copy.h5'
+    copy.write_bytes(open(fname, 'rb').read())
+    result = h5py.trace.replay(tmp_path / 'write.log', name=copy, writes=True)
+    assert result.writes > 0
+
+
+def test_simulate(traced):
+    _, log = traced
+    rec = h5py.trace.load(log).records
+    small = h5py.trace.simulate(log, 4096, 4096)
+    big = h5py.trace.simulate(log, 4096, 1 << 20)
+    assert big.reads <= small.reads <= len(rec)
+    assert big.hits >= small.hits
+    assert big.nbytes == big.misses * 4096
+    with pytest.raises(ValueError):
+        h5py.trace.simulate(log, 0, 4096)
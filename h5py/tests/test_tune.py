@@ -0,0 +1,81 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2020 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Tests for h5py.tune.
+"""
+
+import numpy as np
+
+import h5py
+from h5py._hl import tune
+from .common import ut, TestCase
+
+
+class TestSuggest(TestCase):
+
+    def setUp(self):
+        TestCase.setUp(self)
+        rng = np.random.RandomState(0)
+        self.sample = rng.poisson(3, (8, 64, 64)).astype('u2')
+
+    def test_ranked(self):
+        """ Results are ranked by the objective, and their settings work """
+        for objective in tune.OBJECTIVES:
+            with self.subTest(objective=objective):
+                results = h5py.tune.suggest(self.sample, objective=objective,
+                                            repeat=1)
+                values = [getattr(r, objective) for r in results]
+                self.assertEqual(values, sorted(values, reverse=True))
+
+        best = results[0]
+        self.assertIn('compression', best.settings)
+        self.assertGreater(best.ratio, 1)
+        dset = self.f.create_dataset('x', data=self.sample, **best.settings)
+        np.testing.assert_array_equal(dset[()], self.sample)
+
+    def test_candidates(self):
+        """ Every combination of chunk shape and pipeline is measured """
+        results = h5py.tune.suggest(
+            self.sample, access_pattern='rows', repeat=1,
+            chunks=[(8, 8, 64), (1, 64, 64)],
+            pipelines=[{}, {'compression': 'gzip', 'shuffle': True}])
+        self.assertEqual(len(results), 4)
+        for r in results:
+            self.assertGreater(r.write_speed, 0)
+            self.assertGreater(r.read_speed, 0)
+        plain = [r for r in results if 'compression' not in r.settings]
+        self.assertTrue(all(0.9 < r.ratio <= 1 for r in plain))
+
+    def test_access_patterns(self):
+        """ Named access patterns read along the expected axes """
+        shape = (3, 4, 5)
+        sels = tune._access_selections(shape, 'rows')
+        self.assertEqual(len(sels), 12)
+        self.assertEqual(sels[0], (0, 0, slice(None)))
+        self.assertEqual(len(tune._access_selections(shape, 'columns')), 20)
+        self.assertEqual(tune._access_selections(shape, 'planes')[2],
+                         (2, slice(None), slice(None)))
+        self.assertEqual(len(tune._access_selections((1000, 1000), 'rows')),
+                         tune._MAX_READS)
+
+        chunks = tune.default_chunks((1000, 1000), 'f8', 'rows')
+        self.assertEqual(chunks[0], h5py.filters.guess_chunk((1000, 1000), None, 8))
+        self.assertEqual(chunks[1][1], 1000)
+
+    def test_invalid(self):
+        """ Bad arguments are rejected """
+        with self.assertRaises(ValueError):
+            h5py.tune.suggest(self.sample, objective='speed')
+        with self.assertRaises(ValueError):
+            h5py.tune.suggest(self.sample, access_pattern='diagonal')
+        with self.assertRaises(ValueError):
+            h5py.tune.suggest(np.zeros((0, 4)))
+        with self.assertRaises(TypeError):
+            h5py.tune.suggest(np.array([1, 'a'], dtype=object))
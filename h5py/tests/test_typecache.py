@@ -0,0 +1,59 @@
+# This file is part of h5py, a Python interface to the HDF5 library.
+#
+# http://www.h5py.org
+#
+# Copyright 2008-2020 Andrew Collette and contributors
+#
+# License:  Standard 3-clause BSD; see "license.txt" for full license terms
+#           and contributor agreement.
+
+"""
+    Tests for the cache of HDF5 memory types, h5py._hl.typecache.
+"""
+
+import numpy as np
+import pytest
+
+import h5py
+from h5py import h5t
+from h5py._hl import typecache
+
+COMPOUND = np.dtype([('f%d' % i, ['<i4', '<f8', 'S8'][i % 3]) for i in range(12)])
+
+
+def test_shared():
+    tid = typecache.py_create(COMPOUND)
+    assert typecache.py_create(np.dtype(COMPOUND.descr)) is tid
+    assert tid == h5t.py_create(COMPOUND)
+    assert typecache.py_create(COMPOUND, logical=True) is not tid
+    # Cached types are locked
+    with pytest.raises(TypeError):
+        tid.set_size(1000)
+
+
+def test_hints():
+    """ Dtypes which differ only by h5py's hints get their own types """
+    enum = h5py.enum_dtype({'a': 1, 'b': 2}, basetype='i4')
+    assert isinstance(typecache.py_create(enum, logical=True), h5t.TypeEnumID)
+    assert isinstance(typecache.py_create(np.dtype('i4'), logical=True), h5t.TypeIntegerID)
+    for encoding, cset in (('utf-8', h5t.CSET_UTF8), ('ascii', h5t.CSET_ASCII)):
+        dt = np.dtype([('s', h5py.string_dtype(encoding))])
+        tid = typecache.py_create(dt, logical=True)
+        assert tid.get_member_type(0).get_cset() == cset
+
+
+def test_limit(monkeypatch):
+    monkeypatch.setattr(typecache, 'MAX_TYPES', len(typecache._types))
+    dt = np.dtype([('x', '<i2'), ('never_cached', '<f4')])
+    assert typecache.py_create(dt) is not typecache.py_create(dt)
+
+
+def test_io(writable_file):
+    data = np.arange(40, dtype='i4').view(np.dtype([('a', 'i2'), ('b', 'i2')]))
+    dset = writable_file.create_dataset('x', data=data)
+    dset.attrs['y'] = data
+    dset[5:10] = data[:5]
+    np.testing.assert_array_equal(dset[5:10], data[:5])
+    np.testing.assert_array_equal(dset.fields('b')[:3], data['b'][:3])
+    np.testing.assert_array_equal(dset.attrs['y'], data)
+    assert typecache.stats()['hits'] > 0
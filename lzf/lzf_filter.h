@@ -14,6 +14,8 @@
 #ifndef H5PY_LZF_H
 #define H5PY_LZF_H
 
+#include "hdf5.h"
+
 #ifdef __cplusplus
 extern "C" {
 #endif
@@ -30,6 +32,12 @@ extern "C" {
 */
 int register_lzf(void);
 
+/* The filter callbacks, for code which wraps the filter (e.g. to time it) */
+size_t lzf_filter(unsigned flags, size_t cd_nelmts,
+                  const unsigned cd_values[], size_t nbytes,
+                  size_t *buf_size, void **buf);
+herr_t lzf_set_local(hid_t dcpl, hid_t type, hid_t space);
+
 #ifdef __cplusplus
 }
 #endif
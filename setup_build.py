@@ -35,14 +35,16 @@ MODULES = ['defs', '_errors', '_objects', '_proxy', 'h5fd', 'h5z',
 
 COMPILER_SETTINGS = {
    'libraries'      : ['hdf5', 'hdf5_hl'],
-   'include_dirs'   : [localpath('lzf')],
+   'include_dirs'   : [localpath('lzf'), localpath('bslz4')],
    'library_dirs'   : [],
    'define_macros'  : [('H5_USE_18_API', None),
                        ('NPY_NO_DEPRECATED_API', 0),
                       ]
 }
 
-EXTRA_SRC = {'h5z': [ localpath("lzf/lzf_filter.c") ]}
+EXTRA_SRC = {'h5z': [ localpath("lzf/lzf_filter.c"),
+                      localpath("bslz4/bslz4_filter.c"),
+                      localpath("bslz4/bitshuffle.c") ]}
 
 # Set the environment variable H5PY_SYSTEM_LZF=1 if we want to
 # use the system lzf library
@@ -58,6 +60,19 @@ else:
 
     EXTRA_LIBRARIES = {}
 
+# Likewise H5PY_SYSTEM_LZ4=1 to use the system lz4 library for the bundled
+# bitshuffle/LZ4 filter
+if os.environ.get('H5PY_SYSTEM_LZ4', '0') == '1':
+    EXTRA_LIBRARIES.setdefault('h5z', []).append('lz4')
+else:
+    COMPILER_SETTINGS['include_dirs'] += [localpath('bslz4/lz4')]
+    EXTRA_SRC['h5z'] += [localpath("bslz4/lz4/lz4.c")]
+    if not sys.platform.startswith('win'):
+        # Keep the bundled LZ4 symbols private to h5z, so they can't clash
+        # with another copy loaded by a different extension module.
+        COMPILER_SETTINGS['define_macros'].append(
+            ('LZ4LIB_VISIBILITY', '__attribute__((visibility("hidden")))'))
+
 if sys.platform.startswith('win'):
     COMPILER_SETTINGS['include_dirs'].append(localpath('windows'))
     COMPILER_SETTINGS['define_macros'].extend([